@@ -0,0 +1,120 @@
+"""
+Dependency graph analysis for OneTaskAtATime.
+
+Computes, in one topological pass over all dependencies, for every task in
+the dependency graph:
+- Transitive blocked status: some incomplete task is upstream of it, even
+  if the direct blocker in between was already completed
+- Depth: the longest chain of incomplete blockers above it, i.e. how many
+  tasks must be completed one after another before it is unblocked
+- Unblock count: how many tasks would have no incomplete blocker left if
+  this task were completed
+
+The pass is linear in the number of tasks and dependencies. Instead of
+materializing every upstream set, each task only carries a summary of its
+incomplete upstream tasks (none, exactly one task ID, or several).
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Summary value for "two or more distinct incomplete upstream tasks"
+_MANY = -1
+
+
+@dataclass(frozen=True)
+class DependencyMetrics:
+    """
+    Dependency metrics of one task.
+
+    Attributes:
+        blocked: True if any incomplete task is upstream (directly or transitively)
+        depth: Longest chain of incomplete blockers above the task (0 if not blocked)
+        unblock_count: Number of tasks left without incomplete blockers if
+            this task is completed
+    """
+    blocked: bool = False
+    depth: int = 0
+    unblock_count: int = 0
+
+
+# Metrics of tasks outside the dependency graph
+NO_DEPENDENCIES = DependencyMetrics()
+
+
+def _merge(first: Optional[int], second: Optional[int]) -> Optional[int]:
+    """Merge two upstream summaries (None, a task ID, or _MANY)."""
+    if first is None:
+        return second
+    if second is None or first == second:
+        return first
+    return _MANY
+
+
+def analyze_dependencies(
+    edges: Iterable[Tuple[int, int]],
+    completed_ids: Set[int]
+) -> Dict[int, DependencyMetrics]:
+    """
+    Compute dependency metrics for every task that appears in a dependency.
+
+    Tasks caught in a dependency cycle (which the DAO prevents, but imported
+    data may contain) are reported as blocked with no single unblocking task.
+
+    Args:
+        edges: (blocked_task_id, blocking_task_id) pairs
+        completed_ids: IDs of completed tasks (they no longer block anything)
+
+    Returns:
+        Dict mapping task ID -> DependencyMetrics; tasks without dependencies
+        are absent (use NO_DEPENDENCIES)
+    """
+    dependents: Dict[int, List[int]] = {}
+    pending_blockers: Dict[int, int] = {}
+    for blocked_task_id, blocking_task_id in set(edges):
+        dependents.setdefault(blocking_task_id, []).append(blocked_task_id)
+        dependents.setdefault(blocked_task_id, [])
+        pending_blockers[blocked_task_id] = pending_blockers.get(blocked_task_id, 0) + 1
+        pending_blockers.setdefault(blocking_task_id, 0)
+
+    depth: Dict[int, int] = dict.fromkeys(pending_blockers, 0)
+    upstream: Dict[int, Optional[int]] = dict.fromkeys(pending_blockers)
+
+    # Kahn's algorithm: a task is processed once all of its blockers are
+    queue = deque(task_id for task_id, count in pending_blockers.items() if count == 0)
+    while queue:
+        task_id = queue.popleft()
+        incomplete = task_id not in completed_ids
+        task_depth = depth[task_id] + (1 if incomplete else 0)
+        task_upstream = _merge(upstream[task_id], task_id) if incomplete else upstream[task_id]
+
+        for dependent_id in dependents[task_id]:
+            if task_depth > depth[dependent_id]:
+                depth[dependent_id] = task_depth
+            upstream[dependent_id] = _merge(upstream[dependent_id], task_upstream)
+
+            pending_blockers[dependent_id] -= 1
+            if pending_blockers[dependent_id] == 0:
+                queue.append(dependent_id)
+
+    # Tasks still waiting on blockers are part of (or behind) a cycle
+    for task_id, count in pending_blockers.items():
+        if count > 0:
+            depth[task_id] = max(depth[task_id], 1)
+            upstream[task_id] = _MANY
+
+    unblock_counts: Dict[int, int] = {}
+    for task_id, sole_blocker in upstream.items():
+        if sole_blocker is not None and sole_blocker != _MANY and task_id not in completed_ids:
+            unblock_counts[sole_blocker] = unblock_counts.get(sole_blocker, 0) + 1
+
+    return {
+        task_id: DependencyMetrics(
+            blocked=upstream[task_id] is not None,
+            depth=depth[task_id],
+            unblock_count=unblock_counts.get(task_id, 0)
+        )
+        for task_id in pending_blockers
+    }
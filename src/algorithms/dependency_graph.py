@@ -0,0 +1,239 @@
+"""
+In-memory dependency graph for OneTaskAtATime.
+
+Holds the blocked -> blocking adjacency of all dependencies and memoizes
+transitive reachability, so cycle checks and "all transitive blockers"
+queries are set lookups instead of one SQL query per visited task:
+- Transitive sets are computed on first use with an iterative DFS that
+  reuses already memoized sets (safe on very deep chains)
+- Adding an edge extends the memoized sets it affects in place
+- Removing an edge drops the memoized sets (they are recomputed lazily)
+"""
+
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+
+class DependencyGraph:
+    """
+    Dependency adjacency with memoized transitive blockers and dependents.
+
+    Edges are (blocked_task_id, blocking_task_id) pairs, like rows of the
+    dependencies table.
+    """
+
+    def __init__(self, edges: Iterable[Tuple[int, int]] = ()):
+        """
+        Initialize the graph.
+
+        Args:
+            edges: Initial (blocked_task_id, blocking_task_id) pairs
+        """
+        self._edges: Counter = Counter()
+        self._blockers: Dict[int, Set[int]] = {}
+        self._dependents: Dict[int, Set[int]] = {}
+        self._blocker_closure: Dict[int, FrozenSet[int]] = {}
+        self._dependent_closure: Dict[int, FrozenSet[int]] = {}
+
+        for blocked_task_id, blocking_task_id in edges:
+            self._link(blocked_task_id, blocking_task_id)
+
+    def __len__(self) -> int:
+        return sum(self._edges.values())
+
+    def __contains__(self, edge: Tuple[int, int]) -> bool:
+        return edge in self._edges
+
+    def add(self, blocked_task_id: int, blocking_task_id: int) -> None:
+        """
+        Add a dependency edge.
+
+        Args:
+            blocked_task_id: ID of the blocked task
+            blocking_task_id: ID of the task that blocks it
+        """
+        if (blocked_task_id, blocking_task_id) in self._edges:
+            self._edges[(blocked_task_id, blocking_task_id)] += 1
+            return
+
+        # Everything blocked_task_id reaches now also reaches blocking_task_id
+        # and its blockers (and symmetrically for dependents)
+        self._extend(
+            self._blocker_closure, blocked_task_id,
+            self.get_transitive_blockers(blocking_task_id) | {blocking_task_id}
+        )
+        self._extend(
+            self._dependent_closure, blocking_task_id,
+            self.get_transitive_dependents(blocked_task_id) | {blocked_task_id}
+        )
+        self._link(blocked_task_id, blocking_task_id)
+
+    def remove(self, blocked_task_id: int, blocking_task_id: int) -> None:
+        """
+        Remove a dependency edge. Unknown edges are ignored.
+
+        Args:
+            blocked_task_id: ID of the blocked task
+            blocking_task_id: ID of the task that blocks it
+        """
+        edge = (blocked_task_id, blocking_task_id)
+        count = self._edges.get(edge, 0)
+        if count == 0:
+            return
+        if count > 1:
+            self._edges[edge] = count - 1
+            return
+
+        del self._edges[edge]
+        self._discard(self._blockers, blocked_task_id, blocking_task_id)
+        self._discard(self._dependents, blocking_task_id, blocked_task_id)
+
+        # Other paths may still connect the same tasks: recompute lazily
+        self._blocker_closure.clear()
+        self._dependent_closure.clear()
+
+    def edges(self) -> List[Tuple[int, int]]:
+        """
+        Get every distinct edge.
+
+        Returns:
+            List of (blocked_task_id, blocking_task_id) pairs
+        """
+        return list(self._edges)
+
+    def has_task(self, task_id: int) -> bool:
+        """
+        Check if a task is part of any dependency.
+
+        Args:
+            task_id: ID of the task
+
+        Returns:
+            True if the task blocks or is blocked by another task
+        """
+        return task_id in self._blockers or task_id in self._dependents
+
+    def get_blockers(self, task_id: int) -> Set[int]:
+        """
+        Get IDs of tasks directly blocking a task.
+
+        Args:
+            task_id: ID of the blocked task
+
+        Returns:
+            Set of blocking task IDs
+        """
+        return set(self._blockers.get(task_id, ()))
+
+    def get_dependents(self, task_id: int) -> Set[int]:
+        """
+        Get IDs of tasks directly blocked by a task.
+
+        Args:
+            task_id: ID of the blocking task
+
+        Returns:
+            Set of blocked task IDs
+        """
+        return set(self._dependents.get(task_id, ()))
+
+    def get_transitive_blockers(self, task_id: int) -> FrozenSet[int]:
+        """
+        Get IDs of every task blocking a task, directly or indirectly.
+
+        Args:
+            task_id: ID of the blocked task
+
+        Returns:
+            Frozen set of blocking task IDs
+        """
+        return self._reach(task_id, self._blockers, self._blocker_closure)
+
+    def get_transitive_dependents(self, task_id: int) -> FrozenSet[int]:
+        """
+        Get IDs of every task blocked by a task, directly or indirectly.
+
+        Args:
+            task_id: ID of the blocking task
+
+        Returns:
+            Frozen set of blocked task IDs
+        """
+        return self._reach(task_id, self._dependents, self._dependent_closure)
+
+    def has_path(self, from_task: int, to_task: int) -> bool:
+        """
+        Check if from_task is blocked by to_task, directly or indirectly.
+
+        Args:
+            from_task: ID of the blocked task
+            to_task: ID of the potential (transitive) blocker
+
+        Returns:
+            True if a path exists (or both IDs are the same)
+        """
+        return from_task == to_task or to_task in self.get_transitive_blockers(from_task)
+
+    def would_create_cycle(self, blocked_task_id: int, blocking_task_id: int) -> bool:
+        """
+        Check if adding a dependency would create a circular dependency.
+
+        Args:
+            blocked_task_id: ID of task that would be blocked
+            blocking_task_id: ID of task that would be blocking
+
+        Returns:
+            True if cycle would be created, False otherwise
+        """
+        return self.has_path(blocking_task_id, blocked_task_id)
+
+    def _link(self, blocked_task_id: int, blocking_task_id: int) -> None:
+        """Record an edge in the adjacency maps."""
+        self._edges[(blocked_task_id, blocking_task_id)] += 1
+        self._blockers.setdefault(blocked_task_id, set()).add(blocking_task_id)
+        self._dependents.setdefault(blocking_task_id, set()).add(blocked_task_id)
+
+    @staticmethod
+    def _discard(adjacency: Dict[int, Set[int]], source: int, target: int) -> None:
+        """Remove target from source's adjacency set."""
+        targets = adjacency.get(source)
+        if targets is not None:
+            targets.discard(target)
+            if not targets:
+                del adjacency[source]
+
+    @staticmethod
+    def _extend(closure: Dict[int, FrozenSet[int]], source: int, added: FrozenSet[int]) -> None:
+        """Add tasks newly reachable from source to every memoized set reaching source."""
+        for task_id, reachable in closure.items():
+            if task_id == source or source in reachable:
+                closure[task_id] = reachable | added
+
+    @staticmethod
+    def _reach(
+        task_id: int,
+        adjacency: Dict[int, Set[int]],
+        closure: Dict[int, FrozenSet[int]]
+    ) -> FrozenSet[int]:
+        """Get (and memoize) every task reachable from task_id through adjacency."""
+        cached = closure.get(task_id)
+        if cached is not None:
+            return cached
+
+        reachable: Set[int] = set()
+        stack = list(adjacency.get(task_id, ()))
+        while stack:
+            current = stack.pop()
+            if current in reachable:
+                continue
+            reachable.add(current)
+
+            memoized = closure.get(current)
+            if memoized is not None:
+                reachable |= memoized
+            else:
+                stack.extend(adjacency.get(current, ()))
+
+        result = frozenset(reachable)
+        closure[task_id] = result
+        return result
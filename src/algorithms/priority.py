@@ -5,12 +5,26 @@ This module implements the core task scoring system:
 - Effective Priority = Elo-based calculation within base priority bands
 - Urgency = 1-3 based on days until due date
 - Importance = Effective Priority × Urgency
+
+Scores for many tasks at once are computed column-wise by
+calculate_score_arrays(), which uses NumPy when it is installed and falls
+back to plain Python lists otherwise.
 """
 
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from ..models.task import Task
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python path is used instead
+    np = None
+
+
+# Elo reference range (covers ~99% of tasks)
+ELO_MIN = 1000.0
+ELO_MAX = 2000.0
+
 
 def elo_to_effective_priority(base_priority: int, elo_rating: float) -> float:
     """
@@ -36,10 +50,6 @@ def elo_to_effective_priority(base_priority: int, elo_rating: float) -> float:
     Raises:
         ValueError: If base_priority is not 1, 2, or 3
     """
-    # Elo reference range (covers ~99% of tasks)
-    ELO_MIN = 1000.0
-    ELO_MAX = 2000.0
-
     # Clamp Elo to prevent extreme outliers from breaking bands
     clamped_elo = max(ELO_MIN, min(ELO_MAX, elo_rating))
 
@@ -103,56 +113,157 @@ def calculate_urgency_for_tasks(tasks: List[Task], today: Optional[date] = None)
     Returns:
         Dictionary mapping task.id to urgency score
     """
-    if today is None:
-        today = date.today()
+    due_ordinals = [t.due_date.toordinal() if t.due_date is not None else None for t in tasks]
+    urgency = _to_list(calculate_urgency_array(due_ordinals))
+
+    return {
+        task.id: score
+        for task, score in zip(tasks, urgency)
+        if task.id is not None
+    }
+
+
+def calculate_urgency_array(due_ordinals: Sequence[Optional[int]]):
+    """
+    Calculate normalized urgency for a column of due dates.
+
+    Same rules as calculate_urgency_for_tasks(): no due date = 1.0, a single
+    due date or identical due dates = 3.0, otherwise linear from 3.0 (earliest,
+    including overdue) to 1.0 (latest). Normalization only depends on the
+    spread of due dates, so no reference date is needed.
+
+    Args:
+        due_ordinals: date.toordinal() of each due date, or None for no due date
+
+    Returns:
+        Urgency scores in input order (NumPy array if available, else list)
+    """
+    if np is not None:
+        count = len(due_ordinals)
+        has_date = np.fromiter((d is not None for d in due_ordinals), dtype=bool, count=count)
+        ordinals = np.fromiter((d if d is not None else 0 for d in due_ordinals), dtype=np.int64, count=count)
+
+        urgency = np.ones(count, dtype=np.float64)
+        dated = ordinals[has_date]
+        if dated.size == 0:
+            return urgency
+
+        min_ordinal = dated.min()
+        max_ordinal = dated.max()
+        if min_ordinal == max_ordinal:
+            urgency[has_date] = 3.0
+        else:
+            urgency[has_date] = 3.0 - ((dated - min_ordinal) / (max_ordinal - min_ordinal)) * 2.0
+        return urgency
+
+    dated = [d for d in due_ordinals if d is not None]
+    if not dated:
+        return [1.0] * len(due_ordinals)
+
+    min_ordinal = min(dated)
+    max_ordinal = max(dated)
+    if min_ordinal == max_ordinal:
+        return [3.0 if d is not None else 1.0 for d in due_ordinals]
+
+    span = max_ordinal - min_ordinal
+    return [
+        3.0 - ((d - min_ordinal) / span) * 2.0 if d is not None else 1.0
+        for d in due_ordinals
+    ]
+
+
+def calculate_effective_priority_array(base_priorities: Sequence[int], elo_ratings: Sequence[float]):
+    """
+    Calculate effective priority for columns of base priorities and Elo ratings.
+
+    Vectorized form of elo_to_effective_priority().
+
+    Args:
+        base_priorities: Base priority of each task (1, 2 or 3)
+        elo_ratings: Elo rating of each task
+
+    Returns:
+        Effective priorities in input order (NumPy array if available, else list)
+
+    Raises:
+        ValueError: If any base_priority is not 1, 2, or 3
+    """
+    if np is not None:
+        bases = np.asarray(base_priorities, dtype=np.int64)
+        invalid = (bases < 1) | (bases > 3)
+        if invalid.any():
+            bad = base_priorities[int(np.argmax(invalid))]
+            raise ValueError(f"Invalid base_priority: {bad}. Must be 1, 2, or 3.")
+
+        clamped = np.clip(np.asarray(elo_ratings, dtype=np.float64), ELO_MIN, ELO_MAX)
+        return (bases - 1) + (clamped - ELO_MIN) / (ELO_MAX - ELO_MIN)
+
+    effective = []
+    for base, elo in zip(base_priorities, elo_ratings):
+        if base not in (1, 2, 3):
+            raise ValueError(f"Invalid base_priority: {base}. Must be 1, 2, or 3.")
+        clamped = max(ELO_MIN, min(ELO_MAX, elo))
+        effective.append((base - 1) + (clamped - ELO_MIN) / (ELO_MAX - ELO_MIN))
+    return effective
+
+
+def calculate_score_arrays(
+    base_priorities: Sequence[int],
+    elo_ratings: Sequence[float],
+    due_ordinals: Sequence[Optional[int]]
+) -> Tuple[Sequence[float], Sequence[float]]:
+    """
+    Calculate urgency and importance for columns of task attributes in one pass.
+
+    All three sequences must have the same length and describe the same tasks
+    in the same order. Urgency is normalized across all given tasks.
+
+    Args:
+        base_priorities: Base priority of each task (1, 2 or 3)
+        elo_ratings: Elo rating of each task
+        due_ordinals: date.toordinal() of each due date, or None for no due date
+
+    Returns:
+        Tuple of (urgency, importance) sequences in input order
+        (NumPy arrays if available, else lists)
 
-    urgency_scores = {}
+    Raises:
+        ValueError: If any base_priority is not 1, 2, or 3
+    """
+    urgency = calculate_urgency_array(due_ordinals)
+    effective = calculate_effective_priority_array(base_priorities, elo_ratings)
 
-    # Separate tasks with and without due dates
-    tasks_with_dates = [t for t in tasks if t.due_date is not None]
-    tasks_without_dates = [t for t in tasks if t.due_date is None]
+    if np is not None:
+        return urgency, effective * urgency
 
-    # Tasks without due dates get lowest urgency
-    for task in tasks_without_dates:
-        if task.id is not None:
-            urgency_scores[task.id] = 1.0
+    return urgency, [p * u for p, u in zip(effective, urgency)]
 
-    # If no tasks have due dates, we're done
-    if not tasks_with_dates:
-        return urgency_scores
 
-    # Calculate days remaining for all tasks with due dates
-    days_remaining_list = []
-    for task in tasks_with_dates:
-        days = (task.due_date - today).days  # type: ignore
-        days_remaining_list.append((task, days))
+def calculate_task_scores(tasks: List[Task]) -> Tuple[List[float], List[float]]:
+    """
+    Calculate urgency and importance for a list of tasks, by position.
 
-    # If only one task has a due date, it gets max urgency
-    if len(days_remaining_list) == 1:
-        task, _ = days_remaining_list[0]
-        if task.id is not None:
-            urgency_scores[task.id] = 3.0
-        return urgency_scores
+    Unlike the dict-returning helpers, tasks without an id are scored too.
 
-    # Find min and max days remaining
-    min_days = min(days for _, days in days_remaining_list)
-    max_days = max(days for _, days in days_remaining_list)
+    Args:
+        tasks: List of tasks to score (urgency is normalized across all of them)
 
-    # If all tasks have same due date
-    if min_days == max_days:
-        for task, _ in days_remaining_list:
-            if task.id is not None:
-                urgency_scores[task.id] = 3.0
-        return urgency_scores
+    Returns:
+        Tuple of (urgency, importance) lists aligned with tasks
+    """
+    base_priorities = [t.base_priority for t in tasks]
+    elo_ratings = [t.elo_rating for t in tasks]
+    due_ordinals = [t.due_date.toordinal() if t.due_date is not None else None for t in tasks]
+
+    urgency, importance = calculate_score_arrays(base_priorities, elo_ratings, due_ordinals)
+    return _to_list(urgency), _to_list(importance)
 
-    # Normalize: earliest (lowest days) = 3.0, latest (highest days) = 1.0
-    for task, days in days_remaining_list:
-        if task.id is not None:
-            # Linear interpolation from [min_days, max_days] to [3.0, 1.0]
-            normalized = 3.0 - ((days - min_days) / (max_days - min_days)) * 2.0
-            urgency_scores[task.id] = normalized
 
-    return urgency_scores
+def _to_list(values) -> List[float]:
+    """Convert a score array to a plain list of floats."""
+    if np is not None and isinstance(values, np.ndarray):
+        return values.tolist()
+    return list(values)
 
 
 def calculate_effective_priority(task: Task) -> float:
@@ -202,17 +313,13 @@ def calculate_importance_for_tasks(tasks: List[Task], today: Optional[date] = No
     Returns:
         Dictionary mapping task.id to importance score
     """
-    # First calculate urgency for all tasks (requires normalization)
-    urgency_scores = calculate_urgency_for_tasks(tasks, today)
-
-    # Then calculate importance
-    importance_scores = {}
-    for task in tasks:
-        if task.id is not None:
-            urgency = urgency_scores.get(task.id, 1.0)
-            importance_scores[task.id] = calculate_importance(task, urgency)
+    _, importance = calculate_task_scores(tasks)
 
-    return importance_scores
+    return {
+        task.id: score
+        for task, score in zip(tasks, importance)
+        if task.id is not None
+    }
 
 
 def get_task_score_breakdown(task: Task, urgency: float) -> dict:
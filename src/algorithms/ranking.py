@@ -7,17 +7,71 @@ This module handles:
 - Filtering tasks eligible for Focus Mode
 """
 
+from collections import defaultdict
 from datetime import date
-from typing import List, Optional, Tuple, Set
+from typing import Dict, Iterable, List, Optional, Tuple, Set
 from ..models.task import Task
 from ..models.enums import TaskState
-from .priority import calculate_importance_for_tasks
+from .priority import calculate_task_scores
 
 
 # Epsilon for floating-point comparison (tasks within this range are "tied")
 IMPORTANCE_EPSILON = 0.01
 
 
+def is_actionable(
+    task: Task,
+    today: date,
+    context_filter: Optional[int] = None,
+    tag_filters: Optional[Set[int]] = None
+) -> bool:
+    """
+    Check whether a single task should appear in Focus Mode.
+
+    See get_actionable_tasks() for the rules.
+
+    Args:
+        task: Task to check
+        today: Reference date for the start_date rule
+        context_filter: Optional context ID to filter by, or 'NONE' for tasks with no context
+        tag_filters: Optional set of tag IDs to filter by (OR condition)
+
+    Returns:
+        True if the task is eligible for Focus Mode
+    """
+    # Must be active
+    if task.state != TaskState.ACTIVE:
+        return False
+
+    # Must not be blocked
+    if task.is_blocked():
+        return False
+
+    # If it has a start_date in the future, skip it
+    # (These should be in DEFERRED state, but double-check)
+    if task.start_date is not None and task.start_date > today:
+        return False
+
+    # Apply context filter (single selection)
+    if context_filter is not None:
+        if context_filter == "NONE":
+            # Filter for tasks with no context
+            if task.context_id is not None:
+                return False
+        else:
+            # Filter for tasks with specific context
+            if task.context_id != context_filter:
+                return False
+
+    # Apply tag filters (multiple selection with OR condition)
+    if tag_filters:
+        # Task must have at least one of the filtered tags
+        if not task.project_tags or not any(tag_id in tag_filters for tag_id in task.project_tags):
+            return False
+
+    return True
+
+
 def get_actionable_tasks(
     tasks: List[Task],
     context_filter: Optional[int] = None,
@@ -41,43 +95,8 @@ def get_actionable_tasks(
     Returns:
         List of tasks eligible for Focus Mode
     """
-    actionable = []
     today = date.today()
-
-    for task in tasks:
-        # Must be active
-        if task.state != TaskState.ACTIVE:
-            continue
-
-        # Must not be blocked
-        if task.is_blocked():
-            continue
-
-        # If it has a start_date in the future, skip it
-        # (These should be in DEFERRED state, but double-check)
-        if task.start_date is not None and task.start_date > today:
-            continue
-
-        # Apply context filter (single selection)
-        if context_filter is not None:
-            if context_filter == "NONE":
-                # Filter for tasks with no context
-                if task.context_id is not None:
-                    continue
-            else:
-                # Filter for tasks with specific context
-                if task.context_id != context_filter:
-                    continue
-
-        # Apply tag filters (multiple selection with OR condition)
-        if tag_filters:
-            # Task must have at least one of the filtered tags
-            if not task.project_tags or not any(tag_id in tag_filters for tag_id in task.project_tags):
-                continue
-
-        actionable.append(task)
-
-    return actionable
+    return [task for task in tasks if is_actionable(task, today, context_filter, tag_filters)]
 
 
 def rank_tasks(tasks: List[Task], today: Optional[date] = None) -> List[Tuple[Task, float]]:
@@ -94,15 +113,15 @@ def rank_tasks(tasks: List[Task], today: Optional[date] = None) -> List[Tuple[Ta
     if not tasks:
         return []
 
-    # Calculate importance for all tasks
-    importance_scores = calculate_importance_for_tasks(tasks, today)
+    # Score all tasks in one vectorized pass (urgency normalized across all of them)
+    _, importance = calculate_task_scores(tasks)
 
     # Create list of (task, score) tuples
-    ranked = []
-    for task in tasks:
-        if task.id is not None:
-            score = importance_scores.get(task.id, 0.0)
-            ranked.append((task, score))
+    ranked = [
+        (task, score)
+        for task, score in zip(tasks, importance)
+        if task.id is not None
+    ]
 
     # Sort by importance descending
     ranked.sort(key=lambda x: x[1], reverse=True)
@@ -110,6 +129,33 @@ def rank_tasks(tasks: List[Task], today: Optional[date] = None) -> List[Tuple[Ta
     return ranked
 
 
+def _rank_actionable_tasks(
+    tasks: List[Task],
+    actionable: List[Task]
+) -> List[Tuple[Task, float]]:
+    """
+    Rank actionable tasks with urgency normalized across ALL active tasks.
+
+    Args:
+        tasks: List of all tasks (active ones are used for normalization)
+        actionable: Subset of tasks eligible for Focus Mode
+
+    Returns:
+        List of (task, importance_score) tuples, sorted highest to lowest
+    """
+    active_tasks = [t for t in tasks if t.state == TaskState.ACTIVE]
+    _, importance = calculate_task_scores(active_tasks)
+    importance_scores = {
+        task.id: score
+        for task, score in zip(active_tasks, importance)
+        if task.id is not None
+    }
+
+    ranked = [(task, importance_scores.get(task.id, 0.0)) for task in actionable if task.id is not None]
+    ranked.sort(key=lambda x: x[1], reverse=True)
+    return ranked
+
+
 def get_top_ranked_tasks(tasks: List[Task], today: Optional[date] = None) -> List[Task]:
     """
     Get all tasks tied for highest importance score.
@@ -144,6 +190,143 @@ def get_top_ranked_tasks(tasks: List[Task], today: Optional[date] = None) -> Lis
     return top_tasks
 
 
+def take_top_tied(ranked: Iterable[Tuple[Task, float]]) -> List[Task]:
+    """
+    Collect the tasks tied for the top score.
+
+    Args:
+        ranked: (task, importance_score) pairs sorted highest to lowest; may be
+            a lazy iterator, which is only consumed up to the first task
+            outside the tie
+
+    Returns:
+        Tasks within IMPORTANCE_EPSILON of the top score (empty if none)
+    """
+    top_tasks = []
+    top_score = None
+    for task, score in ranked:
+        if top_score is None:
+            top_score = score
+        elif abs(score - top_score) > IMPORTANCE_EPSILON:
+            break
+        top_tasks.append(task)
+    return top_tasks
+
+
+def _group_by_priority(top_tasks: List[Task]) -> Dict[int, List[Task]]:
+    """Group tied tasks by base_priority, keeping their rank order."""
+    by_priority = defaultdict(list)
+    for task in top_tasks:
+        by_priority[task.base_priority].append(task)
+    return by_priority
+
+
+def break_ties_by_unblock_count(
+    top_tasks: List[Task],
+    unblock_counts: Optional[Dict[int, int]] = None
+) -> List[Task]:
+    """
+    Settle ties within a priority tier in favor of the task unblocking the most work.
+
+    In every base_priority tier with 2+ tied tasks, if one task unblocks
+    strictly more tasks than each of the others, the others are dropped.
+    Tiers where the top unblock count is shared are left for comparison.
+
+    Args:
+        top_tasks: Tasks tied for the top score, in rank order
+        unblock_counts: Map of task_id -> number of tasks unblocked by
+            completing it (see algorithms.dependency_analysis); None disables
+            the tiebreaker
+
+    Returns:
+        Remaining tied tasks, in rank order
+    """
+    if not unblock_counts or len(top_tasks) < 2:
+        return top_tasks
+
+    dropped: Set[int] = set()
+    for tier in _group_by_priority(top_tasks).values():
+        if len(tier) < 2:
+            continue
+        counts = sorted((unblock_counts.get(task.id, 0) for task in tier), reverse=True)
+        if counts[0] > counts[1]:
+            best = max(tier, key=lambda task: unblock_counts.get(task.id, 0))
+            dropped.update(task.id for task in tier if task is not best)
+
+    return [task for task in top_tasks if task.id not in dropped]
+
+
+def resolve_focus_task(
+    top_tasks: List[Task],
+    unblock_counts: Optional[Dict[int, int]] = None
+) -> Optional[Task]:
+    """
+    Pick the Focus Mode task from the tasks tied for the top score.
+
+    Uses base_priority as tiebreaker for cross-tier ties, and optionally the
+    number of tasks each tied task unblocks for ties within a tier.
+
+    Args:
+        top_tasks: Tasks tied for the top score, in rank order
+        unblock_counts: Optional map of task_id -> unblock count
+
+    Returns:
+        Single task to focus on, or None if there is no task or a tie within
+        one priority tier requires comparison
+    """
+    top_tasks = break_ties_by_unblock_count(top_tasks, unblock_counts)
+    if not top_tasks:
+        return None
+
+    # If exactly one task is on top, return it
+    if len(top_tasks) == 1:
+        return top_tasks[0]
+
+    # Multiple tasks tied - check if they're in the same base_priority tier
+    by_priority = _group_by_priority(top_tasks)
+
+    # Check if any priority tier has 2+ tied tasks (requires comparison)
+    for priority in [3, 2, 1]:  # High, Medium, Low
+        if len(by_priority[priority]) >= 2:
+            # Multiple tasks in same tier → need comparison
+            return None
+
+    # Tasks tied across different tiers → pick the one with highest importance
+    # Already have them ranked, so return the first one
+    return top_tasks[0]
+
+
+def select_tied_tier(
+    top_tasks: List[Task],
+    unblock_counts: Optional[Dict[int, int]] = None
+) -> List[Task]:
+    """
+    Pick the tasks that need a comparison from the tasks tied for the top score.
+
+    Args:
+        top_tasks: Tasks tied for the top score, in rank order
+        unblock_counts: Optional map of task_id -> unblock count used to
+            settle ties before asking for a comparison
+
+    Returns:
+        Tied tasks from the highest base_priority tier with 2+ tasks (empty if none)
+    """
+    top_tasks = break_ties_by_unblock_count(top_tasks, unblock_counts)
+    if len(top_tasks) < 2:
+        return []
+
+    by_priority = _group_by_priority(top_tasks)
+
+    # Return the highest priority tier with 2+ tasks
+    # This ensures we compare within tiers, respecting the priority band system
+    for priority in [3, 2, 1]:  # High, Medium, Low
+        if len(by_priority[priority]) >= 2:
+            return by_priority[priority]
+
+    # No tier has 2+ tied tasks (tasks from different tiers, no comparison needed)
+    return []
+
+
 def get_next_focus_task(
     tasks: List[Task],
     today: Optional[date] = None,
@@ -178,44 +361,9 @@ def get_next_focus_task(
     # Calculate importance using ALL active tasks for urgency normalization
     # This ensures consistency with Task List and prevents ranking changes
     # when tasks are blocked/unblocked
-    from ..models.enums import TaskState
-    active_tasks = [t for t in tasks if t.state == TaskState.ACTIVE]
-    importance_scores = calculate_importance_for_tasks(active_tasks, today)
+    ranked = _rank_actionable_tasks(tasks, actionable)
 
-    # Rank actionable tasks using the consistent importance scores
-    ranked = [(task, importance_scores.get(task.id, 0.0)) for task in actionable if task.id is not None]
-    ranked.sort(key=lambda x: x[1], reverse=True)
-
-    if not ranked:
-        return None
-
-    # Get top score and find all tasks within epsilon
-    top_score = ranked[0][1]
-    top_tasks = [task for task, score in ranked if abs(score - top_score) <= IMPORTANCE_EPSILON]
-
-    if not top_tasks:
-        return None
-
-    # If exactly one task is on top, return it
-    if len(top_tasks) == 1:
-        return top_tasks[0]
-
-    # Multiple tasks tied - check if they're in the same base_priority tier
-    # Group tied tasks by base_priority
-    from collections import defaultdict
-    by_priority = defaultdict(list)
-    for task in top_tasks:
-        by_priority[task.base_priority].append(task)
-
-    # Check if any priority tier has 2+ tied tasks (requires comparison)
-    for priority in [3, 2, 1]:  # High, Medium, Low
-        if len(by_priority[priority]) >= 2:
-            # Multiple tasks in same tier → need comparison
-            return None
-
-    # Tasks tied across different tiers → pick the one with highest importance
-    # Already have them ranked, so return the first one
-    return top_tasks[0]
+    return resolve_focus_task(take_top_tied(ranked))
 
 
 def get_tied_tasks(
@@ -253,38 +401,9 @@ def get_tied_tasks(
 
     # Calculate importance using ALL active tasks for urgency normalization
     # This ensures consistency with Task List and Focus Mode
-    from ..models.enums import TaskState
-    active_tasks = [t for t in tasks if t.state == TaskState.ACTIVE]
-    importance_scores = calculate_importance_for_tasks(active_tasks, today)
+    ranked = _rank_actionable_tasks(tasks, actionable)
 
-    # Rank actionable tasks using the consistent importance scores
-    ranked = [(task, importance_scores.get(task.id, 0.0)) for task in actionable if task.id is not None]
-    ranked.sort(key=lambda x: x[1], reverse=True)
-
-    if not ranked:
-        return []
-
-    # Get top score and find all tasks within epsilon
-    top_score = ranked[0][1]
-    top_tasks = [task for task, score in ranked if abs(score - top_score) <= IMPORTANCE_EPSILON]
-
-    if len(top_tasks) < 2:
-        return []
-
-    # Group tied tasks by base_priority
-    from collections import defaultdict
-    by_priority = defaultdict(list)
-    for task in top_tasks:
-        by_priority[task.base_priority].append(task)
-
-    # Return the highest priority tier with 2+ tasks
-    # This ensures we compare within tiers, respecting the priority band system
-    for priority in [3, 2, 1]:  # High, Medium, Low
-        if len(by_priority[priority]) >= 2:
-            return by_priority[priority]
-
-    # No tier has 2+ tied tasks (tasks from different tiers, no comparison needed)
-    return []
+    return select_tied_tier(take_top_tied(ranked))
 
 
 def has_tied_tasks(
@@ -5,6 +5,9 @@ Defines the interface for all undoable commands in OneTaskAtATime.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+
+from src.database.transaction import transaction
 
 
 class Command(ABC):
@@ -13,6 +16,10 @@ class Command(ABC):
 
     All commands that support undo/redo must inherit from this class
     and implement the execute(), undo(), and get_description() methods.
+
+    Commands that write through a task_dao run inside a unit of work on its
+    connection (see transaction()), so every DAO write of one execute() or
+    undo() is committed once, or not at all.
     """
 
     @abstractmethod
@@ -44,3 +51,19 @@ class Command(ABC):
             Description string (e.g., 'Complete task: Buy groceries')
         """
         pass
+
+    def transaction(self):
+        """
+        Open a unit of work on the command's database connection.
+
+        UndoManager wraps execute() and undo() in this scope; implementations
+        may also open it themselves (scopes nest through savepoints).
+
+        Returns:
+            Transaction context manager, or a no-op context if the command
+            has no task_dao
+        """
+        task_dao = getattr(self, 'task_dao', None)
+        if task_dao is None:
+            return nullcontext()
+        return transaction(task_dao.db)
@@ -6,6 +6,7 @@ import copy
 from src.commands.base_command import Command
 from src.models.task import Task
 from src.database.task_dao import TaskDAO
+from src.database.transaction import commit
 
 
 class DeleteTaskCommand(Command):
@@ -83,7 +84,7 @@ class DeleteTaskCommand(Command):
             if task.project_tags:
                 self.task_dao._add_project_tags(task.id, task.project_tags)
 
-            self.task_dao.db.commit()
+            commit(self.task_dao.db)
             return True
 
         except Exception as e:
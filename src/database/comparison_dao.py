@@ -7,6 +7,7 @@ Handles database operations for task comparison history.
 import sqlite3
 from datetime import datetime
 from typing import List, Tuple
+from .transaction import commit
 
 
 class ComparisonDAO:
@@ -41,7 +42,7 @@ class ComparisonDAO:
             """,
             (winner_id, loser_id, adjustment_amount, datetime.now().isoformat())
         )
-        self.db.commit()
+        commit(self.db)
         return cursor.lastrowid
 
     def get_comparison_history(self, task_id: int) -> List[Tuple[int, str, float, str]]:
@@ -129,5 +130,5 @@ class ComparisonDAO:
             """,
             (task_id, task_id)
         )
-        self.db.commit()
+        commit(self.db)
         return cursor.rowcount
@@ -2,14 +2,53 @@
 Database Connection Module
 
 Provides singleton SQLite database connection management for OneTaskAtATime.
+
+The primary connection is used by the UI thread. Background threads (the
+APScheduler jobs) get their own per-thread connections so they can read while
+the UI writes; the database runs in WAL mode to make that possible.
 """
 
 import sqlite3
 import os
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from .schema import DatabaseSchema
+from .settings_dao import SettingsDAO
+
+
+class ThreadBoundConnection:
+    """
+    sqlite3.Connection stand-in that routes each call to the calling thread's connection.
+
+    DAOs built on top of this object behave exactly as with a plain connection
+    on the UI thread, while calls made from worker threads transparently use
+    a dedicated connection for that thread.
+    """
+
+    def __init__(self, manager: 'DatabaseConnection', read_only: bool = False):
+        """
+        Initialize the proxy.
+
+        Args:
+            manager: DatabaseConnection that owns the underlying connections
+            read_only: Whether worker threads should get read-only connections
+        """
+        self._manager = manager
+        self._read_only = read_only
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection.
+
+        Returns:
+            sqlite3.Connection used by the current thread
+        """
+        return self._manager.get_thread_connection(self._read_only)
+
+    def __getattr__(self, name):
+        return getattr(self.get_connection(), name)
 
 
 class DatabaseConnection:
@@ -23,6 +62,15 @@ class DatabaseConnection:
     _connection: Optional[sqlite3.Connection] = None
     _current_db_path: Optional[Path] = None
 
+    # Milliseconds a connection waits on a locked database before failing
+    BUSY_TIMEOUT_MS = 5000
+
+    # Per-thread connections for background workers
+    _thread_local = threading.local()
+    _thread_connections: List[sqlite3.Connection] = []
+    _thread_lock = threading.Lock()
+    _thread_generation = 0  # Bumped whenever per-thread connections are closed
+
     def __new__(cls, custom_path: Optional[str] = None):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -46,7 +94,8 @@ class DatabaseConnection:
         - When running from source: project's resources directory
         - Or uses custom path if provided
 
-        Enables foreign key constraints for referential integrity.
+        Enables foreign key constraints for referential integrity and WAL
+        journaling so background readers do not block the UI writer.
 
         Args:
             custom_path: Optional custom database file path
@@ -74,29 +123,21 @@ class DatabaseConnection:
             db_path = data_dir / "onetaskatatime.db"
 
         # Connect to database
-        self._connection = sqlite3.connect(
-            str(db_path),
-            check_same_thread=False  # Allow usage across threads
-        )
+        self._connection = self.open_connection(str(db_path))
 
         # Store current database path
         self._current_db_path = db_path
 
-        # Enable foreign key constraints
-        self._connection.execute("PRAGMA foreign_keys = ON")
-
-        # Use Row factory for dict-like access
-        self._connection.row_factory = sqlite3.Row
+        # Let background connections read while the UI thread writes
+        self._connection.execute("PRAGMA journal_mode = WAL")
 
         print(f"Database connected: {db_path}")
 
-        # Initialize database schema if needed
-        DatabaseSchema.initialize_database(self._connection)
+        # Initialize or migrate the schema (a single version check when current)
+        DatabaseSchema.run_migrations(self._connection)
 
-        # Run migrations
-        DatabaseSchema.migrate_to_elo_system(self._connection)
-        DatabaseSchema.migrate_to_recurring_tasks(self._connection)
-        DatabaseSchema.migrate_to_notification_system(self._connection)
+        # Cached settings may belong to a previous database
+        SettingsDAO.invalidate_cache()
 
     def get_connection(self) -> sqlite3.Connection:
         """
@@ -109,8 +150,103 @@ class DatabaseConnection:
             self._connect()
         return self._connection
 
+    @classmethod
+    def open_connection(cls, database: str, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a configured SQLite connection.
+
+        Also used by background jobs that need a connection of their own to
+        the database in use.
+
+        Args:
+            database: Database file path
+            read_only: Open the file in read-only mode
+
+        Returns:
+            sqlite3.Connection with foreign keys, busy timeout and Row factory set
+        """
+        if read_only:
+            connection = sqlite3.connect(
+                Path(database).resolve().as_uri() + "?mode=ro",
+                uri=True,
+                check_same_thread=False  # Closed from the UI thread on shutdown
+            )
+        else:
+            connection = sqlite3.connect(
+                database,
+                check_same_thread=False  # Allow usage across threads
+            )
+
+        # Enable foreign key constraints
+        connection.execute("PRAGMA foreign_keys = ON")
+
+        # Wait for competing writers instead of failing immediately
+        connection.execute(f"PRAGMA busy_timeout = {cls.BUSY_TIMEOUT_MS}")
+
+        # Use Row factory for dict-like access
+        connection.row_factory = sqlite3.Row
+
+        return connection
+
+    def get_thread_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Get the connection belonging to the calling thread.
+
+        The main thread always receives the primary connection. Other threads
+        lazily receive their own connection to the same database file (one
+        read-write and one read-only per thread), which are closed together
+        with the primary connection.
+
+        Args:
+            read_only: Return the thread's read-only connection
+
+        Returns:
+            sqlite3.Connection for the current thread
+        """
+        primary = self.get_connection()
+        if (threading.current_thread() is threading.main_thread()
+                or self._current_db_path is None
+                or str(self._current_db_path) == ":memory:"):
+            return primary
+
+        attr = 'read_only' if read_only else 'read_write'
+        cached = getattr(self._thread_local, attr, None)
+        if cached is not None and cached[0] == DatabaseConnection._thread_generation:
+            return cached[1]
+
+        connection = self.open_connection(str(self._current_db_path), read_only=read_only)
+        with self._thread_lock:
+            self._thread_connections.append(connection)
+            setattr(self._thread_local, attr, (DatabaseConnection._thread_generation, connection))
+        return connection
+
+    def thread_bound(self, read_only: bool = False) -> ThreadBoundConnection:
+        """
+        Get a connection proxy for services that run jobs on worker threads.
+
+        Args:
+            read_only: Give worker threads read-only connections
+
+        Returns:
+            ThreadBoundConnection usable anywhere a sqlite3.Connection is expected
+        """
+        return ThreadBoundConnection(self, read_only=read_only)
+
+    def _close_thread_connections(self):
+        """Close every per-thread connection handed out so far."""
+        with self._thread_lock:
+            connections = list(self._thread_connections)
+            self._thread_connections.clear()
+            DatabaseConnection._thread_generation += 1
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+
     def close(self):
         """Close the database connection."""
+        self._close_thread_connections()
         if self._connection:
             self._connection.close()
             self._connection = None
@@ -199,7 +335,8 @@ class DatabaseConnection:
         if not is_valid:
             return (False, f"Invalid database: {error_msg}")
 
-        # Close current connection
+        # Close current connections
+        self._close_thread_connections()
         if self._connection:
             self._connection.close()
             self._connection = None
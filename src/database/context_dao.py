@@ -8,6 +8,7 @@ import sqlite3
 from datetime import datetime
 from typing import List, Optional
 from ..models import Context
+from .transaction import commit
 
 
 class ContextDAO:
@@ -54,7 +55,7 @@ class ContextDAO:
         context.created_at = now
         context.updated_at = now
 
-        self.db.commit()
+        commit(self.db)
         return context
 
     def get_by_id(self, context_id: int) -> Optional[Context]:
@@ -144,7 +145,7 @@ class ContextDAO:
         )
 
         context.updated_at = now
-        self.db.commit()
+        commit(self.db)
         return context
 
     def delete(self, context_id: int) -> bool:
@@ -162,7 +163,7 @@ class ContextDAO:
         """
         cursor = self.db.cursor()
         cursor.execute("DELETE FROM contexts WHERE id = ?", (context_id,))
-        self.db.commit()
+        commit(self.db)
         return cursor.rowcount > 0
 
     def _row_to_context(self, row: sqlite3.Row) -> Context:
@@ -2,17 +2,32 @@
 Dependency Data Access Object for OneTaskAtATime application.
 
 Handles all database operations for task dependencies.
+
+Cycle checks and transitive blocker queries use an in-memory DependencyGraph
+per connection, shared by every DependencyDAO instance. It is loaded with a
+single query and reloaded whenever the dependencies table no longer matches
+it (checked through its row count and highest id, which change on every
+insert or delete by any writer, since ids are never reused).
 """
 
 import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from ..models import Dependency
+from ..algorithms.dependency_graph import DependencyGraph
+from .transaction import commit
 
 
 class DependencyDAO:
     """Data Access Object for Dependency operations."""
 
+    # Dependency graphs per connection: connection -> ((row count, max id), graph)
+    MAX_CACHED_CONNECTIONS = 16
+    _graphs: "OrderedDict[Any, Tuple[Tuple[int, int], DependencyGraph]]" = OrderedDict()
+    _lock = threading.Lock()
+
     def __init__(self, db_connection: sqlite3.Connection):
         """
         Initialize DependencyDAO with database connection.
@@ -64,17 +79,17 @@ class DependencyDAO:
         if dependency.id is not None:
             raise ValueError("Cannot create dependency that already has an id")
 
+        graph = self.get_graph()
+
         # Check for duplicate dependency
-        existing_deps = self.get_dependencies_for_task(dependency.blocked_task_id)
-        for existing_dep in existing_deps:
-            if existing_dep.blocking_task_id == dependency.blocking_task_id:
-                raise ValueError(
-                    f"Dependency already exists: task {dependency.blocked_task_id} "
-                    f"is already blocked by task {dependency.blocking_task_id}"
-                )
+        if (dependency.blocked_task_id, dependency.blocking_task_id) in graph:
+            raise ValueError(
+                f"Dependency already exists: task {dependency.blocked_task_id} "
+                f"is already blocked by task {dependency.blocking_task_id}"
+            )
 
         # Check for circular dependencies
-        if self._would_create_cycle(dependency.blocked_task_id, dependency.blocking_task_id):
+        if graph.would_create_cycle(dependency.blocked_task_id, dependency.blocking_task_id):
             raise ValueError(
                 f"Cannot create dependency: would create circular dependency between "
                 f"tasks {dependency.blocked_task_id} and {dependency.blocking_task_id}"
@@ -94,7 +109,8 @@ class DependencyDAO:
         dependency.id = cursor.lastrowid
         dependency.created_at = now
 
-        self.db.commit()
+        commit(self.db)
+        self._record_insert(dependency)
         return dependency
 
     def get_by_id(self, dependency_id: int) -> Optional[Dependency]:
@@ -178,6 +194,77 @@ class DependencyDAO:
 
         return [self._row_to_dependency(row) for row in cursor.fetchall()]
 
+    def get_blocker_map(self) -> Dict[int, List[Tuple[int, Optional[str]]]]:
+        """
+        Get the full blocked -> blockers adjacency map in a single query.
+
+        Intended for views that need dependency information for many tasks
+        at once, instead of querying dependencies task by task.
+
+        Returns:
+            Dict mapping blocked task ID to a list of (blocking_task_id, title)
+            tuples in dependency creation order. Title is None if the blocking
+            task no longer exists.
+        """
+        cursor = self.db.cursor()
+        cursor.execute(
+            """
+            SELECT d.blocked_task_id, d.blocking_task_id, t.title
+            FROM dependencies d
+            LEFT JOIN tasks t ON t.id = d.blocking_task_id
+            ORDER BY d.id
+            """
+        )
+
+        blocker_map: Dict[int, List[Tuple[int, Optional[str]]]] = {}
+        for row in cursor.fetchall():
+            blocker_map.setdefault(row[0], []).append((row[1], row[2]))
+        return blocker_map
+
+    def get_dependent_task_ids(self, task_ids: List[int]) -> Set[int]:
+        """
+        Get IDs of tasks directly blocked by any of the given tasks.
+
+        Args:
+            task_ids: IDs of blocking tasks
+
+        Returns:
+            Set of blocked task IDs
+        """
+        ids = list(task_ids)
+        dependents: Set[int] = set()
+        cursor = self.db.cursor()
+
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(ids), 900):
+            chunk = ids[start:start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT blocked_task_id FROM dependencies WHERE blocking_task_id IN ({placeholders})",
+                chunk
+            )
+            dependents.update(row[0] for row in cursor.fetchall())
+
+        return dependents
+
+    def get_completed_task_ids(self) -> Set[int]:
+        """
+        Get IDs of completed tasks that take part in any dependency.
+
+        Returns:
+            Set of completed task IDs that block or are blocked by another task
+        """
+        cursor = self.db.cursor()
+        cursor.execute(
+            """
+            SELECT id FROM tasks
+            WHERE state = 'completed'
+            AND (id IN (SELECT blocking_task_id FROM dependencies)
+                 OR id IN (SELECT blocked_task_id FROM dependencies))
+            """
+        )
+        return {row[0] for row in cursor.fetchall()}
+
     def delete(self, dependency_id: int) -> bool:
         """
         Delete a dependency from the database.
@@ -190,7 +277,7 @@ class DependencyDAO:
         """
         cursor = self.db.cursor()
         cursor.execute("DELETE FROM dependencies WHERE id = ?", (dependency_id,))
-        self.db.commit()
+        commit(self.db)
         return cursor.rowcount > 0
 
     def delete_by_tasks(self, blocked_task_id: int, blocking_task_id: int) -> bool:
@@ -209,60 +296,95 @@ class DependencyDAO:
             "DELETE FROM dependencies WHERE blocked_task_id = ? AND blocking_task_id = ?",
             (blocked_task_id, blocking_task_id)
         )
-        self.db.commit()
+        commit(self.db)
         return cursor.rowcount > 0
 
-    def _would_create_cycle(self, blocked_task_id: int, blocking_task_id: int) -> bool:
+    def get_graph(self) -> DependencyGraph:
         """
-        Check if adding a dependency would create a circular dependency.
+        Get the dependency graph of this connection, reloading it if stale.
+
+        Returns:
+            DependencyGraph matching the dependencies table
+        """
+        fingerprint = self._fingerprint()
+        with DependencyDAO._lock:
+            entry = DependencyDAO._graphs.get(self.db)
+            if entry is not None and entry[0] == fingerprint:
+                DependencyDAO._graphs.move_to_end(self.db)
+                return entry[1]
+
+        cursor = self.db.cursor()
+        cursor.execute("SELECT blocked_task_id, blocking_task_id FROM dependencies")
+        graph = DependencyGraph((row[0], row[1]) for row in cursor.fetchall())
+
+        with DependencyDAO._lock:
+            DependencyDAO._graphs[self.db] = (fingerprint, graph)
+            DependencyDAO._graphs.move_to_end(self.db)
+            while len(DependencyDAO._graphs) > DependencyDAO.MAX_CACHED_CONNECTIONS:
+                DependencyDAO._graphs.popitem(last=False)
+        return graph
 
-        Uses depth-first search to detect cycles.
+    def get_transitive_blocker_ids(self, task_id: int) -> Set[int]:
+        """
+        Get IDs of every task blocking a task, directly or indirectly.
 
         Args:
-            blocked_task_id: ID of task that would be blocked
-            blocking_task_id: ID of task that would be blocking
+            task_id: ID of blocked task
 
         Returns:
-            True if cycle would be created, False otherwise
+            Set of blocking task IDs
         """
-        # If blocking_task_id is already blocked by blocked_task_id (directly or indirectly),
-        # then adding this dependency would create a cycle
-        visited: Set[int] = set()
-        return self._has_path(blocking_task_id, blocked_task_id, visited)
+        return set(self.get_graph().get_transitive_blockers(task_id))
 
-    def _has_path(self, from_task: int, to_task: int, visited: Set[int]) -> bool:
+    def get_transitive_dependent_ids(self, task_id: int) -> Set[int]:
         """
-        Check if there's a dependency path from from_task to to_task.
+        Get IDs of every task blocked by a task, directly or indirectly.
 
         Args:
-            from_task: Starting task ID
-            to_task: Target task ID
-            visited: Set of already visited task IDs (prevents infinite loops)
+            task_id: ID of blocking task
 
         Returns:
-            True if path exists, False otherwise
+            Set of blocked task IDs
         """
-        if from_task == to_task:
-            return True
-
-        if from_task in visited:
-            return False
-
-        visited.add(from_task)
+        return set(self.get_graph().get_transitive_dependents(task_id))
 
-        # Get all tasks that from_task is blocked by
-        cursor = self.db.cursor()
-        cursor.execute(
-            "SELECT blocking_task_id FROM dependencies WHERE blocked_task_id = ?",
-            (from_task,)
-        )
+    def _would_create_cycle(self, blocked_task_id: int, blocking_task_id: int) -> bool:
+        """
+        Check if adding a dependency would create a circular dependency.
 
-        for row in cursor.fetchall():
-            blocking_task = row[0]
-            if self._has_path(blocking_task, to_task, visited):
-                return True
+        Args:
+            blocked_task_id: ID of task that would be blocked
+            blocking_task_id: ID of task that would be blocking
 
-        return False
+        Returns:
+            True if cycle would be created, False otherwise
+        """
+        # If blocking_task_id is already blocked by blocked_task_id (directly or indirectly),
+        # then adding this dependency would create a cycle
+        return self.get_graph().would_create_cycle(blocked_task_id, blocking_task_id)
+
+    def _fingerprint(self) -> Tuple[int, int]:
+        """Get (row count, highest id) of the dependencies table."""
+        row = self.db.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM dependencies").fetchone()
+        return row[0], row[1]
+
+    def _record_insert(self, dependency: Dependency) -> None:
+        """Add a dependency this DAO just inserted to the cached graph."""
+        with DependencyDAO._lock:
+            entry = DependencyDAO._graphs.get(self.db)
+        if entry is None:
+            return
+
+        (count, max_id), graph = entry
+        if dependency.id <= max_id:
+            # Graph did not match the table before the insert
+            with DependencyDAO._lock:
+                DependencyDAO._graphs.pop(self.db, None)
+            return
+
+        graph.add(dependency.blocked_task_id, dependency.blocking_task_id)
+        with DependencyDAO._lock:
+            DependencyDAO._graphs[self.db] = ((count + 1, dependency.id), graph)
 
     def _row_to_dependency(self, row: sqlite3.Row) -> Dependency:
         """
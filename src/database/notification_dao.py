@@ -10,6 +10,7 @@ from typing import List, Optional
 import json
 
 from ..models.notification import Notification, NotificationType
+from .transaction import commit
 
 
 class NotificationDAO:
@@ -67,7 +68,7 @@ class NotificationDAO:
         )
 
         notification.id = cursor.lastrowid
-        self.db.commit()
+        commit(self.db)
 
         return notification
 
@@ -172,7 +173,7 @@ class NotificationDAO:
             "UPDATE notifications SET is_read = 1 WHERE id = ?",
             (notification_id,)
         )
-        self.db.commit()
+        commit(self.db)
 
         return cursor.rowcount > 0
 
@@ -191,7 +192,7 @@ class NotificationDAO:
             "UPDATE notifications SET is_read = 0 WHERE id = ?",
             (notification_id,)
         )
-        self.db.commit()
+        commit(self.db)
 
         return cursor.rowcount > 0
 
@@ -204,7 +205,7 @@ class NotificationDAO:
         """
         cursor = self.db.cursor()
         cursor.execute("UPDATE notifications SET is_read = 1 WHERE is_read = 0")
-        self.db.commit()
+        commit(self.db)
 
         return cursor.rowcount
 
@@ -225,7 +226,7 @@ class NotificationDAO:
             "UPDATE notifications SET dismissed_at = ? WHERE id = ?",
             (now.isoformat(), notification_id)
         )
-        self.db.commit()
+        commit(self.db)
 
         return cursor.rowcount > 0
 
@@ -241,7 +242,7 @@ class NotificationDAO:
         """
         cursor = self.db.cursor()
         cursor.execute("DELETE FROM notifications WHERE id = ?", (notification_id,))
-        self.db.commit()
+        commit(self.db)
 
         return cursor.rowcount > 0
 
@@ -264,7 +265,7 @@ class NotificationDAO:
             "DELETE FROM notifications WHERE created_at < ?",
             (cutoff_date.isoformat(),)
         )
-        self.db.commit()
+        commit(self.db)
 
         return cursor.rowcount
 
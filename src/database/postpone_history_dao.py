@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 from ..models.postpone_record import PostponeRecord
 from ..models.enums import PostponeReasonType, ActionTaken
+from .transaction import commit
 
 
 class PostponeHistoryDAO:
@@ -60,7 +61,7 @@ class PostponeHistoryDAO:
         )
 
         record.id = cursor.lastrowid
-        self.db.commit()
+        commit(self.db)
         return record
 
     def get_by_id(self, record_id: int) -> Optional[PostponeRecord]:
@@ -184,7 +185,7 @@ class PostponeHistoryDAO:
             "DELETE FROM postpone_history WHERE task_id = ?",
             (task_id,)
         )
-        self.db.commit()
+        commit(self.db)
         return cursor.rowcount
 
     def get_all(self) -> List[PostponeRecord]:
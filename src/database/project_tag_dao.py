@@ -8,6 +8,7 @@ import sqlite3
 from datetime import datetime
 from typing import List, Optional
 from ..models import ProjectTag
+from .transaction import commit
 
 
 class ProjectTagDAO:
@@ -54,7 +55,7 @@ class ProjectTagDAO:
         tag.created_at = now
         tag.updated_at = now
 
-        self.db.commit()
+        commit(self.db)
         return tag
 
     def get_by_id(self, tag_id: int) -> Optional[ProjectTag]:
@@ -177,7 +178,7 @@ class ProjectTagDAO:
         )
 
         tag.updated_at = now
-        self.db.commit()
+        commit(self.db)
         return tag
 
     def delete(self, tag_id: int) -> bool:
@@ -195,7 +196,7 @@ class ProjectTagDAO:
         """
         cursor = self.db.cursor()
         cursor.execute("DELETE FROM project_tags WHERE id = ?", (tag_id,))
-        self.db.commit()
+        commit(self.db)
         return cursor.rowcount > 0
 
     def _row_to_tag(self, row: sqlite3.Row) -> ProjectTag:
@@ -5,15 +5,15 @@ This module defines all database tables, indexes, and schema management.
 Based on the GTD-inspired task management system with flat structure and tags.
 """
 
-from typing import List
+from typing import Any, Callable, List, Tuple
 import sqlite3
 
 
 class DatabaseSchema:
     """Manages the database schema creation and migrations."""
 
-    # Schema version for migration tracking
-    CURRENT_VERSION = 1
+    # Schema version for migration tracking (version of the last entry in get_migrations())
+    CURRENT_VERSION = 7
 
     @staticmethod
     def get_create_tables_sql() -> List[str]:
@@ -367,7 +367,19 @@ class DatabaseSchema:
 
             # Database settings
             ('custom_database_path', '', 'string',
-             'Path to custom database file (empty for default)')
+             'Path to custom database file (empty for default)'),
+
+            # Automatic snapshots
+            ('snapshot_enabled', 'false', 'boolean',
+             'Take automatic database snapshots'),
+            ('snapshot_interval_hours', '1', 'integer',
+             'Hours between automatic database snapshots'),
+            ('snapshot_keep_hourly', '24', 'integer',
+             'Hours for which the latest snapshot of each hour is kept'),
+            ('snapshot_keep_daily', '7', 'integer',
+             'Days for which the latest snapshot of each day is kept'),
+            ('snapshot_keep_weekly', '4', 'integer',
+             'Weeks for which the latest snapshot of each week is kept')
         ]
 
     @staticmethod
@@ -400,6 +412,185 @@ class DatabaseSchema:
 
         db_connection.commit()
 
+        # Full-text search index over task titles and descriptions
+        DatabaseSchema.create_search_index(db_connection)
+
+        # Trigger-maintained log of task changes
+        DatabaseSchema.create_change_log(db_connection)
+
+        # Trigger-maintained log of deleted history rows
+        DatabaseSchema.create_history_delete_log(db_connection)
+
+    @staticmethod
+    def get_search_index_sql() -> List[str]:
+        """
+        Returns SQL statements that create the tasks_fts index and its sync triggers.
+
+        tasks_fts is an external-content FTS5 table over tasks(title, description);
+        the triggers keep it in step with every insert, delete and title or
+        description update on the tasks table.
+        """
+        return [
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+                title, description,
+                content='tasks', content_rowid='id',
+                tokenize='unicode61'
+            )
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+                INSERT INTO tasks_fts(rowid, title, description)
+                VALUES (new.id, new.title, new.description);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+                INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+                VALUES ('delete', old.id, old.title, old.description);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+                INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+                VALUES ('delete', old.id, old.title, old.description);
+                INSERT INTO tasks_fts(rowid, title, description)
+                VALUES (new.id, new.title, new.description);
+            END
+            """
+        ]
+
+    @staticmethod
+    def create_search_index(db_connection: sqlite3.Connection) -> bool:
+        """
+        Create the full-text search index if it does not exist yet.
+
+        A newly created index is populated from the existing tasks. If the
+        SQLite build lacks FTS5, nothing is created and TaskDAO falls back to
+        LIKE-based search.
+
+        Args:
+            db_connection: Active SQLite database connection
+
+        Returns:
+            True if the index exists after the call, False if FTS5 is unavailable
+        """
+        cursor = db_connection.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'")
+        if cursor.fetchone():
+            return True
+
+        try:
+            for sql in DatabaseSchema.get_search_index_sql():
+                cursor.execute(sql)
+            cursor.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError as e:
+            if "fts5" not in str(e).lower():
+                raise
+            db_connection.rollback()
+            return False
+
+        db_connection.commit()
+        return True
+
+    @staticmethod
+    def get_change_log_sql() -> List[str]:
+        """
+        Returns SQL statements that create the task_changes log and its triggers.
+
+        Every insert, update and delete on tasks appends a row, as do changes
+        to a task's dependencies (logged against the blocked task) and project
+        tags. Readers remember the last seq they processed and only look at
+        newer rows, so in-memory caches can apply changes made by any writer.
+        TaskService.compact_change_log() deletes rows no reader needs.
+        """
+        sql = [
+            """
+            CREATE TABLE IF NOT EXISTS task_changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                task_id INTEGER NOT NULL,
+                operation TEXT NOT NULL CHECK(operation IN ('insert', 'update', 'delete')),
+                changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_task_changes_task_id ON task_changes(task_id)"
+        ]
+
+        # (trigger name, event, table, logged task id, operation)
+        triggers = [
+            ('task_changes_insert', 'INSERT', 'tasks', 'new.id', 'insert'),
+            ('task_changes_update', 'UPDATE', 'tasks', 'new.id', 'update'),
+            ('task_changes_delete', 'DELETE', 'tasks', 'old.id', 'delete'),
+            ('task_changes_dependency_insert', 'INSERT', 'dependencies', 'new.blocked_task_id', 'update'),
+            ('task_changes_dependency_delete', 'DELETE', 'dependencies', 'old.blocked_task_id', 'update'),
+            ('task_changes_tag_insert', 'INSERT', 'task_project_tags', 'new.task_id', 'update'),
+            ('task_changes_tag_delete', 'DELETE', 'task_project_tags', 'old.task_id', 'update'),
+        ]
+        for name, event, table, task_id, operation in triggers:
+            sql.append(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON {table} BEGIN
+                    INSERT INTO task_changes (task_id, operation) VALUES ({task_id}, '{operation}');
+                END
+                """
+            )
+        return sql
+
+    @staticmethod
+    def create_change_log(db_connection: sqlite3.Connection) -> None:
+        """
+        Create the task change log and its triggers if they do not exist yet.
+
+        Args:
+            db_connection: Active SQLite database connection
+        """
+        cursor = db_connection.cursor()
+        for sql in DatabaseSchema.get_change_log_sql():
+            cursor.execute(sql)
+        db_connection.commit()
+
+    @staticmethod
+    def get_history_delete_log_sql() -> List[str]:
+        """
+        Returns SQL statements that create the history_deletes log and its triggers.
+
+        task_comparisons, postpone_history and task_history are append-only
+        for delta exports, which carry their rows added after a watermark.
+        Rows can still be deleted (e.g. when comparisons are reset), so every
+        delete is logged here for delta exports to pass on as a tombstone.
+        """
+        sql = [
+            """
+            CREATE TABLE IF NOT EXISTS history_deletes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                table_name TEXT NOT NULL,
+                row_id INTEGER NOT NULL
+            )
+            """
+        ]
+        for table in ('task_comparisons', 'postpone_history', 'task_history'):
+            sql.append(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS history_deletes_{table} AFTER DELETE ON {table} BEGIN
+                    INSERT INTO history_deletes (table_name, row_id) VALUES ('{table}', old.id);
+                END
+                """
+            )
+        return sql
+
+    @staticmethod
+    def create_history_delete_log(db_connection: sqlite3.Connection) -> None:
+        """
+        Create the history delete log and its triggers if they do not exist yet.
+
+        Args:
+            db_connection: Active SQLite database connection
+        """
+        cursor = db_connection.cursor()
+        for sql in DatabaseSchema.get_history_delete_log_sql():
+            cursor.execute(sql)
+        db_connection.commit()
+
     @staticmethod
     def get_schema_version(db_connection: sqlite3.Connection) -> int:
         """
@@ -442,6 +633,54 @@ class DatabaseSchema:
         )
         db_connection.commit()
 
+    @staticmethod
+    def get_migrations() -> List[Tuple[int, str, Callable[[sqlite3.Connection], Any]]]:
+        """
+        Returns the ordered migration registry as (version, description, function) tuples.
+
+        Each function is idempotent, so databases created before version
+        tracking existed (version 0) can safely replay the whole list.
+        New migrations must be appended with the next version number and
+        CURRENT_VERSION bumped to match.
+        """
+        return [
+            (1, 'Initial schema and default settings', DatabaseSchema.initialize_database),
+            (2, 'Elo rating system', DatabaseSchema.migrate_to_elo_system),
+            (3, 'Recurring tasks', DatabaseSchema.migrate_to_recurring_tasks),
+            (4, 'Notification system', DatabaseSchema.migrate_to_notification_system),
+            (5, 'Full-text task search', DatabaseSchema.create_search_index),
+            (6, 'Task change log', DatabaseSchema.create_change_log),
+            (7, 'History delete log', DatabaseSchema.create_history_delete_log),
+        ]
+
+    @staticmethod
+    def run_migrations(db_connection: sqlite3.Connection) -> int:
+        """
+        Bring the database schema up to CURRENT_VERSION.
+
+        Performs a single schema_version lookup when the database is already
+        current; otherwise runs only the pending migrations in order,
+        recording the version after each step.
+
+        Args:
+            db_connection: Active SQLite database connection
+
+        Returns:
+            Schema version after migrating
+        """
+        version = DatabaseSchema.get_schema_version(db_connection)
+        if version >= DatabaseSchema.CURRENT_VERSION:
+            return version
+
+        for step_version, description, migrate in DatabaseSchema.get_migrations():
+            if step_version <= version:
+                continue
+            migrate(db_connection)
+            DatabaseSchema.set_schema_version(db_connection, step_version)
+            version = step_version
+
+        return version
+
     @staticmethod
     def migrate_to_elo_system(db_connection: sqlite3.Connection) -> None:
         """
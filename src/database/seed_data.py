@@ -189,10 +189,7 @@ def seed_database(db_connection: sqlite3.Connection, clear_existing: bool = Fals
         ),
     ]
 
-    created_tasks = []
-    for task in tasks:
-        created = task_dao.create(task)
-        created_tasks.append(created)
+    created_tasks = task_dao.bulk_create(tasks)
 
     print(f"  Created {len(created_tasks)} tasks")
 
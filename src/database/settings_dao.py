@@ -2,17 +2,44 @@
 Settings Data Access Object for OneTaskAtATime application.
 
 Handles all database operations for application settings.
+
+Settings are read through an in-memory cache of typed values, loaded with a
+single get_all() query. Writes through any SettingsDAO invalidate every
+cache and notify registered listeners; code that writes the settings table
+with raw SQL must call SettingsDAO.invalidate_cache() afterwards.
+
+Listeners are only called for changes made on the main (UI) thread, since
+they may touch widgets and the UI thread's connection. Work done on another
+thread clears the caches only; whoever started it calls invalidate_cache()
+on the UI thread once it has finished.
 """
 
 import sqlite3
 import json
+import copy
+import threading
+import weakref
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from .transaction import commit, rollback
+
+
+# Called with the changed key, or None when any setting may have changed
+SettingsListener = Callable[[Optional[str]], None]
 
 
 class SettingsDAO:
     """Data Access Object for application settings."""
 
+    # Typed settings per connection, shared by every SettingsDAO instance so
+    # short-lived DAOs created on hot paths still hit the cache
+    MAX_CACHED_CONNECTIONS = 16
+    _caches: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+    _generation = 0  # Bumped on every invalidation
+    _listeners: List[Tuple[Callable[[], Optional[SettingsListener]], Optional[FrozenSet[str]]]] = []
+    _lock = threading.Lock()
+
     def __init__(self, db_connection: sqlite3.Connection):
         """
         Initialize SettingsDAO with database connection.
@@ -22,6 +49,89 @@ class SettingsDAO:
         """
         self.db = db_connection
 
+    @classmethod
+    def invalidate_cache(cls, key: Optional[str] = None) -> None:
+        """
+        Drop the cached settings of every connection and notify listeners.
+
+        Called automatically by set()/delete(); call it directly after writing
+        the settings table with raw SQL or after switching databases.
+
+        Args:
+            key: Changed setting key, or None if any setting may have changed
+        """
+        cls._clear_caches()
+        cls._notify(key)
+
+    @classmethod
+    def _clear_caches(cls) -> None:
+        """Drop the cached settings of every connection."""
+        with cls._lock:
+            cls._generation += 1
+            cls._caches.clear()
+
+    @classmethod
+    def add_listener(cls, callback: SettingsListener, keys: Optional[Iterable[str]] = None) -> None:
+        """
+        Register a callback for setting changes.
+
+        Bound methods are held weakly, so registering a service does not keep
+        it alive. The callback runs on the main thread, and only for changes
+        made there (see the module docstring).
+
+        Args:
+            callback: Called with the changed key, or None if any setting may
+                have changed (bulk invalidation, database switch)
+            keys: Optional keys of interest; other keys are not reported
+        """
+        if hasattr(callback, '__self__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        with cls._lock:
+            cls._listeners.append((ref, frozenset(keys) if keys is not None else None))
+
+    @classmethod
+    def remove_listener(cls, callback: SettingsListener) -> None:
+        """
+        Unregister a callback added with add_listener().
+
+        Args:
+            callback: Callback to remove
+        """
+        with cls._lock:
+            cls._listeners = [
+                (ref, keys) for ref, keys in cls._listeners
+                if ref() is not None and ref() != callback
+            ]
+
+    @classmethod
+    def _notify(cls, key: Optional[str]) -> None:
+        """Call the listeners interested in key (all of them if key is None)."""
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        with cls._lock:
+            cls._listeners = [(ref, keys) for ref, keys in cls._listeners if ref() is not None]
+            listeners = list(cls._listeners)
+
+        for ref, keys in listeners:
+            callback = ref()
+            if callback is not None and (key is None or keys is None or key in keys):
+                try:
+                    callback(key)
+                except Exception as e:
+                    # A listener bound to a closed database must not break the write
+                    print(f"Warning: settings listener failed: {e}")
+
+    def _get_cache(self) -> Dict[str, Any]:
+        """Get the typed settings of this connection, loading them if needed."""
+        with SettingsDAO._lock:
+            cache = SettingsDAO._caches.get(self.db)
+        if cache is None:
+            cache = self._refresh_cache()
+        return cache
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a setting value by key.
@@ -33,18 +143,10 @@ class SettingsDAO:
         Returns:
             Setting value converted to appropriate type, or default if not found
         """
-        cursor = self.db.cursor()
-        cursor.execute(
-            "SELECT value, value_type FROM settings WHERE key = ?",
-            (key,)
-        )
-
-        row = cursor.fetchone()
-        if not row:
+        cache = self._get_cache()
+        if key not in cache:
             return default
-
-        value, value_type = row
-        return self._convert_value(value, value_type)
+        return self._copy_value(cache[key])
 
     def set(self, key: str, value: Any, value_type: str, description: str = None) -> None:
         """
@@ -70,15 +172,59 @@ class SettingsDAO:
             (key, str_value, value_type, description, now.isoformat())
         )
 
-        self.db.commit()
+        commit(self.db)
+        self.invalidate_cache(key)
+
+    def apply_changes(self, changes: Dict[str, Optional[Tuple[Any, str, Optional[str]]]]) -> None:
+        """
+        Set and delete several settings in a single transaction.
+
+        Args:
+            changes: Map of key -> (value, value_type, description) to set,
+                or key -> None to delete
+        """
+        if not changes:
+            return
+
+        cursor = self.db.cursor()
+        now = datetime.now().isoformat()
+        try:
+            for key, change in changes.items():
+                if change is None:
+                    cursor.execute("DELETE FROM settings WHERE key = ?", (key,))
+                else:
+                    value, value_type, description = change
+                    cursor.execute(
+                        """
+                        INSERT OR REPLACE INTO settings (key, value, value_type, description, updated_at)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        (key, self._value_to_string(value, value_type), value_type, description, now)
+                    )
+            commit(self.db)
+        except Exception:
+            rollback(self.db)
+            raise
+
+        self._clear_caches()
+        for key in changes:
+            self._notify(key)
 
     def get_all(self) -> Dict[str, Any]:
         """
         Get all settings as a dictionary.
 
+        Always reads the database and refreshes the cache for this connection.
+
         Returns:
             Dictionary of key-value pairs with values converted to appropriate types
         """
+        settings = self._refresh_cache()
+        return {key: self._copy_value(value) for key, value in settings.items()}
+
+    def _refresh_cache(self) -> Dict[str, Any]:
+        """Read and convert every setting, then store them as this connection's cache."""
+        generation = SettingsDAO._generation
         cursor = self.db.cursor()
         cursor.execute("SELECT key, value, value_type FROM settings")
 
@@ -87,6 +233,13 @@ class SettingsDAO:
             key, value, value_type = row
             settings[key] = self._convert_value(value, value_type)
 
+        with SettingsDAO._lock:
+            # Don't store values read before a concurrent invalidation
+            if generation == SettingsDAO._generation:
+                SettingsDAO._caches[self.db] = settings
+                SettingsDAO._caches.move_to_end(self.db)
+                while len(SettingsDAO._caches) > self.MAX_CACHED_CONNECTIONS:
+                    SettingsDAO._caches.popitem(last=False)
         return settings
 
     def delete(self, key: str) -> bool:
@@ -101,8 +254,18 @@ class SettingsDAO:
         """
         cursor = self.db.cursor()
         cursor.execute("DELETE FROM settings WHERE key = ?", (key,))
-        self.db.commit()
-        return cursor.rowcount > 0
+        commit(self.db)
+        deleted = cursor.rowcount > 0
+        if deleted:
+            self.invalidate_cache(key)
+        return deleted
+
+    @staticmethod
+    def _copy_value(value: Any) -> Any:
+        """Copy mutable (JSON) values so callers cannot modify the cache."""
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
 
     def _convert_value(self, value: str, value_type: str) -> Any:
         """
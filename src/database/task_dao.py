@@ -4,15 +4,45 @@ Task Data Access Object for OneTaskAtATime application.
 Handles all database CRUD operations for tasks.
 """
 
+import re
 import sqlite3
 from datetime import datetime, date
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from ..models import Task, TaskState
+from .transaction import commit, rollback
 
 
 class TaskDAO:
     """Data Access Object for Task operations."""
 
+    # Maximum number of IDs bound into a single IN (...) clause. Kept below
+    # SQLite's historical SQLITE_MAX_VARIABLE_NUMBER default of 999.
+    HYDRATION_CHUNK_SIZE = 900
+
+    _INSERT_SQL = """
+        INSERT INTO tasks (
+            title, description, base_priority, priority_adjustment, comparison_count, elo_rating,
+            due_date, state, start_date, delegated_to, follow_up_date,
+            completed_at, context_id, last_resurfaced_at, resurface_count,
+            is_recurring, recurrence_pattern, recurrence_parent_id, share_elo_rating,
+            shared_elo_rating, shared_comparison_count, recurrence_end_date, max_occurrences, occurrence_count,
+            created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    _UPDATE_SQL = """
+        UPDATE tasks SET
+            title = ?, description = ?, base_priority = ?,
+            priority_adjustment = ?, comparison_count = ?, elo_rating = ?, due_date = ?, state = ?,
+            start_date = ?, delegated_to = ?, follow_up_date = ?,
+            completed_at = ?, context_id = ?, last_resurfaced_at = ?,
+            resurface_count = ?, is_recurring = ?, recurrence_pattern = ?,
+            recurrence_parent_id = ?, share_elo_rating = ?, shared_elo_rating = ?,
+            shared_comparison_count = ?, recurrence_end_date = ?, max_occurrences = ?, occurrence_count = ?,
+            updated_at = ?
+        WHERE id = ?
+    """
+
     def __init__(self, db_connection: sqlite3.Connection):
         """
         Initialize TaskDAO with database connection.
@@ -42,44 +72,8 @@ class TaskDAO:
         now = datetime.now()
 
         cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, base_priority, priority_adjustment, comparison_count, elo_rating,
-                due_date, state, start_date, delegated_to, follow_up_date,
-                completed_at, context_id, last_resurfaced_at, resurface_count,
-                is_recurring, recurrence_pattern, recurrence_parent_id, share_elo_rating,
-                shared_elo_rating, shared_comparison_count, recurrence_end_date, max_occurrences, occurrence_count,
-                created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                task.title,
-                task.description,
-                task.base_priority,
-                task.priority_adjustment,
-                task.comparison_count,
-                task.elo_rating,
-                task.due_date.isoformat() if task.due_date else None,
-                task.state.value,
-                task.start_date.isoformat() if task.start_date else None,
-                task.delegated_to,
-                task.follow_up_date.isoformat() if task.follow_up_date else None,
-                task.completed_at.isoformat() if task.completed_at else None,
-                task.context_id,
-                task.last_resurfaced_at.isoformat() if task.last_resurfaced_at else None,
-                task.resurface_count,
-                1 if task.is_recurring else 0,
-                task.recurrence_pattern,
-                task.recurrence_parent_id,
-                1 if task.share_elo_rating else 0,
-                task.shared_elo_rating,
-                task.shared_comparison_count,
-                task.recurrence_end_date.isoformat() if task.recurrence_end_date else None,
-                task.max_occurrences,
-                task.occurrence_count,
-                now.isoformat(),
-                now.isoformat()
-            )
+            self._INSERT_SQL,
+            self._task_values(task) + (now.isoformat(), now.isoformat())
         )
 
         task.id = cursor.lastrowid
@@ -90,7 +84,7 @@ class TaskDAO:
         if task.project_tags:
             self._add_project_tags(task.id, task.project_tags)
 
-        self.db.commit()
+        commit(self.db)
         return task
 
     def get_by_id(self, task_id: int) -> Optional[Task]:
@@ -173,15 +167,189 @@ class TaskDAO:
                 """
             )
 
-        tasks = []
-        for row in cursor.fetchall():
-            task = self._row_to_task(row)
-            task.project_tags = self._get_project_tag_ids(task.id)
-            task.blocking_task_ids = self._get_blocking_task_ids(task.id)
-            tasks.append(task)
+        tasks = [self._row_to_task(row) for row in cursor.fetchall()]
+        self._hydrate_related(tasks)
+        return tasks
+
+    def count_by_state(self) -> Dict[str, int]:
+        """
+        Count tasks in each state with a single query.
+
+        Returns:
+            Dictionary mapping state value to count (0 for states with no tasks)
+        """
+        counts = {state.value: 0 for state in TaskState}
+        cursor = self.db.cursor()
+        cursor.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state")
+        for state, count in cursor.fetchall():
+            counts[state] = count
+        return counts
+
+    def get_by_ids(self, task_ids: List[int]) -> List[Task]:
+        """
+        Retrieve several tasks by ID, preserving the order of task_ids.
+
+        Args:
+            task_ids: IDs of tasks to retrieve (unknown IDs are skipped)
+
+        Returns:
+            List of Task objects
+        """
+        cursor = self.db.cursor()
+        tasks_by_id = {}
+        for chunk, placeholders in self._chunk_ids(list(dict.fromkeys(task_ids))):
+            cursor.execute(
+                f"""
+                SELECT id, title, description, base_priority, priority_adjustment, comparison_count, elo_rating,
+                       due_date, state, start_date, delegated_to, follow_up_date,
+                       completed_at, context_id, last_resurfaced_at, resurface_count,
+                       is_recurring, recurrence_pattern, recurrence_parent_id, share_elo_rating,
+                       shared_elo_rating, shared_comparison_count, recurrence_end_date, max_occurrences, occurrence_count,
+                       created_at, updated_at
+                FROM tasks
+                WHERE id IN ({placeholders})
+                """,
+                chunk
+            )
+            for row in cursor.fetchall():
+                tasks_by_id[row[0]] = self._row_to_task(row)
 
+        tasks = [tasks_by_id[task_id] for task_id in dict.fromkeys(task_ids) if task_id in tasks_by_id]
+        self._hydrate_related(tasks)
         return tasks
 
+    def get_change_seq(self) -> Optional[int]:
+        """
+        Get the sequence number of the latest entry in the task change log.
+
+        Returns:
+            Latest seq (0 if the log is empty), or None if the database has
+            no change log
+        """
+        try:
+            row = self.db.execute("SELECT COALESCE(MAX(seq), 0) FROM task_changes").fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0]
+
+    def get_changed_task_ids(self, since_seq: int) -> Set[int]:
+        """
+        Get IDs of tasks changed after a change log position.
+
+        Args:
+            since_seq: Last seq already processed by the caller
+
+        Returns:
+            Set of task IDs inserted, updated or deleted since since_seq
+        """
+        cursor = self.db.execute(
+            "SELECT DISTINCT task_id FROM task_changes WHERE seq > ?",
+            (since_seq,)
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+    def compact_change_log(self, needed_seq: Optional[int] = None) -> int:
+        """
+        Delete task change log rows that no reader needs.
+
+        Readers only ask which tasks changed after some seq, and a task's
+        latest row answers that for every seq, so older rows of the same task
+        are always dropped. If needed_seq is given (the lowest seq any reader
+        still reads from), rows up to it are dropped as well. The newest row
+        is always kept so get_change_seq() does not go backwards.
+
+        Args:
+            needed_seq: Lowest seq any reader still needs changes after, or
+                None if unknown
+
+        Returns:
+            Number of rows deleted
+        """
+        cursor = self.db.cursor()
+        try:
+            cursor.execute("""
+                DELETE FROM task_changes
+                WHERE seq NOT IN (SELECT MAX(seq) FROM task_changes GROUP BY task_id)
+            """)
+            deleted = cursor.rowcount
+            if needed_seq is not None:
+                cursor.execute(
+                    "DELETE FROM task_changes "
+                    "WHERE seq <= ? AND seq < (SELECT MAX(seq) FROM task_changes)",
+                    (needed_seq,)
+                )
+                deleted += cursor.rowcount
+            commit(self.db)
+        except Exception:
+            rollback(self.db)
+            raise
+        return deleted
+
+    def search_task_ids(self, query: str, title_only: bool = False,
+                        limit: Optional[int] = None) -> List[int]:
+        """
+        Full-text search over task titles and descriptions.
+
+        Every word in the query must match the start of a word in the task
+        (prefix matching, case-insensitive). Results are ranked by relevance,
+        with title matches weighted above description matches. Falls back to
+        a substring LIKE scan when the FTS5 index is unavailable.
+
+        Args:
+            query: Text typed by the user
+            title_only: Only match against task titles
+            limit: Optional maximum number of IDs to return
+
+        Returns:
+            Matching task IDs, best match first
+        """
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return self._search_task_ids_like(query, title_only, limit) if query.strip() else []
+
+        match = ' '.join('"{}"*'.format(term) for term in terms)
+        if title_only:
+            match = f"title : ({match})"
+
+        sql = """
+            SELECT rowid FROM tasks_fts
+            WHERE tasks_fts MATCH ?
+            ORDER BY bm25(tasks_fts, 10.0, 1.0)
+        """
+        params: list = [match]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self.db.cursor()
+        try:
+            cursor.execute(sql, params)
+        except sqlite3.OperationalError:
+            # Index missing (FTS5 not compiled into this SQLite build)
+            return self._search_task_ids_like(query, title_only, limit)
+        return [row[0] for row in cursor.fetchall()]
+
+    def _search_task_ids_like(self, query: str, title_only: bool,
+                              limit: Optional[int]) -> List[int]:
+        """Substring search fallback used when full-text search cannot be used."""
+        pattern = '%' + query.strip().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        if title_only:
+            sql = "SELECT id FROM tasks WHERE title LIKE ? ESCAPE '\\' ORDER BY id"
+            params: list = [pattern]
+        else:
+            sql = (
+                "SELECT id FROM tasks WHERE title LIKE ? ESCAPE '\\' "
+                "OR description LIKE ? ESCAPE '\\' ORDER BY id"
+            )
+            params = [pattern, pattern]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self.db.cursor()
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
     def update(self, task: Task) -> Task:
         """
         Update an existing task in the database.
@@ -202,58 +370,105 @@ class TaskDAO:
         now = datetime.now()
 
         cursor.execute(
-            """
-            UPDATE tasks SET
-                title = ?, description = ?, base_priority = ?,
-                priority_adjustment = ?, comparison_count = ?, elo_rating = ?, due_date = ?, state = ?,
-                start_date = ?, delegated_to = ?, follow_up_date = ?,
-                completed_at = ?, context_id = ?, last_resurfaced_at = ?,
-                resurface_count = ?, is_recurring = ?, recurrence_pattern = ?,
-                recurrence_parent_id = ?, share_elo_rating = ?, shared_elo_rating = ?,
-                shared_comparison_count = ?, recurrence_end_date = ?, max_occurrences = ?, occurrence_count = ?,
-                updated_at = ?
-            WHERE id = ?
-            """,
-            (
-                task.title,
-                task.description,
-                task.base_priority,
-                task.priority_adjustment,
-                task.comparison_count,
-                task.elo_rating,
-                task.due_date.isoformat() if task.due_date else None,
-                task.state.value,
-                task.start_date.isoformat() if task.start_date else None,
-                task.delegated_to,
-                task.follow_up_date.isoformat() if task.follow_up_date else None,
-                task.completed_at.isoformat() if task.completed_at else None,
-                task.context_id,
-                task.last_resurfaced_at.isoformat() if task.last_resurfaced_at else None,
-                task.resurface_count,
-                1 if task.is_recurring else 0,
-                task.recurrence_pattern,
-                task.recurrence_parent_id,
-                1 if task.share_elo_rating else 0,
-                task.shared_elo_rating,
-                task.shared_comparison_count,
-                task.recurrence_end_date.isoformat() if task.recurrence_end_date else None,
-                task.max_occurrences,
-                task.occurrence_count,
-                now.isoformat(),
-                task.id
-            )
+            self._UPDATE_SQL,
+            self._task_values(task) + (now.isoformat(), task.id)
         )
 
         task.updated_at = now
 
         # Update project tags
-        self._remove_all_project_tags(task.id)
-        if task.project_tags:
-            self._add_project_tags(task.id, task.project_tags)
+        self._sync_project_tags({task.id: task.project_tags})
 
-        self.db.commit()
+        commit(self.db)
         return task
 
+    def bulk_create(self, tasks: List[Task]) -> List[Task]:
+        """
+        Insert many tasks in a single transaction.
+
+        Task rows are inserted one statement at a time so that each Task
+        receives its generated id, while project tag links are written with
+        executemany. Everything is committed once at the end and rolled back
+        if any insert fails.
+
+        Args:
+            tasks: Task objects to insert (ids should be None)
+
+        Returns:
+            The same Task objects with ids populated
+
+        Raises:
+            ValueError: If any task already has an id
+        """
+        if any(task.id is not None for task in tasks):
+            raise ValueError("Cannot create task that already has an id")
+        if not tasks:
+            return tasks
+
+        cursor = self.db.cursor()
+        now = datetime.now()
+        timestamps = (now.isoformat(), now.isoformat())
+
+        try:
+            for task in tasks:
+                cursor.execute(self._INSERT_SQL, self._task_values(task) + timestamps)
+                task.id = cursor.lastrowid
+                task.created_at = now
+                task.updated_at = now
+
+            cursor.executemany(
+                "INSERT OR IGNORE INTO task_project_tags (task_id, project_tag_id) VALUES (?, ?)",
+                [(task.id, tag_id) for task in tasks for tag_id in task.project_tags]
+            )
+            commit(self.db)
+        except Exception:
+            rollback(self.db)
+            for task in tasks:
+                task.id = None
+            raise
+
+        return tasks
+
+    def bulk_update(self, tasks: List[Task]) -> List[Task]:
+        """
+        Update many tasks in a single transaction.
+
+        Uses executemany for the task rows and only writes the project tag
+        links that actually changed. Everything is committed once at the end
+        and rolled back if any statement fails.
+
+        Args:
+            tasks: Task objects with updated values (must have ids)
+
+        Returns:
+            The same updated Task objects
+
+        Raises:
+            ValueError: If any task doesn't have an id
+        """
+        if any(task.id is None for task in tasks):
+            raise ValueError("Cannot update task without an id")
+        if not tasks:
+            return tasks
+
+        cursor = self.db.cursor()
+        now = datetime.now()
+
+        try:
+            cursor.executemany(
+                self._UPDATE_SQL,
+                [self._task_values(task) + (now.isoformat(), task.id) for task in tasks]
+            )
+            self._sync_project_tags({task.id: task.project_tags for task in tasks})
+            commit(self.db)
+        except Exception:
+            rollback(self.db)
+            raise
+
+        for task in tasks:
+            task.updated_at = now
+        return tasks
+
     def delete(self, task_id: int) -> bool:
         """
         Delete a task from the database.
@@ -266,7 +481,7 @@ class TaskDAO:
         """
         cursor = self.db.cursor()
         cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        self.db.commit()
+        commit(self.db)
         return cursor.rowcount > 0
 
     def get_active_tasks(self) -> List[Task]:
@@ -278,6 +493,78 @@ class TaskDAO:
         """
         return self.get_all(TaskState.ACTIVE)
 
+    def get_actionable_tasks(
+        self,
+        current_date: Optional[date] = None,
+        context_filter: Optional[int] = None,
+        tag_filters: Optional[Set[int]] = None
+    ) -> List[Task]:
+        """
+        Get tasks eligible for Focus Mode, filtered in SQL.
+
+        Applies the same rules as ranking.get_actionable_tasks() so that
+        completed, trashed and other inactive tasks are never loaded:
+        ACTIVE state, no incomplete blocking task, start_date not in the
+        future, context and tag (OR) filters.
+
+        Args:
+            current_date: Reference date for the start_date rule (defaults to today)
+            context_filter: Optional context ID, or 'NONE' for tasks with no context
+            tag_filters: Optional set of tag IDs (task must have at least one)
+
+        Returns:
+            List of Task objects, newest first (same order as get_all)
+        """
+        if current_date is None:
+            current_date = date.today()
+
+        conditions = [
+            "t.state = 'active'",
+            "(t.start_date IS NULL OR t.start_date <= ?)",
+            """NOT EXISTS (
+                SELECT 1 FROM dependencies d
+                JOIN tasks b ON b.id = d.blocking_task_id
+                WHERE d.blocked_task_id = t.id AND b.state != 'completed'
+            )"""
+        ]
+        params: list = [current_date.isoformat()]
+
+        if context_filter == "NONE":
+            conditions.append("t.context_id IS NULL")
+        elif context_filter is not None:
+            conditions.append("t.context_id = ?")
+            params.append(context_filter)
+
+        if tag_filters:
+            tag_ids = sorted(tag_filters)
+            conditions.append(
+                f"""EXISTS (
+                SELECT 1 FROM task_project_tags tpt
+                WHERE tpt.task_id = t.id AND tpt.project_tag_id IN ({','.join('?' * len(tag_ids))})
+            )"""
+            )
+            params.extend(tag_ids)
+
+        cursor = self.db.cursor()
+        cursor.execute(
+            f"""
+            SELECT t.id, t.title, t.description, t.base_priority, t.priority_adjustment, t.comparison_count,
+                   t.elo_rating, t.due_date, t.state, t.start_date, t.delegated_to, t.follow_up_date,
+                   t.completed_at, t.context_id, t.last_resurfaced_at, t.resurface_count,
+                   t.is_recurring, t.recurrence_pattern, t.recurrence_parent_id, t.share_elo_rating,
+                   t.shared_elo_rating, t.shared_comparison_count, t.recurrence_end_date, t.max_occurrences,
+                   t.occurrence_count, t.created_at, t.updated_at
+            FROM tasks t
+            WHERE {' AND '.join(conditions)}
+            ORDER BY t.created_at DESC
+            """,
+            params
+        )
+
+        tasks = [self._row_to_task(row) for row in cursor.fetchall()]
+        self._hydrate_related(tasks)
+        return tasks
+
     def get_deferred_tasks_ready_to_activate(self, current_date: date) -> List[Task]:
         """
         Get deferred tasks whose start_date has arrived.
@@ -304,13 +591,8 @@ class TaskDAO:
             (current_date.isoformat(),)
         )
 
-        tasks = []
-        for row in cursor.fetchall():
-            task = self._row_to_task(row)
-            task.project_tags = self._get_project_tag_ids(task.id)
-            task.blocking_task_ids = self._get_blocking_task_ids(task.id)
-            tasks.append(task)
-
+        tasks = [self._row_to_task(row) for row in cursor.fetchall()]
+        self._hydrate_related(tasks)
         return tasks
 
     def get_delegated_tasks_for_followup(self, current_date: date, days_before: int = 1) -> List[Task]:
@@ -343,15 +625,43 @@ class TaskDAO:
             (check_date.isoformat(),)
         )
 
-        tasks = []
-        for row in cursor.fetchall():
-            task = self._row_to_task(row)
-            task.project_tags = self._get_project_tag_ids(task.id)
-            task.blocking_task_ids = self._get_blocking_task_ids(task.id)
-            tasks.append(task)
-
+        tasks = [self._row_to_task(row) for row in cursor.fetchall()]
+        self._hydrate_related(tasks)
         return tasks
 
+    def _task_values(self, task: Task) -> tuple:
+        """
+        Convert a Task to the column values shared by _INSERT_SQL and _UPDATE_SQL.
+
+        Timestamps (and the id for updates) are appended by the caller.
+        """
+        return (
+            task.title,
+            task.description,
+            task.base_priority,
+            task.priority_adjustment,
+            task.comparison_count,
+            task.elo_rating,
+            task.due_date.isoformat() if task.due_date else None,
+            task.state.value,
+            task.start_date.isoformat() if task.start_date else None,
+            task.delegated_to,
+            task.follow_up_date.isoformat() if task.follow_up_date else None,
+            task.completed_at.isoformat() if task.completed_at else None,
+            task.context_id,
+            task.last_resurfaced_at.isoformat() if task.last_resurfaced_at else None,
+            task.resurface_count,
+            1 if task.is_recurring else 0,
+            task.recurrence_pattern,
+            task.recurrence_parent_id,
+            1 if task.share_elo_rating else 0,
+            task.shared_elo_rating,
+            task.shared_comparison_count,
+            task.recurrence_end_date.isoformat() if task.recurrence_end_date else None,
+            task.max_occurrences,
+            task.occurrence_count
+        )
+
     def _row_to_task(self, row: sqlite3.Row) -> Task:
         """
         Convert a database row to a Task object.
@@ -392,6 +702,71 @@ class TaskDAO:
             updated_at=datetime.fromisoformat(row[26]) if row[26] else None
         )
 
+    def _hydrate_related(self, tasks: List[Task]) -> None:
+        """
+        Populate project tags and blocking task IDs for a batch of tasks.
+
+        Loads the related rows for the whole result set with one query per
+        chunk of IDs instead of two queries per task, then stitches them onto
+        the Task objects in place.
+
+        Args:
+            tasks: Tasks loaded via _row_to_task (modified in place)
+        """
+        if not tasks:
+            return
+
+        task_ids = [task.id for task in tasks]
+        tags_by_task = self._load_project_tag_map(task_ids)
+        blockers_by_task = self._load_blocking_task_map(task_ids)
+
+        for task in tasks:
+            task.project_tags = tags_by_task[task.id]
+            task.blocking_task_ids = blockers_by_task[task.id]
+
+    def _chunk_ids(self, task_ids: List[int]) -> Iterator[Tuple[List[int], str]]:
+        """Yield (chunk, placeholders) pairs sized for an IN (...) clause."""
+        for start in range(0, len(task_ids), self.HYDRATION_CHUNK_SIZE):
+            chunk = task_ids[start:start + self.HYDRATION_CHUNK_SIZE]
+            yield chunk, ','.join('?' * len(chunk))
+
+    def _load_project_tag_map(self, task_ids: List[int]) -> Dict[int, List[int]]:
+        """Get project tag IDs for many tasks, keyed by task ID."""
+        tags_by_task: Dict[int, List[int]] = {task_id: [] for task_id in task_ids}
+        cursor = self.db.cursor()
+        for chunk, placeholders in self._chunk_ids(list(tags_by_task)):
+            cursor.execute(
+                f"""
+                SELECT task_id, project_tag_id FROM task_project_tags
+                WHERE task_id IN ({placeholders})
+                ORDER BY task_id, project_tag_id
+                """,
+                chunk
+            )
+            for task_id, tag_id in cursor.fetchall():
+                tags_by_task[task_id].append(tag_id)
+        return tags_by_task
+
+    def _load_blocking_task_map(self, task_ids: List[int]) -> Dict[int, List[int]]:
+        """Get incomplete blocking task IDs for many tasks, keyed by task ID."""
+        blockers_by_task: Dict[int, List[int]] = {task_id: [] for task_id in task_ids}
+        cursor = self.db.cursor()
+        for chunk, placeholders in self._chunk_ids(list(blockers_by_task)):
+            cursor.execute(
+                f"""
+                SELECT d.blocked_task_id, d.blocking_task_id
+                FROM dependencies d
+                JOIN tasks t ON t.id = d.blocking_task_id
+                WHERE d.blocked_task_id IN ({placeholders})
+                AND t.state != 'completed'
+                ORDER BY d.id
+                """,
+                chunk
+            )
+            for blocked_id, blocking_id in cursor.fetchall():
+                blockers_by_task[blocked_id].append(blocking_id)
+        return blockers_by_task
+
     def _get_project_tag_ids(self, task_id: int) -> List[int]:
         """Get list of project tag IDs for a task."""
         cursor = self.db.cursor()
@@ -423,10 +798,36 @@ class TaskDAO:
                 (task_id, tag_id)
             )
 
-    def _remove_all_project_tags(self, task_id: int) -> None:
-        """Remove all project tags from a task."""
+    def _sync_project_tags(self, tags_by_task: Dict[int, List[int]]) -> None:
+        """
+        Bring the stored project tags for each task in line with the given sets.
+
+        Only the links that differ are deleted or inserted; unchanged links are
+        left alone. Does not commit.
+
+        Args:
+            tags_by_task: Desired project tag IDs keyed by task ID
+        """
+        current = self._load_project_tag_map(list(tags_by_task))
+        to_remove = []
+        to_add = []
+        for task_id, tag_ids in tags_by_task.items():
+            wanted = set(tag_ids or [])
+            existing = set(current[task_id])
+            to_remove.extend((task_id, tag_id) for tag_id in existing - wanted)
+            to_add.extend((task_id, tag_id) for tag_id in wanted - existing)
+
         cursor = self.db.cursor()
-        cursor.execute("DELETE FROM task_project_tags WHERE task_id = ?", (task_id,))
+        if to_remove:
+            cursor.executemany(
+                "DELETE FROM task_project_tags WHERE task_id = ? AND project_tag_id = ?",
+                to_remove
+            )
+        if to_add:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO task_project_tags (task_id, project_tag_id) VALUES (?, ?)",
+                to_add
+            )
 
     def delete_all_tasks(self) -> int:
         """
@@ -440,5 +841,5 @@ class TaskDAO:
         count = cursor.fetchone()[0]
 
         cursor.execute("DELETE FROM tasks")
-        self.db.commit()
+        commit(self.db)
         return count
@@ -10,6 +10,7 @@ from typing import List, Optional
 
 from src.models.task_history_event import TaskHistoryEvent
 from src.models.enums import TaskEventType
+from .transaction import commit
 
 
 class TaskHistoryDAO:
@@ -63,7 +64,7 @@ class TaskHistoryDAO:
             )
         )
 
-        self.db_connection.commit()
+        commit(self.db_connection)
         event.id = cursor.lastrowid
         return event
 
@@ -217,7 +218,7 @@ class TaskHistoryDAO:
             (task_id,)
         )
 
-        self.db_connection.commit()
+        commit(self.db_connection)
         return cursor.rowcount > 0
 
     def get_count_by_task(self, task_id: int) -> int:
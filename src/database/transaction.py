@@ -0,0 +1,157 @@
+"""
+Transaction Module - Unit-of-work scopes for OneTaskAtATime.
+
+DAO methods commit after every write, so one user action (completing a
+recurring task, recording a comparison, undoing a command) used to perform
+several commits and could leave partial state behind on failure. A
+Transaction groups those writes: while one is open on a connection, DAO
+commits are deferred and everything is committed once when the outermost
+scope exits, or rolled back if it raises.
+
+Scopes nest through SQLite savepoints, so an inner scope can fail and roll
+back its own writes without discarding the outer ones.
+
+Usage:
+    with transaction(db_connection):
+        task_dao.update(task)
+        history_dao.create_event(event)
+"""
+
+import sqlite3
+from typing import Any, Dict
+
+
+# Open scopes per connection: id(connection) -> nesting depth.
+# Entries only exist while a scope is open, so connections are never leaked.
+_depths: Dict[int, int] = {}
+
+
+def _resolve(connection: Any) -> Any:
+    """
+    Get the sqlite3 connection behind a connection-like object.
+
+    Accepts a sqlite3.Connection, a ThreadBoundConnection or a
+    DatabaseConnection, so DAOs and services agree on the same scope.
+    """
+    get_connection = getattr(connection, 'get_connection', None)
+    if get_connection is not None:
+        return get_connection()
+    return connection
+
+
+def in_transaction(connection: Any) -> bool:
+    """
+    Check whether a unit of work is open on a connection.
+
+    Args:
+        connection: sqlite3.Connection, ThreadBoundConnection or DatabaseConnection
+
+    Returns:
+        True if DAO commits on this connection are currently deferred
+    """
+    return id(_resolve(connection)) in _depths
+
+
+def commit(connection: Any) -> None:
+    """
+    Commit, unless a unit of work is open (its outermost scope commits instead).
+
+    DAOs call this instead of connection.commit().
+
+    Args:
+        connection: Connection the DAO writes to
+    """
+    if not in_transaction(connection):
+        connection.commit()
+
+
+def rollback(connection: Any) -> None:
+    """
+    Roll back, unless a unit of work is open.
+
+    Inside a unit of work the caller is expected to re-raise; the enclosing
+    scope then rolls back to its savepoint.
+
+    Args:
+        connection: Connection the DAO writes to
+    """
+    if not in_transaction(connection):
+        connection.rollback()
+
+
+class Transaction:
+    """
+    Unit-of-work scope on one database connection.
+
+    The outermost scope commits once on success; nested scopes are savepoints
+    that are released on success and rolled back on error. A scope rolls back
+    when its block raises, or when set_rollback_only() was called.
+    """
+
+    def __init__(self, connection: Any):
+        """
+        Initialize the scope (nothing happens until it is entered).
+
+        Args:
+            connection: sqlite3.Connection, ThreadBoundConnection or DatabaseConnection
+        """
+        self.connection = connection
+        self.rollback_only = False
+        self._conn = None
+        self._savepoint = None
+
+    def set_rollback_only(self) -> None:
+        """Roll back this scope's writes on exit instead of keeping them."""
+        self.rollback_only = True
+
+    def __enter__(self) -> 'Transaction':
+        self._conn = _resolve(self.connection)
+        key = id(self._conn)
+        depth = _depths.get(key, 0) + 1
+        self._savepoint = f"uow_{depth}"
+
+        # A savepoint outside of a transaction starts one
+        self._conn.execute(f"SAVEPOINT {self._savepoint}")
+        _depths[key] = depth
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        key = id(self._conn)
+        depth = _depths[key]
+        if depth > 1:
+            _depths[key] = depth - 1
+        else:
+            del _depths[key]
+
+        if exc_type is None and not self.rollback_only:
+            try:
+                self._conn.execute(f"RELEASE {self._savepoint}")
+                if depth == 1:
+                    self._conn.commit()
+            except sqlite3.Error:
+                if depth == 1:
+                    self._conn.rollback()
+                raise
+        else:
+            self._conn.execute(f"ROLLBACK TO {self._savepoint}")
+            self._conn.execute(f"RELEASE {self._savepoint}")
+
+            # Cached settings may hold values that were never committed
+            # (listeners are only notified on the main thread)
+            from .settings_dao import SettingsDAO
+            SettingsDAO.invalidate_cache()
+
+        return False
+
+
+def transaction(connection: Any) -> Transaction:
+    """
+    Open a unit of work on a connection.
+
+    Args:
+        connection: sqlite3.Connection, ThreadBoundConnection or DatabaseConnection
+
+    Returns:
+        Transaction context manager
+    """
+    return Transaction(connection)
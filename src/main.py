@@ -23,6 +23,7 @@ from src.services.logging_service import LoggingService
 from src.services.database_path_service import DatabasePathService
 from src.database.connection import DatabaseConnection
 from src.database.settings_dao import SettingsDAO
+from src.services.settings_write_buffer import SettingsWriteBuffer
 
 
 def main():
@@ -87,6 +88,9 @@ def main():
 
         logger.info("QApplication initialized")
 
+        # Last chance to write buffered UI settings
+        app.aboutToQuit.connect(SettingsWriteBuffer.flush_all)
+
         window = MainWindow(app)
         window.show()
 
@@ -10,6 +10,7 @@ from ..database.task_dao import TaskDAO
 from ..database.comparison_dao import ComparisonDAO
 from ..database.settings_dao import SettingsDAO
 from ..database.connection import DatabaseConnection
+from ..database.transaction import transaction
 
 
 class ComparisonService:
@@ -86,20 +87,21 @@ class ComparisonService:
         winner.comparison_count += 1
         loser.comparison_count += 1
 
-        # Save the comparison to database (store absolute value of loser's change)
-        self.comparison_dao.record_comparison(
-            winner.id,
-            loser.id,
-            abs(elo_change_loser)
-        )
+        with transaction(self.db):
+            # Save the comparison to database (store absolute value of loser's change)
+            self.comparison_dao.record_comparison(
+                winner.id,
+                loser.id,
+                abs(elo_change_loser)
+            )
 
-        # Handle shared Elo rating for recurring tasks
-        self._sync_shared_elo(winner)
-        self._sync_shared_elo(loser)
+            # Handle shared Elo rating for recurring tasks
+            self._sync_shared_elo(winner)
+            self._sync_shared_elo(loser)
 
-        # Update both tasks in database
-        updated_winner = self.task_dao.update(winner)
-        updated_loser = self.task_dao.update(loser)
+            # Update both tasks in database
+            updated_winner = self.task_dao.update(winner)
+            updated_loser = self.task_dao.update(loser)
 
         return (updated_winner, updated_loser)
 
@@ -110,8 +112,9 @@ class ComparisonService:
         Args:
             comparison_results: List of (winner, loser) tuples
         """
-        for winner, loser in comparison_results:
-            self.record_comparison(winner, loser)
+        with transaction(self.db):
+            for winner, loser in comparison_results:
+                self.record_comparison(winner, loser)
 
     def reset_task_priority_adjustment(self, task_id: int) -> Optional[Task]:
         """
@@ -136,11 +139,12 @@ class ComparisonService:
         # Also reset deprecated fields (for backward compatibility during transition)
         task.priority_adjustment = 0.0
 
-        # Delete comparison history
-        self.comparison_dao.delete_comparisons_for_task(task_id)
+        with transaction(self.db):
+            # Delete comparison history
+            self.comparison_dao.delete_comparisons_for_task(task_id)
 
-        # Update task
-        return self.task_dao.update(task)
+            # Update task
+            return self.task_dao.update(task)
 
     def reset_all_priority_adjustments(self) -> int:
         """
@@ -153,7 +157,7 @@ class ComparisonService:
         """
         # Get all tasks
         all_tasks = self.task_dao.get_all()
-        reset_count = 0
+        tasks_to_reset = []
 
         for task in all_tasks:
             # Reset if Elo is not at default or comparison_count > 0
@@ -161,14 +165,15 @@ class ComparisonService:
                 task.elo_rating = 1500.0
                 task.comparison_count = 0
                 task.priority_adjustment = 0.0  # Also reset deprecated field
-                self.task_dao.update(task)
-                reset_count += 1
+                tasks_to_reset.append(task)
+
+        with transaction(self.db):
+            self.task_dao.bulk_update(tasks_to_reset)
 
-        # Clear all comparison history
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM task_comparisons")
-        conn.commit()
+            # Clear all comparison history
+            cursor = self.db.get_connection().cursor()
+            cursor.execute("DELETE FROM task_comparisons")
+        reset_count = len(tasks_to_reset)
 
         return reset_count
 
@@ -258,10 +263,12 @@ class ComparisonService:
         elif task.is_recurring:
             # This is the parent task - update all active children
             all_tasks = self.task_dao.get_all()
+            children = []
             for other_task in all_tasks:
                 if (other_task.recurrence_parent_id == task.id and
                     other_task.share_elo_rating and
                     other_task.id != task.id):  # Don't update self
                     other_task.shared_elo_rating = task.elo_rating
                     other_task.shared_comparison_count = task.comparison_count
-                    self.task_dao.update(other_task)
+                    children.append(other_task)
+            self.task_dao.bulk_update(children)
@@ -4,6 +4,7 @@ Provides comprehensive data deletion with transaction safety.
 """
 import sqlite3
 from typing import Dict, Any
+from ..database.settings_dao import SettingsDAO
 
 
 class DataResetService:
@@ -142,6 +143,8 @@ class DataResetService:
 
                 # Commit transaction
                 self.db_connection.commit()
+                if reset_settings:
+                    SettingsDAO.invalidate_cache()
 
                 return {
                     'success': True,
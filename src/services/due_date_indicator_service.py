@@ -21,6 +21,15 @@ class DueDateIndicatorService:
     - Tasks due soon (0 < days until due <= threshold)
     """
 
+    # Settings that affect the indicators
+    SETTING_KEYS = (
+        'due_date_indicators_enabled',
+        'due_soon_threshold_days',
+        'overdue_symbol',
+        'due_today_symbol',
+        'due_soon_symbol',
+    )
+
     def __init__(self, settings_dao: SettingsDAO):
         """
         Initialize the due date indicator service.
@@ -30,6 +39,7 @@ class DueDateIndicatorService:
         """
         self.settings_dao = settings_dao
         self._load_settings()
+        SettingsDAO.add_listener(self._on_setting_changed, keys=self.SETTING_KEYS)
 
     def _load_settings(self):
         """Load indicator settings from database."""
@@ -40,9 +50,13 @@ class DueDateIndicatorService:
         self.due_soon_symbol = self.settings_dao.get_str('due_soon_symbol', '◆')
 
     def reload_settings(self):
-        """Reload settings from database (call after settings change)."""
+        """Reload settings from database (called automatically when they change)."""
         self._load_settings()
 
+    def _on_setting_changed(self, key: Optional[str]):
+        """Reload when one of the indicator settings changed."""
+        self.reload_settings()
+
     def get_indicator(self, task: Task) -> str:
         """
         Get the due date indicator symbol for a task.
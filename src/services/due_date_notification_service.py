@@ -42,8 +42,10 @@ class DueDateNotificationService:
             db_connection: Database connection instance
         """
         self.db_connection = db_connection
-        self.task_dao = TaskDAO(db_connection.get_connection())
-        self.settings_dao = SettingsDAO(db_connection.get_connection())
+        # Periodic checks run on a scheduler thread and only read, so they use
+        # that thread's read-only connection instead of the UI connection
+        self.task_dao = TaskDAO(db_connection.thread_bound(read_only=True))
+        self.settings_dao = SettingsDAO(db_connection.thread_bound(read_only=True))
         self.toast_service = ToastNotificationService(db_connection)
 
         # Track notified tasks in current session to avoid duplicates
@@ -1,14 +1,149 @@
 """Export service for backing up application data.
 
-Provides JSON export and SQLite database backup functionality.
+Provides JSON export (as one document or line-delimited, optionally
+gzip-compressed) and SQLite database backup functionality.
+
+Every JSON export records a watermark: the last task change log seq and
+the highest IDs of the append-only history tables at the time of export.
+A delta export contains only what changed after a watermark (changed
+tasks with their tag links and dependencies, new history rows, and
+tombstones for deleted tasks and history rows), so a chain of deltas on top
+of a full export restores the same data as a new full export.
+
+A filtered export holds only the tasks matching an ExportFilter, together
+with the contexts and project tags they use and the dependencies,
+comparisons and history among them. It is meant to be merged into another
+database and records no watermark.
 """
-import json
-import shutil
+import gzip
+import os
 import sqlite3
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Tuple
 from pathlib import Path
 
+from ..database.settings_dao import SettingsDAO
+from ..database.transaction import transaction
+from ..models.enums import TaskState
+from .json_stream import FORMAT_JSON, GZIP_COMPRESSLEVEL, open_export_writer
+
+
+class OperationCancelled(Exception):
+    """Raised when an export, import or backup is cancelled before it completes."""
+
+
+def check_cancelled(cancel_event: Optional[threading.Event]) -> None:
+    """Raise OperationCancelled if cancel_event is set."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise OperationCancelled()
+
+
+def error_result(error: Exception) -> Dict[str, Any]:
+    """Build the result dictionary of a failed or cancelled operation."""
+    cancelled = isinstance(error, OperationCancelled)
+    return {
+        'success': False,
+        'cancelled': cancelled,
+        'error': "Cancelled" if cancelled else str(error)
+    }
+
+
+@dataclass(frozen=True)
+class ExportFilter:
+    """Selects the tasks of a filtered export.
+
+    A task must match every given criterion; for contexts, project tags and
+    states it must match one of the listed values. Empty criteria match all
+    tasks.
+    """
+    context_ids: Tuple[int, ...] = ()
+    project_tag_ids: Tuple[int, ...] = ()
+    states: Tuple[TaskState, ...] = ()
+    updated_since: Optional[datetime] = None
+
+    def is_empty(self) -> bool:
+        """Check if the filter matches every task."""
+        return not (self.context_ids or self.project_tag_ids or self.states or self.updated_since)
+
+    def task_ids_query(self) -> Tuple[str, tuple]:
+        """Get a query selecting the IDs of the matching tasks.
+
+        Returns:
+            (query, params)
+        """
+        def placeholders(values) -> str:
+            return ','.join('?' * len(values))
+
+        conditions = []
+        params: list = []
+        if self.context_ids:
+            conditions.append(f"context_id IN ({placeholders(self.context_ids)})")
+            params.extend(self.context_ids)
+        if self.project_tag_ids:
+            conditions.append(
+                "id IN (SELECT task_id FROM task_project_tags "
+                f"WHERE project_tag_id IN ({placeholders(self.project_tag_ids)}))"
+            )
+            params.extend(self.project_tag_ids)
+        if self.states:
+            conditions.append(f"state IN ({placeholders(self.states)})")
+            params.extend(state.value for state in self.states)
+        if self.updated_since is not None:
+            # Compared as instants: TaskDAO stores isoformat() ('T' separator),
+            # column defaults use CURRENT_TIMESTAMP (' ' separator)
+            conditions.append("julianday(updated_at) >= julianday(?)")
+            params.append(self.updated_since.isoformat())
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return f"SELECT id FROM tasks{where}", tuple(params)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Describe the filter for the export metadata."""
+        return {
+            'context_ids': list(self.context_ids),
+            'project_tag_ids': list(self.project_tag_ids),
+            'states': [state.value for state in self.states],
+            'updated_since': self.updated_since.isoformat() if self.updated_since else None
+        }
+
+
+class _ExportProgress:
+    """Reports export progress by rows written across all sections."""
+
+    def __init__(self, callback: Optional[Callable[[str, int], None]], total_rows: int,
+                 report_every: int = 500, cancel_event: Optional[threading.Event] = None):
+        self._callback = callback
+        self._total_rows = max(total_rows, 1)
+        self._report_every = report_every
+        self._cancel_event = cancel_event
+        self._rows = 0
+        self._message = ""
+
+    def _report(self) -> None:
+        check_cancelled(self._cancel_event)
+        if self._callback:
+            self._callback(self._message, min(int(self._rows / self._total_rows * 95), 95))
+
+    def start_section(self, message: str) -> None:
+        """Report the start of a section."""
+        self._message = message
+        self._report()
+
+    def track(self, rows: Iterable[Any]) -> Iterator[Any]:
+        """Pass rows through, reporting every report_every rows."""
+        for row in rows:
+            yield row
+            self._rows += 1
+            if self._rows % self._report_every == 0:
+                self._report()
+
+
+class _BackupRestartLimit(Exception):
+    """Raised to stop a stepwise backup that keeps restarting."""
+
 
 class ExportService:
     """Service for exporting application data."""
@@ -16,6 +151,35 @@ class ExportService:
     APP_VERSION = "1.0.0"
     SCHEMA_VERSION = 1
 
+    # Rows fetched from the database per round trip while streaming
+    CHUNK_SIZE = 500
+
+    # Setting holding the watermark of the last JSON export (not exported itself)
+    WATERMARK_SETTING = 'export_watermark'
+
+    # Watermark components: the task change log, the history delete log and
+    # the append-only history tables, as (key, table, monotonic column)
+    WATERMARK_SOURCES = (
+        ('task_changes', 'task_changes', 'seq'),
+        ('history_deletes', 'history_deletes', 'seq'),
+        ('task_comparisons', 'task_comparisons', 'id'),
+        ('postpone_history', 'postpone_history', 'id'),
+        ('task_history', 'task_history', 'id'),
+    )
+
+    # History tables whose deleted rows delta exports pass on as tombstones
+    HISTORY_TABLES = ('task_comparisons', 'postpone_history', 'task_history')
+
+    # Pages copied per database backup step (4 MB with the default page size)
+    BACKUP_PAGES_PER_STEP = 1024
+
+    # Seconds the database backup pauses between steps to let writers in
+    BACKUP_STEP_PAUSE = 0.005
+
+    # Restarts (caused by writes from other connections) before the rest of
+    # the backup is copied in one step
+    BACKUP_MAX_RESTARTS = 5
+
     def __init__(self, db_connection: sqlite3.Connection):
         """Initialize export service.
 
@@ -28,14 +192,36 @@ class ExportService:
         self,
         filepath: str,
         include_settings: bool = True,
-        progress_callback: Optional[Callable[[str, int], None]] = None
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        compact: bool = False,
+        export_format: str = FORMAT_JSON,
+        compress: Optional[bool] = None,
+        cancel_event: Optional[threading.Event] = None,
+        export_filter: Optional[ExportFilter] = None
     ) -> Dict[str, Any]:
         """Export all data to structured JSON file.
 
+        Rows are streamed from each table in chunks and written as they are
+        read, so memory use does not grow with the size of the database. The
+        file is written next to filepath and moved into place once complete.
+
+        With an export_filter, only the matching tasks are exported, with the
+        contexts and project tags they use and the dependencies, comparisons
+        and history among them (no notifications). The filter is applied in
+        the queries, so unmatched rows are never read. A filtered export does
+        not record a watermark and cannot be the base of incremental exports.
+
         Args:
             filepath: Destination file path for JSON export
             include_settings: Whether to include settings in export
             progress_callback: Optional callback(message, percent) for progress updates
+            compact: Write without indentation or whitespace (smaller, faster)
+            export_format: FORMAT_JSON for one JSON document, or FORMAT_NDJSON
+                for one {"section": record} object per line
+            compress: gzip the file; None compresses if filepath ends in ".gz"
+            cancel_event: Optional event; setting it aborts the export and
+                removes the partial file
+            export_filter: Optional filter selecting the exported tasks
 
         Returns:
             Dictionary with export results:
@@ -49,101 +235,369 @@ class ExportService:
                 'comparison_count': int,
                 'history_count': int,
                 'notification_count': int,
+                'event_count': int (task history events),
+                'watermark': Dict[str, int] (None for a filtered export),
+                'cancelled': bool (if success=False),
                 'error': str (if success=False)
             }
         """
-        try:
-            if progress_callback:
-                progress_callback("Starting export...", 0)
+        if export_filter is not None and export_filter.is_empty():
+            export_filter = None
 
-            # Build export data structure
-            export_data = {
-                "metadata": {
-                    "export_date": datetime.now().isoformat(),
-                    "app_version": self.APP_VERSION,
-                    "schema_version": self.SCHEMA_VERSION,
-                    "export_type": "full"
-                }
-            }
+        return self._export(
+            filepath, include_settings, progress_callback, compact, export_format, compress,
+            cancel_event=cancel_event, export_filter=export_filter
+        )
+
+    def export_delta(
+        self,
+        filepath: str,
+        since: Optional[Dict[str, int]] = None,
+        include_settings: bool = True,
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        compact: bool = False,
+        export_format: str = FORMAT_JSON,
+        compress: Optional[bool] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """Export only the data changed since an earlier export.
 
-            # Export each table
-            total_steps = 8
-            current_step = 0
+        The delta holds the tasks inserted or updated since the watermark
+        (with all their tag links and dependencies), tombstones for deleted
+        tasks and history rows, history rows added since, and the current
+        contexts, project tags, notifications and settings (small tables,
+        exported whole).
 
-            if progress_callback:
-                progress_callback("Exporting contexts...", int((current_step / total_steps) * 100))
-            export_data["contexts"] = self._export_contexts()
-            current_step += 1
+        Args:
+            filepath: Destination file path
+            since: Watermark of the export to build on; None uses the
+                watermark recorded by the last JSON export
+            include_settings: Whether to include settings in export
+            progress_callback: Optional callback(message, percent) for progress updates
+            compact: Write without indentation or whitespace (smaller, faster)
+            export_format: FORMAT_JSON or FORMAT_NDJSON
+            compress: gzip the file; None compresses if filepath ends in ".gz"
+            cancel_event: Optional event; setting it aborts the export
 
-            if progress_callback:
-                progress_callback("Exporting project tags...", int((current_step / total_steps) * 100))
-            export_data["project_tags"] = self._export_project_tags()
-            current_step += 1
+        Returns:
+            Dictionary with export results as for export_to_json(), plus
+            'deleted_count' (tombstones)
+        """
+        if since is None:
+            since = self.get_export_watermark()
+            if since is None:
+                return {
+                    'success': False,
+                    'error': 'No previous export recorded. Create a full export first.'
+                }
 
-            if progress_callback:
-                progress_callback("Exporting tasks...", int((current_step / total_steps) * 100))
-            export_data["tasks"] = self._export_tasks()
-            current_step += 1
+        return self._export(
+            filepath, include_settings, progress_callback, compact, export_format, compress,
+            since=since, cancel_event=cancel_event
+        )
 
-            if progress_callback:
-                progress_callback("Exporting dependencies...", int((current_step / total_steps) * 100))
-            export_data["dependencies"] = self._export_dependencies()
-            current_step += 1
+    def get_export_watermark(self) -> Optional[Dict[str, int]]:
+        """Get the watermark recorded by the last JSON export.
 
-            if progress_callback:
-                progress_callback("Exporting task comparisons...", int((current_step / total_steps) * 100))
-            export_data["task_comparisons"] = self._export_task_comparisons()
-            current_step += 1
+        Returns:
+            Watermark dictionary, or None if nothing was exported from this
+            database yet (or it was replaced by an import since)
+        """
+        watermark = SettingsDAO(self.db_connection).get(self.WATERMARK_SETTING)
+        return watermark if isinstance(watermark, dict) else None
 
-            if progress_callback:
-                progress_callback("Exporting postpone history...", int((current_step / total_steps) * 100))
-            export_data["postpone_history"] = self._export_postpone_history()
-            current_step += 1
+    def compact_history_delete_log(self) -> int:
+        """Delete history delete log rows no delta export needs.
 
-            if progress_callback:
-                progress_callback("Exporting notifications...", int((current_step / total_steps) * 100))
-            export_data["notifications"] = self._export_notifications()
-            current_step += 1
+        Delta exports build on the watermark of the last JSON export, so
+        rows up to it are no longer needed (and none are without one).
 
-            if include_settings:
-                if progress_callback:
-                    progress_callback("Exporting settings...", int((current_step / total_steps) * 100))
-                export_data["settings"] = self._export_settings()
-            current_step += 1
+        Returns:
+            Number of rows deleted
+        """
+        watermark = self.get_export_watermark()
+        needed_seq = watermark.get('history_deletes', 0) if watermark else None
+        with transaction(self.db_connection):
+            if needed_seq is None:
+                cursor = self.db_connection.execute("DELETE FROM history_deletes")
+            else:
+                cursor = self.db_connection.execute(
+                    "DELETE FROM history_deletes WHERE seq <= ?", (needed_seq,)
+                )
+        return cursor.rowcount
+
+    def _read_watermark(self) -> Dict[str, int]:
+        """Read the current watermark (inside the export's read transaction)."""
+        cursor = self.db_connection.cursor()
+        watermark = {}
+        for key, table, column in self.WATERMARK_SOURCES:
+            cursor.execute(f"SELECT COALESCE(MAX({column}), 0) FROM {table}")
+            watermark[key] = cursor.fetchone()[0]
+        return watermark
 
-            # Write to file
+    def _export(
+        self,
+        filepath: str,
+        include_settings: bool,
+        progress_callback: Optional[Callable[[str, int], None]],
+        compact: bool,
+        export_format: str,
+        compress: Optional[bool],
+        since: Optional[Dict[str, int]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        export_filter: Optional[ExportFilter] = None
+    ) -> Dict[str, Any]:
+        """Write a full export, a delta export if since is given, or a filtered export."""
+        temp_path = f"{filepath}.partial"
+        try:
             if progress_callback:
-                progress_callback("Writing to file...", 95)
+                progress_callback("Starting export...", 0)
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            if export_filter is not None:
+                export_type = "filtered"
+            else:
+                export_type = "full" if since is None else "delta"
+            metadata = {
+                "export_date": datetime.now().isoformat(),
+                "app_version": self.APP_VERSION,
+                "schema_version": self.SCHEMA_VERSION,
+                "export_type": export_type
+            }
+            counts = {}
+
+            # One read transaction gives every section the same snapshot
+            if compress is None:
+                compress = filepath.endswith('.gz')
+
+            with transaction(self.db_connection), \
+                    self._open_output(temp_path, compress) as f:
+                if export_filter is not None:
+                    watermark = None
+                    metadata["filter"] = export_filter.to_dict()
+                else:
+                    watermark = self._read_watermark()
+                    if since is not None:
+                        since = {key: since.get(key, 0) for key in watermark}
+                        metadata["since"] = since
+                    metadata["watermark"] = watermark
+
+                sections = self._sections(include_settings, since, export_filter)
+                progress = _ExportProgress(
+                    progress_callback, self._count_rows(sections), cancel_event=cancel_event
+                )
+                writer = open_export_writer(f, export_format, compact)
+                writer.write_value("metadata", metadata)
+
+                for name, message, rows, _ in sections:
+                    progress.start_section(message)
+                    if name == "settings":
+                        counts[name] = writer.write_object(name, progress.track(rows))
+                    else:
+                        counts[name] = writer.write_array(name, progress.track(rows))
+
+                writer.close()
+
+            os.replace(temp_path, filepath)
+            if watermark is not None:
+                SettingsDAO(self.db_connection).set(
+                    self.WATERMARK_SETTING, watermark, 'json', 'Watermark of the last JSON export'
+                )
 
             if progress_callback:
                 progress_callback("Export complete!", 100)
 
-            return {
+            result = {
                 'success': True,
                 'filepath': filepath,
-                'task_count': len(export_data['tasks']),
-                'context_count': len(export_data['contexts']),
-                'tag_count': len(export_data['project_tags']),
-                'dependency_count': len(export_data['dependencies']),
-                'comparison_count': len(export_data['task_comparisons']),
-                'history_count': len(export_data['postpone_history']),
-                'notification_count': len(export_data['notifications'])
+                'task_count': counts['tasks'],
+                'context_count': counts['contexts'],
+                'tag_count': counts['project_tags'],
+                'dependency_count': counts['dependencies'],
+                'comparison_count': counts['task_comparisons'],
+                'history_count': counts['postpone_history'],
+                'notification_count': counts['notifications'],
+                'event_count': counts['task_history'],
+                'watermark': watermark
             }
+            if since is not None:
+                result['deleted_count'] = counts['deleted_tasks']
+            return result
 
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return error_result(e)
+
+    @staticmethod
+    def _open_output(path: str, compress: bool):
+        """Open the export file for writing text, gzip-compressed if requested."""
+        if compress:
+            return gzip.open(path, 'wt', encoding='utf-8', compresslevel=GZIP_COMPRESSLEVEL)
+        return open(path, 'w', encoding='utf-8')
+
+    def _sections(
+        self,
+        include_settings: bool,
+        since: Optional[Dict[str, int]] = None,
+        export_filter: Optional[ExportFilter] = None
+    ) -> List[Tuple[str, str, Iterator, Tuple[str, tuple]]]:
+        """Get the exported sections.
+
+        Args:
+            include_settings: Whether to include settings
+            since: Watermark to export changes after (None for a full export)
+            export_filter: Filter selecting the exported tasks (not combined
+                with since)
+
+        Returns:
+            List of (name, progress message, row iterator, (count query, params))
+        """
+        since_seq = None if since is None else since['task_changes']
+
+        if export_filter is not None:
+            where = self._filtered_where(export_filter)
+        else:
+            def added(table: str) -> Tuple[str, tuple]:
+                return self._added_since(None if since is None else since[table])
+
+            where = {
+                'contexts': ("", ()),
+                'project_tags': ("", ()),
+                'tasks': self._changed_since("id", since_seq),
+                'task_project_tags': self._changed_since("task_id", since_seq),
+                'dependencies': self._changed_since("blocked_task_id", since_seq),
+                'task_comparisons': added("task_comparisons"),
+                'postpone_history': added("postpone_history"),
+                'task_history': added("task_history"),
+                'notifications': ("", ()),
             }
 
-    def export_database_backup(self, dest_filepath: str) -> Dict[str, Any]:
+        def count(table: str, table_where: Tuple[str, tuple] = ("", ())) -> Tuple[str, tuple]:
+            return f"SELECT COUNT(*) FROM {table} {table_where[0]}", table_where[1]
+
+        sections = []
+        if since is not None:
+            sections.append((
+                "deleted_tasks", "Exporting deleted tasks...", self._export_deleted_tasks(since_seq),
+                count("task_changes", ("WHERE seq > ? AND operation = 'delete'", (since_seq,)))
+            ))
+            deleted_history, params = self._deleted_history_query(since)
+            sections.append((
+                "deleted_history", "Exporting deleted history...", self._export_deleted_history(since),
+                (f"SELECT COUNT(*) FROM ({deleted_history})", params)
+            ))
+        sections += [
+            ("contexts", "Exporting contexts...", self._export_contexts(where['contexts']),
+             count("contexts", where['contexts'])),
+            ("project_tags", "Exporting project tags...", self._export_project_tags(where['project_tags']),
+             count("project_tags", where['project_tags'])),
+            ("tasks", "Exporting tasks...",
+             self._export_tasks(where['tasks'], where['task_project_tags'], export_filter),
+             count("tasks", where['tasks'])),
+            ("dependencies", "Exporting dependencies...", self._export_dependencies(where['dependencies']),
+             count("dependencies", where['dependencies'])),
+            ("task_comparisons", "Exporting task comparisons...",
+             self._export_task_comparisons(where['task_comparisons']),
+             count("task_comparisons", where['task_comparisons'])),
+            ("postpone_history", "Exporting postpone history...",
+             self._export_postpone_history(where['postpone_history']),
+             count("postpone_history", where['postpone_history'])),
+            ("task_history", "Exporting task history...",
+             self._export_task_history(where['task_history']),
+             count("task_history", where['task_history'])),
+            ("notifications", "Exporting notifications...", self._export_notifications(where['notifications']),
+             count("notifications", where['notifications'])),
+        ]
+        if include_settings:
+            sections.append((
+                "settings", "Exporting settings...", self._export_settings(),
+                count("settings", ("WHERE key != ?", (self.WATERMARK_SETTING,)))
+            ))
+        return sections
+
+    @staticmethod
+    def _filtered_where(export_filter: ExportFilter) -> Dict[str, Tuple[str, tuple]]:
+        """Get the WHERE clause of every table for a filtered export.
+
+        Related rows are kept only if every task they reference matches, so
+        the export can be imported on its own without dangling references.
+        """
+        task_ids, params = export_filter.task_ids_query()
+
+        def in_scope(*columns: str) -> Tuple[str, tuple]:
+            clauses = [f"{column} IN ({task_ids})" for column in columns]
+            return f"WHERE {' AND '.join(clauses)}", params * len(columns)
+
+        return {
+            'contexts': (f"WHERE id IN (SELECT context_id FROM tasks WHERE id IN ({task_ids}))", params),
+            'project_tags': (
+                "WHERE id IN (SELECT project_tag_id FROM task_project_tags "
+                f"WHERE task_id IN ({task_ids}))",
+                params
+            ),
+            'tasks': in_scope("id"),
+            'task_project_tags': in_scope("task_id"),
+            'dependencies': in_scope("blocked_task_id", "blocking_task_id"),
+            'task_comparisons': in_scope("winner_task_id", "loser_task_id"),
+            'postpone_history': in_scope("task_id"),
+            'task_history': in_scope("task_id"),
+            'notifications': ("WHERE 0", ()),
+        }
+
+    @staticmethod
+    def _changed_since(column: str, since_seq: Optional[int]) -> Tuple[str, tuple]:
+        """Get a WHERE clause limiting a task ID column to tasks changed after since_seq."""
+        if since_seq is None:
+            return "", ()
+        return f"WHERE {column} IN (SELECT task_id FROM task_changes WHERE seq > ?)", (since_seq,)
+
+    @staticmethod
+    def _added_since(since_id: Optional[int]) -> Tuple[str, tuple]:
+        """Get a WHERE clause limiting an append-only table to rows added after since_id."""
+        if since_id is None:
+            return "", ()
+        return "WHERE id > ?", (since_id,)
+
+    def _count_rows(self, sections: List[Tuple[str, str, Iterator, Tuple[str, tuple]]]) -> int:
+        """Count the rows that will be exported (for progress reporting)."""
+        cursor = self.db_connection.cursor()
+        total = 0
+        for _, _, _, (query, params) in sections:
+            cursor.execute(query, params)
+            total += cursor.fetchone()[0]
+        return total
+
+    def _iter_rows(self, query: str, params: tuple = ()) -> Iterator[tuple]:
+        """Iterate over query results, fetching CHUNK_SIZE rows at a time."""
+        cursor = self.db_connection.cursor()
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(self.CHUNK_SIZE)
+            if not rows:
+                break
+            yield from rows
+
+    def export_database_backup(
+        self,
+        dest_filepath: str,
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
         """Create SQLite database file backup.
 
+        Uses the SQLite online backup API on a separate read-only connection,
+        so the copy is a consistent snapshot even while the application
+        writes. Pages are copied BACKUP_PAGES_PER_STEP at a time; the source
+        is only locked during a step and the copy pauses between steps so
+        writers are not starved. A write by another connection restarts the
+        copy; after BACKUP_MAX_RESTARTS restarts the rest is copied in one
+        step. The file is written next to dest_filepath and moved into place
+        once complete.
+
         Args:
             dest_filepath: Destination path for database backup
+            progress_callback: Optional callback(message, percent) for progress updates
+            cancel_event: Optional event; setting it aborts the backup
 
         Returns:
             Dictionary with backup results:
@@ -151,83 +605,193 @@ class ExportService:
                 'success': bool,
                 'filepath': str,
                 'size_bytes': int,
+                'cancelled': bool (if success=False),
                 'error': str (if success=False)
             }
         """
+        temp_path = f"{dest_filepath}.partial"
+        source = None
         try:
-            # Get current database file path
-            cursor = self.db_connection.cursor()
-            cursor.execute("PRAGMA database_list")
-            db_info = cursor.fetchone()
-            source_path = db_info[2]  # File path is third column
+            if progress_callback:
+                progress_callback("Starting database backup...", 0)
+
+            source = self._open_backup_source()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            dest = sqlite3.connect(temp_path)
+            try:
+                self._copy_pages(source, dest, progress_callback, cancel_event)
+            finally:
+                dest.close()
 
-            # Copy database file
-            shutil.copy2(source_path, dest_filepath)
+            os.replace(temp_path, dest_filepath)
 
-            # Get file size
-            file_size = Path(dest_filepath).stat().st_size
+            if progress_callback:
+                progress_callback("Backup complete!", 100)
 
             return {
                 'success': True,
                 'filepath': dest_filepath,
-                'size_bytes': file_size
+                'size_bytes': Path(dest_filepath).stat().st_size
             }
 
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e)
-            }
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return error_result(e)
+        finally:
+            if source is not None and source is not self.db_connection:
+                source.close()
+
+    def _open_backup_source(self) -> sqlite3.Connection:
+        """Open a read-only connection to the database file being backed up.
+
+        In-memory and temporary databases cannot be opened twice; they are
+        copied through the service's own connection instead.
+        """
+        source_path = self.db_connection.execute("PRAGMA database_list").fetchone()[2]
+        if not source_path:
+            return self.db_connection
+        return sqlite3.connect(
+            Path(source_path).resolve().as_uri() + "?mode=ro",
+            uri=True,
+            check_same_thread=False
+        )
+
+    def _copy_pages(
+        self,
+        source: sqlite3.Connection,
+        dest: sqlite3.Connection,
+        progress_callback: Optional[Callable[[str, int], None]],
+        cancel_event: Optional[threading.Event]
+    ) -> None:
+        """Copy every page of source to dest in steps.
+
+        Raises:
+            OperationCancelled: If cancel_event was set
+        """
+        copied = 0
+        restarts = 0
 
-    def _export_contexts(self) -> List[Dict]:
-        """Export all contexts."""
-        cursor = self.db_connection.cursor()
-        cursor.execute("SELECT id, name, description FROM contexts ORDER BY id")
+        def after_step(status: int, remaining: int, page_count: int) -> None:
+            nonlocal copied, restarts
+            if page_count - remaining < copied:
+                restarts += 1
+            copied = page_count - remaining
+
+            if progress_callback:
+                percent = min(int(copied / max(page_count, 1) * 95), 95)
+                progress_callback(f"Copying database ({copied} of {page_count} pages)...", percent)
+
+            if remaining == 0:
+                return
+            if restarts > self.BACKUP_MAX_RESTARTS:
+                raise _BackupRestartLimit()
 
-        contexts = []
-        for row in cursor.fetchall():
-            contexts.append({
+            # Pausing releases the source; an event also wakes up on cancel
+            if cancel_event is not None:
+                cancel_event.wait(self.BACKUP_STEP_PAUSE)
+            else:
+                time.sleep(self.BACKUP_STEP_PAUSE)
+            check_cancelled(cancel_event)
+
+        try:
+            source.backup(dest, pages=self.BACKUP_PAGES_PER_STEP, progress=after_step)
+        except _BackupRestartLimit:
+            source.backup(dest)
+
+    def _export_contexts(self, where: Tuple[str, tuple] = ("", ())) -> Iterator[Dict]:
+        """Export contexts (all, or those selected by a WHERE clause)."""
+        for row in self._iter_rows(f"SELECT id, name, description FROM contexts {where[0]} ORDER BY id",
+                                   where[1]):
+            yield {
                 'id': row[0],
                 'name': row[1],
                 'description': row[2]
-            })
-
-        return contexts
-
-    def _export_project_tags(self) -> List[Dict]:
-        """Export all project tags."""
-        cursor = self.db_connection.cursor()
-        cursor.execute("SELECT id, name, description FROM project_tags ORDER BY id")
+            }
 
-        tags = []
-        for row in cursor.fetchall():
-            tags.append({
+    def _export_project_tags(self, where: Tuple[str, tuple] = ("", ())) -> Iterator[Dict]:
+        """Export project tags (all, or those selected by a WHERE clause)."""
+        for row in self._iter_rows(f"SELECT id, name, description FROM project_tags {where[0]} ORDER BY id",
+                                   where[1]):
+            yield {
                 'id': row[0],
                 'name': row[1],
                 'description': row[2]
-            })
+            }
 
-        return tags
+    def _export_deleted_tasks(self, since_seq: int) -> Iterator[int]:
+        """Export IDs of tasks deleted after a change log position (tombstones)."""
+        for row in self._iter_rows("""
+            SELECT DISTINCT task_id FROM task_changes
+            WHERE seq > ? AND operation = 'delete'
+              AND task_id NOT IN (SELECT id FROM tasks)
+            ORDER BY task_id
+        """, (since_seq,)):
+            yield row[0]
+
+    def _deleted_history_query(self, since: Dict[str, int]) -> Tuple[str, tuple]:
+        """Get a query for history rows that existed at since and were deleted after it."""
+        parts = []
+        params: list = []
+        for table in self.HISTORY_TABLES:
+            parts.append(f"""
+                SELECT table_name, row_id FROM history_deletes
+                WHERE table_name = ? AND seq > ? AND row_id <= ?
+                  AND row_id NOT IN (SELECT id FROM {table})
+            """)
+            params += [table, since['history_deletes'], since[table]]
+        return " UNION ".join(parts) + " ORDER BY 1, 2", tuple(params)
+
+    def _export_deleted_history(self, since: Dict[str, int]) -> Iterator[Dict]:
+        """Export tombstones of history rows deleted after a watermark."""
+        for table, row_id in self._iter_rows(*self._deleted_history_query(since)):
+            yield {'table': table, 'id': row_id}
+
+    def _export_tasks(
+        self,
+        where: Tuple[str, tuple] = ("", ()),
+        link_where: Tuple[str, tuple] = ("", ()),
+        export_filter: Optional[ExportFilter] = None
+    ) -> Iterator[Dict]:
+        """Export tasks with relationships.
 
-    def _export_tasks(self) -> List[Dict]:
-        """Export all tasks with relationships."""
-        cursor = self.db_connection.cursor()
-        cursor.execute("""
+        Project tag links are read with a second cursor in task order and
+        merged in as the tasks stream past, instead of one query per task.
+
+        Args:
+            where: WHERE clause selecting the tasks
+            link_where: WHERE clause selecting the same tasks' tag links
+            export_filter: Filter of a filtered export; recurrence parents
+                outside it are exported as None
+        """
+        tag_links = self._iter_rows(
+            f"SELECT task_id, project_tag_id FROM task_project_tags {link_where[0]} "
+            "ORDER BY task_id, project_tag_id",
+            link_where[1]
+        )
+        pending_link = next(tag_links, None)
+
+        parent_column, params = "recurrence_parent_id", where[1]
+        if export_filter is not None:
+            task_ids, parent_params = export_filter.task_ids_query()
+            parent_column = f"CASE WHEN recurrence_parent_id IN ({task_ids}) THEN recurrence_parent_id END"
+            params = parent_params + params
+
+        for row in self._iter_rows(f"""
             SELECT
                 id, title, description, state, base_priority,
                 elo_rating, comparison_count, context_id, due_date,
                 start_date, delegated_to, follow_up_date, completed_at,
                 last_resurfaced_at, resurface_count,
-                is_recurring, recurrence_pattern, recurrence_parent_id,
+                is_recurring, recurrence_pattern, {parent_column},
                 share_elo_rating, shared_elo_rating, shared_comparison_count,
                 recurrence_end_date, occurrence_count,
                 created_at, updated_at
             FROM tasks
+            {where[0]}
             ORDER BY id
-        """)
-
-        tasks = []
-        for row in cursor.fetchall():
+        """, params):
             task = {
                 'id': row[0],
                 'title': row[1],
@@ -256,99 +820,105 @@ class ExportService:
                 'updated_at': row[24]
             }
 
-            # Get associated project tags
-            tag_cursor = self.db_connection.cursor()
-            tag_cursor.execute(
-                "SELECT project_tag_id FROM task_project_tags WHERE task_id = ?",
-                (task['id'],)
-            )
-            task['project_tag_ids'] = [r[0] for r in tag_cursor.fetchall()]
-
-            tasks.append(task)
+            # Skip links of tasks that no longer exist, then take this task's
+            while pending_link is not None and pending_link[0] < task['id']:
+                pending_link = next(tag_links, None)
+            task['project_tag_ids'] = []
+            while pending_link is not None and pending_link[0] == task['id']:
+                task['project_tag_ids'].append(pending_link[1])
+                pending_link = next(tag_links, None)
 
-        return tasks
+            yield task
 
-    def _export_dependencies(self) -> List[Dict]:
-        """Export all task dependencies."""
-        cursor = self.db_connection.cursor()
-        cursor.execute("""
+    def _export_dependencies(self, where: Tuple[str, tuple] = ("", ())) -> Iterator[Dict]:
+        """Export task dependencies (all, or those selected by a WHERE clause)."""
+        where, params = where
+        for row in self._iter_rows(f"""
             SELECT id, blocked_task_id, blocking_task_id, created_at
             FROM dependencies
+            {where}
             ORDER BY blocked_task_id, blocking_task_id
-        """)
-
-        dependencies = []
-        for row in cursor.fetchall():
-            dependencies.append({
+        """, params):
+            yield {
                 'id': row[0],
                 'blocked_task_id': row[1],
                 'blocking_task_id': row[2],
                 'created_at': row[3]
-            })
-
-        return dependencies
+            }
 
-    def _export_task_comparisons(self) -> List[Dict]:
-        """Export all task comparisons."""
-        cursor = self.db_connection.cursor()
-        cursor.execute("""
+    def _export_task_comparisons(self, where: Tuple[str, tuple] = ("", ())) -> Iterator[Dict]:
+        """Export task comparisons (all, or those selected by a WHERE clause)."""
+        where, params = where
+        for row in self._iter_rows(f"""
             SELECT
                 id, winner_task_id, loser_task_id,
                 adjustment_amount, compared_at
             FROM task_comparisons
+            {where}
             ORDER BY id
-        """)
-
-        comparisons = []
-        for row in cursor.fetchall():
-            comparisons.append({
+        """, params):
+            yield {
                 'id': row[0],
                 'winner_task_id': row[1],
                 'loser_task_id': row[2],
                 'adjustment_amount': row[3],
                 'compared_at': row[4]
-            })
-
-        return comparisons
+            }
 
-    def _export_postpone_history(self) -> List[Dict]:
-        """Export postpone history."""
-        cursor = self.db_connection.cursor()
-        cursor.execute("""
+    def _export_postpone_history(self, where: Tuple[str, tuple] = ("", ())) -> Iterator[Dict]:
+        """Export postpone history (all, or those selected by a WHERE clause)."""
+        where, params = where
+        for row in self._iter_rows(f"""
             SELECT
                 id, task_id, reason_type, reason_notes,
                 action_taken, postponed_at
             FROM postpone_history
+            {where}
             ORDER BY id
-        """)
-
-        history = []
-        for row in cursor.fetchall():
-            history.append({
+        """, params):
+            yield {
                 'id': row[0],
                 'task_id': row[1],
                 'reason_type': row[2],
                 'reason_notes': row[3],
                 'action_taken': row[4],
                 'postponed_at': row[5]
-            })
+            }
 
-        return history
+    def _export_task_history(self, where: Tuple[str, tuple] = ("", ())) -> Iterator[Dict]:
+        """Export task history events (all, or those selected by a WHERE clause)."""
+        where, params = where
+        for row in self._iter_rows(f"""
+            SELECT
+                id, task_id, event_type, event_timestamp,
+                old_value, new_value, changed_by, context_data
+            FROM task_history
+            {where}
+            ORDER BY id
+        """, params):
+            yield {
+                'id': row[0],
+                'task_id': row[1],
+                'event_type': row[2],
+                'event_timestamp': row[3],
+                'old_value': row[4],
+                'new_value': row[5],
+                'changed_by': row[6],
+                'context_data': row[7]
+            }
 
-    def _export_notifications(self) -> List[Dict]:
-        """Export notifications."""
-        cursor = self.db_connection.cursor()
-        cursor.execute("""
+    def _export_notifications(self, where: Tuple[str, tuple] = ("", ())) -> Iterator[Dict]:
+        """Export notifications (all, or those selected by a WHERE clause)."""
+        where, params = where
+        for row in self._iter_rows(f"""
             SELECT
                 id, type, title, message,
                 is_read, action_type, action_data, created_at, dismissed_at
             FROM notifications
+            {where}
             ORDER BY id
-        """)
-
-        notifications = []
-        for row in cursor.fetchall():
-            notifications.append({
+        """, params):
+            yield {
                 'id': row[0],
                 'type': row[1],
                 'title': row[2],
@@ -358,22 +928,17 @@ class ExportService:
                 'action_data': row[6],
                 'created_at': row[7],
                 'dismissed_at': row[8]
-            })
-
-        return notifications
-
-    def _export_settings(self) -> Dict[str, Any]:
-        """Export settings as dictionary."""
-        cursor = self.db_connection.cursor()
-        cursor.execute("SELECT key, value, value_type FROM settings ORDER BY key")
+            }
 
-        settings = {}
-        for row in cursor.fetchall():
-            key, value, value_type = row
+    def _export_settings(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Export settings as (key, entry) pairs of the settings object."""
+        # The watermark describes this database's change log, not the data
+        for key, value, value_type in self._iter_rows(
+            "SELECT key, value, value_type FROM settings WHERE key != ? ORDER BY key",
+            (self.WATERMARK_SETTING,)
+        ):
             # Store with type info for proper restoration
-            settings[key] = {
+            yield key, {
                 'value': value,
                 'type': value_type
             }
-
-        return settings
@@ -6,6 +6,7 @@ Detects and manages first-run state for onboarding.
 
 import sqlite3
 from typing import Optional
+from ..database.settings_dao import SettingsDAO
 
 
 class FirstRunDetector:
@@ -57,6 +58,7 @@ class FirstRunDetector:
         )
 
         self.db_connection.commit()
+        SettingsDAO.invalidate_cache('onboarding_completed')
 
     def should_show_tutorial(self) -> bool:
         """
@@ -91,6 +93,7 @@ class FirstRunDetector:
         )
 
         self.db_connection.commit()
+        SettingsDAO.invalidate_cache('tutorial_shown')
 
     def reset_onboarding(self):
         """Reset onboarding state (for testing or re-running tutorial)."""
@@ -105,3 +108,4 @@ class FirstRunDetector:
         )
 
         self.db_connection.commit()
+        SettingsDAO.invalidate_cache()
@@ -1,13 +1,62 @@
 """Import service for restoring application data.
 
 Provides JSON import and database restoration with validation and ID conflict resolution.
+A full export followed by the delta exports taken after it can be restored
+together with import_export_chain().
 """
 import json
+import os
 import shutil
 import sqlite3
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Callable
+from itertools import islice
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Tuple
 from pathlib import Path
+from ..database.settings_dao import SettingsDAO
+from ..database.transaction import transaction
+from .export_service import ExportService, check_cancelled, error_result
+from .json_stream import FORMAT_JSON, FORMAT_NDJSON, iter_export_members, open_export
+
+
+def _batches(records: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split records into lists of at most size items."""
+    records = iter(records)
+    while True:
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+
+class _ImportProgress:
+    """Reports import progress with the message of the current section.
+
+    Every report is also a cancellation point: a set cancel_event raises
+    OperationCancelled, which rolls back the import transaction.
+    """
+
+    def __init__(self, callback: Optional[Callable[[str, int], None]], percent: int = 0,
+                 cancel_event: Optional[threading.Event] = None):
+        self._callback = callback
+        self._message = "Loading import file..."
+        self._percent = percent
+        self._cancel_event = cancel_event
+
+    def set_message(self, message: str) -> None:
+        """Report the start of a step."""
+        check_cancelled(self._cancel_event)
+        self._message = message
+        if self._callback:
+            self._callback(message, self._percent)
+
+    def report(self, percent: int) -> None:
+        """Report progress when the percentage grows."""
+        check_cancelled(self._cancel_event)
+        percent = min(percent, 95)
+        if self._callback and percent > self._percent:
+            self._percent = percent
+            self._callback(self._message, percent)
 
 
 class ImportService:
@@ -15,6 +64,45 @@ class ImportService:
 
     SUPPORTED_SCHEMA_VERSION = 1
 
+    # Records inserted per executemany() call
+    BATCH_SIZE = 500
+
+    # Sections in import order, and the sections whose IDs they reference
+    SECTION_ORDER = (
+        'deleted_tasks', 'deleted_history', 'contexts', 'project_tags', 'tasks', 'dependencies',
+        'task_comparisons', 'postpone_history', 'task_history', 'notifications', 'settings'
+    )
+    SECTION_PREREQUISITES = {
+        'tasks': ('contexts', 'project_tags'),
+        'dependencies': ('tasks',),
+        'task_comparisons': ('tasks',),
+        'postpone_history': ('tasks',),
+        'task_history': ('tasks',),
+    }
+    REQUIRED_SECTIONS = ('contexts', 'project_tags', 'tasks')
+    DELTA_REQUIRED_SECTIONS = ('deleted_tasks', 'tasks')
+
+    # Tables a delta export carries whole; rows missing from it were deleted
+    DELTA_SYNCED_TABLES = ('contexts', 'project_tags', 'notifications')
+
+    # Task columns in the order of _task_row()
+    TASK_COLUMNS = (
+        'id', 'title', 'description', 'state', 'base_priority',
+        'elo_rating', 'comparison_count', 'context_id', 'due_date',
+        'start_date', 'delegated_to', 'follow_up_date', 'completed_at',
+        'last_resurfaced_at', 'resurface_count',
+        'is_recurring', 'recurrence_pattern', 'recurrence_parent_id',
+        'share_elo_rating', 'shared_elo_rating', 'shared_comparison_count',
+        'recurrence_end_date', 'occurrence_count',
+        'created_at', 'updated_at'
+    )
+
+    # Notification columns in the order of _notification_row()
+    NOTIFICATION_COLUMNS = (
+        'id', 'type', 'title', 'message', 'is_read',
+        'action_type', 'action_data', 'created_at', 'dismissed_at'
+    )
+
     def __init__(self, db_connection: sqlite3.Connection):
         """Initialize import service.
 
@@ -28,15 +116,33 @@ class ImportService:
         self,
         filepath: str,
         merge_mode: bool = False,
-        progress_callback: Optional[Callable[[str, int], None]] = None
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        streaming: bool = True,
+        cancel_event: Optional[threading.Event] = None
     ) -> Dict[str, Any]:
         """Import data from JSON file with validation.
 
+        Plain and gzip-compressed files, in either the JSON document or the
+        line-delimited (NDJSON) format, are detected automatically.
+
+        The whole import runs in one transaction with foreign key checks
+        deferred until commit, so any failure leaves the database unchanged.
+        Records are inserted with executemany() in batches of BATCH_SIZE.
+        Cached settings are dropped afterwards; settings listeners are only
+        notified if this runs on the main thread (see SettingsDAO), so a
+        background import is followed by SettingsDAO.invalidate_cache() on
+        the UI thread.
+
         Args:
             filepath: Source JSON file path
             merge_mode: If True, merge with existing data (remap IDs on conflict).
                        If False, replace all existing data.
             progress_callback: Optional callback(message, percent) for progress updates
+            streaming: If True, parse the file incrementally, one record at a
+                       time (bounded memory). If False, load it with json.load
+                       (line-delimited files are always streamed).
+            cancel_event: Optional event; setting it aborts the import and
+                rolls back every change
 
         Returns:
             Dictionary with import results:
@@ -46,6 +152,7 @@ class ImportService:
                 'context_count': int,
                 'tag_count': int,
                 'warnings': List[str],
+                'cancelled': bool (if success=False),
                 'error': str (if success=False)
             }
         """
@@ -53,118 +160,399 @@ class ImportService:
             if progress_callback:
                 progress_callback("Loading import file...", 0)
 
-            # Load and validate JSON
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            counts = self._import_file(
+                filepath, merge_mode, progress_callback, streaming, cancel_event=cancel_event
+            )
 
-            validation_result = self._validate_import_data(data)
-            if not validation_result['valid']:
-                return {
-                    'success': False,
-                    'error': validation_result['error']
-                }
+            SettingsDAO.invalidate_cache()
 
             if progress_callback:
-                progress_callback("Validation complete...", 5)
+                progress_callback("Import complete!", 100)
 
-            # Begin transaction
-            self.db_connection.execute("BEGIN TRANSACTION")
+            return self._result(counts)
 
-            try:
-                warnings = []
-                total_steps = 8 if merge_mode else 9
-                current_step = 1
+        except Exception as e:
+            return error_result(e)
 
-                # Clear existing data if replace mode
-                if not merge_mode:
-                    if progress_callback:
-                        progress_callback("Clearing existing data...", int((current_step / total_steps) * 100))
-                    self._clear_all_data()
-                    current_step += 1
-
-                # Reset ID mappings for merge mode
-                self._id_mappings = {
-                    'contexts': {},
-                    'project_tags': {},
-                    'tasks': {}
-                }
-
-                # Import in dependency order
-                if progress_callback:
-                    progress_callback("Importing contexts...", int((current_step / total_steps) * 100))
-                context_count = self._import_contexts(data.get('contexts', []), merge_mode)
-                current_step += 1
-
-                if progress_callback:
-                    progress_callback("Importing project tags...", int((current_step / total_steps) * 100))
-                tag_count = self._import_project_tags(data.get('project_tags', []), merge_mode)
-                current_step += 1
-
-                if progress_callback:
-                    progress_callback("Importing tasks...", int((current_step / total_steps) * 100))
-                task_count = self._import_tasks(data.get('tasks', []), merge_mode)
-                current_step += 1
-
-                if progress_callback:
-                    progress_callback("Importing dependencies...", int((current_step / total_steps) * 100))
-                dep_count = self._import_dependencies(data.get('dependencies', []), merge_mode)
-                current_step += 1
-
-                if progress_callback:
-                    progress_callback("Importing task comparisons...", int((current_step / total_steps) * 100))
-                comp_count = self._import_task_comparisons(data.get('task_comparisons', []), merge_mode)
-                current_step += 1
-
-                if progress_callback:
-                    progress_callback("Importing postpone history...", int((current_step / total_steps) * 100))
-                hist_count = self._import_postpone_history(data.get('postpone_history', []), merge_mode)
-                current_step += 1
-
-                if progress_callback:
-                    progress_callback("Importing notifications...", int((current_step / total_steps) * 100))
-                notif_count = self._import_notifications(data.get('notifications', []), merge_mode)
-                current_step += 1
-
-                # Import settings if present and not merge mode
-                if 'settings' in data and not merge_mode:
+    def import_export_chain(
+        self,
+        filepaths: List[str],
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        streaming: bool = True,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """Restore a full export and the delta exports taken after it.
+
+        The files may be given in any order: they are arranged by their
+        watermarks, and every delta must continue exactly where the previous
+        file ended. All existing data is replaced, and the whole chain is
+        applied in one transaction.
+
+        Args:
+            filepaths: One full export and any number of delta exports
+            progress_callback: Optional callback(message, percent) for progress updates
+            streaming: Parse files incrementally (see import_from_json)
+            cancel_event: Optional event; setting it aborts the import and
+                rolls back every file
+
+        Returns:
+            Dictionary with import results as for import_from_json() (record
+            counts summed over all files), plus 'file_count' and
+            'deleted_count'
+        """
+        try:
+            if progress_callback:
+                progress_callback("Checking export chain...", 0)
+
+            chain = self.order_export_chain(filepaths)
+            totals: Dict[str, int] = {}
+
+            with transaction(self.db_connection):
+                for position, (filepath, _) in enumerate(chain):
+                    file_progress = None
                     if progress_callback:
-                        progress_callback("Importing settings...", int((current_step / total_steps) * 100))
-                    self._import_settings(data['settings'])
-
-                # Commit transaction
-                self.db_connection.commit()
-
-                if progress_callback:
-                    progress_callback("Import complete!", 100)
-
-                return {
-                    'success': True,
-                    'task_count': task_count,
-                    'context_count': context_count,
-                    'tag_count': tag_count,
-                    'dependency_count': dep_count,
-                    'comparison_count': comp_count,
-                    'history_count': hist_count,
-                    'notification_count': notif_count,
-                    'warnings': warnings
-                }
-
-            except Exception as e:
-                # Rollback on error
-                self.db_connection.rollback()
-                raise e
+                        def file_progress(message, percent, position=position):
+                            progress_callback(
+                                f"File {position + 1} of {len(chain)}: {message}",
+                                (position * 100 + percent) // len(chain)
+                            )
+
+                    counts = self._import_file(
+                        filepath, False, file_progress, streaming, delta=position > 0,
+                        cancel_event=cancel_event
+                    )
+                    for section, count in counts.items():
+                        totals[section] = totals.get(section, 0) + count
+
+            SettingsDAO.invalidate_cache()
+
+            if progress_callback:
+                progress_callback("Import complete!", 100)
+
+            result = self._result(totals)
+            result['file_count'] = len(chain)
+            result['deleted_count'] = totals.get('deleted_tasks', 0)
+            return result
 
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e)
+            return error_result(e)
+
+    def order_export_chain(self, filepaths: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Arrange a full export and its delta exports in the order they apply.
+
+        Args:
+            filepaths: Export file paths in any order
+
+        Returns:
+            List of (filepath, metadata), the full export first
+
+        Raises:
+            ValueError: If the files do not form exactly one unbroken chain
+        """
+        base = None
+        deltas = []
+        for filepath in filepaths:
+            metadata = self.read_metadata(filepath)
+            error = self._validate_metadata(metadata)
+            if error:
+                raise ValueError(f"{os.path.basename(filepath)}: {error}")
+            if metadata.get('export_type') == 'delta':
+                deltas.append((filepath, metadata))
+            elif base is not None:
+                raise ValueError("Select only one full export")
+            else:
+                base = (filepath, metadata)
+
+        if base is None:
+            raise ValueError("The full export that the incremental exports build on is missing")
+        if base[1].get('export_type') == 'filtered':
+            raise ValueError(
+                f"{os.path.basename(base[0])} is a filtered export and cannot be used as the base "
+                "of incremental exports"
+            )
+        if 'watermark' not in base[1]:
+            raise ValueError(
+                f"{os.path.basename(base[0])} was created before incremental exports "
+                "were supported and cannot be used as their base"
+            )
+
+        chain = [base]
+        while deltas:
+            watermark = chain[-1][1]['watermark']
+            following = [delta for delta in deltas if self._continues(delta[1].get('since'), watermark)]
+            if not following:
+                missing = ', '.join(os.path.basename(filepath) for filepath, _ in deltas)
+                raise ValueError(
+                    f"Incremental exports do not continue the chain: {missing}. "
+                    "An export in between may be missing."
+                )
+            chain.append(following[0])
+            deltas.remove(following[0])
+        return chain
+
+    @staticmethod
+    def _continues(since: Optional[Dict[str, int]], watermark: Dict[str, int]) -> bool:
+        """Check if a delta built on since continues a file ending at watermark.
+
+        Components missing from older watermarks count as 0.
+        """
+        if not isinstance(since, dict):
+            return False
+        return all(since.get(key, 0) == watermark.get(key, 0) for key in set(since) | set(watermark))
+
+    def read_metadata(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """Read the metadata section of an export, skipping everything else.
+
+        Args:
+            filepath: Export file path (any supported format)
+
+        Returns:
+            Metadata dictionary, or None if the file has none
+
+        Raises:
+            ValueError: If the file is not valid JSON/NDJSON
+            OSError: If the file cannot be read
+        """
+        stream, raw, export_format = open_export(filepath)
+        with raw, stream:
+            for key, value in iter_export_members(stream, export_format):
+                if key == 'metadata':
+                    return value
+        return None
+
+    def _import_file(
+        self,
+        filepath: str,
+        merge_mode: bool,
+        progress_callback: Optional[Callable[[str, int], None]],
+        streaming: bool,
+        delta: bool = False,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, int]:
+        """Import one export file; see import_from_json().
+
+        Returns:
+            Dict mapping section name -> number of imported records
+
+        Raises:
+            ValueError: If the file fails validation
+        """
+        stream, raw, export_format = open_export(filepath)
+        with raw, stream:
+            if streaming or export_format != FORMAT_JSON:
+                file_size = max(os.fstat(raw.fileno()).st_size, 1)
+                progress = _ImportProgress(progress_callback, cancel_event=cancel_event)
+                members = iter_export_members(
+                    stream, export_format,
+                    on_progress=lambda _: progress.report(5 + int(raw.tell() / file_size * 90))
+                )
+                return self._import_members(
+                    members, merge_mode, progress,
+                    line_delimited=export_format == FORMAT_NDJSON, delta=delta
+                )
+
+            data = json.load(stream)
+            validation_result = self._validate_import_data(data, delta)
+            if not validation_result['valid']:
+                raise ValueError(validation_result['error'])
+
+            if progress_callback:
+                progress_callback("Validation complete...", 5)
+
+            progress = _ImportProgress(progress_callback, percent=5, cancel_event=cancel_event)
+            return self._import_members(iter(data.items()), merge_mode, progress, delta=delta)
+
+    @staticmethod
+    def _result(counts: Dict[str, int]) -> Dict[str, Any]:
+        """Build the result dictionary of a successful import."""
+        return {
+            'success': True,
+            'task_count': counts.get('tasks', 0),
+            'context_count': counts.get('contexts', 0),
+            'tag_count': counts.get('project_tags', 0),
+            'dependency_count': counts.get('dependencies', 0),
+            'comparison_count': counts.get('task_comparisons', 0),
+            'history_count': counts.get('postpone_history', 0),
+            'event_count': counts.get('task_history', 0),
+            'notification_count': counts.get('notifications', 0),
+            'warnings': []
+        }
+
+    def read_file_summary(self, filepath: str) -> Dict[str, Any]:
+        """Summarize an export file without loading it into memory.
+
+        Args:
+            filepath: Export file path (any supported format)
+
+        Returns:
+            Dictionary with:
+            {
+                'metadata': dict or None,
+                'counts': Dict[str, int] (records per section),
+                'has_settings': bool,
+                'format': FORMAT_JSON or FORMAT_NDJSON,
+                'compressed': bool
             }
 
-    def _validate_import_data(self, data: Dict) -> Dict[str, Any]:
+        Raises:
+            ValueError: If the file is not valid JSON/NDJSON
+            OSError: If the file cannot be read
+        """
+        stream, raw, export_format = open_export(filepath)
+        with raw, stream:
+            summary = {
+                'metadata': None,
+                'counts': {},
+                'has_settings': False,
+                'format': export_format,
+                'compressed': stream is not raw
+            }
+            for key, value in iter_export_members(stream, export_format):
+                if key == 'metadata':
+                    summary['metadata'] = value
+                elif key == 'settings':
+                    summary['has_settings'] = True
+                else:
+                    count = len(value) if isinstance(value, (dict, list)) else sum(1 for _ in value)
+                    summary['counts'][key] = summary['counts'].get(key, 0) + count
+        return summary
+
+    def _import_members(
+        self,
+        members: Iterator[Tuple[str, Any]],
+        merge_mode: bool,
+        progress: '_ImportProgress',
+        line_delimited: bool = False,
+        delta: bool = False
+    ) -> Dict[str, int]:
+        """Import the top-level members of an export in one transaction.
+
+        Sections are imported as they arrive. A section that arrives before
+        the metadata or before a section it references (possible in
+        hand-edited files) is held in memory until those have been imported.
+
+        Args:
+            members: (key, value) pairs of the export object; array values
+                may be lazy iterators
+            merge_mode: Whether to merge with existing data
+            progress: Progress reporter
+            line_delimited: Members come from an NDJSON export, which omits
+                empty sections and lists sections in import order, so no
+                section is required or waited for
+            delta: Apply a delta export on top of the existing data instead
+                of importing a full export
+
+        Returns:
+            Dict mapping section name -> number of imported records
+
+        Raises:
+            ValueError: If the file fails validation
+        """
+        # Reset ID mappings for merge mode (old_id -> new_id, remapped IDs only)
+        self._id_mappings = {
+            'contexts': {},
+            'project_tags': {},
+            'tasks': {}
+        }
+        counts: Dict[str, int] = {}
+        pending: Dict[str, Any] = {}
+        metadata_valid = False
+        importers = self._delta_importers() if delta else self._section_importers()
+        required_sections = self.DELTA_REQUIRED_SECTIONS if delta else self.REQUIRED_SECTIONS
+
+        def ready(section: str) -> bool:
+            return metadata_valid and (line_delimited or all(
+                required in counts for required in self.SECTION_PREREQUISITES.get(section, ())
+            ))
+
+        def run(section: str, records: Any) -> None:
+            progress.set_message(f"Importing {section.replace('_', ' ')}...")
+            counts[section] = counts.get(section, 0) + importers[section](records, merge_mode)
+
+        with transaction(self.db_connection):
+            # Constraints are checked once when the transaction commits
+            self.db_connection.execute("PRAGMA defer_foreign_keys = ON")
+
+            if not merge_mode and not delta:
+                progress.set_message("Clearing existing data...")
+                self._clear_all_data()
+
+            for key, value in members:
+                if key == 'metadata':
+                    error = self._validate_metadata(value, delta)
+                    if error:
+                        raise ValueError(error)
+                    metadata_valid = True
+                elif key not in importers or (key == 'settings' and merge_mode):
+                    continue
+                elif ready(key):
+                    run(key, value)
+                elif isinstance(value, dict):
+                    pending.setdefault(key, {}).update(value)
+                else:
+                    pending.setdefault(key, []).extend(value)
+
+                # Sections held back earlier may be importable now
+                for section in self.SECTION_ORDER:
+                    if section in pending and ready(section):
+                        run(section, pending.pop(section))
+
+            if not metadata_valid:
+                raise ValueError('Missing metadata section')
+            for section in () if line_delimited else required_sections:
+                if section not in counts and section not in pending:
+                    raise ValueError(f'Missing required section: {section}')
+            for section in self.SECTION_ORDER:
+                if section in pending:
+                    run(section, pending.pop(section))
+
+            # Line-delimited deltas omit tables that are now empty
+            for table in self.DELTA_SYNCED_TABLES if delta else ():
+                if table not in counts:
+                    self._delete_missing(table, set())
+
+            progress.set_message("Committing...")
+
+        return counts
+
+    def _section_importers(self) -> Dict[str, Callable[[Iterable, bool], int]]:
+        """Get the importer for each section."""
+        return {
+            'contexts': self._import_contexts,
+            'project_tags': self._import_project_tags,
+            'tasks': self._import_tasks,
+            'dependencies': self._import_dependencies,
+            'task_comparisons': self._import_task_comparisons,
+            'postpone_history': self._import_postpone_history,
+            'task_history': self._import_task_history,
+            'notifications': self._import_notifications,
+            'settings': lambda settings, merge_mode: self._import_settings(settings),
+        }
+
+    def _delta_importers(self) -> Dict[str, Callable[[Iterable, bool], int]]:
+        """Get the importer for each section of a delta export.
+
+        History rows are appended as in a full import (and deleted ones
+        removed); everything else replaces the current version of the same
+        rows.
+        """
+        importers = self._section_importers()
+        importers.update({
+            'deleted_tasks': self._delete_tasks,
+            'deleted_history': self._delete_history,
+            'contexts': self._sync_contexts,
+            'project_tags': self._sync_project_tags,
+            'tasks': self._upsert_tasks,
+            'notifications': self._sync_notifications,
+        })
+        return importers
+
+    def _validate_import_data(self, data: Dict, delta: bool = False) -> Dict[str, Any]:
         """Validate JSON structure and schema version.
 
         Args:
             data: Parsed JSON data
+            delta: Whether a delta export is expected
 
         Returns:
             Dictionary with validation results:
@@ -174,28 +562,53 @@ class ImportService:
         if 'metadata' not in data:
             return {'valid': False, 'error': 'Missing metadata section'}
 
-        metadata = data['metadata']
+        error = self._validate_metadata(data['metadata'], delta)
+        if error:
+            return {'valid': False, 'error': error}
+
+        # Check required sections
+        for section in self.DELTA_REQUIRED_SECTIONS if delta else self.REQUIRED_SECTIONS:
+            if section not in data:
+                return {'valid': False, 'error': f'Missing required section: {section}'}
+
+        return {'valid': True}
+
+    def _validate_metadata(self, metadata: Dict, delta: Optional[bool] = None) -> Optional[str]:
+        """Validate the metadata section.
+
+        Args:
+            metadata: Parsed metadata object
+            delta: Whether a delta export (True) or a full export (False) is
+                expected; None accepts both
+
+        Returns:
+            Error message, or None if the metadata is valid
+        """
+        if not isinstance(metadata, dict):
+            return 'Invalid metadata section'
 
         # Check schema version
         schema_version = metadata.get('schema_version')
         if schema_version is None:
-            return {'valid': False, 'error': 'Missing schema_version in metadata'}
+            return 'Missing schema_version in metadata'
 
         if schema_version > self.SUPPORTED_SCHEMA_VERSION:
-            return {
-                'valid': False,
-                'error': f'Unsupported schema version {schema_version}. '
-                        f'This application supports up to version {self.SUPPORTED_SCHEMA_VERSION}. '
-                        f'Please upgrade the application.'
-            }
+            return (
+                f'Unsupported schema version {schema_version}. '
+                f'This application supports up to version {self.SUPPORTED_SCHEMA_VERSION}. '
+                f'Please upgrade the application.'
+            )
 
-        # Check required sections
-        required_sections = ['contexts', 'project_tags', 'tasks']
-        for section in required_sections:
-            if section not in data:
-                return {'valid': False, 'error': f'Missing required section: {section}'}
+        is_delta = metadata.get('export_type') == 'delta'
+        if delta is not None and is_delta and not delta:
+            return (
+                'This is an incremental export. Import it together with the full export '
+                'it builds on and any incremental exports in between.'
+            )
+        if delta is not None and delta and not is_delta:
+            return 'Expected an incremental export'
 
-        return {'valid': True}
+        return None
 
     def _clear_all_data(self):
         """Clear all data from the database (for replace mode).
@@ -207,6 +620,7 @@ class ImportService:
         # Delete in reverse dependency order
         cursor.execute("DELETE FROM task_comparisons")
         cursor.execute("DELETE FROM postpone_history")
+        cursor.execute("DELETE FROM task_history")
         cursor.execute("DELETE FROM notifications")
         cursor.execute("DELETE FROM task_project_tags")
         cursor.execute("DELETE FROM dependencies")
@@ -214,308 +628,437 @@ class ImportService:
         cursor.execute("DELETE FROM project_tags")
         cursor.execute("DELETE FROM contexts")
 
-    def _import_contexts(self, contexts_data: List[Dict], merge_mode: bool) -> int:
+        # History rows keep their exported IDs, so the watermark of this
+        # database's last export no longer describes its contents
+        cursor.execute("DELETE FROM settings WHERE key = ?", (ExportService.WATERMARK_SETTING,))
+
+    def _import_contexts(self, contexts_data: Iterable[Dict], merge_mode: bool) -> int:
         """Import contexts with ID conflict resolution.
 
         Args:
-            contexts_data: List of context dictionaries
+            contexts_data: Context dictionaries
             merge_mode: Whether to remap IDs on conflict
 
         Returns:
             Number of contexts imported
         """
-        cursor = self.db_connection.cursor()
-        count = 0
+        return self._import_named('contexts', contexts_data, merge_mode)
 
-        for context in contexts_data:
-            old_id = context['id']
-            name = context['name']
-            description = context.get('description')
+    def _import_project_tags(self, tags_data: Iterable[Dict], merge_mode: bool) -> int:
+        """Import project tags with ID conflict resolution."""
+        return self._import_named('project_tags', tags_data, merge_mode)
 
-            if merge_mode:
-                # Check for ID conflict
-                cursor.execute("SELECT id FROM contexts WHERE id = ?", (old_id,))
-                if cursor.fetchone():
-                    # ID conflict - insert with new ID
-                    cursor.execute(
-                        "INSERT INTO contexts (name, description) VALUES (?, ?)",
-                        (name, description)
-                    )
-                    new_id = cursor.lastrowid
-                    self._id_mappings['contexts'][old_id] = new_id
-                else:
-                    # No conflict - use original ID
-                    cursor.execute(
-                        "INSERT INTO contexts (id, name, description) VALUES (?, ?, ?)",
-                        (old_id, name, description)
-                    )
-                    self._id_mappings['contexts'][old_id] = old_id
-            else:
-                # Replace mode - use original IDs
-                cursor.execute(
-                    "INSERT INTO contexts (id, name, description) VALUES (?, ?, ?)",
-                    (old_id, name, description)
-                )
+    def _import_named(self, table: str, records: Iterable[Dict], merge_mode: bool) -> int:
+        """Import uniquely named records (contexts or project tags).
+
+        In merge mode, a record whose name already exists is not inserted
+        again: its exported ID is mapped to the existing row's ID in
+        _id_mappings, so the tasks referencing it follow.
 
-            count += 1
+        Args:
+            table: Table the records go into (also the _id_mappings key)
+            records: Dictionaries with 'id', 'name' and 'description'
+            merge_mode: Whether to reuse names and remap IDs on conflict
+
+        Returns:
+            Number of records imported
+        """
+        count = 0
+        for batch in _batches(records, self.BATCH_SIZE):
+            count += len(batch)
+            if merge_mode:
+                batch = self._match_names(table, batch)
+                if not batch:
+                    continue
+
+            ids = self._assign_ids(table, batch, merge_mode)
+            self.db_connection.executemany(
+                f"INSERT INTO {table} (id, name, description) VALUES (?, ?, ?)",
+                [
+                    (new_id, record['name'], record.get('description'))
+                    for new_id, record in zip(ids, batch)
+                ]
+            )
 
         return count
 
-    def _import_project_tags(self, tags_data: List[Dict], merge_mode: bool) -> int:
-        """Import project tags with ID conflict resolution."""
-        cursor = self.db_connection.cursor()
+    def _match_names(self, table: str, batch: List[Dict]) -> List[Dict]:
+        """Map the records of a batch whose name already exists to the existing rows.
+
+        Returns:
+            Records of the batch whose name is not taken yet
+        """
+        names = [record['name'] for record in batch]
+        placeholders = ','.join('?' * len(names))
+        existing = dict(
+            self.db_connection.execute(
+                f"SELECT name, id FROM {table} WHERE name IN ({placeholders})", names
+            ).fetchall()
+        )
+        if not existing:
+            return batch
+
+        mapping = self._id_mappings[table]
+        remaining = []
+        for record in batch:
+            existing_id = existing.get(record['name'])
+            if existing_id is None:
+                remaining.append(record)
+            elif existing_id != record['id']:
+                mapping[record['id']] = existing_id
+        return remaining
+
+    def _task_row(self, new_id: int, task: Dict) -> tuple:
+        """Get the TASK_COLUMNS values of an exported task, with remapped references."""
+        context_ids = self._id_mappings['contexts']
+        task_ids = self._id_mappings['tasks']
+
+        # Remap context_id and recurrence_parent_id if needed
+        context_id = task.get('context_id')
+        context_id = context_ids.get(context_id, context_id)
+        recurrence_parent_id = task.get('recurrence_parent_id')
+        recurrence_parent_id = task_ids.get(recurrence_parent_id, recurrence_parent_id)
+
+        return (
+            new_id,
+            task['title'],
+            task.get('description'),
+            task['state'],
+            task['base_priority'],
+            task.get('elo_rating', 1500.0),
+            task.get('comparison_count', 0),
+            context_id,
+            task.get('due_date'),
+            task.get('start_date'),
+            task.get('delegated_to'),
+            task.get('follow_up_date'),
+            task.get('completed_at'),
+            task.get('last_resurfaced_at'),
+            task.get('resurface_count', 0),
+            task.get('is_recurring', 0),
+            task.get('recurrence_pattern'),
+            recurrence_parent_id,
+            task.get('share_elo_rating', 0),
+            task.get('shared_elo_rating'),
+            task.get('shared_comparison_count'),
+            task.get('recurrence_end_date'),
+            task.get('occurrence_count', 0),
+            task.get('created_at'),
+            task.get('updated_at')
+        )
+
+    def _insert_tasks(self, tasks_data: Iterable[Dict], merge_mode: bool, upsert: bool) -> int:
+        """Insert (or update) tasks with their project tag links, in batches."""
+        tag_ids = self._id_mappings['project_tags']
+        columns = ', '.join(self.TASK_COLUMNS)
+        placeholders = ', '.join('?' * len(self.TASK_COLUMNS))
+        sql = f"INSERT INTO tasks ({columns}) VALUES ({placeholders})"
+        if upsert:
+            sql += " ON CONFLICT(id) DO UPDATE SET " + ', '.join(
+                f"{column} = excluded.{column}" for column in self.TASK_COLUMNS[1:]
+            )
         count = 0
 
-        for tag in tags_data:
-            old_id = tag['id']
-            name = tag['name']
-            description = tag.get('description')
+        for batch in _batches(tasks_data, self.BATCH_SIZE):
+            ids = self._assign_ids('tasks', batch, merge_mode)
 
-            if merge_mode:
-                cursor.execute("SELECT id FROM project_tags WHERE id = ?", (old_id,))
-                if cursor.fetchone():
-                    cursor.execute(
-                        "INSERT INTO project_tags (name, description) VALUES (?, ?)",
-                        (name, description)
-                    )
-                    new_id = cursor.lastrowid
-                    self._id_mappings['project_tags'][old_id] = new_id
-                else:
-                    cursor.execute(
-                        "INSERT INTO project_tags (id, name, description) VALUES (?, ?, ?)",
-                        (old_id, name, description)
-                    )
-                    self._id_mappings['project_tags'][old_id] = old_id
-            else:
-                cursor.execute(
-                    "INSERT INTO project_tags (id, name, description) VALUES (?, ?, ?)",
-                    (old_id, name, description)
-                )
+            task_rows = []
+            tag_rows = []
+            for new_id, task in zip(ids, batch):
+                task_rows.append(self._task_row(new_id, task))
+
+                # Project tag associations
+                for tag_id in task.get('project_tag_ids', ()):
+                    tag_rows.append((new_id, tag_ids.get(tag_id, tag_id)))
 
-            count += 1
+            if upsert:
+                # The export carries every tag link and dependency of a changed task
+                id_rows = [(task_id,) for task_id in ids]
+                self.db_connection.executemany("DELETE FROM task_project_tags WHERE task_id = ?", id_rows)
+                self.db_connection.executemany("DELETE FROM dependencies WHERE blocked_task_id = ?", id_rows)
+
+            self.db_connection.executemany(sql, task_rows)
+            self.db_connection.executemany(
+                "INSERT INTO task_project_tags (task_id, project_tag_id) VALUES (?, ?)",
+                tag_rows
+            )
+            count += len(batch)
 
         return count
 
-    def _import_tasks(self, tasks_data: List[Dict], merge_mode: bool) -> int:
+    def _import_tasks(self, tasks_data: Iterable[Dict], merge_mode: bool) -> int:
         """Import tasks with relationships and ID conflict resolution."""
-        cursor = self.db_connection.cursor()
-        count = 0
+        return self._insert_tasks(tasks_data, merge_mode, upsert=False)
+
+    def _upsert_tasks(self, tasks_data: Iterable[Dict], merge_mode: bool) -> int:
+        """Replace changed tasks of a delta export, with their tag links and dependencies."""
+        return self._insert_tasks(tasks_data, False, upsert=True)
 
-        for task in tasks_data:
-            old_id = task['id']
-
-            # Remap context_id if needed
-            context_id = task.get('context_id')
-            if context_id and merge_mode and context_id in self._id_mappings['contexts']:
-                context_id = self._id_mappings['contexts'][context_id]
-
-            # Remap recurrence_parent_id if needed
-            recurrence_parent_id = task.get('recurrence_parent_id')
-            if recurrence_parent_id and merge_mode and recurrence_parent_id in self._id_mappings['tasks']:
-                recurrence_parent_id = self._id_mappings['tasks'][recurrence_parent_id]
-
-            # Prepare task data (matching actual schema)
-            task_data = (
-                task['title'],
-                task.get('description'),
-                task['state'],
-                task['base_priority'],
-                task.get('elo_rating', 1500.0),
-                task.get('comparison_count', 0),
-                context_id,
-                task.get('due_date'),
-                task.get('start_date'),
-                task.get('delegated_to'),
-                task.get('follow_up_date'),
-                task.get('completed_at'),
-                task.get('last_resurfaced_at'),
-                task.get('resurface_count', 0),
-                task.get('is_recurring', 0),
-                task.get('recurrence_pattern'),
-                recurrence_parent_id,
-                task.get('share_elo_rating', 0),
-                task.get('shared_elo_rating'),
-                task.get('shared_comparison_count'),
-                task.get('recurrence_end_date'),
-                task.get('occurrence_count', 0),
-                task.get('created_at'),
-                task.get('updated_at')
+    def _delete_tasks(self, task_ids: Iterable[int], merge_mode: bool) -> int:
+        """Apply the tombstones of a delta export (related rows cascade)."""
+        count = 0
+        for batch in _batches(task_ids, self.BATCH_SIZE):
+            self.db_connection.executemany(
+                "DELETE FROM tasks WHERE id = ?", [(task_id,) for task_id in batch]
             )
+            count += len(batch)
+        return count
 
-            if merge_mode:
-                cursor.execute("SELECT id FROM tasks WHERE id = ?", (old_id,))
-                if cursor.fetchone():
-                    # ID conflict - insert with new ID
-                    cursor.execute(
-                        """INSERT INTO tasks (
-                            title, description, state, base_priority,
-                            elo_rating, comparison_count, context_id, due_date,
-                            start_date, delegated_to, follow_up_date, completed_at,
-                            last_resurfaced_at, resurface_count,
-                            is_recurring, recurrence_pattern, recurrence_parent_id,
-                            share_elo_rating, shared_elo_rating, shared_comparison_count,
-                            recurrence_end_date, occurrence_count,
-                            created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                        task_data
-                    )
-                    new_id = cursor.lastrowid
-                    self._id_mappings['tasks'][old_id] = new_id
-                else:
-                    # No conflict - use original ID
-                    cursor.execute(
-                        """INSERT INTO tasks (
-                            id, title, description, state, base_priority,
-                            elo_rating, comparison_count, context_id, due_date,
-                            start_date, delegated_to, follow_up_date, completed_at,
-                            last_resurfaced_at, resurface_count,
-                            is_recurring, recurrence_pattern, recurrence_parent_id,
-                            share_elo_rating, shared_elo_rating, shared_comparison_count,
-                            recurrence_end_date, occurrence_count,
-                            created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (old_id,) + task_data
-                    )
-                    self._id_mappings['tasks'][old_id] = old_id
-            else:
-                # Replace mode - use original ID
-                cursor.execute(
-                    """INSERT INTO tasks (
-                        id, title, description, state, base_priority,
-                        elo_rating, comparison_count, context_id, due_date,
-                        start_date, delegated_to, follow_up_date, completed_at,
-                        last_resurfaced_at, resurface_count,
-                        is_recurring, recurrence_pattern, recurrence_parent_id,
-                        share_elo_rating, shared_elo_rating, shared_comparison_count,
-                        recurrence_end_date, occurrence_count,
-                        created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (old_id,) + task_data
+    def _delete_history(self, tombstones: Iterable[Dict], merge_mode: bool) -> int:
+        """Apply the history row tombstones of a delta export."""
+        count = 0
+        for batch in _batches(tombstones, self.BATCH_SIZE):
+            for table in ExportService.HISTORY_TABLES:
+                self.db_connection.executemany(
+                    f"DELETE FROM {table} WHERE id = ?",
+                    [(tombstone['id'],) for tombstone in batch if tombstone['table'] == table]
                 )
-                new_id = old_id
-
-            # Import project tag associations
-            if 'project_tag_ids' in task:
-                final_task_id = self._id_mappings['tasks'].get(old_id, old_id) if merge_mode else old_id
-                for tag_id in task['project_tag_ids']:
-                    final_tag_id = self._id_mappings['project_tags'].get(tag_id, tag_id) if merge_mode else tag_id
-                    cursor.execute(
-                        "INSERT INTO task_project_tags (task_id, project_tag_id) VALUES (?, ?)",
-                        (final_task_id, final_tag_id)
-                    )
+            count += len(batch)
+        return count
 
-            count += 1
+    def _sync_table(self, table: str, records: Iterable[Dict], columns: Tuple[str, ...],
+                    to_row: Callable[[Dict], tuple]) -> int:
+        """Make a small table match the complete copy carried by a delta export.
 
-        return count
+        Rows missing from records are deleted first (so a name freed by a
+        deleted row can be reused), then every record is inserted or updated.
 
-    def _import_dependencies(self, deps_data: List[Dict], merge_mode: bool) -> int:
+        Args:
+            table: Table name
+            records: Every row of the table in the delta
+            columns: Column names, 'id' first
+            to_row: Converts a record into values for columns
+
+        Returns:
+            Number of records
+        """
+        records = list(records)
+        self._delete_missing(table, {record['id'] for record in records})
+
+        updates = ', '.join(f"{column} = excluded.{column}" for column in columns[1:])
+        self.db_connection.executemany(
+            f"""INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})
+                ON CONFLICT(id) DO UPDATE SET {updates}""",
+            [to_row(record) for record in records]
+        )
+        return len(records)
+
+    def _delete_missing(self, table: str, keep_ids: set) -> None:
+        """Delete the rows of table whose IDs are not in keep_ids."""
+        stale = [
+            (row[0],) for row in self.db_connection.execute(f"SELECT id FROM {table}")
+            if row[0] not in keep_ids
+        ]
+        self.db_connection.executemany(f"DELETE FROM {table} WHERE id = ?", stale)
+
+    def _sync_contexts(self, contexts_data: Iterable[Dict], merge_mode: bool) -> int:
+        """Replace all contexts with those of a delta export."""
+        return self._sync_table(
+            'contexts', contexts_data, ('id', 'name', 'description'),
+            lambda context: (context['id'], context['name'], context.get('description'))
+        )
+
+    def _sync_project_tags(self, tags_data: Iterable[Dict], merge_mode: bool) -> int:
+        """Replace all project tags with those of a delta export."""
+        return self._sync_table(
+            'project_tags', tags_data, ('id', 'name', 'description'),
+            lambda tag: (tag['id'], tag['name'], tag.get('description'))
+        )
+
+    def _sync_notifications(self, notif_data: Iterable[Dict], merge_mode: bool) -> int:
+        """Replace all notifications with those of a delta export."""
+        return self._sync_table(
+            'notifications', notif_data, self.NOTIFICATION_COLUMNS,
+            lambda notif: self._notification_row(notif['id'], notif)
+        )
+
+    def _import_dependencies(self, deps_data: Iterable[Dict], merge_mode: bool) -> int:
         """Import task dependencies with ID remapping."""
-        cursor = self.db_connection.cursor()
+        task_ids = self._id_mappings['tasks']
         count = 0
 
-        for dep in deps_data:
-            blocked_id = dep.get('blocked_task_id', dep.get('task_id'))  # Support old format
-            blocking_id = dep.get('blocking_task_id', dep.get('depends_on_task_id'))  # Support old format
-
-            # Remap IDs if in merge mode
-            if merge_mode:
-                blocked_id = self._id_mappings['tasks'].get(blocked_id, blocked_id)
-                blocking_id = self._id_mappings['tasks'].get(blocking_id, blocking_id)
-
-            cursor.execute(
+        for batch in _batches(deps_data, self.BATCH_SIZE):
+            rows = []
+            for dep in batch:
+                blocked_id = dep.get('blocked_task_id', dep.get('task_id'))  # Support old format
+                blocking_id = dep.get('blocking_task_id', dep.get('depends_on_task_id'))  # Support old format
+                rows.append((
+                    task_ids.get(blocked_id, blocked_id),
+                    task_ids.get(blocking_id, blocking_id),
+                    dep.get('created_at')
+                ))
+
+            self.db_connection.executemany(
                 """INSERT INTO dependencies (blocked_task_id, blocking_task_id, created_at)
                    VALUES (?, ?, ?)""",
-                (blocked_id, blocking_id, dep.get('created_at'))
+                rows
             )
-            count += 1
+            count += len(batch)
 
         return count
 
-    def _import_task_comparisons(self, comps_data: List[Dict], merge_mode: bool) -> int:
+    def _import_task_comparisons(self, comps_data: Iterable[Dict], merge_mode: bool) -> int:
         """Import task comparisons with ID remapping."""
-        cursor = self.db_connection.cursor()
+        task_ids = self._id_mappings['tasks']
         count = 0
 
-        for comp in comps_data:
-            winner_id = comp['winner_task_id']
-            loser_id = comp['loser_task_id']
-
-            # Remap IDs if in merge mode
-            if merge_mode:
-                winner_id = self._id_mappings['tasks'].get(winner_id, winner_id)
-                loser_id = self._id_mappings['tasks'].get(loser_id, loser_id)
-
-            cursor.execute(
+        for batch in _batches(comps_data, self.BATCH_SIZE):
+            self.db_connection.executemany(
                 """INSERT INTO task_comparisons (
-                    winner_task_id, loser_task_id, adjustment_amount, compared_at
-                ) VALUES (?, ?, ?, ?)""",
-                (winner_id, loser_id,
-                 comp.get('adjustment_amount', 0.0),
-                 comp.get('compared_at', comp.get('comparison_date')))  # Support old format
+                    id, winner_task_id, loser_task_id, adjustment_amount, compared_at
+                ) VALUES (?, ?, ?, ?, ?)""",
+                [
+                    (self._kept_id(comp, merge_mode),
+                     task_ids.get(comp['winner_task_id'], comp['winner_task_id']),
+                     task_ids.get(comp['loser_task_id'], comp['loser_task_id']),
+                     comp.get('adjustment_amount', 0.0),
+                     comp.get('compared_at', comp.get('comparison_date')))  # Support old format
+                    for comp in batch
+                ]
             )
-            count += 1
+            count += len(batch)
 
         return count
 
-    def _import_postpone_history(self, hist_data: List[Dict], merge_mode: bool) -> int:
+    def _import_postpone_history(self, hist_data: Iterable[Dict], merge_mode: bool) -> int:
         """Import postpone history with ID remapping."""
-        cursor = self.db_connection.cursor()
+        task_ids = self._id_mappings['tasks']
         count = 0
 
-        for record in hist_data:
-            task_id = record['task_id']
+        for batch in _batches(hist_data, self.BATCH_SIZE):
+            self.db_connection.executemany(
+                """INSERT INTO postpone_history (
+                    id, task_id, reason_type, reason_notes, action_taken, postponed_at
+                ) VALUES (?, ?, ?, ?, ?, ?)""",
+                [
+                    (self._kept_id(record, merge_mode),
+                     task_ids.get(record['task_id'], record['task_id']),
+                     record.get('reason_type', record.get('reason', 'other')),  # Support old format
+                     record.get('reason_notes'),
+                     record.get('action_taken'),
+                     record['postponed_at'])
+                    for record in batch
+                ]
+            )
+            count += len(batch)
 
-            # Remap IDs if in merge mode
-            if merge_mode:
-                task_id = self._id_mappings['tasks'].get(task_id, task_id)
+        return count
 
-            cursor.execute(
-                """INSERT INTO postpone_history (
-                    task_id, reason_type, reason_notes, action_taken, postponed_at
-                ) VALUES (?, ?, ?, ?, ?)""",
-                (task_id,
-                 record.get('reason_type', record.get('reason', 'other')),  # Support old format
-                 record.get('reason_notes'),
-                 record.get('action_taken'),
-                 record['postponed_at'])
+    def _import_task_history(self, events_data: Iterable[Dict], merge_mode: bool) -> int:
+        """Import task history events with ID remapping."""
+        task_ids = self._id_mappings['tasks']
+        count = 0
+
+        for batch in _batches(events_data, self.BATCH_SIZE):
+            self.db_connection.executemany(
+                """INSERT INTO task_history (
+                    id, task_id, event_type, event_timestamp,
+                    old_value, new_value, changed_by, context_data
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (self._kept_id(event, merge_mode),
+                     task_ids.get(event['task_id'], event['task_id']),
+                     event['event_type'],
+                     event.get('event_timestamp'),
+                     event.get('old_value'),
+                     event.get('new_value'),
+                     event.get('changed_by', 'user'),
+                     event.get('context_data'))
+                    for event in batch
+                ]
             )
-            count += 1
+            count += len(batch)
 
         return count
 
-    def _import_notifications(self, notif_data: List[Dict], merge_mode: bool) -> int:
+    @staticmethod
+    def _notification_row(new_id: Optional[int], notif: Dict) -> tuple:
+        """Get the NOTIFICATION_COLUMNS values of an exported notification."""
+        return (
+            new_id,
+            notif.get('type', notif.get('notification_type', 'info')),  # Support old format
+            notif['title'], notif['message'],
+            notif.get('is_read', 0),
+            notif.get('action_type'),
+            notif.get('action_data'),
+            notif['created_at'],
+            notif.get('dismissed_at', notif.get('read_at'))  # Support old format
+        )
+
+    def _import_notifications(self, notif_data: Iterable[Dict], merge_mode: bool) -> int:
         """Import notifications."""
-        cursor = self.db_connection.cursor()
         count = 0
 
-        for notif in notif_data:
-            cursor.execute(
-                """INSERT INTO notifications (
-                    type, title, message, is_read,
-                    action_type, action_data, created_at, dismissed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (notif.get('type', notif.get('notification_type', 'info')),  # Support old format
-                 notif['title'], notif['message'],
-                 notif.get('is_read', 0),
-                 notif.get('action_type'),
-                 notif.get('action_data'),
-                 notif['created_at'],
-                 notif.get('dismissed_at', notif.get('read_at')))  # Support old format
+        for batch in _batches(notif_data, self.BATCH_SIZE):
+            self.db_connection.executemany(
+                f"""INSERT INTO notifications ({', '.join(self.NOTIFICATION_COLUMNS)})
+                    VALUES ({', '.join('?' * len(self.NOTIFICATION_COLUMNS))})""",
+                [self._notification_row(self._kept_id(notif, merge_mode), notif) for notif in batch]
             )
-            count += 1
+            count += len(batch)
 
         return count
 
-    def _import_settings(self, settings_data: Dict[str, Any]):
+    @staticmethod
+    def _kept_id(record: Dict, merge_mode: bool) -> Optional[int]:
+        """Get the ID a history record keeps (None lets merged records get new IDs).
+
+        Replace mode keeps exported IDs so that later delta exports, which
+        select new history rows by ID, line up with the restored data.
+        """
+        return None if merge_mode else record.get('id')
+
+    def _import_settings(self, settings_data: Dict[str, Any]) -> int:
         """Import settings (replace mode only)."""
-        cursor = self.db_connection.cursor()
+        now = datetime.now().isoformat()
+        self.db_connection.executemany(
+            """INSERT OR REPLACE INTO settings (key, value, value_type, updated_at)
+               VALUES (?, ?, ?, ?)""",
+            [
+                (key, setting['value'], setting['type'], now)
+                for key, setting in settings_data.items()
+            ]
+        )
+        return len(settings_data)
+
+    def _assign_ids(self, table: str, batch: List[Dict], merge_mode: bool) -> List[int]:
+        """Get the ID each record of a batch is stored under.
+
+        In merge mode, IDs already taken in the table are looked up with one
+        query per batch; those records get fresh IDs above every existing ID
+        and every ID of the batch, and are recorded in _id_mappings.
 
-        for key, setting in settings_data.items():
-            value = setting['value']
-            value_type = setting['type']
+        Args:
+            table: Table the records go into (also the _id_mappings key)
+            batch: Records with their exported 'id'
+            merge_mode: Whether to remap IDs on conflict
 
-            cursor.execute(
-                """INSERT OR REPLACE INTO settings (key, value, value_type, updated_at)
-                   VALUES (?, ?, ?, ?)""",
-                (key, value, value_type, datetime.now().isoformat())
+        Returns:
+            IDs in batch order
+        """
+        old_ids = [record['id'] for record in batch]
+        if not merge_mode:
+            return old_ids
+
+        placeholders = ','.join('?' * len(old_ids))
+        taken = {
+            row[0] for row in self.db_connection.execute(
+                f"SELECT id FROM {table} WHERE id IN ({placeholders})", old_ids
             )
+        }
+        if not taken:
+            return old_ids
+
+        max_id = self.db_connection.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+        next_id = max(max_id, max(old_ids)) + 1
+        mapping = self._id_mappings[table]
+
+        ids = []
+        for old_id in old_ids:
+            if old_id in taken:
+                mapping[old_id] = next_id
+                old_id = next_id
+                next_id += 1
+            taken.add(old_id)
+            ids.append(old_id)
+        return ids
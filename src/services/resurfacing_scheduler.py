@@ -6,6 +6,7 @@ This module manages periodic background jobs for:
 - Reminding users of delegated tasks needing follow-up
 - Triggering periodic reviews of Someday/Maybe tasks
 - Analyzing postponement patterns for intervention
+- Taking and pruning automatic database snapshots (when enabled)
 """
 
 import sqlite3
@@ -21,6 +22,7 @@ from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 
 from ..models.task import Task
 from .resurfacing_service import ResurfacingService
+from .snapshot_service import SnapshotService
 from ..database.settings_dao import SettingsDAO
 
 
@@ -42,6 +44,16 @@ class ResurfacingScheduler(QObject):
     someday_review_triggered = pyqtSignal()
     postpone_intervention_needed = pyqtSignal(list)  # List[PostponeSuggestion]
 
+    # Settings that control job schedules
+    JOB_SETTING_KEYS = (
+        'deferred_check_hours',
+        'delegated_check_time',
+        'someday_review_days',
+        'postpone_analysis_time',
+        'snapshot_enabled',
+        'snapshot_interval_hours',
+    )
+
     def __init__(self, db_connection: sqlite3.Connection, notification_manager):
         """
         Initialize the resurfacing scheduler.
@@ -55,6 +67,7 @@ class ResurfacingScheduler(QObject):
         self.db_connection = db_connection
         self.notification_manager = notification_manager
         self.resurfacing_service = ResurfacingService(db_connection, notification_manager)
+        self.snapshot_service = SnapshotService(db_connection)
         self.settings_dao = SettingsDAO(db_connection)
 
         # Create background scheduler
@@ -75,6 +88,9 @@ class ResurfacingScheduler(QObject):
 
         self._is_running = False
 
+        # Reschedule jobs whenever their settings change
+        SettingsDAO.add_listener(self._on_setting_changed, keys=self.JOB_SETTING_KEYS)
+
     @property
     def running(self):
         """Return whether the scheduler is currently running."""
@@ -135,8 +151,9 @@ class ResurfacingScheduler(QObject):
         """
         Reload job configurations from updated settings.
 
-        This is called when the user changes settings in the Settings dialog.
-        It removes all existing jobs and reconfigures them with new settings.
+        Called automatically when a job setting changes (see
+        _on_setting_changed). It removes all existing jobs and reconfigures
+        them with new settings.
         """
         if not self._is_running:
             return
@@ -151,6 +168,10 @@ class ResurfacingScheduler(QObject):
 
         logger.info("Scheduler settings reloaded")
 
+    def _on_setting_changed(self, key):
+        """Reschedule jobs after a job setting changed."""
+        self.reload_settings()
+
     # ========== PUBLIC MANUAL TRIGGER METHODS ==========
 
     def check_deferred_tasks(self):
@@ -186,6 +207,7 @@ class ResurfacingScheduler(QObject):
         2. check_delegated_tasks - Daily at specific time
         3. trigger_someday_review - Periodic interval
         4. analyze_postponements - Daily at specific time
+        5. create_snapshot - Hourly interval (configurable), only if enabled
         """
         # Job 1: Check deferred tasks (hourly by default)
         deferred_check_hours = self.settings_dao.get_int('deferred_check_hours', default=1)
@@ -233,6 +255,18 @@ class ResurfacingScheduler(QObject):
         )
         logger.info(f"Configured: Analyze postponements daily at {postpone_analysis_time}")
 
+        # Job 5: Take a database snapshot (hourly by default, off unless enabled)
+        if self.settings_dao.get_bool('snapshot_enabled', default=False):
+            snapshot_interval_hours = self.settings_dao.get_int('snapshot_interval_hours', default=1)
+            self.scheduler.add_job(
+                func=self._job_create_snapshot,
+                trigger=IntervalTrigger(hours=snapshot_interval_hours),
+                id='create_snapshot',
+                name='Create Snapshot',
+                replace_existing=True
+            )
+            logger.info(f"Configured: Create snapshot every {snapshot_interval_hours} hour(s)")
+
     def _parse_time_string(self, time_str: str) -> tuple[int, int]:
         """
         Parse a time string in HH:MM format.
@@ -336,6 +370,21 @@ class ResurfacingScheduler(QObject):
         except Exception as e:
             logger.error(f"Error analyzing postponements: {e}", exc_info=True)
 
+    def _job_create_snapshot(self):
+        """
+        Job: Take a database snapshot and apply the retention policy.
+
+        Runs hourly (configurable) while snapshots are enabled.
+        """
+        logger.info("Running job: Create snapshot")
+
+        try:
+            self.snapshot_service.take_snapshot()
+            self.snapshot_service.prune()
+
+        except Exception as e:
+            logger.error(f"Error creating snapshot: {e}", exc_info=True)
+
     def _job_listener(self, event):
         """
         Event listener for job execution monitoring.
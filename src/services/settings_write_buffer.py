@@ -0,0 +1,152 @@
+"""
+Settings Write Buffer - Coalescing write-behind layer for SettingsDAO.
+
+UI state such as filters, search text and dialog geometry is saved on every
+interaction. Writing each change straight through SettingsDAO.set() costs one
+commit (and fsync) per row per keystroke. This buffer keeps the latest value
+per key in memory and writes all pending changes in one transaction once the
+UI has been idle for a short period, or when flushed explicitly (database
+switch, shutdown).
+"""
+
+import sqlite3
+import weakref
+from typing import Any, Dict, Optional, Set, Tuple
+from PyQt5.QtCore import QObject, QTimer, QCoreApplication
+from ..database.settings_dao import SettingsDAO
+
+
+# Sentinel for a pending delete
+_DELETED = object()
+
+
+class SettingsWriteBuffer(QObject):
+    """
+    Write-behind buffer for settings of one database connection.
+
+    Use for_connection() to get the shared buffer of a connection, so every
+    widget writing UI state coalesces into the same pending batch.
+    """
+
+    # Idle time after the last change before pending writes are flushed
+    IDLE_DELAY_MS = 500
+
+    _buffers: 'weakref.WeakValueDictionary[Any, SettingsWriteBuffer]' = weakref.WeakValueDictionary()
+    _dirty: Set['SettingsWriteBuffer'] = set()  # Keeps buffers with pending writes alive
+
+    def __init__(self, settings_dao: SettingsDAO, delay_ms: Optional[int] = None):
+        """
+        Initialize the buffer.
+
+        Args:
+            settings_dao: DAO used to write the pending changes
+            delay_ms: Idle delay before flushing (defaults to IDLE_DELAY_MS)
+        """
+        super().__init__()
+        self.settings_dao = settings_dao
+        self._pending: Dict[str, Any] = {}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.IDLE_DELAY_MS if delay_ms is None else delay_ms)
+        self._timer.timeout.connect(self._flush_safely)
+
+    @classmethod
+    def for_connection(cls, db_connection: sqlite3.Connection) -> 'SettingsWriteBuffer':
+        """
+        Get the shared buffer for a connection, creating it if needed.
+
+        Args:
+            db_connection: Active SQLite database connection
+
+        Returns:
+            SettingsWriteBuffer writing to db_connection
+        """
+        buffer = cls._buffers.get(db_connection)
+        if buffer is None:
+            buffer = cls(SettingsDAO(db_connection))
+            cls._buffers[db_connection] = buffer
+        return buffer
+
+    @classmethod
+    def flush_all(cls) -> None:
+        """Write the pending changes of every buffer (call before shutdown or switching databases)."""
+        for buffer in list(cls._dirty):
+            buffer._flush_safely()
+
+    @property
+    def has_pending(self) -> bool:
+        """True if some changes have not been written yet."""
+        return bool(self._pending)
+
+    def set(self, key: str, value: Any, value_type: str, description: str = None) -> None:
+        """
+        Queue a setting write.
+
+        Args:
+            key: Setting key
+            value: Setting value
+            value_type: Type of value ('string', 'integer', 'float', 'boolean', 'json')
+            description: Optional description of setting
+        """
+        self._queue(key, (value, value_type, description))
+
+    def delete(self, key: str) -> None:
+        """
+        Queue a setting deletion.
+
+        Args:
+            key: Setting key to delete
+        """
+        self._queue(key, _DELETED)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a setting value, including changes that are still pending.
+
+        Args:
+            key: Setting key
+            default: Default value if setting not found
+
+        Returns:
+            Pending or stored value, or default if not found
+        """
+        if key in self._pending:
+            change = self._pending[key]
+            if change is _DELETED:
+                return default
+            return SettingsDAO._copy_value(change[0])
+        return self.settings_dao.get(key, default)
+
+    def flush(self) -> None:
+        """Write all pending changes in one transaction."""
+        self._timer.stop()
+        SettingsWriteBuffer._dirty.discard(self)
+        if not self._pending:
+            return
+
+        changes: Dict[str, Optional[Tuple[Any, str, Optional[str]]]] = {
+            key: (None if change is _DELETED else change)
+            for key, change in self._pending.items()
+        }
+        self._pending = {}
+        self.settings_dao.apply_changes(changes)
+
+    def _flush_safely(self) -> None:
+        """Flush, reporting instead of raising database errors (e.g. closed connection)."""
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to save settings: {e}")
+
+    def _queue(self, key: str, change: Any) -> None:
+        """Record the latest change for key and restart the idle timer."""
+        self._pending[key] = change
+
+        if QCoreApplication.instance() is None:
+            # No event loop to run the timer: write through
+            self.flush()
+            return
+
+        SettingsWriteBuffer._dirty.add(self)
+        self._timer.start()
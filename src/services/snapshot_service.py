@@ -0,0 +1,448 @@
+"""
+Snapshot service for OneTaskAtATime.
+
+Keeps a history of database snapshots in a content-addressed store:
+- A snapshot is taken with the online backup API (see
+  ExportService.export_database_backup), so it is consistent while the
+  application keeps writing
+- The copy is split into fixed-size chunks of whole pages; each chunk is
+  stored once, zlib-compressed, under the SHA-256 of its content, so
+  consecutive snapshots share every unchanged chunk
+- A snapshot itself is a small JSON manifest listing its chunks
+- Retention keeps the newest snapshot of each of the last N hours, days
+  and ISO weeks; chunks no longer referenced by any manifest are deleted
+
+Store layout:
+    <store>/manifests/<snapshot id>.json
+    <store>/chunks/<first 2 hex digits>/<sha256>
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..database.connection import DatabaseConnection
+from ..database.settings_dao import SettingsDAO
+from .export_service import ExportService
+
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot cannot be taken or restored."""
+
+
+@dataclass(frozen=True)
+class SnapshotInfo:
+    """
+    One stored snapshot.
+
+    Attributes:
+        id: Snapshot ID (sortable by creation time)
+        created_at: Local time the snapshot was taken
+        source: Path of the database the snapshot was taken from
+        size_bytes: Size of the database file
+        chunk_count: Number of chunks making up the file
+        added_bytes: Compressed bytes this snapshot added to the store
+    """
+    id: str
+    created_at: datetime
+    source: str
+    size_bytes: int
+    chunk_count: int
+    added_bytes: int
+
+
+def select_retained_snapshots(
+    snapshots: Iterable[SnapshotInfo],
+    keep_hourly: int,
+    keep_daily: int,
+    keep_weekly: int
+) -> Set[str]:
+    """
+    Select the snapshots a retention policy keeps.
+
+    For each period (hour, day, ISO week) the newest snapshot of each of
+    the last keep_* periods that have snapshots is kept. The newest
+    snapshot overall is always kept.
+
+    Args:
+        snapshots: Snapshots of one database
+        keep_hourly: Number of hours to keep a snapshot for
+        keep_daily: Number of days to keep a snapshot for
+        keep_weekly: Number of weeks to keep a snapshot for
+
+    Returns:
+        IDs of the snapshots to keep
+    """
+    ordered = sorted(snapshots, key=lambda s: (s.created_at, s.id), reverse=True)
+    if not ordered:
+        return set()
+
+    periods = (
+        (keep_hourly, lambda s: s.created_at.strftime('%Y-%m-%d %H')),
+        (keep_daily, lambda s: s.created_at.date()),
+        (keep_weekly, lambda s: s.created_at.isocalendar()[:2]),
+    )
+
+    kept = {ordered[0].id}
+    for count, period_of in periods:
+        seen = set()
+        for snapshot in ordered:
+            period = period_of(snapshot)
+            if period in seen:
+                continue
+            if len(seen) >= count:
+                break
+            seen.add(period)
+            kept.add(snapshot.id)
+    return kept
+
+
+class SnapshotService:
+    """Service for taking, pruning and restoring deduplicated database snapshots."""
+
+    # Chunk size in bytes: a whole number of pages for every SQLite page size
+    CHUNK_SIZE = 64 * 1024
+
+    # zlib level for stored chunks (fast; database pages compress well)
+    COMPRESS_LEVEL = 1
+
+    # Name of the store directory created next to the database file
+    STORE_DIRNAME = "snapshots"
+
+    # Retention defaults (overridden by settings)
+    DEFAULT_KEEP_HOURLY = 24
+    DEFAULT_KEEP_DAILY = 7
+    DEFAULT_KEEP_WEEKLY = 4
+
+    # Serializes snapshots and pruning across service instances, so pruning
+    # never deletes chunks of a snapshot whose manifest is not written yet
+    _store_lock = threading.Lock()
+
+    def __init__(self, db_connection: sqlite3.Connection, store_dir: Optional[str] = None):
+        """
+        Initialize the snapshot service.
+
+        Args:
+            db_connection: Database connection (snapshots are taken of its main database)
+            store_dir: Snapshot store directory; defaults to a "snapshots"
+                directory next to the database file
+        """
+        self.db_connection = db_connection
+        self.settings_dao = SettingsDAO(db_connection)
+        self._store_dir = Path(store_dir) if store_dir else None
+
+    @property
+    def store_dir(self) -> Path:
+        """Directory of the snapshot store."""
+        if self._store_dir is None:
+            self._store_dir = Path(self._database_path()).parent / self.STORE_DIRNAME
+        return self._store_dir
+
+    def _database_path(self) -> str:
+        """Get the path of the database file being snapshotted."""
+        path = self.db_connection.execute("PRAGMA database_list").fetchone()[2]
+        if not path:
+            raise SnapshotError("In-memory databases cannot be snapshotted")
+        return path
+
+    # ========== TAKING SNAPSHOTS ==========
+
+    def take_snapshot(self) -> SnapshotInfo:
+        """
+        Take a snapshot of the database.
+
+        Only chunks that are not in the store yet are written. If nothing
+        changed since the last snapshot of this database, no new snapshot
+        is created and the last one is returned.
+
+        Returns:
+            SnapshotInfo of the new (or unchanged last) snapshot
+
+        Raises:
+            SnapshotError: If the database could not be copied
+        """
+        source = self._database_path()
+        with self._store_lock:
+            self._manifest_dir().mkdir(parents=True, exist_ok=True)
+            copy_path = self.store_dir / "snapshot.db"
+
+            result = ExportService(self.db_connection).export_database_backup(str(copy_path))
+            if not result['success']:
+                raise SnapshotError(f"Could not copy the database: {result['error']}")
+
+            try:
+                chunks, added_bytes = self._store_chunks(copy_path)
+                size_bytes = copy_path.stat().st_size
+            finally:
+                copy_path.unlink()
+
+            latest = next(iter(self.list_snapshots(source)), None)
+            if latest is not None and self._read_manifest(latest.id)['chunks'] == chunks:
+                logger.debug(f"Database unchanged since snapshot {latest.id}")
+                return latest
+
+            created_at = datetime.now()
+            manifest = {
+                'id': created_at.strftime('%Y%m%d-%H%M%S-%f'),
+                'created_at': created_at.isoformat(),
+                'source': source,
+                'size_bytes': size_bytes,
+                'chunk_size': self.CHUNK_SIZE,
+                'added_bytes': added_bytes,
+                'chunks': chunks,
+            }
+            self._write_atomic(
+                self._manifest_dir() / f"{manifest['id']}.json",
+                json.dumps(manifest).encode('utf-8')
+            )
+
+        logger.info(
+            f"Snapshot {manifest['id']}: {len(chunks)} chunks, "
+            f"{added_bytes} bytes added to the store"
+        )
+        return self._info(manifest)
+
+    def _store_chunks(self, path: Path) -> Tuple[List[str], int]:
+        """
+        Store the chunks of a file that are not in the store yet.
+
+        Returns:
+            (chunk hashes in file order, compressed bytes written)
+        """
+        chunks: List[str] = []
+        added_bytes = 0
+        with open(path, 'rb') as f:
+            while True:
+                data = f.read(self.CHUNK_SIZE)
+                if not data:
+                    break
+                digest = hashlib.sha256(data).hexdigest()
+                chunks.append(digest)
+
+                chunk_path = self._chunk_path(digest)
+                if not chunk_path.exists():
+                    chunk_path.parent.mkdir(parents=True, exist_ok=True)
+                    compressed = zlib.compress(data, self.COMPRESS_LEVEL)
+                    self._write_atomic(chunk_path, compressed)
+                    added_bytes += len(compressed)
+        return chunks, added_bytes
+
+    # ========== LISTING ==========
+
+    def list_snapshots(self, source: Optional[str] = None) -> List[SnapshotInfo]:
+        """
+        List stored snapshots, newest first.
+
+        Args:
+            source: Only list snapshots of this database file
+
+        Returns:
+            List of SnapshotInfo
+        """
+        snapshots = []
+        for manifest in self._iter_manifests():
+            info = self._info(manifest)
+            if source is None or os.path.normcase(info.source) == os.path.normcase(source):
+                snapshots.append(info)
+
+        snapshots.sort(key=lambda s: (s.created_at, s.id), reverse=True)
+        return snapshots
+
+    def get_store_size(self) -> int:
+        """
+        Get the bytes used by the store on disk.
+
+        Returns:
+            Total size of all chunk and manifest files
+        """
+        if not self.store_dir.is_dir():
+            return 0
+        return sum(path.stat().st_size for path in self.store_dir.rglob("*") if path.is_file())
+
+    # ========== RETENTION ==========
+
+    def prune(
+        self,
+        keep_hourly: Optional[int] = None,
+        keep_daily: Optional[int] = None,
+        keep_weekly: Optional[int] = None
+    ) -> int:
+        """
+        Delete the snapshots the retention policy no longer keeps.
+
+        The policy is applied to each source database separately. Chunks
+        that no remaining snapshot references are deleted afterwards.
+
+        Args:
+            keep_hourly: Hours to keep (default: snapshot_keep_hourly setting)
+            keep_daily: Days to keep (default: snapshot_keep_daily setting)
+            keep_weekly: Weeks to keep (default: snapshot_keep_weekly setting)
+
+        Returns:
+            Number of snapshots deleted
+        """
+        if keep_hourly is None:
+            keep_hourly = self.settings_dao.get_int('snapshot_keep_hourly', self.DEFAULT_KEEP_HOURLY)
+        if keep_daily is None:
+            keep_daily = self.settings_dao.get_int('snapshot_keep_daily', self.DEFAULT_KEEP_DAILY)
+        if keep_weekly is None:
+            keep_weekly = self.settings_dao.get_int('snapshot_keep_weekly', self.DEFAULT_KEEP_WEEKLY)
+
+        with self._store_lock:
+            by_source: Dict[str, List[SnapshotInfo]] = {}
+            for snapshot in self.list_snapshots():
+                by_source.setdefault(os.path.normcase(snapshot.source), []).append(snapshot)
+
+            deleted = 0
+            for snapshots in by_source.values():
+                kept = select_retained_snapshots(snapshots, keep_hourly, keep_daily, keep_weekly)
+                for snapshot in snapshots:
+                    if snapshot.id not in kept:
+                        (self._manifest_dir() / f"{snapshot.id}.json").unlink()
+                        deleted += 1
+
+            removed_chunks = self._collect_garbage()
+
+        if deleted:
+            logger.info(f"Pruned {deleted} snapshot(s) and {removed_chunks} unreferenced chunk(s)")
+        return deleted
+
+    def _collect_garbage(self) -> int:
+        """Delete chunks (and leftover partial chunk files) no manifest references.
+
+        Nothing is deleted if any manifest cannot be read, since the chunks
+        of that snapshot would look unreferenced.
+        """
+        referenced: Set[str] = set()
+        try:
+            for manifest in self._iter_manifests(strict=True):
+                referenced.update(manifest['chunks'])
+        except SnapshotError as e:
+            logger.warning(f"Skipping snapshot chunk cleanup: {e}")
+            return 0
+
+        removed = 0
+        chunk_root = self.store_dir / "chunks"
+        if chunk_root.is_dir():
+            for path in chunk_root.glob("*/*"):
+                if path.name not in referenced:
+                    path.unlink()
+                    removed += 1
+        return removed
+
+    # ========== RESTORING ==========
+
+    def restore(self, snapshot_id: str, dest_path: str) -> str:
+        """
+        Rebuild the database file of a snapshot.
+
+        Every chunk is checked against its hash. The file is written next to
+        dest_path, validated, and moved into place; switch to it with
+        DatabaseConnection.switch_database().
+
+        Args:
+            snapshot_id: ID of the snapshot to restore
+            dest_path: Path of the database file to create
+
+        Returns:
+            dest_path
+
+        Raises:
+            SnapshotError: If the snapshot is missing, damaged or invalid
+        """
+        try:
+            manifest = self._read_manifest(snapshot_id)
+        except (OSError, ValueError) as e:
+            raise SnapshotError(f"Snapshot {snapshot_id} not found: {e}")
+
+        temp_path = f"{dest_path}.partial"
+        try:
+            with open(temp_path, 'wb') as f:
+                for digest in manifest['chunks']:
+                    f.write(self._read_chunk(digest))
+                f.truncate(manifest['size_bytes'])
+
+            is_valid, error = DatabaseConnection.validate_database_file(temp_path)
+            if not is_valid:
+                raise SnapshotError(f"Snapshot {snapshot_id} is not a valid database: {error}")
+
+            os.replace(temp_path, dest_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        logger.info(f"Restored snapshot {snapshot_id} to {dest_path}")
+        return dest_path
+
+    def _read_chunk(self, digest: str) -> bytes:
+        """Read and verify one chunk."""
+        try:
+            data = zlib.decompress(self._chunk_path(digest).read_bytes())
+        except (OSError, zlib.error) as e:
+            raise SnapshotError(f"Chunk {digest} is missing or damaged: {e}")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise SnapshotError(f"Chunk {digest} is damaged (checksum mismatch)")
+        return data
+
+    # ========== STORE HELPERS ==========
+
+    def _manifest_dir(self) -> Path:
+        return self.store_dir / "manifests"
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.store_dir / "chunks" / digest[:2] / digest
+
+    def _iter_manifests(self, strict: bool = False) -> Iterator[dict]:
+        """Yield every readable manifest in the store.
+
+        Args:
+            strict: Raise SnapshotError on an unreadable manifest instead of
+                skipping it
+        """
+        manifest_dir = self._manifest_dir()
+        if not manifest_dir.is_dir():
+            return
+        for path in manifest_dir.glob("*.json"):
+            try:
+                manifest = json.loads(path.read_text(encoding='utf-8'))
+                self._info(manifest)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                if strict:
+                    raise SnapshotError(f"Unreadable snapshot manifest {path.name}: {e}")
+                logger.warning(f"Skipping unreadable snapshot manifest {path.name}: {e}")
+                continue
+            yield manifest
+
+    def _read_manifest(self, snapshot_id: str) -> dict:
+        path = self._manifest_dir() / f"{snapshot_id}.json"
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    @staticmethod
+    def _info(manifest: dict) -> SnapshotInfo:
+        return SnapshotInfo(
+            id=manifest['id'],
+            created_at=datetime.fromisoformat(manifest['created_at']),
+            source=manifest['source'],
+            size_bytes=manifest['size_bytes'],
+            chunk_count=len(manifest['chunks']),
+            added_bytes=manifest['added_bytes']
+        )
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write a file so readers never see it half written."""
+        temp_path = path.with_name(path.name + ".partial")
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
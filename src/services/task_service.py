@@ -4,7 +4,9 @@ Task Service - Business logic layer for task operations.
 Coordinates between UI, algorithms, and database layers.
 """
 
-from typing import List, Optional, Set
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
 from datetime import date, datetime
 from ..models.task import Task
 from ..models.enums import TaskState, PostponeReasonType, ActionTaken
@@ -14,12 +16,39 @@ from ..database.task_dao import TaskDAO
 from ..database.postpone_history_dao import PostponeHistoryDAO
 from ..database.context_dao import ContextDAO
 from ..database.task_history_dao import TaskHistoryDAO
+from ..database.dependency_dao import DependencyDAO
 from ..database.connection import DatabaseConnection
-from ..algorithms.ranking import get_next_focus_task, get_actionable_tasks, get_tied_tasks
+from ..database.transaction import transaction
+from ..algorithms.ranking import take_top_tied, resolve_focus_task, select_tied_tier
+from ..algorithms.ranking_index import RankingIndex
+from ..algorithms.dependency_analysis import DependencyMetrics, analyze_dependencies
+from ..algorithms.initial_ranking import check_for_new_tasks
+from .export_service import ExportService
 from .recurrence_service import RecurrenceService
 from .task_history_service import TaskHistoryService
 
 
+@dataclass
+class FocusSnapshot:
+    """
+    Everything Focus Mode needs for one refresh.
+
+    All fields come from the same synchronized set of ACTIVE tasks, so the
+    new-task check, the tie check and the focus task agree with each other.
+    """
+    active_tasks: List[Task]
+    new_task_band: int = 0  # Highest priority band with unranked tasks (0 if none)
+    new_tasks: List[Task] = field(default_factory=list)
+    tied_tasks: List[Task] = field(default_factory=list)
+    focus_task: Optional[Task] = None
+    state_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def has_new_tasks(self) -> bool:
+        """True if some ACTIVE tasks still need initial ranking."""
+        return bool(self.new_tasks)
+
+
 class TaskService:
     """
     Service layer for task operations.
@@ -27,6 +56,13 @@ class TaskService:
     Handles business logic for task lifecycle, coordinates with DAOs and algorithms.
     """
 
+    # Rebuild the ranking index from scratch instead of patching it when at
+    # least this many tasks changed since the last sync (imports, resets)
+    RANKING_REBUILD_THRESHOLD = 500
+
+    # Live instances, whose change log positions compact_change_log() keeps
+    _instances: "weakref.WeakSet[TaskService]" = weakref.WeakSet()
+
     def __init__(self, db_connection: DatabaseConnection):
         """
         Initialize the task service.
@@ -38,9 +74,20 @@ class TaskService:
         self.task_dao = TaskDAO(db_connection.get_connection())
         self.postpone_dao = PostponeHistoryDAO(db_connection.get_connection())
         self.context_dao = ContextDAO(db_connection.get_connection())
+        self.dependency_dao = DependencyDAO(db_connection.get_connection())
         history_dao = TaskHistoryDAO(db_connection.get_connection())
         self.history_service = TaskHistoryService(history_dao)
 
+        # Focus Mode ranking index, kept in sync through the task change log
+        self._ranking_index: Optional[RankingIndex] = None
+        self._ranking_seq: Optional[int] = None
+
+        # Dependency metrics, recomputed when a task in the dependency graph changes
+        self._dependency_metrics: Optional[Dict[int, DependencyMetrics]] = None
+        self._metrics_seq: Optional[int] = None
+
+        TaskService._instances.add(self)
+
     def get_all_tasks(self) -> List[Task]:
         """
         Get all tasks from the database.
@@ -86,8 +133,10 @@ class TaskService:
         Returns:
             Top-priority task, or None if no actionable tasks or tie exists
         """
-        all_tasks = self.task_dao.get_all()
-        return get_next_focus_task(all_tasks, context_filter=context_filter, tag_filters=tag_filters)
+        return self.get_ranking_index().get_next_focus_task(
+            context_filter=context_filter, tag_filters=tag_filters,
+            unblock_counts=self.get_unblock_counts()
+        )
 
     def get_tied_tasks(
         self,
@@ -104,8 +153,166 @@ class TaskService:
         Returns:
             List of tied tasks (empty if no ties)
         """
-        all_tasks = self.task_dao.get_all()
-        return get_tied_tasks(all_tasks, context_filter=context_filter, tag_filters=tag_filters)
+        return self.get_ranking_index().get_tied_tasks(
+            context_filter=context_filter, tag_filters=tag_filters,
+            unblock_counts=self.get_unblock_counts()
+        )
+
+    def evaluate_focus(
+        self,
+        context_filter: Optional[int] = None,
+        tag_filters: Optional[Set[int]] = None,
+        check_new_tasks: bool = True
+    ) -> FocusSnapshot:
+        """
+        Evaluate Focus Mode from a single snapshot of the ACTIVE tasks.
+
+        Replaces separate get_all_tasks()/get_tied_tasks()/get_focus_task()
+        calls: the ranking index is synchronized once and the new-task bands,
+        tied set, focus task and state counts are all derived from it.
+
+        Args:
+            context_filter: Optional context ID to filter by (single selection)
+            tag_filters: Optional set of tag IDs to filter by (OR condition)
+            check_new_tasks: Whether to look for tasks needing initial ranking
+
+        Returns:
+            FocusSnapshot for this refresh
+        """
+        index = self.get_ranking_index()
+        snapshot = FocusSnapshot(
+            active_tasks=index.get_tasks(),
+            state_counts=self.task_dao.count_by_state()
+        )
+
+        if check_new_tasks:
+            has_new, priority_band, new_tasks = check_for_new_tasks(snapshot.active_tasks)
+            if has_new:
+                snapshot.new_task_band = priority_band
+                snapshot.new_tasks = new_tasks
+
+        top_tasks = take_top_tied(index.iter_ranked(context_filter=context_filter, tag_filters=tag_filters))
+        unblock_counts = self.get_unblock_counts() if len(top_tasks) > 1 else None
+        snapshot.tied_tasks = select_tied_tier(top_tasks, unblock_counts)
+        snapshot.focus_task = resolve_focus_task(top_tasks, unblock_counts)
+        return snapshot
+
+    def get_ranking_index(self) -> RankingIndex:
+        """
+        Get the ranking index of ACTIVE tasks, synchronized with the database.
+
+        The first call loads all ACTIVE tasks. Later calls read the task
+        change log and reload only the tasks changed since the previous call
+        (plus tasks they block), so completing or editing one task does not
+        reload and re-sort everything. Databases without a change log are
+        reloaded on every call.
+
+        Returns:
+            Up-to-date RankingIndex
+        """
+        seq = self.task_dao.get_change_seq()
+
+        if self._ranking_index is None or seq is None or self._ranking_seq is None:
+            self._ranking_index = RankingIndex(self.task_dao.get_all(state=TaskState.ACTIVE))
+        elif seq != self._ranking_seq:
+            changed_ids = self.task_dao.get_changed_task_ids(self._ranking_seq)
+            if len(changed_ids) >= self.RANKING_REBUILD_THRESHOLD:
+                self._ranking_index.rebuild(self.task_dao.get_all(state=TaskState.ACTIVE))
+            else:
+                self._apply_ranking_changes(changed_ids)
+
+        self._ranking_seq = seq
+        return self._ranking_index
+
+    def compact_change_log(self) -> int:
+        """
+        Delete task change log rows that no reader needs any more.
+
+        Rows up to the lowest seq still needed are deleted: the seqs the
+        ranking indexes and dependency metrics of live TaskService instances
+        were synchronized at, and the watermark of the last JSON export
+        (delta exports read changes after it). Without a watermark, the log
+        is only collapsed to the latest row per task. The history delete log
+        is pruned along with it (see ExportService.compact_history_delete_log).
+
+        Returns:
+            Number of task change log rows deleted
+        """
+        export_service = ExportService(self.db.get_connection())
+        export_service.compact_history_delete_log()
+        watermark = export_service.get_export_watermark()
+        if watermark is None:
+            return self.task_dao.compact_change_log()
+
+        needed = [watermark.get('task_changes', 0)]
+        for service in list(TaskService._instances):
+            needed += [seq for seq in (service._ranking_seq, service._metrics_seq) if seq is not None]
+        return self.task_dao.compact_change_log(min(needed))
+
+    def _apply_ranking_changes(self, changed_ids: Set[int]) -> None:
+        """
+        Reload changed tasks into the ranking index.
+
+        Tasks blocked by a changed task are reloaded too, since completing
+        (or un-completing) a blocker changes their blocked status.
+
+        Args:
+            changed_ids: IDs of tasks inserted, updated or deleted
+        """
+        affected_ids = set(changed_ids)
+        affected_ids |= self.dependency_dao.get_dependent_task_ids(list(changed_ids))
+
+        reloaded = self.task_dao.get_by_ids(list(affected_ids))
+        for task in reloaded:
+            self._ranking_index.upsert(task)
+
+        for task_id in affected_ids - {task.id for task in reloaded}:
+            self._ranking_index.remove(task_id)
+
+    def get_dependency_metrics(self) -> Dict[int, DependencyMetrics]:
+        """
+        Get transitive blocked status, depth and unblock count of every task in a dependency.
+
+        Computed in one pass over the dependency graph and cached. The cache is
+        kept as long as the task change log shows no change to a task that
+        is (or was) part of a dependency, so edits to unrelated tasks do not
+        trigger a recomputation.
+
+        Returns:
+            Dict mapping task ID -> DependencyMetrics; tasks without
+            dependencies are absent (see dependency_analysis.NO_DEPENDENCIES)
+        """
+        seq = self.task_dao.get_change_seq()
+        graph = self.dependency_dao.get_graph()
+
+        if self._dependency_metrics is not None and seq is not None and self._metrics_seq is not None:
+            if seq == self._metrics_seq:
+                return self._dependency_metrics
+
+            changed_ids = self.task_dao.get_changed_task_ids(self._metrics_seq)
+            if not any(task_id in self._dependency_metrics or graph.has_task(task_id)
+                       for task_id in changed_ids):
+                self._metrics_seq = seq
+                return self._dependency_metrics
+
+        self._dependency_metrics = analyze_dependencies(
+            graph.edges(), self.dependency_dao.get_completed_task_ids()
+        )
+        self._metrics_seq = seq
+        return self._dependency_metrics
+
+    def get_unblock_counts(self) -> Dict[int, int]:
+        """
+        Get how many tasks each task would unblock if completed (ranking tiebreaker).
+
+        Returns:
+            Dict mapping task ID -> unblock count (only non-zero counts)
+        """
+        return {
+            task_id: metrics.unblock_count
+            for task_id, metrics in self.get_dependency_metrics().items()
+            if metrics.unblock_count
+        }
 
     def get_ranked_tasks(
         self,
@@ -122,8 +329,20 @@ class TaskService:
         Returns:
             List of tasks ranked by importance (highest first)
         """
-        all_tasks = self.task_dao.get_all()
-        return get_actionable_tasks(all_tasks, context_filter=context_filter, tag_filters=tag_filters)
+        return self.task_dao.get_actionable_tasks(context_filter=context_filter, tag_filters=tag_filters)
+
+    def search_tasks(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        """
+        Search tasks by title and description.
+
+        Args:
+            query: Search text (each word is matched as a prefix)
+            limit: Optional maximum number of results
+
+        Returns:
+            Matching tasks, best match first
+        """
+        return self.task_dao.get_by_ids(self.task_dao.search_task_ids(query, limit=limit))
 
     def create_task(self, task: Task) -> Task:
         """
@@ -152,6 +371,18 @@ class TaskService:
         """
         return self.task_dao.update(task)
 
+    def update_tasks(self, tasks: List[Task]) -> List[Task]:
+        """
+        Update several tasks in a single transaction.
+
+        Args:
+            tasks: Tasks to update (must have ids)
+
+        Returns:
+            Updated tasks
+        """
+        return self.task_dao.bulk_update(tasks)
+
     def delete_task(self, task_id: int) -> bool:
         """
         Delete a task.
@@ -197,23 +428,24 @@ class TaskService:
         Returns:
             Updated task, or None if not found
         """
-        task = self.task_dao.get_by_id(task_id)
-        if task is None:
-            return None
+        with transaction(self.db):
+            task = self.task_dao.get_by_id(task_id)
+            if task is None:
+                return None
 
-        old_state = task.state
-        task.mark_completed()
-        completed_task = self.task_dao.update(task)
+            old_state = task.state
+            task.mark_completed()
+            completed_task = self.task_dao.update(task)
 
-        # Record state change in history
-        if old_state != TaskState.COMPLETED:
-            self.history_service.record_state_change(completed_task, old_state, TaskState.COMPLETED)
+            # Record state change in history
+            if old_state != TaskState.COMPLETED:
+                self.history_service.record_state_change(completed_task, old_state, TaskState.COMPLETED)
 
-        # Handle recurring logic
-        if task.is_recurring:
-            self._generate_next_occurrence(completed_task)
+            # Handle recurring logic
+            if task.is_recurring:
+                self._generate_next_occurrence(completed_task)
 
-        return completed_task
+            return completed_task
 
     def defer_task(self, task_id: int, start_date: date,
                    reason: PostponeReasonType = PostponeReasonType.NOT_READY,
@@ -230,28 +462,29 @@ class TaskService:
         Returns:
             Updated task, or None if not found
         """
-        task = self.task_dao.get_by_id(task_id)
-        if task is None:
-            return None
+        with transaction(self.db):
+            task = self.task_dao.get_by_id(task_id)
+            if task is None:
+                return None
 
-        old_state = task.state
-        task.defer_until(start_date)
-        updated_task = self.task_dao.update(task)
-
-        # Record state change in history
-        if old_state != TaskState.DEFERRED:
-            self.history_service.record_state_change(updated_task, old_state, TaskState.DEFERRED)
+            old_state = task.state
+            task.defer_until(start_date)
+            updated_task = self.task_dao.update(task)
 
-        # Record postpone reason after successful state change
-        postpone_record = PostponeRecord(
-            task_id=task_id,
-            reason_type=reason,
-            reason_notes=notes,
-            action_taken=ActionTaken.DEFERRED
-        )
-        self.postpone_dao.create(postpone_record)
+            # Record state change in history
+            if old_state != TaskState.DEFERRED:
+                self.history_service.record_state_change(updated_task, old_state, TaskState.DEFERRED)
+
+            # Record postpone reason after successful state change
+            postpone_record = PostponeRecord(
+                task_id=task_id,
+                reason_type=reason,
+                reason_notes=notes,
+                action_taken=ActionTaken.DEFERRED
+            )
+            self.postpone_dao.create(postpone_record)
 
-        return updated_task
+            return updated_task
 
     def delegate_task(self, task_id: int, delegated_to: str,
                      follow_up_date: date, notes: Optional[str] = None) -> Optional[Task]:
@@ -267,28 +500,29 @@ class TaskService:
         Returns:
             Updated task, or None if not found
         """
-        task = self.task_dao.get_by_id(task_id)
-        if task is None:
-            return None
-
-        old_state = task.state
-        task.delegate_to(delegated_to, follow_up_date)
-        updated_task = self.task_dao.update(task)
+        with transaction(self.db):
+            task = self.task_dao.get_by_id(task_id)
+            if task is None:
+                return None
 
-        # Record state change in history
-        if old_state != TaskState.DELEGATED:
-            self.history_service.record_state_change(updated_task, old_state, TaskState.DELEGATED)
+            old_state = task.state
+            task.delegate_to(delegated_to, follow_up_date)
+            updated_task = self.task_dao.update(task)
 
-        # Record postpone reason after successful state change
-        postpone_record = PostponeRecord(
-            task_id=task_id,
-            reason_type=PostponeReasonType.OTHER,  # Delegation is a form of postponement
-            reason_notes=notes,
-            action_taken=ActionTaken.DELEGATED
-        )
-        self.postpone_dao.create(postpone_record)
+            # Record state change in history
+            if old_state != TaskState.DELEGATED:
+                self.history_service.record_state_change(updated_task, old_state, TaskState.DELEGATED)
+
+            # Record postpone reason after successful state change
+            postpone_record = PostponeRecord(
+                task_id=task_id,
+                reason_type=PostponeReasonType.OTHER,  # Delegation is a form of postponement
+                reason_notes=notes,
+                action_taken=ActionTaken.DELEGATED
+            )
+            self.postpone_dao.create(postpone_record)
 
-        return updated_task
+            return updated_task
 
     def move_to_someday(self, task_id: int) -> Optional[Task]:
         """
@@ -300,19 +534,20 @@ class TaskService:
         Returns:
             Updated task, or None if not found
         """
-        task = self.task_dao.get_by_id(task_id)
-        if task is None:
-            return None
+        with transaction(self.db):
+            task = self.task_dao.get_by_id(task_id)
+            if task is None:
+                return None
 
-        old_state = task.state
-        task.move_to_someday()
-        updated_task = self.task_dao.update(task)
+            old_state = task.state
+            task.move_to_someday()
+            updated_task = self.task_dao.update(task)
 
-        # Record state change in history
-        if old_state != TaskState.SOMEDAY:
-            self.history_service.record_state_change(updated_task, old_state, TaskState.SOMEDAY)
+            # Record state change in history
+            if old_state != TaskState.SOMEDAY:
+                self.history_service.record_state_change(updated_task, old_state, TaskState.SOMEDAY)
 
-        return updated_task
+            return updated_task
 
     def move_to_trash(self, task_id: int) -> Optional[Task]:
         """
@@ -324,19 +559,20 @@ class TaskService:
         Returns:
             Updated task, or None if not found
         """
-        task = self.task_dao.get_by_id(task_id)
-        if task is None:
-            return None
+        with transaction(self.db):
+            task = self.task_dao.get_by_id(task_id)
+            if task is None:
+                return None
 
-        old_state = task.state
-        task.move_to_trash()
-        updated_task = self.task_dao.update(task)
+            old_state = task.state
+            task.move_to_trash()
+            updated_task = self.task_dao.update(task)
 
-        # Record state change in history
-        if old_state != TaskState.TRASH:
-            self.history_service.record_state_change(updated_task, old_state, TaskState.TRASH)
+            # Record state change in history
+            if old_state != TaskState.TRASH:
+                self.history_service.record_state_change(updated_task, old_state, TaskState.TRASH)
 
-        return updated_task
+            return updated_task
 
     def activate_task(self, task_id: int) -> Optional[Task]:
         """
@@ -348,24 +584,25 @@ class TaskService:
         Returns:
             Updated task, or None if not found
         """
-        task = self.task_dao.get_by_id(task_id)
-        if task is None:
-            return None
+        with transaction(self.db):
+            task = self.task_dao.get_by_id(task_id)
+            if task is None:
+                return None
 
-        old_state = task.state
-        task.state = TaskState.ACTIVE
-        # Clear state-specific fields
-        task.start_date = None
-        task.delegated_to = None
-        task.follow_up_date = None
-        task.completed_at = None
-        updated_task = self.task_dao.update(task)
+            old_state = task.state
+            task.state = TaskState.ACTIVE
+            # Clear state-specific fields
+            task.start_date = None
+            task.delegated_to = None
+            task.follow_up_date = None
+            task.completed_at = None
+            updated_task = self.task_dao.update(task)
 
-        # Record state change in history
-        if old_state != TaskState.ACTIVE:
-            self.history_service.record_state_change(updated_task, old_state, TaskState.ACTIVE)
+            # Record state change in history
+            if old_state != TaskState.ACTIVE:
+                self.history_service.record_state_change(updated_task, old_state, TaskState.ACTIVE)
 
-        return updated_task
+            return updated_task
 
     def restore_task(self, task_id: int) -> Optional[Task]:
         """
@@ -389,22 +626,23 @@ class TaskService:
         Returns:
             Updated task, or None if not found
         """
-        task = self.task_dao.get_by_id(task_id)
-        if task is None:
-            return None
+        with transaction(self.db):
+            task = self.task_dao.get_by_id(task_id)
+            if task is None:
+                return None
 
-        if task.state == TaskState.COMPLETED:
-            old_state = task.state
-            task.state = TaskState.ACTIVE
-            task.completed_at = None
-            updated_task = self.task_dao.update(task)
+            if task.state == TaskState.COMPLETED:
+                old_state = task.state
+                task.state = TaskState.ACTIVE
+                task.completed_at = None
+                updated_task = self.task_dao.update(task)
 
-            # Record state change in history
-            self.history_service.record_state_change(updated_task, old_state, TaskState.ACTIVE)
+                # Record state change in history
+                self.history_service.record_state_change(updated_task, old_state, TaskState.ACTIVE)
 
-            return updated_task
+                return updated_task
 
-        return task
+            return task
 
     def get_tasks_by_state(self, state: TaskState) -> List[Task]:
         """
@@ -459,11 +697,7 @@ class TaskService:
         Returns:
             Dictionary mapping state name to count
         """
-        counts = {}
-        for state in TaskState:
-            tasks = self.get_tasks_by_state(state)
-            counts[state.value] = len(tasks)
-        return counts
+        return self.task_dao.count_by_state()
 
     def _generate_next_occurrence(self, completed_task: Task) -> Optional[Task]:
         """
@@ -6,6 +6,7 @@ import os
 from typing import Optional
 from PyQt5.QtWidgets import QApplication
 import sqlite3
+from ..database.settings_dao import SettingsDAO
 
 
 class ThemeService:
@@ -119,6 +120,7 @@ class ThemeService:
             ("theme", theme_name)
         )
         self.db_connection.commit()
+        SettingsDAO.invalidate_cache('theme')
         self.apply_theme(theme_name)
 
     def get_available_themes(self) -> list[str]:
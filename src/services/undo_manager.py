@@ -4,7 +4,7 @@ Undo/Redo Manager for OneTaskAtATime.
 Manages the undo/redo stack using the Command pattern.
 """
 
-from typing import List, Optional
+from typing import Callable, List, Optional
 from PyQt5.QtCore import QObject, pyqtSignal
 
 from src.commands.base_command import Command
@@ -44,7 +44,7 @@ class UndoManager(QObject):
         Returns:
             True if command executed successfully, False otherwise
         """
-        if command.execute():
+        if self._run_atomically(command, command.execute):
             # Add to undo stack
             self.undo_stack.append(command)
 
@@ -75,7 +75,7 @@ class UndoManager(QObject):
 
         command = self.undo_stack.pop()
 
-        if command.undo():
+        if self._run_atomically(command, command.undo):
             # Move to redo stack
             self.redo_stack.append(command)
 
@@ -101,7 +101,7 @@ class UndoManager(QObject):
 
         command = self.redo_stack.pop()
 
-        if command.execute():
+        if self._run_atomically(command, command.execute):
             # Move back to undo stack
             self.undo_stack.append(command)
 
@@ -115,6 +115,26 @@ class UndoManager(QObject):
             self.redo_stack.append(command)
             return False
 
+    def _run_atomically(self, command: Command, action: Callable[[], bool]) -> bool:
+        """
+        Run a command's execute() or undo() in one unit of work.
+
+        Writes are committed once if the action succeeds and rolled back if it
+        returns False or raises, so a failed command leaves no partial state.
+
+        Args:
+            command: Command providing the transaction scope
+            action: Bound execute or undo method of command
+
+        Returns:
+            Result of action
+        """
+        with command.transaction() as unit:
+            succeeded = action()
+            if not succeeded and unit is not None:
+                unit.set_rollback_only()
+        return succeeded
+
     def can_undo(self) -> bool:
         """
         Check if undo is available.
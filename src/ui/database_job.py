@@ -0,0 +1,75 @@
+"""Background job runner for long database operations.
+
+Imports, exports and backups run on a QThread with a database connection of
+their own, so the UI thread's connection is never used concurrently and the
+UI stays responsive. Progress and the result are delivered through Qt
+signals (queued to the UI thread), and a job can be cancelled while it runs.
+Settings listeners are not called for changes a job makes (see SettingsDAO);
+the dialog handling the result calls SettingsDAO.invalidate_cache().
+"""
+import sqlite3
+import threading
+from typing import Any, Callable, Dict
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from ..database.connection import DatabaseConnection
+
+
+class DatabaseJob(QThread):
+    """Runs one database operation on a worker thread.
+
+    The operation is called with the job's own connection. It should pass
+    report_progress as its progress callback and cancel_event as its
+    cancellation event; the services check the event while they work and
+    roll back (or remove partial files) when it is set.
+    """
+
+    progress = pyqtSignal(str, int)  # message, percent
+    finished = pyqtSignal(dict)  # result dictionary
+    error = pyqtSignal(str)  # error message
+
+    def __init__(self, db_connection: sqlite3.Connection,
+                 operation: Callable[[sqlite3.Connection], Dict[str, Any]]):
+        """Initialize the job.
+
+        Args:
+            db_connection: The UI thread's connection; the job opens its own
+                connection to the same database file
+            operation: Called on the worker thread with the job's connection;
+                returns the result dictionary
+        """
+        super().__init__()
+        self.db_connection = db_connection
+        self.operation = operation
+        self.cancel_event = threading.Event()
+
+        # Look up the file here, on the thread that owns db_connection
+        self._database_path = db_connection.execute("PRAGMA database_list").fetchone()[2]
+
+    def cancel(self):
+        """Request cancellation; the job stops at its next progress report."""
+        self.cancel_event.set()
+
+    def report_progress(self, message: str, percent: int):
+        """Progress callback for the operation (emits the progress signal)."""
+        self.progress.emit(message, percent)
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the job's connection (in-memory databases cannot be shared)."""
+        if not self._database_path:
+            return self.db_connection
+        return DatabaseConnection.open_connection(self._database_path)
+
+    def run(self):
+        """Run the job on the worker thread."""
+        connection = None
+        try:
+            connection = self._open_connection()
+            self.finished.emit(self.operation(connection))
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            if connection is not None and connection is not self.db_connection:
+                connection.close()
+
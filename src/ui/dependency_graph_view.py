@@ -1,21 +1,20 @@
 """
 DependencyGraphView for OneTaskAtATime application.
 
-Text-based tree visualization of task dependency chains.
-Shows which tasks are blocking other tasks in a hierarchical format.
+Expandable tree visualization of task dependency chains.
+Shows which tasks are blocking other tasks in a hierarchical format; deeper
+levels are loaded on demand when a node is expanded.
 """
 
-from typing import List, Set, Optional, Dict
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QMessageBox, QFileDialog
+    QTreeView, QFileDialog
 )
-from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 from ..models.task import Task
-from ..models.enums import TaskState
 from ..database.task_dao import TaskDAO
 from ..database.dependency_dao import DependencyDAO
+from .dependency_tree_model import DependencyTreeModel, BLOCKERS, DEPENDENTS, task_icon
 from .message_box import MessageBox
 
 
@@ -27,9 +26,9 @@ class DependencyGraphView(QDialog):
     - Tasks that block the selected task (dependencies)
     - Tasks that the selected task blocks (dependents)
     - Visual indicators for task state (✓ completed, ⛔ blocked, etc.)
-    - Indented tree structure showing dependency chains
+    - Indented tree structure showing dependency chains, expanded lazily
 
-    Example output:
+    Example export:
     ```
     Task: Implement user authentication
     ├─ ⛔ Design database schema (ACTIVE)
@@ -100,14 +99,17 @@ class DependencyGraphView(QDialog):
         legend.setWordWrap(True)
         layout.addWidget(legend)
 
-        # Graph display (text-based)
-        self.graph_display = QTextEdit()
-        self.graph_display.setReadOnly(True)
-        self.graph_display.setFont(QFont("Courier New", 10))
-        self.graph_display.setStyleSheet(
+        # Graph display (children are loaded when a node is expanded)
+        self.graph_model = DependencyTreeModel(self.task, self.task_dao, self.dependency_dao, self)
+        self.graph_tree = QTreeView()
+        self.graph_tree.setModel(self.graph_model)
+        self.graph_tree.setHeaderHidden(True)
+        self.graph_tree.setUniformRowHeights(True)
+        self.graph_tree.setEditTriggers(QTreeView.NoEditTriggers)
+        self.graph_tree.setStyleSheet(
             "background-color: #ffffff; border: 1px solid #ced4da; padding: 10px;"
         )
-        layout.addWidget(self.graph_display)
+        layout.addWidget(self.graph_tree)
 
         # Build and display the graph
         self._build_graph()
@@ -132,128 +134,23 @@ class DependencyGraphView(QDialog):
         layout.addLayout(button_layout)
 
     def _build_graph(self):
-        """Build and display the dependency graph."""
-        graph_text = []
-
-        # Section 1: Tasks blocking this task (dependencies)
-        if self.task.id:
-            dependencies = self.dependency_dao.get_dependencies_for_task(self.task.id)
-
-            if dependencies:
-                graph_text.append("═" * 60)
-                graph_text.append("TASKS BLOCKING THIS TASK")
-                graph_text.append("═" * 60)
-                graph_text.append("")
-
-                for dep in dependencies:
-                    blocking_task = self.task_dao.get_by_id(dep.blocking_task_id)
-                    if blocking_task:
-                        # Build tree starting from this blocking task
-                        tree_lines = self._build_tree(blocking_task, visited=set())
-                        graph_text.extend(tree_lines)
-                        graph_text.append("")  # Blank line between trees
-            else:
-                graph_text.append("═" * 60)
-                graph_text.append("TASKS BLOCKING THIS TASK")
-                graph_text.append("═" * 60)
-                graph_text.append("")
-                graph_text.append("✓ No blocking tasks - this task is ready to work on!")
-                graph_text.append("")
-
-            # Section 2: Tasks blocked by this task (dependents)
-            dependents = self.dependency_dao.get_blocking_tasks(self.task.id)
-
-            if dependents:
-                graph_text.append("═" * 60)
-                graph_text.append("TASKS BLOCKED BY THIS TASK")
-                graph_text.append("═" * 60)
-                graph_text.append("")
-
-                for dep in dependents:
-                    dependent_task = self.task_dao.get_by_id(dep.blocked_task_id)
-                    if dependent_task:
-                        icon = self._get_task_icon(dependent_task)
-                        state_name = dependent_task.state.value if dependent_task.state else "ACTIVE"
-                        graph_text.append(f"{icon} {dependent_task.title} ({state_name})")
-
-                graph_text.append("")
-            else:
-                graph_text.append("═" * 60)
-                graph_text.append("TASKS BLOCKED BY THIS TASK")
-                graph_text.append("═" * 60)
-                graph_text.append("")
-                graph_text.append("✓ No dependent tasks - completing this won't unblock anything")
-                graph_text.append("")
+        """(Re)load the dependency tree and expand its top level."""
+        self.graph_model.reload()
 
-        else:
-            graph_text.append("⚠️ Task has not been saved yet - no dependency information available")
-
-        self.graph_display.setPlainText("\n".join(graph_text))
+        for direction in (BLOCKERS, DEPENDENTS):
+            index = self.graph_model.section_index(direction)
+            if index.isValid():
+                self.graph_model.fetchMore(index)
+                self.graph_tree.expand(index)
 
-    def _build_tree(self, task: Task, prefix: str = "", visited: Optional[Set[int]] = None,
-                    is_last: bool = True, depth: int = 0) -> List[str]:
+    def graph_text(self) -> str:
         """
-        Recursively build tree structure showing dependencies.
-
-        Args:
-            task: Current task to display
-            prefix: Prefix for tree formatting (e.g., "│  " or "   ")
-            visited: Set of task IDs already visited (prevents infinite loops)
-            is_last: Whether this is the last child at this level
-            depth: Current depth in tree (for limiting recursion)
+        Render the complete dependency tree as plain text.
 
         Returns:
-            List of formatted tree lines
+            Tree text (as written by Export to File)
         """
-        if visited is None:
-            visited = set()
-
-        lines = []
-
-        # Prevent infinite loops from circular dependencies
-        if task.id in visited:
-            icon = "🔄"  # Circular reference indicator
-            state_name = "CIRCULAR"
-            lines.append(f"{prefix}{'└─' if is_last else '├─'} {icon} {task.title} ({state_name})")
-            return lines
-
-        # Limit depth to prevent extremely deep trees
-        MAX_DEPTH = 5
-        if depth >= MAX_DEPTH:
-            icon = "⋯"
-            lines.append(f"{prefix}{'└─' if is_last else '├─'} {icon} {task.title} (MAX DEPTH)")
-            return lines
-
-        visited.add(task.id)
-
-        # Display current task
-        icon = self._get_task_icon(task)
-        state_name = task.state.value if task.state else "ACTIVE"
-        lines.append(f"{prefix}{'└─' if is_last else '├─'} {icon} {task.title} ({state_name})")
-
-        # Get dependencies of this task
-        if task.id:
-            dependencies = self.dependency_dao.get_dependencies_for_task(task.id)
-
-            if dependencies:
-                # Prepare prefix for children
-                child_prefix = prefix + ("   " if is_last else "│  ")
-
-                for i, dep in enumerate(dependencies):
-                    is_last_child = (i == len(dependencies) - 1)
-                    blocking_task = self.task_dao.get_by_id(dep.blocking_task_id)
-
-                    if blocking_task:
-                        child_lines = self._build_tree(
-                            blocking_task,
-                            prefix=child_prefix,
-                            visited=visited.copy(),  # Pass copy to allow parallel branches
-                            is_last=is_last_child,
-                            depth=depth + 1
-                        )
-                        lines.extend(child_lines)
-
-        return lines
+        return "\n".join(self.graph_model.render_text())
 
     def _get_task_icon(self, task: Task) -> str:
         """
@@ -265,25 +162,7 @@ class DependencyGraphView(QDialog):
         Returns:
             Icon string (emoji)
         """
-        if not task.state:
-            return "⚪"  # No state (shouldn't happen)
-
-        state_icons = {
-            TaskState.ACTIVE: "🔄",
-            TaskState.COMPLETED: "✓",
-            TaskState.DEFERRED: "📅",
-            TaskState.DELEGATED: "👤",
-            TaskState.SOMEDAY: "💤",
-            TaskState.TRASH: "🗑️"
-        }
-
-        icon = state_icons.get(task.state, "⚪")
-
-        # Add blocker indicator if task is blocked
-        if task.id and task.blocking_task_ids:
-            icon = "⛔"
-
-        return icon
+        return task_icon(task)
 
     def _export_graph(self):
         """Export graph to plain text file."""
@@ -300,7 +179,7 @@ class DependencyGraphView(QDialog):
                     f.write(f"Dependency Graph: {self.task.title}\n")
                     f.write(f"Generated: {__import__('datetime').datetime.now().isoformat()}\n")
                     f.write("\n")
-                    f.write(self.graph_display.toPlainText())
+                    f.write(self.graph_text())
 
                 MessageBox.information(
                     self,
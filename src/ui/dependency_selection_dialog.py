@@ -265,7 +265,11 @@ class DependencySelectionDialog(QDialog, GeometryMixin):
         """Refresh the available tasks list."""
         self.available_list.clear()
 
-        search_text = self.search_box.text().lower()
+        search_text = self.search_box.text().strip()
+        matching_ids = (
+            set(self.task_dao.search_task_ids(search_text, title_only=True))
+            if search_text else None
+        )
 
         for task in self.all_tasks:
             # Skip if already a dependency
@@ -273,7 +277,7 @@ class DependencySelectionDialog(QDialog, GeometryMixin):
                 continue
 
             # Filter by search text
-            if search_text and search_text not in task.title.lower():
+            if matching_ids is not None and task.id not in matching_ids:
                 continue
 
             item = QListWidgetItem(f"[{task.state.value}] {task.title}")
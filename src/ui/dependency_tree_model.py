@@ -0,0 +1,399 @@
+"""
+Dependency Tree Model - Lazy model backing the Dependency Graph view
+
+Provides a QAbstractItemModel over the dependency chains of one task. The
+adjacency comes from the DAO's in-memory dependency graph (one bulk query,
+cached per connection), and children are only created when a node is
+expanded (canFetchMore/fetchMore), so opening the graph of a hub task with
+hundreds of descendants only loads its direct neighbours.
+
+Memoization:
+- Child ID lists are computed once per (direction, task) and shared by every
+  occurrence of that task in the tree
+- Tasks are loaded in bulk (one get_by_ids call per expanded node) and kept
+  until reload()
+- Text export prints each subtree once and refers back to it afterwards
+"""
+
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex, QVariant
+from typing import Dict, List, Optional, Tuple
+from ..algorithms.dependency_graph import DependencyGraph
+from ..database.task_dao import TaskDAO
+from ..database.dependency_dao import DependencyDAO
+from ..models.task import Task
+from ..models.enums import TaskState
+
+
+# Directions of the two sections of the tree
+BLOCKERS = "blockers"
+DEPENDENTS = "dependents"
+
+SECTION_TITLES = {
+    BLOCKERS: "TASKS BLOCKING THIS TASK",
+    DEPENDENTS: "TASKS BLOCKED BY THIS TASK",
+}
+
+EMPTY_SECTION_MESSAGES = {
+    BLOCKERS: "✓ No blocking tasks - this task is ready to work on!",
+    DEPENDENTS: "✓ No dependent tasks - completing this won't unblock anything",
+}
+
+UNSAVED_TASK_MESSAGE = "⚠️ Task has not been saved yet - no dependency information available"
+
+STATE_ICONS = {
+    TaskState.ACTIVE: "🔄",
+    TaskState.COMPLETED: "✓",
+    TaskState.DEFERRED: "📅",
+    TaskState.DELEGATED: "👤",
+    TaskState.SOMEDAY: "💤",
+    TaskState.TRASH: "🗑️"
+}
+
+
+def task_icon(task: Task) -> str:
+    """
+    Get visual indicator for task state.
+
+    Args:
+        task: Task to get icon for
+
+    Returns:
+        Icon string (emoji); ⛔ if the task has incomplete blockers
+    """
+    if not task.state:
+        return "⚪"  # No state (shouldn't happen)
+
+    if task.id and task.blocking_task_ids:
+        return "⛔"
+
+    return STATE_ICONS.get(task.state, "⚪")
+
+
+def task_label(task: Task) -> str:
+    """Get the display text of a task node."""
+    state_name = task.state.value if task.state else "ACTIVE"
+    return f"{task_icon(task)} {task.title} ({state_name})"
+
+
+class _Node:
+    """One row of the tree (section header, task or message)."""
+
+    __slots__ = ('parent', 'row', 'direction', 'task_id', 'text', 'circular', 'children')
+
+    def __init__(self, parent: Optional['_Node'], row: int, direction: Optional[str] = None,
+                 task_id: Optional[int] = None, text: str = "", circular: bool = False):
+        self.parent = parent
+        self.row = row
+        self.direction = direction
+        self.task_id = task_id
+        self.text = text
+        self.circular = circular
+        # None until fetched
+        self.children: Optional[List['_Node']] = None
+
+    def is_ancestor_task(self, task_id: int) -> bool:
+        """Check if task_id appears on the path from the root to this node."""
+        node = self
+        while node is not None:
+            if node.task_id == task_id:
+                return True
+            node = node.parent
+        return False
+
+
+class DependencyTreeModel(QAbstractItemModel):
+    """
+    Tree model of the tasks blocking and blocked by one task.
+
+    Top-level rows are the two sections ("blocking this task" and "blocked by
+    this task"); below them, each task node expands to the tasks further
+    along the same direction. A task that already appears on the path to a
+    node is shown as CIRCULAR and not expanded again.
+    """
+
+    def __init__(self, task: Task, task_dao: TaskDAO, dependency_dao: DependencyDAO, parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            task: Task whose dependency chains are shown
+            task_dao: DAO used to bulk load task details
+            dependency_dao: DAO providing the dependency graph
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.task = task
+        self.task_dao = task_dao
+        self.dependency_dao = dependency_dao
+
+        self._graph: Optional[DependencyGraph] = None
+        self._child_ids: Dict[Tuple[str, int], List[int]] = {}
+        self._tasks: Dict[int, Task] = {}
+        self._roots: List[_Node] = []
+
+        self._load()
+
+    def reload(self):
+        """Drop memoized data and rebuild the top level from the database."""
+        self.beginResetModel()
+        self._load()
+        self.endResetModel()
+
+    def _load(self):
+        """Load the adjacency and create the top-level rows."""
+        self._child_ids = {}
+        self._tasks = {}
+
+        if not self.task.id:
+            self._graph = None
+            self._roots = [_Node(None, 0, text=UNSAVED_TASK_MESSAGE)]
+            return
+
+        self._graph = self.dependency_dao.get_graph()
+        self._roots = [
+            _Node(None, row, direction=direction, text=SECTION_TITLES[direction])
+            for row, direction in enumerate((BLOCKERS, DEPENDENTS))
+        ]
+
+    def section_index(self, direction: str) -> QModelIndex:
+        """
+        Get the index of a section header.
+
+        Args:
+            direction: BLOCKERS or DEPENDENTS
+
+        Returns:
+            Model index (invalid for an unsaved task)
+        """
+        for node in self._roots:
+            if node.direction == direction and node.task_id is None:
+                return self.createIndex(node.row, 0, node)
+        return QModelIndex()
+
+    def task_at(self, index: QModelIndex) -> Optional[Task]:
+        """
+        Get the task displayed at an index.
+
+        Args:
+            index: Model index
+
+        Returns:
+            Task or None for section headers and messages
+        """
+        node = self._node(index)
+        if node is None or node.task_id is None:
+            return None
+        return self._tasks.get(node.task_id)
+
+    def get_child_ids(self, direction: str, task_id: int) -> List[int]:
+        """
+        Get (memoized) IDs of the next tasks along a direction.
+
+        Args:
+            direction: BLOCKERS or DEPENDENTS
+            task_id: ID of the task
+
+        Returns:
+            Task IDs ordered by title
+        """
+        key = (direction, task_id)
+        child_ids = self._child_ids.get(key)
+        if child_ids is None:
+            if direction == BLOCKERS:
+                neighbours = self._graph.get_blockers(task_id)
+            else:
+                neighbours = self._graph.get_dependents(task_id)
+
+            self._load_tasks(neighbours)
+            child_ids = sorted(
+                (task_id for task_id in neighbours if task_id in self._tasks),
+                key=lambda task_id: (self._tasks[task_id].title.lower(), task_id)
+            )
+            self._child_ids[key] = child_ids
+        return child_ids
+
+    def _load_tasks(self, task_ids) -> None:
+        """Bulk load tasks that are not cached yet."""
+        missing = [task_id for task_id in task_ids if task_id not in self._tasks]
+        if missing:
+            for task in self.task_dao.get_by_ids(missing):
+                self._tasks[task.id] = task
+
+    def _has_neighbours(self, direction: str, task_id: int) -> bool:
+        """Check for children without loading them."""
+        if direction == BLOCKERS:
+            return bool(self._graph.get_blockers(task_id))
+        return bool(self._graph.get_dependents(task_id))
+
+    def _node(self, index: QModelIndex) -> Optional[_Node]:
+        return index.internalPointer() if index.isValid() else None
+
+    def _children_of(self, parent: QModelIndex) -> Optional[List[_Node]]:
+        node = self._node(parent)
+        return self._roots if node is None else node.children
+
+    # QAbstractItemModel interface
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        children = self._children_of(parent)
+        if column != 0 or children is None or not 0 <= row < len(children):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        node = self._node(index)
+        if node is None or node.parent is None:
+            return QModelIndex()
+        return self.createIndex(node.parent.row, 0, node.parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        children = self._children_of(parent)
+        return len(children) if children is not None else 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self._node(parent)
+        if node is None:
+            return bool(self._roots)
+        if node.children is not None:
+            return bool(node.children)
+        if node.direction is None or node.circular:
+            return False
+        if node.task_id is None:
+            return True  # Section header (shows a message when empty)
+        return self._has_neighbours(node.direction, node.task_id)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self._node(parent)
+        return (
+            node is not None and node.children is None
+            and node.direction is not None and not node.circular
+        )
+
+    def fetchMore(self, parent: QModelIndex):
+        node = self._node(parent)
+        if node is None or not self.canFetchMore(parent):
+            return
+
+        task_id = node.task_id if node.task_id is not None else self.task.id
+        children = [
+            _Node(node, row, direction=node.direction, task_id=child_id,
+                  circular=node.is_ancestor_task(child_id) or child_id == self.task.id)
+            for row, child_id in enumerate(self.get_child_ids(node.direction, task_id))
+        ]
+        if not children and node.task_id is None:
+            children = [_Node(node, 0, text=EMPTY_SECTION_MESSAGES[node.direction])]
+
+        if not children:
+            node.children = []
+            return
+
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        node.children = children
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        node = self._node(index)
+        if node is None:
+            return QVariant()
+
+        task = self._tasks.get(node.task_id) if node.task_id is not None else None
+
+        if role == Qt.DisplayRole:
+            if task is None:
+                return node.text
+            if node.circular:
+                return f"🔄 {task.title} (CIRCULAR)"
+            return task_label(task)
+        if role == Qt.ToolTipRole and task is not None:
+            return task.description or None
+        if role == Qt.UserRole:
+            return node.task_id
+
+        return QVariant()
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # Text export
+
+    def render_text(self) -> List[str]:
+        """
+        Render the complete tree as indented text.
+
+        Every task is loaded with one bulk query. A subtree that was already
+        printed is replaced by a reference to it, so the output grows with the
+        size of the graph instead of the number of paths through it.
+
+        Returns:
+            List of text lines
+        """
+        if not self.task.id:
+            return [UNSAVED_TASK_MESSAGE]
+
+        self._load_tasks(
+            self._graph.get_transitive_blockers(self.task.id)
+            | self._graph.get_transitive_dependents(self.task.id)
+        )
+
+        lines: List[str] = []
+        for direction in (BLOCKERS, DEPENDENTS):
+            lines.append("═" * 60)
+            lines.append(SECTION_TITLES[direction])
+            lines.append("═" * 60)
+            lines.append("")
+
+            child_ids = self.get_child_ids(direction, self.task.id)
+            if child_ids:
+                lines.extend(self._render_subtrees(direction, child_ids))
+            else:
+                lines.append(EMPTY_SECTION_MESSAGES[direction])
+            lines.append("")
+
+        return lines
+
+    def _render_subtrees(self, direction: str, root_ids: List[int]) -> List[str]:
+        """Render the trees below root_ids (iteratively, safe on deep chains)."""
+        lines: List[str] = []
+        printed = set()
+        on_path = {self.task.id}
+
+        # (task_id, prefix, is_last); a bare task ID marks leaving its subtree
+        stack: list = [
+            (task_id, "", i == len(root_ids) - 1)
+            for i, task_id in reversed(list(enumerate(root_ids)))
+        ]
+        while stack:
+            entry = stack.pop()
+            if not isinstance(entry, tuple):
+                on_path.discard(entry)
+                continue
+
+            task_id, prefix, is_last = entry
+            task = self._tasks[task_id]
+            branch = f"{prefix}{'└─' if is_last else '├─'}"
+            child_ids = self.get_child_ids(direction, task_id)
+
+            if task_id in on_path:
+                lines.append(f"{branch} 🔄 {task.title} (CIRCULAR)")
+                continue
+            if task_id in printed and child_ids:
+                lines.append(f"{branch} ⋯ {task.title} (see above)")
+                continue
+
+            printed.add(task_id)
+            lines.append(f"{branch} {task_label(task)}")
+
+            on_path.add(task_id)
+            stack.append(task_id)
+            child_prefix = prefix + ("   " if is_last else "│  ")
+            for i in reversed(range(len(child_ids))):
+                stack.append((child_ids[i], child_prefix, i == len(child_ids) - 1))
+
+        return lines
@@ -7,57 +7,89 @@ from datetime import datetime
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QRadioButton, QGroupBox, QFileDialog, QProgressBar,
-    QCheckBox, QMessageBox, QLineEdit
+    QCheckBox, QMessageBox, QLineEdit, QComboBox
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 
-from ..services.export_service import ExportService
+from ..database.context_dao import ContextDAO
+from ..database.project_tag_dao import ProjectTagDAO
+from ..database.settings_dao import SettingsDAO
+from ..services.export_service import ExportFilter, ExportService
+from ..services.json_stream import FORMAT_JSON, FORMAT_NDJSON
+from .database_job import DatabaseJob
 from .geometry_mixin import GeometryMixin
 from .message_box import MessageBox
 
 
-class ExportWorker(QThread):
-    """Worker thread for export operations."""
+# JSON export formats offered in the dialog: label -> (export_format, compact)
+JSON_FORMATS = [
+    ("JSON (readable)", FORMAT_JSON, False),
+    ("JSON (compact)", FORMAT_JSON, True),
+    ("Line-delimited JSON (NDJSON)", FORMAT_NDJSON, True),
+]
 
-    progress = pyqtSignal(str, int)  # message, percent
-    finished = pyqtSignal(dict)  # result dictionary
-    error = pyqtSignal(str)  # error message
 
-    def __init__(self, export_service: ExportService, export_type: str,
-                 filepath: str, include_settings: bool):
+class ExportWorker(DatabaseJob):
+    """Worker thread for export operations (on its own database connection)."""
+
+    def __init__(self, db_connection: sqlite3.Connection, export_type: str,
+                 filepath: str, include_settings: bool,
+                 export_format: str = FORMAT_JSON, compact: bool = False,
+                 compress: bool = False, incremental: bool = False,
+                 export_filter: ExportFilter = None):
         """Initialize export worker.
 
         Args:
-            export_service: ExportService instance
+            db_connection: The dialog's database connection
             export_type: 'json' or 'database'
             filepath: Destination file path
             include_settings: Whether to include settings (JSON only)
+            export_format: FORMAT_JSON or FORMAT_NDJSON (JSON only)
+            compact: Write compact JSON (JSON only)
+            compress: gzip-compress the export (JSON only)
+            incremental: Only export changes since the last export (JSON only)
+            export_filter: Only export the matching tasks (JSON only)
         """
-        super().__init__()
-        self.export_service = export_service
+        super().__init__(db_connection, self._export)
         self.export_type = export_type
         self.filepath = filepath
         self.include_settings = include_settings
+        self.export_format = export_format
+        self.compact = compact
+        self.compress = compress
+        self.incremental = incremental
+        self.export_filter = export_filter
 
-    def run(self):
+    def _export(self, connection: sqlite3.Connection) -> dict:
         """Run the export operation."""
-        try:
-            if self.export_type == 'json':
-                result = self.export_service.export_to_json(
-                    self.filepath,
-                    self.include_settings,
-                    self.progress.emit
-                )
-            else:  # database
-                self.progress.emit("Creating database backup...", 50)
-                result = self.export_service.export_database_backup(self.filepath)
-                self.progress.emit("Backup complete!", 100)
-
-            self.finished.emit(result)
-
-        except Exception as e:
-            self.error.emit(str(e))
+        export_service = ExportService(connection)
+        if self.export_type == 'json' and self.incremental:
+            return export_service.export_delta(
+                self.filepath,
+                include_settings=self.include_settings,
+                progress_callback=self.report_progress,
+                compact=self.compact,
+                export_format=self.export_format,
+                compress=self.compress,
+                cancel_event=self.cancel_event
+            )
+        if self.export_type == 'json':
+            return export_service.export_to_json(
+                self.filepath,
+                self.include_settings,
+                self.report_progress,
+                compact=self.compact,
+                export_format=self.export_format,
+                compress=self.compress,
+                cancel_event=self.cancel_event,
+                export_filter=self.export_filter
+            )
+        return export_service.export_database_backup(
+            self.filepath,
+            progress_callback=self.report_progress,
+            cancel_event=self.cancel_event
+        )
 
 
 class ExportDialog(QDialog, GeometryMixin):
@@ -135,7 +167,7 @@ class ExportDialog(QDialog, GeometryMixin):
         self.database_radio = QRadioButton("SQLite Database Backup")
         self.database_radio.toggled.connect(self._on_export_type_changed)
         self.database_radio.setWhatsThis(
-            "Create a direct copy of the SQLite database file. This is a complete system backup including all data and settings."
+            "Create a consistent copy of the SQLite database file, taken in the background while you keep working. This is a complete system backup including all data and settings. The backup can be cancelled while it runs."
         )
         export_type_layout.addWidget(self.database_radio)
 
@@ -160,6 +192,70 @@ class ExportDialog(QDialog, GeometryMixin):
         )
         options_layout.addWidget(self.include_settings_check)
 
+        format_layout = QHBoxLayout()
+        format_layout.addWidget(QLabel("Format:"))
+        self.format_combo = QComboBox()
+        for label, _, _ in JSON_FORMATS:
+            self.format_combo.addItem(label)
+        self.format_combo.currentIndexChanged.connect(self._update_default_filepath)
+        self.format_combo.setWhatsThis(
+            "Readable JSON is indented for inspection. Compact JSON is smaller. "
+            "Line-delimited JSON stores one record per line, which suits very large exports "
+            "and line-oriented tools."
+        )
+        format_layout.addWidget(self.format_combo)
+        format_layout.addStretch()
+        options_layout.addLayout(format_layout)
+
+        self.compress_check = QCheckBox("Compress (gzip)")
+        self.compress_check.setToolTip(
+            "Write a gzip-compressed export (typically several times smaller)"
+        )
+        self.compress_check.setWhatsThis(
+            "Compress the export with gzip. Compressed exports are detected automatically when importing."
+        )
+        self.compress_check.toggled.connect(self._update_default_filepath)
+        options_layout.addWidget(self.compress_check)
+
+        self.incremental_check = QCheckBox("Only changes since the last export (incremental)")
+        self.incremental_check.setToolTip(
+            "Export only what changed since the last JSON export"
+        )
+        self.incremental_check.setWhatsThis(
+            "Create a small incremental export containing only the tasks and history changed since "
+            "the last JSON export. To restore, import the last full export together with every "
+            "incremental export taken after it."
+        )
+        if self.export_service.get_export_watermark() is None:
+            self.incremental_check.setToolTip("Available after the first JSON export")
+        self.incremental_check.toggled.connect(self._on_scope_changed)
+        options_layout.addWidget(self.incremental_check)
+
+        scope_layout = QHBoxLayout()
+        scope_layout.addWidget(QLabel("Tasks:"))
+        self.context_scope_combo = QComboBox()
+        self.context_scope_combo.addItem("All contexts", None)
+        for context in ContextDAO(self.db_connection).get_all():
+            self.context_scope_combo.addItem(context.name, context.id)
+        self.context_scope_combo.currentIndexChanged.connect(self._on_scope_changed)
+        scope_layout.addWidget(self.context_scope_combo)
+
+        self.tag_scope_combo = QComboBox()
+        self.tag_scope_combo.addItem("All project tags", None)
+        for tag in ProjectTagDAO(self.db_connection).get_all():
+            self.tag_scope_combo.addItem(tag.name, tag.id)
+        self.tag_scope_combo.currentIndexChanged.connect(self._on_scope_changed)
+        scope_layout.addWidget(self.tag_scope_combo)
+        scope_layout.addStretch()
+
+        for combo in (self.context_scope_combo, self.tag_scope_combo):
+            combo.setWhatsThis(
+                "Export only the tasks in a context and/or with a project tag, for example to share "
+                "one project. Their dependencies and history are included; other tasks are not. "
+                "Import a filtered export in merge mode."
+            )
+        options_layout.addLayout(scope_layout)
+
         self.options_group.setLayout(options_layout)
         layout.addWidget(self.options_group)
 
@@ -212,11 +308,15 @@ class ExportDialog(QDialog, GeometryMixin):
 
         self.cancel_btn = QPushButton("Cancel")
         self.cancel_btn.clicked.connect(self.reject)
+        self.cancel_btn.setWhatsThis(
+            "Close the dialog. While an export is running, stop the export instead."
+        )
         button_layout.addWidget(self.cancel_btn)
 
         layout.addLayout(button_layout)
 
         # Set default file path
+        self._update_scope_controls()
         self._update_default_filepath()
 
     def _on_export_type_changed(self):
@@ -225,26 +325,70 @@ class ExportDialog(QDialog, GeometryMixin):
         self.options_group.setVisible(is_json)
         self._update_default_filepath()
 
+    def _selected_format(self):
+        """Get the (export_format, compact) pair chosen in the format combo."""
+        _, export_format, compact = JSON_FORMATS[self.format_combo.currentIndex()]
+        return export_format, compact
+
+    def _export_filter(self):
+        """Get the ExportFilter chosen in the scope combos, or None for all tasks."""
+        context_id = self.context_scope_combo.currentData()
+        tag_id = self.tag_scope_combo.currentData()
+        if context_id is None and tag_id is None:
+            return None
+        return ExportFilter(
+            context_ids=() if context_id is None else (context_id,),
+            project_tag_ids=() if tag_id is None else (tag_id,)
+        )
+
+    def _update_scope_controls(self):
+        """Allow either an incremental or a filtered export, not both."""
+        has_previous_export = self.export_service.get_export_watermark() is not None
+        self.incremental_check.setEnabled(has_previous_export and self._export_filter() is None)
+        is_incremental = self.incremental_check.isChecked()
+        self.context_scope_combo.setEnabled(not is_incremental)
+        self.tag_scope_combo.setEnabled(not is_incremental)
+
+    def _on_scope_changed(self):
+        """Handle a change of the incremental option or the scope combos."""
+        self._update_scope_controls()
+        self._update_default_filepath()
+
+    def _is_incremental(self) -> bool:
+        """Check if an incremental JSON export is selected."""
+        return self.json_radio.isChecked() and self.incremental_check.isChecked()
+
+    def _default_extension(self) -> str:
+        """Get the file extension for the selected export type and options."""
+        if not self.json_radio.isChecked():
+            return ".db"
+        export_format, _ = self._selected_format()
+        extension = ".ndjson" if export_format == FORMAT_NDJSON else ".json"
+        if self.compress_check.isChecked():
+            extension += ".gz"
+        return extension
+
     def _update_default_filepath(self):
         """Update the default file path based on export type."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        if self.json_radio.isChecked():
-            default_filename = f"onetask_backup_{timestamp}.json"
+        if self._is_incremental():
+            kind = "changes"
+        elif self.json_radio.isChecked() and self._export_filter() is not None:
+            kind = "filtered"
         else:
-            default_filename = f"onetask_backup_{timestamp}.db"
+            kind = "backup"
+        default_filename = f"onetask_{kind}_{timestamp}{self._default_extension()}"
 
         self.filepath_edit.setText(default_filename)
         self.export_btn.setEnabled(True)
 
     def _browse_file(self):
         """Open file dialog to select destination."""
+        default_ext = self._default_extension()
         if self.json_radio.isChecked():
-            filter_str = "JSON Files (*.json)"
-            default_ext = ".json"
+            filter_str = f"Export Files (*{default_ext})"
         else:
             filter_str = "SQLite Database (*.db)"
-            default_ext = ".db"
 
         filepath, _ = QFileDialog.getSaveFileName(
             self,
@@ -278,27 +422,51 @@ class ExportDialog(QDialog, GeometryMixin):
         self.json_radio.setEnabled(False)
         self.database_radio.setEnabled(False)
         self.include_settings_check.setEnabled(False)
-        self.cancel_btn.setEnabled(False)
+        self.format_combo.setEnabled(False)
+        self.compress_check.setEnabled(False)
+        self.incremental_check.setEnabled(False)
+        self.context_scope_combo.setEnabled(False)
+        self.tag_scope_combo.setEnabled(False)
+
+        # Create and start worker thread
+        export_type = 'json' if self.json_radio.isChecked() else 'database'
 
         # Show progress bar
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        # Create and start worker thread
-        export_type = 'json' if self.json_radio.isChecked() else 'database'
         include_settings = self.include_settings_check.isChecked()
+        export_format, compact = self._selected_format()
 
         self.export_worker = ExportWorker(
-            self.export_service,
+            self.db_connection,
             export_type,
             filepath,
-            include_settings
+            include_settings,
+            export_format=export_format,
+            compact=compact,
+            compress=self.compress_check.isChecked(),
+            incremental=self._is_incremental(),
+            export_filter=None if self._is_incremental() else self._export_filter()
         )
         self.export_worker.progress.connect(self._on_progress)
         self.export_worker.finished.connect(self._on_export_finished)
         self.export_worker.error.connect(self._on_export_error)
         self.export_worker.start()
 
+    def _is_cancellable(self) -> bool:
+        """Check if an export is running."""
+        return self.export_worker is not None and self.export_worker.isRunning()
+
+    def reject(self):
+        """Stop a running export, or close the dialog."""
+        if self._is_cancellable():
+            self.export_worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("Cancelling export...")
+            return
+        super().reject()
+
     def _on_progress(self, message: str, percent: int):
         """Handle progress updates.
 
@@ -315,6 +483,9 @@ class ExportDialog(QDialog, GeometryMixin):
         Args:
             result: Export result dictionary
         """
+        self.export_worker.wait()
+        SettingsDAO.invalidate_cache()  # Settings changed on the worker thread
+
         if result.get('success'):
             if 'task_count' in result:
                 # JSON export
@@ -328,8 +499,11 @@ class ExportDialog(QDialog, GeometryMixin):
                     f"  • {result['dependency_count']} dependencies\n"
                     f"  • {result['comparison_count']} comparisons\n"
                     f"  • {result['history_count']} postpone records\n"
+                    f"  • {result['event_count']} task history events\n"
                     f"  • {result['notification_count']} notifications"
                 )
+                if 'deleted_count' in result:
+                    message += f"\n  • {result['deleted_count']} deleted tasks"
             else:
                 # Database backup
                 size_mb = result['size_bytes'] / (1024 * 1024)
@@ -346,6 +520,9 @@ class ExportDialog(QDialog, GeometryMixin):
                 message
             )
             self.accept()
+        elif result.get('cancelled'):
+            self._reset_ui()
+            self.status_label.setText("Export cancelled.")
         else:
             error_msg = result.get('error', 'Unknown error')
             MessageBox.critical(
@@ -362,6 +539,8 @@ class ExportDialog(QDialog, GeometryMixin):
         Args:
             error: Error message
         """
+        self.export_worker.wait()
+        SettingsDAO.invalidate_cache()  # Settings changed on the worker thread
         MessageBox.critical(
             self,
             self.db_connection,
@@ -376,6 +555,9 @@ class ExportDialog(QDialog, GeometryMixin):
         self.json_radio.setEnabled(True)
         self.database_radio.setEnabled(True)
         self.include_settings_check.setEnabled(True)
+        self.format_combo.setEnabled(True)
+        self.compress_check.setEnabled(True)
+        self._update_scope_controls()
         self.cancel_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.status_label.setText("")
@@ -674,8 +674,8 @@ class FocusModeWidget(QWidget):
     def _load_filter_state(self):
         """Load saved filter state from settings."""
         try:
-            from ..database.settings_dao import SettingsDAO
-            settings_dao = SettingsDAO(self.db_connection.get_connection())
+            from ..services.settings_write_buffer import SettingsWriteBuffer
+            settings_dao = SettingsWriteBuffer.for_connection(self.db_connection.get_connection())
 
             # Load context filter
             context_filter = settings_dao.get('focus_mode.context_filter', None)
@@ -694,8 +694,8 @@ class FocusModeWidget(QWidget):
     def _save_filter_state(self):
         """Save current filter state to settings."""
         try:
-            from ..database.settings_dao import SettingsDAO
-            settings_dao = SettingsDAO(self.db_connection.get_connection())
+            from ..services.settings_write_buffer import SettingsWriteBuffer
+            settings_dao = SettingsWriteBuffer.for_connection(self.db_connection.get_connection())
 
             # Save context filter
             context_value = self.active_context_filter if self.active_context_filter is not None else None
@@ -42,13 +42,15 @@ class GeometryMixin:
             default_height: Default height for first-time display (optional)
         """
         # Import here to avoid circular dependencies
-        from ..database.settings_dao import SettingsDAO
+        from ..services.settings_write_buffer import SettingsWriteBuffer
 
-        # Handle both DatabaseConnection objects and raw connections
+        # Handle both DatabaseConnection objects and raw connections.
+        # Geometry is saved on every hide, so writes go through the shared
+        # write-behind buffer instead of committing immediately.
         if hasattr(db_connection, 'get_connection'):
-            self._geometry_settings_dao = SettingsDAO(db_connection.get_connection())
+            self._geometry_settings = SettingsWriteBuffer.for_connection(db_connection.get_connection())
         else:
-            self._geometry_settings_dao = SettingsDAO(db_connection)
+            self._geometry_settings = SettingsWriteBuffer.for_connection(db_connection)
 
         self._geometry_restored = False
         self._geometry_default_width = default_width
@@ -115,7 +117,7 @@ class GeometryMixin:
     def _restore_dialog_geometry(self):
         """Restore saved dialog geometry relative to main window."""
         try:
-            saved_geometry = self._geometry_settings_dao.get(self._geometry_settings_key)
+            saved_geometry = self._geometry_settings.get(self._geometry_settings_key)
 
             if not saved_geometry:
                 # First time - position at default offset from main window
@@ -194,7 +196,7 @@ class GeometryMixin:
                 'height': geom.height()
             }
 
-            self._geometry_settings_dao.set(
+            self._geometry_settings.set(
                 self._geometry_settings_key,
                 geometry_data,
                 'json',
@@ -268,7 +270,7 @@ class GeometryMixin:
             'height': dialog_geometry.height()
         }
 
-        self._geometry_settings_dao.set(
+        self._geometry_settings.set(
             self._geometry_settings_key,
             geometry_data,
             'json',
@@ -2,54 +2,60 @@
 
 Provides UI for importing data from JSON backups with replace/merge modes.
 """
-import json
+import os
 import sqlite3
 from datetime import datetime
+from typing import List
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QRadioButton, QGroupBox, QFileDialog, QProgressBar,
     QTextEdit, QMessageBox, QLineEdit
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 
+from ..database.settings_dao import SettingsDAO
 from ..services.import_service import ImportService
+from ..services.json_stream import FORMAT_NDJSON
+from .database_job import DatabaseJob
 from .geometry_mixin import GeometryMixin
 from .message_box import MessageBox
 
 
-class ImportWorker(QThread):
-    """Worker thread for import operations."""
+class ImportWorker(DatabaseJob):
+    """Worker thread for import operations (on its own database connection)."""
 
-    progress = pyqtSignal(str, int)  # message, percent
-    finished = pyqtSignal(dict)  # result dictionary
-    error = pyqtSignal(str)  # error message
-
-    def __init__(self, import_service: ImportService, filepath: str, merge_mode: bool):
+    def __init__(self, db_connection: sqlite3.Connection, filepath: str, merge_mode: bool,
+                 chain_filepaths: List[str] = None):
         """Initialize import worker.
 
         Args:
-            import_service: ImportService instance
+            db_connection: The dialog's database connection
             filepath: Source file path
             merge_mode: Whether to merge (True) or replace (False)
+            chain_filepaths: Full export plus incremental exports to restore
+                together (replaces filepath and merge_mode)
         """
-        super().__init__()
-        self.import_service = import_service
+        super().__init__(db_connection, self._import)
         self.filepath = filepath
         self.merge_mode = merge_mode
+        self.chain_filepaths = chain_filepaths
 
-    def run(self):
+    def _import(self, connection: sqlite3.Connection) -> dict:
         """Run the import operation."""
-        try:
-            result = self.import_service.import_from_json(
-                self.filepath,
-                self.merge_mode,
-                self.progress.emit
+        import_service = ImportService(connection)
+        if self.chain_filepaths:
+            return import_service.import_export_chain(
+                self.chain_filepaths,
+                self.report_progress,
+                cancel_event=self.cancel_event
             )
-            self.finished.emit(result)
-
-        except Exception as e:
-            self.error.emit(str(e))
+        return import_service.import_from_json(
+            self.filepath,
+            self.merge_mode,
+            self.report_progress,
+            cancel_event=self.cancel_event
+        )
 
 
 class ImportDialog(QDialog, GeometryMixin):
@@ -67,6 +73,7 @@ class ImportDialog(QDialog, GeometryMixin):
         self.import_service = ImportService(db_connection)
         self.import_worker = None
         self.file_summary = None
+        self.chain_filepaths = []
 
         # Initialize geometry persistence
         self._init_geometry_persistence(db_connection, default_width=550, default_height=550)
@@ -229,38 +236,88 @@ class ImportDialog(QDialog, GeometryMixin):
         self.warning_banner.setVisible(is_replace)
 
     def _browse_file(self):
-        """Open file dialog to select import file."""
-        filepath, _ = QFileDialog.getOpenFileName(
+        """Open file dialog to select import file(s).
+
+        Several files are selected to restore a full export together with
+        the incremental exports taken after it.
+        """
+        filepaths, _ = QFileDialog.getOpenFileNames(
             self,
             "Select Import File",
             "",
-            "JSON Files (*.json)"
+            "Backup Files (*.json *.json.gz *.ndjson *.ndjson.gz);;All Files (*)"
         )
 
-        if filepath:
-            self.filepath_edit.setText(filepath)
-            self._load_file_summary(filepath)
+        if len(filepaths) == 1:
+            self.chain_filepaths = []
+            self.filepath_edit.setText(filepaths[0])
+            self._load_file_summary(filepaths[0])
+        elif filepaths:
+            self.filepath_edit.setText("; ".join(filepaths))
+            self._load_chain_summary(filepaths)
+
+    def _load_chain_summary(self, filepaths: List[str]):
+        """Load and display the summary of a full export and its incremental exports.
+
+        Args:
+            filepaths: Selected export files (any order)
+        """
+        self.chain_filepaths = []
+        self.merge_radio.setEnabled(True)
+        try:
+            chain = self.import_service.order_export_chain(filepaths)
+        except (ValueError, OSError) as e:
+            self.summary_text.setPlainText(f"Error: {str(e)}")
+            self.summary_text.setStyleSheet("color: #c62828;")
+            self.import_btn.setEnabled(False)
+            return
+
+        lines = ["Full export with incremental exports (restored in this order):"]
+        for filepath, metadata in chain:
+            lines.append(f"  • {os.path.basename(filepath)} ({metadata.get('export_date', 'Unknown')})")
+        lines.append("")
+        lines.append("All existing data will be replaced.")
+
+        self.summary_text.setPlainText("\n".join(lines))
+        self.summary_text.setStyleSheet("")
+        self.chain_filepaths = [filepath for filepath, _ in chain]
+        self.replace_radio.setChecked(True)
+        self.merge_radio.setEnabled(False)
+        self.import_btn.setEnabled(True)
 
     def _load_file_summary(self, filepath: str):
         """Load and display summary of import file.
 
+        The file is scanned as a stream (records are counted, not kept), and
+        compressed or line-delimited exports are detected automatically.
+
         Args:
-            filepath: Path to JSON file
+            filepath: Path to export file
         """
+        self.merge_radio.setEnabled(True)
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            summary = self.import_service.read_file_summary(filepath)
 
             # Check if valid import file
-            if 'metadata' not in data:
+            metadata = summary['metadata']
+            if metadata is None:
                 self.summary_text.setPlainText("Error: Invalid import file (missing metadata)")
                 self.import_btn.setEnabled(False)
                 return
 
-            metadata = data.get('metadata', {})
             schema_version = metadata.get('schema_version', 'Unknown')
             export_date = metadata.get('export_date', 'Unknown')
 
+            if metadata.get('export_type') == 'delta':
+                self.summary_text.setPlainText(
+                    "This is an incremental export.\n"
+                    "Select it together with the full export it builds on and every "
+                    "incremental export in between (use Browse and select several files)."
+                )
+                self.summary_text.setStyleSheet("color: #c62828;")
+                self.import_btn.setEnabled(False)
+                return
+
             # Check schema version compatibility
             if schema_version > ImportService.SUPPORTED_SCHEMA_VERSION:
                 self.summary_text.setPlainText(
@@ -280,39 +337,43 @@ class ImportDialog(QDialog, GeometryMixin):
                 export_date_str = export_date
 
             # Count items
-            task_count = len(data.get('tasks', []))
-            context_count = len(data.get('contexts', []))
-            tag_count = len(data.get('project_tags', []))
-            dep_count = len(data.get('dependencies', []))
-            comp_count = len(data.get('task_comparisons', []))
-            hist_count = len(data.get('postpone_history', []))
-            notif_count = len(data.get('notifications', []))
-            has_settings = 'settings' in data
+            counts = summary['counts']
+            format_name = "Line-delimited JSON" if summary['format'] == FORMAT_NDJSON else "JSON"
+            if summary['compressed']:
+                format_name += " (gzip)"
 
             # Build summary
-            summary = (
+            summary_str = (
                 f"Export Date: {export_date_str}\n"
                 f"Schema Version: {schema_version}\n"
-                f"App Version: {metadata.get('app_version', 'Unknown')}\n\n"
+                f"App Version: {metadata.get('app_version', 'Unknown')}\n"
+                f"Format: {format_name}\n\n"
                 f"Contents:\n"
-                f"  • {task_count} tasks\n"
-                f"  • {context_count} contexts\n"
-                f"  • {tag_count} project tags\n"
-                f"  • {dep_count} dependencies\n"
-                f"  • {comp_count} task comparisons\n"
-                f"  • {hist_count} postpone records\n"
-                f"  • {notif_count} notifications\n"
+                f"  • {counts.get('tasks', 0)} tasks\n"
+                f"  • {counts.get('contexts', 0)} contexts\n"
+                f"  • {counts.get('project_tags', 0)} project tags\n"
+                f"  • {counts.get('dependencies', 0)} dependencies\n"
+                f"  • {counts.get('task_comparisons', 0)} task comparisons\n"
+                f"  • {counts.get('postpone_history', 0)} postpone records\n"
+                f"  • {counts.get('task_history', 0)} task history events\n"
+                f"  • {counts.get('notifications', 0)} notifications\n"
             )
 
-            if has_settings:
-                summary += f"  • Settings included\n"
+            if summary['has_settings']:
+                summary_str += f"  • Settings included\n"
 
-            self.summary_text.setPlainText(summary)
+            if metadata.get('export_type') == 'filtered':
+                summary_str += (
+                    "\nThis is a filtered export holding only some tasks. "
+                    "Use merge mode to add them to your data.\n"
+                )
+
+            self.summary_text.setPlainText(summary_str)
             self.summary_text.setStyleSheet("")
             self.import_btn.setEnabled(True)
-            self.file_summary = data
+            self.file_summary = summary
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self.summary_text.setPlainText(f"Error: Invalid JSON file\n{str(e)}")
             self.summary_text.setStyleSheet("color: #c62828;")
             self.import_btn.setEnabled(False)
@@ -363,7 +424,6 @@ class ImportDialog(QDialog, GeometryMixin):
         self.import_btn.setEnabled(False)
         self.replace_radio.setEnabled(False)
         self.merge_radio.setEnabled(False)
-        self.cancel_btn.setEnabled(False)
 
         # Show progress bar
         self.progress_bar.setVisible(True)
@@ -371,9 +431,10 @@ class ImportDialog(QDialog, GeometryMixin):
 
         # Create and start worker thread
         self.import_worker = ImportWorker(
-            self.import_service,
+            self.db_connection,
             filepath,
-            merge_mode
+            merge_mode,
+            chain_filepaths=self.chain_filepaths
         )
         self.import_worker.progress.connect(self._on_progress)
         self.import_worker.finished.connect(self._on_import_finished)
@@ -396,7 +457,13 @@ class ImportDialog(QDialog, GeometryMixin):
         Args:
             result: Import result dictionary
         """
-        if result.get('success'):
+        self.import_worker.wait()
+        SettingsDAO.invalidate_cache()  # Settings changed on the worker thread
+
+        if result.get('cancelled'):
+            self._reset_ui()
+            self.status_label.setText("Import cancelled. No changes were made.")
+        elif result.get('success'):
             message = (
                 f"Import completed successfully!\n\n"
                 f"Imported:\n"
@@ -406,8 +473,14 @@ class ImportDialog(QDialog, GeometryMixin):
                 f"  • {result.get('dependency_count', 0)} dependencies\n"
                 f"  • {result.get('comparison_count', 0)} comparisons\n"
                 f"  • {result.get('history_count', 0)} postpone records\n"
+                f"  • {result.get('event_count', 0)} task history events\n"
                 f"  • {result.get('notification_count', 0)} notifications"
             )
+            if 'file_count' in result:
+                message += (
+                    f"\n  • {result['deleted_count']} deleted tasks\n\n"
+                    f"Restored from {result['file_count']} files."
+                )
 
             if result.get('warnings'):
                 message += "\n\nWarnings:\n"
@@ -437,6 +510,8 @@ class ImportDialog(QDialog, GeometryMixin):
         Args:
             error: Error message
         """
+        self.import_worker.wait()
+        SettingsDAO.invalidate_cache()  # Settings changed on the worker thread
         MessageBox.critical(
             self,
             self.db_connection,
@@ -445,11 +520,20 @@ class ImportDialog(QDialog, GeometryMixin):
         )
         self._reset_ui()
 
+    def reject(self):
+        """Cancel a running import (rolling it back) before closing."""
+        if self.import_worker is not None and self.import_worker.isRunning():
+            self.import_worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("Cancelling import...")
+            return
+        super().reject()
+
     def _reset_ui(self):
         """Reset UI controls after import."""
         self.import_btn.setEnabled(True)
         self.replace_radio.setEnabled(True)
-        self.merge_radio.setEnabled(True)
+        self.merge_radio.setEnabled(not self.chain_filepaths)
         self.cancel_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.status_label.setText("")
@@ -5,6 +5,7 @@ Provides the main application container with menu bar and navigation.
 """
 
 import os
+from typing import Optional
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QMenuBar, QMenu, QAction, QStatusBar, QMessageBox, QStackedWidget, QDialog,
@@ -27,6 +28,7 @@ from .review_delegated_dialog import ReviewDelegatedDialog
 from .review_someday_dialog import ReviewSomedayDialog
 from .activated_tasks_dialog import ActivatedTasksDialog
 from .export_dialog import ExportDialog
+from .snapshot_dialog import SnapshotDialog
 from .import_dialog import ImportDialog
 from .reset_confirmation_dialog import ResetConfirmationDialog
 from .analytics_view import AnalyticsView
@@ -38,6 +40,7 @@ from ..services.postpone_workflow_service import PostponeWorkflowService
 from ..services.notification_manager import NotificationManager
 from ..services.toast_notification_service import ToastNotificationService
 from ..services.resurfacing_scheduler import ResurfacingScheduler
+from ..services.settings_write_buffer import SettingsWriteBuffer
 from ..services.due_date_notification_service import DueDateNotificationService
 from ..services.database_path_service import DatabasePathService
 from ..services.theme_service import ThemeService
@@ -224,17 +227,20 @@ class MainWindow(QMainWindow):
         self.db_connection = db_connection if db_connection else DatabaseConnection()
         self.settings_dao = SettingsDAO(self.db_connection.get_connection())
         self.task_service = TaskService(self.db_connection)
+        self.task_service.compact_change_log()
         self.comparison_service = ComparisonService(self.db_connection)
         self.postpone_workflow_service = PostponeWorkflowService(self.db_connection.get_connection())
 
         # Initialize Phase 6 services (notification system and scheduler)
-        self.notification_manager = NotificationManager(self.db_connection.get_connection())
+        # Scheduler jobs run on worker threads, so these get a thread-bound
+        # connection that gives each worker its own SQLite connection
+        self.notification_manager = NotificationManager(self.db_connection.thread_bound())
         self.toast_service = ToastNotificationService(self.db_connection.get_connection())
         self.notification_manager.set_toast_service(self.toast_service)
 
         # Initialize resurfacing scheduler
         self.resurfacing_scheduler = ResurfacingScheduler(
-            self.db_connection.get_connection(),
+            self.db_connection.thread_bound(),
             self.notification_manager
         )
 
@@ -432,6 +438,11 @@ class MainWindow(QMainWindow):
         switch_db_action.triggered.connect(self._switch_database)
         file_menu.addAction(switch_db_action)
 
+        snapshots_action = QAction("Restore S&napshot...", self)
+        snapshots_action.setStatusTip("Browse database snapshots and restore one")
+        snapshots_action.triggered.connect(self._show_snapshots)
+        file_menu.addAction(snapshots_action)
+
         file_menu.addSeparator()
 
         exit_action = QAction("E&xit", self)
@@ -581,9 +592,16 @@ class MainWindow(QMainWindow):
 
         self._update_status_bar()
 
-    def _update_status_bar(self):
-        """Update status bar with task counts."""
-        counts = self.task_service.get_task_count_by_state()
+    def _update_status_bar(self, counts: Optional[dict] = None):
+        """
+        Update status bar with task counts.
+
+        Args:
+            counts: Optional state counts from an existing FocusSnapshot;
+                loaded from the database if not given
+        """
+        if counts is None:
+            counts = self.task_service.get_task_count_by_state()
         active = counts.get('active', 0)
         completed = counts.get('completed', 0)
         self.statusBar().showMessage(
@@ -596,17 +614,18 @@ class MainWindow(QMainWindow):
         context_filter = self.focus_mode.get_active_context_filter()
         tag_filters = self.focus_mode.get_active_tag_filters()
 
-        # First check if there are new tasks needing initial ranking
-        if self._check_and_handle_new_tasks():
-            # New tasks were ranked, refresh again to show the top task
-            self._refresh_focus_task()
-            return
+        # One snapshot gives new-task bands, ties and the focus task together;
+        # only re-evaluate after the user ranked new tasks
+        while True:
+            snapshot = self.task_service.evaluate_focus(
+                context_filter=context_filter,
+                tag_filters=tag_filters,
+                check_new_tasks=not self.test_mode
+            )
+            if not (snapshot.has_new_tasks and self._check_and_handle_new_tasks(snapshot)):
+                break
 
-        # Check if there are tied tasks
-        tied_tasks = self.task_service.get_tied_tasks(
-            context_filter=context_filter,
-            tag_filters=tag_filters
-        )
+        tied_tasks = snapshot.tied_tasks
 
         # Skip comparison dialog in test mode, just pick first task
         if len(tied_tasks) >= 2 and not self.test_mode:
@@ -617,11 +636,8 @@ class MainWindow(QMainWindow):
             if self.test_mode and len(tied_tasks) >= 2:
                 task = tied_tasks[0]
             else:
-                # No tie, get the top task
-                task = self.task_service.get_focus_task(
-                    context_filter=context_filter,
-                    tag_filters=tag_filters
-                )
+                # No tie, use the top task
+                task = snapshot.focus_task
 
             # If no task is available, prompt user to review deferred/postponed tasks
             if task is None and not self.test_mode:
@@ -631,7 +647,7 @@ class MainWindow(QMainWindow):
                     return
 
             self.focus_mode.set_task(task)
-            self._update_status_bar()
+            self._update_status_bar(snapshot.state_counts)
 
     def _on_new_task(self):
         """Handle New Task action."""
@@ -874,35 +890,31 @@ class MainWindow(QMainWindow):
 
         return False
 
-    def _check_and_handle_new_tasks(self) -> bool:
+    def _check_and_handle_new_tasks(self, snapshot) -> bool:
         """
-        Check for new tasks (comparison_count = 0) and prompt for initial ranking.
+        Prompt for initial ranking of new tasks (comparison_count = 0).
+
+        Args:
+            snapshot: FocusSnapshot with the new tasks and ACTIVE tasks
 
         Returns:
             True if new tasks were found and user completed ranking, False otherwise
         """
         # Skip ranking dialog in test mode
-        if self.test_mode:
+        if self.test_mode or not snapshot.has_new_tasks:
             return False
 
         from ..algorithms.initial_ranking import (
-            check_for_new_tasks,
             get_ranking_candidates,
             assign_elo_ratings_from_ranking
         )
         from .sequential_ranking_dialog import SequentialRankingDialog
 
-        # Get all tasks to check for new ones
-        all_tasks = self.task_service.get_all_tasks()
-
-        # Check if there are new tasks in any priority band
-        has_new, priority_band, new_tasks = check_for_new_tasks(all_tasks)
-
-        if not has_new:
-            return False
+        priority_band = snapshot.new_task_band
+        new_tasks = snapshot.new_tasks
 
         # Get ranking candidates (new tasks + top/bottom existing tasks)
-        candidates = get_ranking_candidates(all_tasks, new_tasks, priority_band)
+        candidates = get_ranking_candidates(snapshot.active_tasks, new_tasks, priority_band)
 
         # Separate new from existing for dialog display
         existing_tasks = [t for t in candidates if t.comparison_count > 0]
@@ -934,13 +946,13 @@ class MainWindow(QMainWindow):
                 priority_band
             )
 
-            # Update each task's Elo rating in the database
+            # Update each task's Elo rating, then persist them in one transaction
             for task, new_elo in task_elo_assignments:
                 task.elo_rating = new_elo
                 # Mark as having been in at least one comparison
                 # (even though this is interpolation, not actual comparison)
                 task.comparison_count = 1
-                self.task_service.update_task(task)
+            self.task_service.update_tasks([task for task, _ in task_elo_assignments])
 
             self.statusBar().showMessage(
                 f"Ranked {len(ranked_tasks)} new task{'s' if len(ranked_tasks) != 1 else ''} "
@@ -1161,8 +1173,8 @@ class MainWindow(QMainWindow):
 
     def _on_settings_saved(self):
         """Handle settings saved signal."""
-        # Reload scheduler settings
-        self.resurfacing_scheduler.reload_settings()
+        # The scheduler and indicator services reload themselves through
+        # SettingsDAO change notifications
 
         # Reapply theme if changed (Phase 7)
         if hasattr(self, 'theme_service'):
@@ -1431,6 +1443,8 @@ class MainWindow(QMainWindow):
             self._refresh_focus_task()
             if hasattr(self, 'task_list_view'):
                 self.task_list_view.refresh_tasks()
+            # A replace import logs every task; drop what the refresh consumed
+            self.task_service.compact_change_log()
             self.statusBar().showMessage("Data imported successfully", 5000)
 
     def _reset_all_data(self):
@@ -1446,9 +1460,6 @@ class MainWindow(QMainWindow):
     def _switch_database(self):
         """Switch to a different database file immediately."""
         from PyQt5.QtWidgets import QFileDialog
-        import logging
-
-        logger = logging.getLogger(__name__)
 
         # Get database file from user
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1497,6 +1508,28 @@ class MainWindow(QMainWindow):
         if result != QMessageBox.Yes:
             return
 
+        self._activate_database(file_path)
+
+    def _show_snapshots(self):
+        """Show the snapshot dialog and switch to a restored snapshot."""
+        dialog = SnapshotDialog(self.db_connection.get_connection(), self)
+        if dialog.exec_() == QDialog.Accepted and dialog.restored_path:
+            self._activate_database(dialog.restored_path)
+
+    def _activate_database(self, file_path: str) -> bool:
+        """
+        Switch to a database file and reload services and views.
+
+        Args:
+            file_path: Path of a validated database file
+
+        Returns:
+            True if the switch succeeded
+        """
+        import logging
+
+        logger = logging.getLogger(__name__)
+
         try:
             # Stop background services before switching
             if hasattr(self, 'resurfacing_scheduler'):
@@ -1504,6 +1537,9 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'due_date_service'):
                 self.due_date_service.stop()
 
+            # Pending settings belong to the current database
+            SettingsWriteBuffer.flush_all()
+
             # Switch to the new database
             success, message = self.db_connection.switch_database(file_path)
 
@@ -1519,7 +1555,7 @@ class MainWindow(QMainWindow):
                     self.resurfacing_scheduler.start()
                 if hasattr(self, 'due_date_service'):
                     self.due_date_service.start()
-                return
+                return False
 
             # Update settings DAO to use new connection
             self.settings_dao = SettingsDAO(self.db_connection.get_connection())
@@ -1541,6 +1577,7 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage(f"Switched to database: {file_path}", 10000)
 
             logger.info(f"Successfully switched to database: {file_path}")
+            return True
 
         except Exception as e:
             logger.error(f"Error switching database: {e}", exc_info=True)
@@ -1550,6 +1587,7 @@ class MainWindow(QMainWindow):
                 "Error",
                 f"An error occurred while switching databases:\n\n{str(e)}"
             )
+            return False
 
     def _reinitialize_services(self):
         """Reinitialize all services after database switch."""
@@ -1563,17 +1601,18 @@ class MainWindow(QMainWindow):
 
             # Reinitialize services
             self.task_service = TaskService(self.db_connection)
+            self.task_service.compact_change_log()
             self.comparison_service = ComparisonService(self.db_connection)
             self.postpone_workflow_service = PostponeWorkflowService(self.db_connection.get_connection())
 
             # Reinitialize notification system
-            self.notification_manager = NotificationManager(self.db_connection.get_connection())
+            self.notification_manager = NotificationManager(self.db_connection.thread_bound())
             self.toast_service = ToastNotificationService(self.db_connection.get_connection())
             self.notification_manager.set_toast_service(self.toast_service)
 
             # Reinitialize and restart schedulers
             self.resurfacing_scheduler = ResurfacingScheduler(
-                self.db_connection.get_connection(),
+                self.db_connection.thread_bound(),
                 self.notification_manager
             )
             self.due_date_service = DueDateNotificationService(self.db_connection)
@@ -1776,6 +1815,9 @@ class MainWindow(QMainWindow):
         # Save window geometry before closing
         self._save_window_geometry()
 
+        # Write settings still waiting in the write-behind buffer
+        SettingsWriteBuffer.flush_all()
+
         # Shutdown scheduler gracefully (Phase 6)
         self.resurfacing_scheduler.shutdown(wait=True, timeout=5)
 
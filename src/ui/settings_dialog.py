@@ -99,6 +99,7 @@ class SettingsDialog(QDialog, GeometryMixin):
         self.triggers_tab = self._create_triggers_tab()
         self.intervention_tab = self._create_intervention_tab()
         self.theme_tab = self._create_theme_tab()
+        self.snapshots_tab = self._create_snapshots_tab()
         self.advanced_tab = self._create_advanced_tab()
 
         self.tab_widget.addTab(self.resurfacing_tab, "Resurfacing")
@@ -106,6 +107,7 @@ class SettingsDialog(QDialog, GeometryMixin):
         self.tab_widget.addTab(self.triggers_tab, "Notification Triggers")
         self.tab_widget.addTab(self.intervention_tab, "Intervention")
         self.tab_widget.addTab(self.theme_tab, "Theme")
+        self.tab_widget.addTab(self.snapshots_tab, "Snapshots")
         self.tab_widget.addTab(self.advanced_tab, "Advanced")
 
         layout.addWidget(self.tab_widget)
@@ -408,6 +410,76 @@ class SettingsDialog(QDialog, GeometryMixin):
         layout.addStretch()
         return tab
 
+    def _create_snapshots_tab(self) -> QWidget:
+        """Create the automatic snapshots settings tab."""
+        tab = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(10, 10, 10, 10)
+        tab.setLayout(layout)
+
+        # Schedule group
+        schedule_group = QGroupBox("Automatic Snapshots")
+        schedule_form = QFormLayout()
+
+        self.snapshot_enabled_check = QCheckBox("Take automatic snapshots")
+        self.snapshot_enabled_check.setToolTip("Periodically save a snapshot of the database")
+        self.snapshot_enabled_check.setWhatsThis(
+            "Periodically save a snapshot of the database in a 'snapshots' folder next to the "
+            "database file. Snapshots share unchanged data, so each one only adds the parts of "
+            "the database that changed. Restore a snapshot with File > Restore Snapshot."
+        )
+        schedule_form.addRow(self.snapshot_enabled_check)
+
+        self.snapshot_interval_spin = QSpinBox()
+        self.snapshot_interval_spin.setRange(1, 24)
+        self.snapshot_interval_spin.setSuffix(" hours")
+        self.snapshot_interval_spin.setToolTip("How often to take a snapshot")
+        self.snapshot_interval_spin.setWhatsThis(
+            "How often to take a snapshot. No new snapshot is stored if nothing changed since the last one."
+        )
+        schedule_form.addRow("Interval:", self.snapshot_interval_spin)
+
+        schedule_group.setLayout(schedule_form)
+        layout.addWidget(schedule_group)
+
+        # Retention group
+        retention_group = QGroupBox("Retention")
+        retention_form = QFormLayout()
+
+        self.snapshot_keep_hourly_spin = QSpinBox()
+        self.snapshot_keep_hourly_spin.setRange(0, 168)
+        self.snapshot_keep_hourly_spin.setSuffix(" hours")
+        self.snapshot_keep_hourly_spin.setToolTip("Keep the latest snapshot of each of the last N hours")
+        self.snapshot_keep_hourly_spin.setWhatsThis(
+            "Keep the latest snapshot of each of the last N hours with snapshots. "
+            "The most recent snapshot is always kept."
+        )
+        retention_form.addRow("Hourly:", self.snapshot_keep_hourly_spin)
+
+        self.snapshot_keep_daily_spin = QSpinBox()
+        self.snapshot_keep_daily_spin.setRange(0, 365)
+        self.snapshot_keep_daily_spin.setSuffix(" days")
+        self.snapshot_keep_daily_spin.setToolTip("Keep the latest snapshot of each of the last N days")
+        self.snapshot_keep_daily_spin.setWhatsThis(
+            "Keep the latest snapshot of each of the last N days with snapshots."
+        )
+        retention_form.addRow("Daily:", self.snapshot_keep_daily_spin)
+
+        self.snapshot_keep_weekly_spin = QSpinBox()
+        self.snapshot_keep_weekly_spin.setRange(0, 104)
+        self.snapshot_keep_weekly_spin.setSuffix(" weeks")
+        self.snapshot_keep_weekly_spin.setToolTip("Keep the latest snapshot of each of the last N weeks")
+        self.snapshot_keep_weekly_spin.setWhatsThis(
+            "Keep the latest snapshot of each of the last N weeks with snapshots."
+        )
+        retention_form.addRow("Weekly:", self.snapshot_keep_weekly_spin)
+
+        retention_group.setLayout(retention_form)
+        layout.addWidget(retention_group)
+
+        layout.addStretch()
+        return tab
+
     def _create_advanced_tab(self) -> QWidget:
         """Create the advanced settings tab."""
         tab = QWidget()
@@ -588,6 +660,27 @@ class SettingsDialog(QDialog, GeometryMixin):
             self.settings_dao.get_int('font_size', default=10)
         )
 
+        # Snapshots tab
+        self.snapshot_enabled_check.setChecked(
+            self.settings_dao.get_bool('snapshot_enabled', default=False)
+        )
+
+        self.snapshot_interval_spin.setValue(
+            self.settings_dao.get_int('snapshot_interval_hours', default=1)
+        )
+
+        self.snapshot_keep_hourly_spin.setValue(
+            self.settings_dao.get_int('snapshot_keep_hourly', default=24)
+        )
+
+        self.snapshot_keep_daily_spin.setValue(
+            self.settings_dao.get_int('snapshot_keep_daily', default=7)
+        )
+
+        self.snapshot_keep_weekly_spin.setValue(
+            self.settings_dao.get_int('snapshot_keep_weekly', default=4)
+        )
+
         # Advanced tab
         self.k_factor_new_spin.setValue(
             self.settings_dao.get_int('elo_k_factor_new', default=32)
@@ -726,6 +819,42 @@ class SettingsDialog(QDialog, GeometryMixin):
             'Base font size in points'
         )
 
+        # Snapshot settings
+        self.settings_dao.set(
+            'snapshot_enabled',
+            self.snapshot_enabled_check.isChecked(),
+            'boolean',
+            'Take automatic database snapshots'
+        )
+
+        self.settings_dao.set(
+            'snapshot_interval_hours',
+            self.snapshot_interval_spin.value(),
+            'integer',
+            'Hours between automatic database snapshots'
+        )
+
+        self.settings_dao.set(
+            'snapshot_keep_hourly',
+            self.snapshot_keep_hourly_spin.value(),
+            'integer',
+            'Hours for which the latest snapshot of each hour is kept'
+        )
+
+        self.settings_dao.set(
+            'snapshot_keep_daily',
+            self.snapshot_keep_daily_spin.value(),
+            'integer',
+            'Days for which the latest snapshot of each day is kept'
+        )
+
+        self.settings_dao.set(
+            'snapshot_keep_weekly',
+            self.snapshot_keep_weekly_spin.value(),
+            'integer',
+            'Weeks for which the latest snapshot of each week is kept'
+        )
+
         # Advanced settings
         self.settings_dao.set(
             'elo_k_factor_new',
@@ -0,0 +1,269 @@
+"""Snapshot dialog for browsing and restoring database snapshots.
+
+Lists the snapshots in the snapshot store, takes a snapshot on demand and
+rebuilds a selected snapshot as a new database file for the main window to
+switch to.
+"""
+import os
+import sqlite3
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
+    QMessageBox
+)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtGui import QFont
+
+from ..services.snapshot_service import SnapshotError, SnapshotService
+from .geometry_mixin import GeometryMixin
+from .message_box import MessageBox
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format a byte count for display."""
+    if size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    return f"{size_bytes / (1024 * 1024):.2f} MB"
+
+
+class SnapshotWorker(QThread):
+    """Worker thread taking a snapshot."""
+
+    finished = pyqtSignal(object)  # SnapshotInfo
+    error = pyqtSignal(str)  # error message
+
+    def __init__(self, snapshot_service: SnapshotService):
+        """Initialize snapshot worker.
+
+        Args:
+            snapshot_service: SnapshotService instance
+        """
+        super().__init__()
+        self.snapshot_service = snapshot_service
+
+    def run(self):
+        """Take the snapshot."""
+        try:
+            self.finished.emit(self.snapshot_service.take_snapshot())
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class SnapshotDialog(QDialog, GeometryMixin):
+    """Dialog listing database snapshots.
+
+    After a successful restore the dialog is accepted and restored_path
+    holds the path of the rebuilt database file.
+    """
+
+    def __init__(self, db_connection: sqlite3.Connection, parent=None):
+        """Initialize snapshot dialog.
+
+        Args:
+            db_connection: Database connection
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.db_connection = db_connection
+        self.snapshot_service = SnapshotService(db_connection)
+        self.snapshot_worker = None
+        self.snapshots = []
+        self.restored_path = None
+
+        # Initialize geometry persistence
+        self._init_geometry_persistence(db_connection, default_width=700, default_height=450)
+
+        self._init_ui()
+        self._load_snapshots()
+
+    def _init_ui(self):
+        """Initialize the user interface."""
+        self.setWindowTitle("Database Snapshots")
+        self.setMinimumSize(700, 450)
+
+        # Enable WhatsThis help button
+        self.setWindowFlags(self.windowFlags() | Qt.WindowContextHelpButtonHint)
+
+        self.setWhatsThis(
+            "This dialog lists the stored snapshots of your database. Restoring a snapshot creates "
+            "a new database file from it and switches to that file; your current database is not modified."
+        )
+
+        layout = QVBoxLayout()
+        layout.setSpacing(15)
+        layout.setContentsMargins(20, 20, 20, 20)
+        self.setLayout(layout)
+
+        # Header
+        header_label = QLabel("Database Snapshots")
+        header_font = QFont()
+        header_font.setPointSize(14)
+        header_font.setBold(True)
+        header_label.setFont(header_font)
+        layout.addWidget(header_label)
+
+        desc_label = QLabel(
+            "Snapshots share unchanged data, so each one only adds what changed since the previous one. "
+            "Automatic snapshots can be enabled in Settings > Snapshots."
+        )
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+
+        # Snapshot table
+        self.snapshot_table = QTableWidget()
+        self.snapshot_table.setColumnCount(4)
+        self.snapshot_table.setHorizontalHeaderLabels(["Taken", "Database", "Size", "Added to Store"])
+        self.snapshot_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.snapshot_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.snapshot_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.snapshot_table.setAlternatingRowColors(True)
+        self.snapshot_table.verticalHeader().setVisible(False)
+        self.snapshot_table.itemSelectionChanged.connect(self._update_buttons)
+        self.snapshot_table.itemDoubleClicked.connect(self._restore_selected)
+
+        header = self.snapshot_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        layout.addWidget(self.snapshot_table)
+
+        # Status label
+        self.status_label = QLabel("")
+        self.status_label.setWordWrap(True)
+        self.status_label.setStyleSheet("color: #666;")
+        layout.addWidget(self.status_label)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+
+        self.snapshot_btn = QPushButton("Take Snapshot Now")
+        self.snapshot_btn.clicked.connect(self._take_snapshot)
+        self.snapshot_btn.setWhatsThis("Take a snapshot of the current database right away.")
+        button_layout.addWidget(self.snapshot_btn)
+
+        button_layout.addStretch()
+
+        self.restore_btn = QPushButton("Restore...")
+        self.restore_btn.setObjectName("primaryButton")
+        self.restore_btn.clicked.connect(self._restore_selected)
+        self.restore_btn.setWhatsThis(
+            "Create a new database file from the selected snapshot and switch to it."
+        )
+        button_layout.addWidget(self.restore_btn)
+
+        self.close_btn = QPushButton("Close")
+        self.close_btn.clicked.connect(self.reject)
+        button_layout.addWidget(self.close_btn)
+
+        layout.addLayout(button_layout)
+        self._update_buttons()
+
+    def _load_snapshots(self):
+        """Fill the table from the snapshot store."""
+        self.snapshots = self.snapshot_service.list_snapshots()
+        self.snapshot_table.setRowCount(len(self.snapshots))
+
+        for row, snapshot in enumerate(self.snapshots):
+            taken_item = QTableWidgetItem(snapshot.created_at.strftime('%Y-%m-%d %H:%M:%S'))
+            taken_item.setData(Qt.UserRole, snapshot.id)
+            source_item = QTableWidgetItem(os.path.basename(snapshot.source))
+            source_item.setToolTip(snapshot.source)
+
+            self.snapshot_table.setItem(row, 0, taken_item)
+            self.snapshot_table.setItem(row, 1, source_item)
+            self.snapshot_table.setItem(row, 2, QTableWidgetItem(_format_size(snapshot.size_bytes)))
+            self.snapshot_table.setItem(row, 3, QTableWidgetItem(_format_size(snapshot.added_bytes)))
+
+        if self.snapshots:
+            self.status_label.setText(
+                f"{len(self.snapshots)} snapshot(s) using "
+                f"{_format_size(self.snapshot_service.get_store_size())} in "
+                f"{self.snapshot_service.store_dir}"
+            )
+        else:
+            self.status_label.setText("No snapshots yet.")
+        self._update_buttons()
+
+    def _selected_snapshot(self):
+        """Get the selected snapshot, or None."""
+        rows = self.snapshot_table.selectionModel().selectedRows()
+        return self.snapshots[rows[0].row()] if rows else None
+
+    def _update_buttons(self):
+        """Enable buttons according to the selection and running work."""
+        busy = self.snapshot_worker is not None and self.snapshot_worker.isRunning()
+        self.snapshot_btn.setEnabled(not busy)
+        self.restore_btn.setEnabled(not busy and self._selected_snapshot() is not None)
+
+    def _take_snapshot(self):
+        """Take a snapshot on a worker thread."""
+        self.status_label.setText("Taking snapshot...")
+        self.snapshot_worker = SnapshotWorker(self.snapshot_service)
+        self.snapshot_worker.finished.connect(self._on_snapshot_finished)
+        self.snapshot_worker.error.connect(self._on_snapshot_error)
+        self.snapshot_worker.start()
+        self._update_buttons()
+
+    def _on_snapshot_finished(self, snapshot):
+        """Handle a completed snapshot.
+
+        Args:
+            snapshot: SnapshotInfo of the new (or unchanged last) snapshot
+        """
+        self.snapshot_worker.wait()
+        self._load_snapshots()
+
+    def _on_snapshot_error(self, error: str):
+        """Handle a failed snapshot.
+
+        Args:
+            error: Error message
+        """
+        self.snapshot_worker.wait()
+        self._update_buttons()
+        self.status_label.setText("")
+        MessageBox.critical(
+            self,
+            self.db_connection,
+            "Snapshot Failed",
+            f"The snapshot could not be taken:\n\n{error}"
+        )
+
+    def _restore_path(self, snapshot) -> str:
+        """Get the path of the database file a snapshot is restored to."""
+        database_dir = self.snapshot_service.store_dir.parent
+        stem = os.path.splitext(os.path.basename(snapshot.source))[0]
+        return str(database_dir / f"{stem}-restored-{snapshot.id}.db")
+
+    def _restore_selected(self, *args):
+        """Restore the selected snapshot after confirmation."""
+        snapshot = self._selected_snapshot()
+        if snapshot is None or not self.restore_btn.isEnabled():
+            return
+
+        dest_path = self._restore_path(snapshot)
+        result = MessageBox.question(
+            self,
+            self.db_connection,
+            "Restore Snapshot?",
+            f"Restore the snapshot taken {snapshot.created_at.strftime('%Y-%m-%d %H:%M')}?\n\n"
+            f"The snapshot will be saved as:\n{dest_path}\n\n"
+            f"The application will then switch to this database. "
+            f"Your current database will not be modified."
+        )
+        if result != QMessageBox.Yes:
+            return
+
+        try:
+            self.restored_path = self.snapshot_service.restore(snapshot.id, dest_path)
+        except SnapshotError as e:
+            MessageBox.critical(
+                self,
+                self.db_connection,
+                "Restore Failed",
+                f"The snapshot could not be restored:\n\n{e}"
+            )
+            return
+
+        self.accept()
@@ -6,13 +6,13 @@ Phase 4: Full task management interface.
 """
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget,
-    QTableWidgetItem, QHeaderView, QLineEdit, QComboBox, QLabel,
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
+    QAbstractItemView, QHeaderView, QLineEdit, QComboBox, QLabel,
     QMenu, QCheckBox, QGroupBox, QGridLayout, QShortcut, QMessageBox, QSizePolicy
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QColor, QBrush, QKeySequence, QCursor, QFont
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date
 from ..models import Task, TaskState
 from ..models.recurrence_pattern import RecurrencePattern
@@ -27,7 +27,8 @@ from ..database.dependency_dao import DependencyDAO
 from ..database.task_history_dao import TaskHistoryDAO
 from ..database.task_dao import TaskDAO
 from ..database.settings_dao import SettingsDAO
-from ..algorithms.priority import calculate_urgency_for_tasks, calculate_importance
+from ..algorithms.priority import calculate_urgency_for_tasks, calculate_importance, calculate_task_scores
+from ..algorithms.dependency_analysis import DependencyMetrics, NO_DEPENDENCIES
 from ..commands import (
     EditTaskCommand,
     DeleteTaskCommand,
@@ -40,6 +41,7 @@ from ..commands import (
 )
 from .task_history_dialog import TaskHistoryDialog
 from .message_box import MessageBox
+from .task_table_model import TaskTableModel, TaskTablePalette
 
 
 class TaskListView(QWidget):
@@ -94,6 +96,8 @@ class TaskListView(QWidget):
         self.active_context_filters = set()  # Set of active context filter IDs (can include 'NONE')
         self.active_tag_filters = set()  # Set of active project tag filter IDs
         self.hide_tasks_with_dependencies = False  # Filter flag for hiding tasks with dependencies
+        self._blocker_map = None  # Map of blocked task_id -> [(blocking_task_id, title)], loaded per refresh
+        self._dependency_metrics = None  # Map of task_id -> DependencyMetrics, loaded when first needed
 
         # Column configuration
         self.all_columns = {
@@ -110,10 +114,15 @@ class TaskListView(QWidget):
             "Context": "Context",
             "Project Tags": "Project Tags",
             "Delegated To": "Delegated To",
-            "Follow-Up Date": "Follow-Up Date"
+            "Follow-Up Date": "Follow-Up Date",
+            "Blocking Depth": "Blocking Depth",
+            "Unblocks": "Unblocks"
         }
-        self.visible_columns = list(self.all_columns.keys())  # All visible by default
+        # Optional columns are hidden until added through the column manager
+        self.optional_columns = {"Blocking Depth", "Unblocks"}
+        self.visible_columns = [col for col in self.all_columns if col not in self.optional_columns]
         self.column_indices = {col: idx for idx, col in enumerate(self.visible_columns)}  # Initialize mapping
+        self._palette_cache: Dict[bool, TaskTablePalette] = {}  # Map of is_dark -> shared brushes
 
         self._load_contexts()
         self._load_project_tags()
@@ -122,17 +131,19 @@ class TaskListView(QWidget):
         self._setup_shortcuts()  # Phase 8: Keyboard shortcuts
         self.refresh_tasks()
 
-    def _get_state_colors(self, state: TaskState) -> tuple:
+    def _get_state_colors(self, state: TaskState, is_dark_theme: Optional[bool] = None) -> tuple:
         """Get theme-aware background and text colors for a task state.
 
         Args:
             state: Task state
+            is_dark_theme: Theme to use; detected from settings when None
 
         Returns:
             Tuple of (background_color, text_color) or (None, None)
         """
         # Detect current theme
-        is_dark_theme = self._is_dark_theme()
+        if is_dark_theme is None:
+            is_dark_theme = self._is_dark_theme()
 
         if state == TaskState.COMPLETED:
             if is_dark_theme:
@@ -234,21 +245,16 @@ class TaskListView(QWidget):
             print(f"Error formatting recurrence pattern: {e}")
             return "Invalid pattern"
 
-    def _set_header_tooltips(self):
-        """Set tooltips for column headers."""
+    def _set_model_columns(self):
+        """Push the visible columns, header labels and header tooltips to the model."""
         # Map column names to their tooltip text
         tooltips = {
-            "Recurring": "Recurring"
+            "Recurring": "Recurring",
+            "Blocking Depth": "Longest chain of incomplete tasks that must be completed first",
+            "Unblocks": "Tasks left without incomplete blockers once this task is completed"
         }
 
-        # Set tooltips for visible columns
-        for col_name in self.visible_columns:
-            if col_name in tooltips:
-                col_idx = self.column_indices[col_name]
-                # Get the header item
-                header_item = self.task_table.horizontalHeaderItem(col_idx)
-                if header_item:
-                    header_item.setToolTip(tooltips[col_name])
+        self.task_model.set_columns(self.visible_columns, self.all_columns, tooltips)
 
     def _init_ui(self):
         """Initialize the user interface."""
@@ -524,16 +530,16 @@ class TaskListView(QWidget):
 
         layout.addLayout(sort_layout)
 
-        # Task table
-        self.task_table = QTableWidget()
-        self.task_table.setColumnCount(14)
-        self.task_table.setHorizontalHeaderLabels([
-            "ID", "🔄", "Title", "Dependencies", "Importance", "Priority", "Effective Priority", "Start Date", "Due Date", "State", "Context", "Project Tags", "Delegated To", "Follow-Up Date"
-        ])
+        # Task table (model/view: cell data is computed lazily for painted rows)
+        self.task_model = TaskTableModel(self._build_row_data, self)
+        self.task_table = QTableView()
+        self.task_table.setModel(self.task_model)
+        self._set_model_columns()
 
         # Configure table appearance
-        self.task_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.task_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.task_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.task_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.task_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.task_table.setAlternatingRowColors(True)
         self.task_table.setSortingEnabled(False)  # Use custom multi-column sorting
 
@@ -571,9 +577,6 @@ class TaskListView(QWidget):
         # Make the last visible column stretch to fill remaining space
         header.setStretchLastSection(True)
 
-        # Set tooltips for column headers
-        self._set_header_tooltips()
-
         # Enable context menu
         self.task_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.task_table.customContextMenuRequested.connect(self._show_context_menu)
@@ -582,7 +585,7 @@ class TaskListView(QWidget):
         self.task_table.doubleClicked.connect(self._on_edit_task)
 
         # Connect selection changed to update button states
-        self.task_table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.task_table.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
         layout.addWidget(self.task_table)
 
@@ -773,7 +776,7 @@ class TaskListView(QWidget):
 
     def _on_selection_changed(self):
         """Handle task selection changes to enable/disable action buttons."""
-        has_selection = self.task_table.currentRow() >= 0
+        has_selection = self.task_table.currentIndex().row() >= 0
 
         # Enable/disable all action buttons based on selection
         self.complete_btn.setEnabled(has_selection)
@@ -804,9 +807,11 @@ class TaskListView(QWidget):
         if self.tasks:
             logger.info(f"[TASK_LIST] Sample tasks: {[t.title for t in self.tasks[:3]]}")
 
-        # Reload contexts and tags in case they changed
+        # Reload contexts, tags and dependencies in case they changed
         self._load_contexts()
         self._load_project_tags()
+        self._load_blocker_map()
+        self._dependency_metrics = None
         self._update_context_filter()
         self._apply_filters()
 
@@ -841,8 +846,8 @@ class TaskListView(QWidget):
     def _load_filter_state(self):
         """Load saved filter state from settings."""
         try:
-            from ..database.settings_dao import SettingsDAO
-            settings_dao = SettingsDAO(self.db_connection.get_connection())
+            from ..services.settings_write_buffer import SettingsWriteBuffer
+            settings_dao = SettingsWriteBuffer.for_connection(self.db_connection.get_connection())
 
             # Load context filters
             context_filters = settings_dao.get('task_list.context_filters', [])
@@ -864,10 +869,10 @@ class TaskListView(QWidget):
             print(f"Error loading filter state: {e}")
 
     def _save_filter_state(self):
-        """Save current filter state to settings."""
+        """Save current filter state to settings (written once typing/clicking pauses)."""
         try:
-            from ..database.settings_dao import SettingsDAO
-            settings_dao = SettingsDAO(self.db_connection.get_connection())
+            from ..services.settings_write_buffer import SettingsWriteBuffer
+            settings_dao = SettingsWriteBuffer.for_connection(self.db_connection.get_connection())
 
             # Save context filters
             context_list = []
@@ -906,6 +911,54 @@ class TaskListView(QWidget):
         except Exception as e:
             print(f"Error saving filter state: {e}")
 
+    def _load_blocker_map(self):
+        """Load the dependency adjacency map for all tasks in one query."""
+        try:
+            self._blocker_map = self.dependency_dao.get_blocker_map()
+        except Exception as e:
+            print(f"Error loading dependencies: {e}")
+            self._blocker_map = {}
+
+    def _get_blockers(self, task: Task) -> list:
+        """
+        Get the blocking tasks of a task from the cached adjacency map.
+
+        Args:
+            task: Task to look up
+
+        Returns:
+            List of (blocking_task_id, title) tuples
+        """
+        if not task.id:
+            return []
+
+        if self._blocker_map is None:
+            self._load_blocker_map()
+
+        return self._blocker_map.get(task.id, [])
+
+    def _get_dependency_metrics(self, task: Task) -> DependencyMetrics:
+        """
+        Get the transitive dependency metrics of a task.
+
+        The metrics of all tasks are computed in one pass the first time a
+        row showing them is built after a refresh.
+
+        Args:
+            task: Task to look up
+
+        Returns:
+            DependencyMetrics of the task
+        """
+        if self._dependency_metrics is None:
+            try:
+                self._dependency_metrics = self.task_service.get_dependency_metrics()
+            except Exception as e:
+                print(f"Error analyzing dependencies: {e}")
+                self._dependency_metrics = {}
+
+        return self._dependency_metrics.get(task.id, NO_DEPENDENCIES)
+
     def _task_has_dependencies(self, task: Task) -> bool:
         """
         Check if a task has any dependencies (is blocked by other tasks).
@@ -916,16 +969,7 @@ class TaskListView(QWidget):
         Returns:
             True if task has dependencies, False otherwise
         """
-        if not task.id:
-            return False
-
-        try:
-            dependency_dao = DependencyDAO(self.db_connection.get_connection())
-            dependencies = dependency_dao.get_dependencies_for_task(task.id)
-            return len(dependencies) > 0
-        except Exception as e:
-            print(f"Error checking dependencies for task {task.id}: {e}")
-            return False
+        return len(self._get_blockers(task)) > 0
 
     def _apply_filters(self):
         """Apply current filters and update the table."""
@@ -933,7 +977,7 @@ class TaskListView(QWidget):
         logger = logging.getLogger(__name__)
 
         # Get filter values
-        search_text = self.search_box.text().lower()
+        search_text = self.search_box.text().strip()
 
         # Get selected states from checkboxes
         selected_states = [
@@ -980,14 +1024,11 @@ class TaskListView(QWidget):
             ]
             logger.info(f"[TASK_LIST] After dependency filter: {len(filtered_tasks)} tasks")
 
-        # Filter by search text
+        # Filter by search text (full-text index lookup)
         if search_text:
             logger.info(f"[TASK_LIST] Search text: '{search_text}'")
-            filtered_tasks = [
-                t for t in filtered_tasks
-                if search_text in t.title.lower() or
-                   (t.description and search_text in t.description.lower())
-            ]
+            matching_ids = set(self.task_dao.search_task_ids(search_text))
+            filtered_tasks = [t for t in filtered_tasks if t.id in matching_ids]
             logger.info(f"[TASK_LIST] After search filter: {len(filtered_tasks)} tasks")
 
         logger.info(f"[TASK_LIST] Final filtered count: {len(filtered_tasks)} tasks")
@@ -1015,15 +1056,12 @@ class TaskListView(QWidget):
         if not tasks:
             return tasks
 
-        # Calculate urgency and importance for all tasks
-        urgency_scores = calculate_urgency_for_tasks(tasks)
+        # Calculate importance for all tasks in one vectorized pass
+        _, importance_scores = calculate_task_scores(tasks)
 
         # Create a list of (task, sort_keys) tuples
         task_data = []
-        for task in tasks:
-            urgency = urgency_scores.get(task.id, 1.0) if task.id else 1.0
-            importance = calculate_importance(task, urgency)
-
+        for task, importance in zip(tasks, importance_scores):
             # Create sort keys dictionary
             sort_keys = {
                 'importance': importance,
@@ -1076,115 +1114,111 @@ class TaskListView(QWidget):
         """
         Populate the table with tasks.
 
+        Only the task list, urgency scores and theme brushes are handed to the
+        model here; per-cell text and colors are built lazily when rows are
+        painted.
+
         Args:
             tasks: List of tasks to display
         """
-        self.task_table.setRowCount(len(tasks))
-
         # Calculate urgency for all tasks (requires normalization across tasks)
         urgency_scores = calculate_urgency_for_tasks(tasks) if tasks else {}
 
-        for row, task in enumerate(tasks):
-            # Calculate shared values
-            urgency = urgency_scores.get(task.id, 1.0) if task.id else 1.0
-            importance = calculate_importance(task, urgency)
-            priority_names = {1: "Low", 2: "Medium", 3: "High"}
-
-            # Prepare all column data
-            recurring_symbol = "🔁" if task.is_recurring else ""
-            recurring_tooltip = self._format_recurrence_pattern(task.recurrence_pattern) if task.is_recurring else ""
-
-            # Get due date indicator
-            indicator = self.indicator_service.get_indicator(task)
-            indicator_with_label = self.indicator_service.get_indicator_with_label(task)
-            due_date_text = task.due_date.strftime("%Y-%m-%d") if task.due_date else ""
-            if indicator:
-                due_date_text = f"{indicator} {due_date_text}"
-            due_date_tooltip = indicator_with_label[1] if indicator_with_label[1] else None
-
-            column_data = {
-                "ID": (str(task.id), task.id, None),
-                "Recurring": (recurring_symbol, None, recurring_tooltip),
-                "Title": (task.title, None, None),
-                "Dependencies": (self._get_dependencies_str(task), None, None),
-                "Importance": (f"{importance:.2f}", importance, None),
-                "Priority": (priority_names.get(task.base_priority, "Unknown"), task.base_priority, None),
-                "Effective Priority": (f"{task.get_effective_priority():.2f}", task.get_effective_priority(), None),
-                "Start Date": (task.start_date.strftime("%Y-%m-%d") if task.start_date else "", task.start_date if task.start_date else date.max, None),
-                "Due Date": (due_date_text, task.due_date if task.due_date else date.max, due_date_tooltip),
-                "State": (task.state.value.title(), None, None),
-                "Context": (self.contexts.get(task.context_id, "") if task.context_id else "", None, None),
-                "Project Tags": (", ".join([self.project_tags.get(tag_id, f"Tag#{tag_id}") for tag_id in task.project_tags]), None, None),
-                "Delegated To": (task.delegated_to if task.delegated_to else "", None, None),
-                "Follow-Up Date": (task.follow_up_date.strftime("%Y-%m-%d") if task.follow_up_date else "", task.follow_up_date if task.follow_up_date else date.max, None)
-            }
+        self.task_model.set_tasks(tasks, urgency_scores, self._get_palette())
+        self._on_selection_changed()
 
-            # Populate only visible columns
-            for col_name in self.visible_columns:
-                if col_name not in column_data:
-                    continue
+    def _get_palette(self) -> TaskTablePalette:
+        """
+        Get the shared brushes for the current theme.
 
-                col_idx = self.column_indices[col_name]
-                text, user_data, tooltip = column_data[col_name]
+        The theme is read once per refresh and the brushes for each theme are
+        built only once.
 
-                item = QTableWidgetItem(text)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+        Returns:
+            TaskTablePalette for the active theme
+        """
+        is_dark = self._is_dark_theme()
+        palette = self._palette_cache.get(is_dark)
+        if palette is None:
+            state_colors = {state: self._get_state_colors(state, is_dark) for state in TaskState}
+            palette = TaskTablePalette(is_dark, state_colors)
+            self._palette_cache[is_dark] = palette
+        return palette
+
+    def _build_row_data(self, task: Task, urgency: float) -> dict:
+        """
+        Build the cell data for every column of a task row.
 
-                # Center-align all cells
-                item.setTextAlignment(Qt.AlignCenter)
+        Called by the table model the first time a row is displayed.
 
-                if user_data is not None:
-                    item.setData(Qt.UserRole, user_data)
+        Args:
+            task: Task shown in the row
+            urgency: Normalized urgency score for the task
 
-                # Set tooltip if provided
-                if tooltip:
-                    item.setToolTip(tooltip)
+        Returns:
+            Map of column name -> (text, user_data, tooltip)
+        """
+        importance = calculate_importance(task, urgency)
+        priority_names = {1: "Low", 2: "Medium", 3: "High"}
+
+        # Prepare all column data
+        recurring_symbol = "🔁" if task.is_recurring else ""
+        recurring_tooltip = self._format_recurrence_pattern(task.recurrence_pattern) if task.is_recurring else ""
+
+        # Get due date indicator
+        indicator = self.indicator_service.get_indicator(task)
+        indicator_with_label = self.indicator_service.get_indicator_with_label(task)
+        due_date_text = task.due_date.strftime("%Y-%m-%d") if task.due_date else ""
+        if indicator:
+            due_date_text = f"{indicator} {due_date_text}"
+        due_date_tooltip = indicator_with_label[1] if indicator_with_label[1] else None
+
+        return {
+            "ID": (str(task.id), task.id, None),
+            "Recurring": (recurring_symbol, None, recurring_tooltip),
+            "Title": (task.title, None, task.title),
+            "Dependencies": (self._get_dependencies_str(task), None, self._get_dependency_tooltip(task)),
+            "Importance": (f"{importance:.2f}", importance, None),
+            "Priority": (priority_names.get(task.base_priority, "Unknown"), task.base_priority, None),
+            "Effective Priority": (f"{task.get_effective_priority():.2f}", task.get_effective_priority(), None),
+            "Start Date": (task.start_date.strftime("%Y-%m-%d") if task.start_date else "", task.start_date if task.start_date else date.max, None),
+            "Due Date": (due_date_text, task.due_date if task.due_date else date.max, due_date_tooltip),
+            "State": (task.state.value.title(), None, None),
+            "Context": (self.contexts.get(task.context_id, "") if task.context_id else "", None, None),
+            "Project Tags": (", ".join([self.project_tags.get(tag_id, f"Tag#{tag_id}") for tag_id in task.project_tags]), None, None),
+            "Delegated To": (task.delegated_to if task.delegated_to else "", None, None),
+            "Follow-Up Date": (task.follow_up_date.strftime("%Y-%m-%d") if task.follow_up_date else "", task.follow_up_date if task.follow_up_date else date.max, None),
+            **self._build_dependency_metric_cells(task)
+        }
 
-                # Special formatting for Title column
-                if col_name == "Title":
-                    # Add tooltip showing full title
-                    item.setToolTip(task.title)
+    def _build_dependency_metric_cells(self, task: Task) -> dict:
+        """
+        Build the optional dependency metric cells, skipping the analysis when they are hidden.
 
-                # Apply theme-aware backgrounds to all cells
-                is_dark = self._is_dark_theme()
+        Args:
+            task: Task shown in the row
 
-                # Special formatting for State column
-                if col_name == "State":
-                    bg_color, text_color = self._get_state_colors(task.state)
-                    if bg_color:
-                        item.setBackground(QBrush(QColor(bg_color)))
-                    if text_color:
-                        item.setForeground(QBrush(QColor(text_color)))
-                else:
-                    # For non-State columns, apply theme-aware background
-                    if is_dark:
-                        # Dark theme colors - alternating rows
-                        if row % 2 == 0:
-                            item.setBackground(QBrush(QColor("#313335")))
-                        else:
-                            item.setBackground(QBrush(QColor("#3c3f41")))
-                        item.setForeground(QBrush(QColor("#e0e0e0")))
-                    else:
-                        # Light theme colors - alternating rows
-                        if row % 2 == 0:
-                            item.setBackground(QBrush(QColor("#ffffff")))
-                        else:
-                            item.setBackground(QBrush(QColor("#f9f9f9")))
-                        item.setForeground(QBrush(QColor("#212121")))
-
-                # Special formatting for Dependencies column (override foreground only)
-                if col_name == "Dependencies":
-                    if text.startswith("⛔"):
-                        # Red foreground for blocked tasks
-                        item.setForeground(QBrush(QColor("#dc3545")))
-                    else:
-                        # Gray for tasks without dependencies
-                        item.setForeground(QBrush(QColor("#6c757d")))
-                    # Add tooltip showing blocking task titles
-                    tooltip = self._get_dependency_tooltip(task)
-                    item.setToolTip(tooltip)
+        Returns:
+            Map of column name -> (text, user_data, tooltip)
+        """
+        if not self.optional_columns.intersection(self.visible_columns):
+            return {"Blocking Depth": ("", 0, None), "Unblocks": ("", 0, None)}
 
-                self.task_table.setItem(row, col_idx, item)
+        metrics = self._get_dependency_metrics(task)
+        if metrics.blocked:
+            depth_text = f"⛔ {metrics.depth}"
+            depth_tooltip = f"Blocked through {metrics.depth} level(s) of incomplete tasks"
+        else:
+            depth_text = "—"
+            depth_tooltip = "Not blocked"
+
+        unblocks_text = str(metrics.unblock_count) if metrics.unblock_count else "—"
+        unblocks_tooltip = f"Completing this task unblocks {metrics.unblock_count} task(s)"
+
+        return {
+            "Blocking Depth": (depth_text, metrics.depth, depth_tooltip),
+            "Unblocks": (unblocks_text, metrics.unblock_count, unblocks_tooltip)
+        }
 
     def _get_dependencies_str(self, task: Task) -> str:
         """
@@ -1193,20 +1227,11 @@ class TaskListView(QWidget):
         Returns:
             String showing blocking task count with indicator (e.g., "⛔ 2" or "—")
         """
-        if not task.id:
-            return "—"
+        blocking_count = len(self._get_blockers(task))
 
-        try:
-            dependency_dao = DependencyDAO(self.db_connection.get_connection())
-            dependencies = dependency_dao.get_dependencies_for_task(task.id)
-            blocking_count = len(dependencies)
-
-            if blocking_count > 0:
-                return f"⛔ {blocking_count}"
-            else:
-                return "—"
-        except Exception as e:
-            print(f"Error loading dependencies for task {task.id}: {e}")
+        if blocking_count > 0:
+            return f"⛔ {blocking_count}"
+        else:
             return "—"
 
     def _get_dependency_tooltip(self, task: Task) -> str:
@@ -1222,28 +1247,16 @@ class TaskListView(QWidget):
         if not task.id:
             return ""
 
-        try:
-            from ..database.task_dao import TaskDAO
-            dependency_dao = DependencyDAO(self.db_connection.get_connection())
-            task_dao = TaskDAO(self.db_connection.get_connection())
-            dependencies = dependency_dao.get_dependencies_for_task(task.id)
-
-            if not dependencies:
-                return "No dependencies"
-
-            blocking_tasks = []
-            for dep in dependencies:
-                blocking_task = task_dao.get_by_id(dep.blocking_task_id)
-                if blocking_task:
-                    blocking_tasks.append(blocking_task.title)
-
-            if blocking_tasks:
-                return "Blocked by:\n" + "\n".join(f"• {title}" for title in blocking_tasks)
-            else:
-                return "Dependencies found but tasks not loaded"
+        blockers = self._get_blockers(task)
+        if not blockers:
+            return "No dependencies"
 
-        except Exception as e:
-            return f"Error loading dependencies: {e}"
+        blocking_tasks = [title for _, title in blockers if title is not None]
+
+        if blocking_tasks:
+            return "Blocked by:\n" + "\n".join(f"• {title}" for title in blocking_tasks)
+        else:
+            return "Dependencies found but tasks not loaded"
 
     def _on_filter_changed(self):
         """Handle filter changes."""
@@ -1287,12 +1300,12 @@ class TaskListView(QWidget):
 
     def _on_edit_task(self):
         """Handle edit task action."""
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             MessageBox.warning(self, self.db_connection.get_connection(), "No Selection", "Please select a task to edit.")
             return
 
-        task_id = self.task_table.item(current_row, 0).data(Qt.UserRole)
+        task_id = self.task_model.task_id_at(current_row)
         task = self.task_service.get_task_by_id(task_id)
 
         if not task:
@@ -1321,12 +1334,12 @@ class TaskListView(QWidget):
 
     def _on_view_dependency_graph(self):
         """Handle view dependency graph action."""
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             MessageBox.warning(self, self.db_connection.get_connection(), "No Selection", "Please select a task to view dependencies.")
             return
 
-        task_id = self.task_table.item(current_row, 0).data(Qt.UserRole)
+        task_id = self.task_model.task_id_at(current_row)
         task = self.task_service.get_task_by_id(task_id)
 
         if not task:
@@ -1340,12 +1353,12 @@ class TaskListView(QWidget):
 
     def _on_view_task_history(self):
         """Handle view task history action."""
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             MessageBox.warning(self, self.db_connection.get_connection(), "No Selection", "Please select a task to view its history.")
             return
 
-        task_id = self.task_table.item(current_row, 0).data(Qt.UserRole)
+        task_id = self.task_model.task_id_at(current_row)
         task = self.task_service.get_task_by_id(task_id)
 
         if not task:
@@ -1357,13 +1370,13 @@ class TaskListView(QWidget):
 
     def _on_delete_task(self):
         """Handle delete task action."""
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             MessageBox.warning(self, self.db_connection.get_connection(), "No Selection", "Please select a task to delete.")
             return
 
-        task_id = self.task_table.item(current_row, self.column_indices["ID"]).data(Qt.UserRole)
-        task_title = self.task_table.item(current_row, self.column_indices["Title"]).text()
+        task_id = self.task_model.task_id_at(current_row)
+        task_title = self.task_model.task_at(current_row).title
 
         reply = MessageBox.question(
             self,
@@ -1386,11 +1399,11 @@ class TaskListView(QWidget):
 
     def _on_change_state_active(self):
         """Handle change task state to Active."""
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             return
 
-        task_id = self.task_table.item(current_row, 0).data(Qt.UserRole)
+        task_id = self.task_model.task_id_at(current_row)
 
         # Execute state change through undo manager
         command = ChangeStateCommand(self.task_dao, task_id, TaskState.ACTIVE)
@@ -1400,11 +1413,11 @@ class TaskListView(QWidget):
 
     def _on_change_state_deferred(self):
         """Handle change task state to Deferred."""
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             return
 
-        task_id = self.task_table.item(current_row, 0).data(Qt.UserRole)
+        task_id = self.task_model.task_id_at(current_row)
         task = self.task_service.get_task_by_id(task_id)
 
         if not task:
@@ -1498,11 +1511,11 @@ class TaskListView(QWidget):
 
     def _on_change_state_delegated(self):
         """Handle change task state to Delegated."""
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             return
 
-        task_id = self.task_table.item(current_row, 0).data(Qt.UserRole)
+        task_id = self.task_model.task_id_at(current_row)
         task = self.task_service.get_task_by_id(task_id)
 
         if not task:
@@ -1532,11 +1545,11 @@ class TaskListView(QWidget):
 
     def _on_change_state_someday(self):
         """Handle change task state to Someday/Maybe."""
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             return
 
-        task_id = self.task_table.item(current_row, 0).data(Qt.UserRole)
+        task_id = self.task_model.task_id_at(current_row)
         task = self.task_service.get_task_by_id(task_id)
 
         if not task:
@@ -1563,11 +1576,11 @@ class TaskListView(QWidget):
 
     def _on_change_state_completed(self):
         """Handle change task state to Completed."""
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             return
 
-        task_id = self.task_table.item(current_row, 0).data(Qt.UserRole)
+        task_id = self.task_model.task_id_at(current_row)
 
         # Execute complete through undo manager
         command = CompleteTaskCommand(self.task_dao, task_id, self.dependency_dao)
@@ -1577,11 +1590,11 @@ class TaskListView(QWidget):
 
     def _on_change_state_trash(self):
         """Handle change task state to Trash."""
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             return
 
-        task_id = self.task_table.item(current_row, 0).data(Qt.UserRole)
+        task_id = self.task_model.task_id_at(current_row)
         task = self.task_service.get_task_by_id(task_id)
 
         if not task:
@@ -1715,14 +1728,9 @@ class TaskListView(QWidget):
 
     def _update_column_visibility(self):
         """Update table columns based on visible_columns configuration."""
-        # Update column count and headers
-        self.task_table.setColumnCount(len(self.visible_columns))
-        self.task_table.setHorizontalHeaderLabels([
-            self.all_columns[col] for col in self.visible_columns
-        ])
-
-        # Update column indices mapping
+        # Update column indices mapping, column count and headers
         self.column_indices = {col: idx for idx, col in enumerate(self.visible_columns)}
+        self._set_model_columns()
 
         # Configure column resize modes - allow user resizing
         header = self.task_table.horizontalHeader()
@@ -1743,7 +1751,9 @@ class TaskListView(QWidget):
             "Context": 100,
             "Project Tags": 120,
             "Delegated To": 120,
-            "Follow-Up Date": 120
+            "Follow-Up Date": 120,
+            "Blocking Depth": 110,
+            "Unblocks": 80
         }
         for idx, col in enumerate(self.visible_columns):
             width = default_widths.get(col, 100)
@@ -1752,9 +1762,6 @@ class TaskListView(QWidget):
         # Make the last visible column stretch to fill remaining space
         header.setStretchLastSection(True)
 
-        # Set tooltips for column headers
-        self._set_header_tooltips()
-
         # Refresh the table data
         self._apply_filters()
 
@@ -1765,7 +1772,7 @@ class TaskListView(QWidget):
         Args:
             position: Position where right-click occurred
         """
-        current_row = self.task_table.currentRow()
+        current_row = self.task_table.currentIndex().row()
         if current_row < 0:
             return
 
@@ -1840,7 +1847,7 @@ class TaskListView(QWidget):
 
         # Check if it's an up or down arrow key
         if key == Qt.Key_Up or key == Qt.Key_Down:
-            row_count = self.task_table.rowCount()
+            row_count = self.task_model.rowCount()
 
             # Transfer focus to the task table so shortcuts work
             self.task_table.setFocus(Qt.OtherFocusReason)
@@ -1849,9 +1856,9 @@ class TaskListView(QWidget):
             # Down arrow -> go to first row
             # Up arrow -> go to last row
             if key == Qt.Key_Down and row_count > 0:
-                self.task_table.setCurrentCell(0, 0)
+                self.task_table.selectRow(0)
             elif key == Qt.Key_Up and row_count > 0:
-                self.task_table.setCurrentCell(row_count - 1, 0)
+                self.task_table.selectRow(row_count - 1)
         else:
             # Normal search box behavior for all other keys
             QLineEdit.keyPressEvent(self.search_box, event)
@@ -0,0 +1,270 @@
+"""
+Task Table Model - Lazy model backing the Task List view
+
+Provides a QAbstractTableModel over a list of tasks. Cell text, tooltips and
+colors are only computed when the view asks for them, i.e. for rows that are
+actually painted, so refreshing or scrolling a large task list does not
+allocate per-cell items up front.
+"""
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+from PyQt5.QtGui import QBrush, QColor
+from typing import Callable, Dict, List, Optional, Tuple
+from ..models import Task, TaskState
+
+
+# (display text, sort/user data, tooltip) for one cell
+CellData = Tuple[str, object, Optional[str]]
+
+# Builds the cell data for every column of a task, given its urgency score
+RowBuilder = Callable[[Task, float], Dict[str, CellData]]
+
+
+class TaskTablePalette:
+    """
+    Pre-built brushes for one theme.
+
+    Brushes are created once per theme and shared by every cell instead of
+    allocating new QBrush/QColor objects for each cell.
+    """
+
+    def __init__(self, is_dark: bool, state_colors: Dict[TaskState, tuple]):
+        """
+        Build the brushes for a theme.
+
+        Args:
+            is_dark: True for the dark theme, False for the light theme
+            state_colors: Map of TaskState -> (background_color, text_color);
+                either color may be None
+        """
+        if is_dark:
+            row_colors = ("#313335", "#3c3f41")
+            text_color = "#e0e0e0"
+        else:
+            row_colors = ("#ffffff", "#f9f9f9")
+            text_color = "#212121"
+
+        self.is_dark = is_dark
+        self.row_backgrounds = tuple(QBrush(QColor(color)) for color in row_colors)
+        self.foreground = QBrush(QColor(text_color))
+        self.blocked_foreground = QBrush(QColor("#dc3545"))
+        self.unblocked_foreground = QBrush(QColor("#6c757d"))
+        self.state_brushes: Dict[TaskState, tuple] = {
+            state: (
+                QBrush(QColor(bg_color)) if bg_color else None,
+                QBrush(QColor(fg_color)) if fg_color else None
+            )
+            for state, (bg_color, fg_color) in state_colors.items()
+        }
+
+
+class TaskTableModel(QAbstractTableModel):
+    """
+    Table model of tasks with lazily computed cell data.
+
+    Rows are built on first access through the row builder callback and
+    memoized until the next call to set_tasks().
+    """
+
+    def __init__(self, row_builder: RowBuilder, parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            row_builder: Callback returning the cell data for a task
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._row_builder = row_builder
+        self._tasks: List[Task] = []
+        self._urgency_scores: Dict[int, float] = {}
+        self._row_cache: Dict[int, Dict[str, CellData]] = {}
+        self._columns: List[str] = []
+        self._headers: Dict[str, str] = {}
+        self._header_tooltips: Dict[str, str] = {}
+        self._palette: Optional[TaskTablePalette] = None
+
+    def set_columns(self, columns: List[str], headers: Dict[str, str],
+                    header_tooltips: Optional[Dict[str, str]] = None):
+        """
+        Set the visible columns.
+
+        Args:
+            columns: Visible column names in display order
+            headers: Map of column name -> header label
+            header_tooltips: Optional map of column name -> header tooltip
+        """
+        self.beginResetModel()
+        self._columns = list(columns)
+        self._headers = dict(headers)
+        self._header_tooltips = dict(header_tooltips or {})
+        self.endResetModel()
+
+    def set_tasks(self, tasks: List[Task], urgency_scores: Dict[int, float],
+                  palette: TaskTablePalette):
+        """
+        Replace the displayed tasks.
+
+        Row count changes are reported as row insertions/removals rather than
+        a model reset so the view keeps its column widths and current row.
+
+        Args:
+            tasks: Tasks to display, in display order
+            urgency_scores: Map of task_id -> urgency score
+            palette: Brushes for the current theme
+        """
+        old_count = len(self._tasks)
+        new_count = len(tasks)
+
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._tasks = self._tasks[:new_count]
+            self.endRemoveRows()
+
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._set_contents(tasks, urgency_scores, palette)
+            self.endInsertRows()
+        else:
+            self._set_contents(tasks, urgency_scores, palette)
+
+        if old_count and new_count and self._columns:
+            last_row = min(old_count, new_count) - 1
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(last_row, len(self._columns) - 1)
+            )
+
+    def _set_contents(self, tasks: List[Task], urgency_scores: Dict[int, float],
+                      palette: TaskTablePalette):
+        """Store new contents and drop memoized rows."""
+        self._tasks = list(tasks)
+        self._urgency_scores = urgency_scores
+        self._palette = palette
+        self._row_cache = {}
+
+    def task_at(self, row: int) -> Optional[Task]:
+        """
+        Get the task displayed in a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Task or None if the row is out of range
+        """
+        if 0 <= row < len(self._tasks):
+            return self._tasks[row]
+        return None
+
+    def task_id_at(self, row: int) -> Optional[int]:
+        """
+        Get the ID of the task displayed in a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Task ID or None if the row is out of range
+        """
+        task = self.task_at(row)
+        return task.id if task else None
+
+    def column_name(self, column: int) -> Optional[str]:
+        """Get the column name at a column index."""
+        if 0 <= column < len(self._columns):
+            return self._columns[column]
+        return None
+
+    def _row_data(self, row: int) -> Dict[str, CellData]:
+        """Build (or fetch memoized) cell data for a row."""
+        cells = self._row_cache.get(row)
+        if cells is None:
+            task = self._tasks[row]
+            urgency = self._urgency_scores.get(task.id, 1.0) if task.id else 1.0
+            cells = self._row_builder(task, urgency)
+            self._row_cache[row] = cells
+        return cells
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._tasks)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._columns)
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            column = self.column_name(section)
+            if column is None:
+                return QVariant()
+            if role == Qt.DisplayRole:
+                return self._headers.get(column, column)
+            if role == Qt.ToolTipRole and column in self._header_tooltips:
+                return self._header_tooltips[column]
+            return QVariant()
+
+        if role == Qt.DisplayRole:
+            return section + 1
+        return QVariant()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._tasks):
+            return QVariant()
+
+        column = self.column_name(index.column())
+        if column is None:
+            return QVariant()
+
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+
+        row = index.row()
+
+        if role in (Qt.BackgroundRole, Qt.ForegroundRole):
+            return self._brush(row, column, role)
+
+        cell = self._row_data(row).get(column)
+        if cell is None:
+            return QVariant()
+        text, user_data, tooltip = cell
+
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.UserRole:
+            return user_data if user_data is not None else QVariant()
+        if role == Qt.ToolTipRole:
+            return tooltip if tooltip else QVariant()
+        return QVariant()
+
+    def _brush(self, row: int, column: str, role: int):
+        """Pick the shared brush for a cell."""
+        palette = self._palette
+        if palette is None:
+            return QVariant()
+
+        if column == "State":
+            background, foreground = palette.state_brushes.get(
+                self._tasks[row].state, (None, None)
+            )
+            brush = background if role == Qt.BackgroundRole else foreground
+            return brush if brush is not None else QVariant()
+
+        if role == Qt.BackgroundRole:
+            return palette.row_backgrounds[row % 2]
+
+        if column == "Dependencies":
+            text = self._row_data(row)["Dependencies"][0]
+            if text.startswith("⛔"):
+                return palette.blocked_foreground
+            return palette.unblocked_foreground
+
+        return palette.foreground
@@ -0,0 +1,123 @@
+"""
+Unit tests for DatabaseConnection thread handling.
+"""
+
+import pytest
+import sqlite3
+import tempfile
+import threading
+import os
+
+from src.database.connection import DatabaseConnection
+from src.database.schema import DatabaseSchema
+from src.database.task_dao import TaskDAO
+from src.models import Task
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for the database and its WAL files."""
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+@pytest.fixture
+def database(temp_dir):
+    """Create a fresh DatabaseConnection singleton on a temporary file."""
+    DatabaseConnection._instance = None
+    DatabaseConnection._connection = None
+    db = DatabaseConnection(os.path.join(temp_dir, 'test.db'))
+    yield db
+    db.close()
+    DatabaseConnection._instance = None
+    DatabaseConnection._connection = None
+    DatabaseConnection._current_db_path = None
+
+
+def run_in_thread(func):
+    """Run func on a worker thread and return its result (re-raising errors)."""
+    result = {}
+
+    def target():
+        try:
+            result['value'] = func()
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+class TestDatabaseConnectionThreads:
+    """Tests for WAL mode and per-thread connections."""
+
+    def test_wal_mode_enabled(self, database):
+        """Test that the primary connection uses WAL journaling."""
+        mode = database.get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == 'wal'
+
+    def test_main_thread_gets_primary_connection(self, database):
+        """Test that the UI thread keeps using the primary connection."""
+        assert database.get_thread_connection() is database.get_connection()
+        assert database.get_thread_connection(read_only=True) is database.get_connection()
+
+    def test_worker_thread_gets_own_connection(self, database):
+        """Test that worker threads receive a dedicated, reused connection."""
+        primary = database.get_connection()
+
+        def worker():
+            first = database.get_thread_connection()
+            second = database.get_thread_connection()
+            return first, second
+
+        first, second = run_in_thread(worker)
+        assert first is second
+        assert first is not primary
+
+    def test_worker_sees_committed_writes(self, database):
+        """Test that rows written by the UI thread are visible to worker threads."""
+        proxy = database.thread_bound()
+        TaskDAO(database.get_connection()).create(Task(title="From UI"))
+
+        titles = run_in_thread(lambda: [t.title for t in TaskDAO(proxy).get_all()])
+        assert titles == ["From UI"]
+
+    def test_read_only_connection_rejects_writes(self, database):
+        """Test that read-only worker connections cannot modify the database."""
+        proxy = database.thread_bound(read_only=True)
+
+        def worker():
+            TaskDAO(proxy).create(Task(title="Should fail"))
+
+        with pytest.raises(sqlite3.OperationalError):
+            run_in_thread(worker)
+
+    def test_close_closes_thread_connections(self, database):
+        """Test that closing the singleton also closes worker connections."""
+        worker_conn = run_in_thread(database.get_thread_connection)
+
+        database.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            worker_conn.execute("SELECT 1")
+
+    def test_switch_database_rebinds_worker_connections(self, database, temp_dir):
+        """Test that worker threads follow the singleton to a new database file."""
+        other_path = os.path.join(temp_dir, 'other.db')
+        other = sqlite3.connect(other_path)
+        DatabaseSchema.initialize_database(other)
+        TaskDAO(other).create(Task(title="Other DB"))
+        other.close()
+
+        run_in_thread(database.get_thread_connection)
+        success, _ = database.switch_database(other_path)
+        assert success
+
+        titles = run_in_thread(
+            lambda: [t.title for t in TaskDAO(database.thread_bound()).get_all()]
+        )
+        assert titles == ["Other DB"]
@@ -314,3 +314,132 @@ class TestSettingsDAO:
         result = settings_dao.get("empty_dict")
 
         assert result == {}
+
+
+class TestSettingsCache:
+    """Tests for the shared settings cache and change notifications."""
+
+    def test_reads_are_served_from_cache(self, db_connection):
+        """Test that repeated reads, even from new DAO instances, query once."""
+        SettingsDAO(db_connection).set("k_factor", 32, "integer")
+        statements = []
+        db_connection.set_trace_callback(statements.append)
+
+        for _ in range(5):
+            assert SettingsDAO(db_connection).get_int("k_factor") == 32
+        assert SettingsDAO(db_connection).get("missing", "default") == "default"
+
+        db_connection.set_trace_callback(None)
+        assert len([s for s in statements if "FROM settings" in s]) == 1
+
+    def test_set_and_delete_invalidate_other_instances(self, db_connection):
+        """Test that writes through one DAO are seen by another."""
+        reader = SettingsDAO(db_connection)
+        writer = SettingsDAO(db_connection)
+        writer.set("theme", "light", "string")
+        assert reader.get("theme") == "light"
+
+        writer.set("theme", "dark", "string")
+        assert reader.get("theme") == "dark"
+
+        writer.delete("theme")
+        assert reader.get("theme") is None
+
+    def test_raw_writes_need_explicit_invalidation(self, settings_dao, db_connection):
+        """Test that raw SQL writes become visible after invalidate_cache()."""
+        settings_dao.set("theme", "light", "string")
+        assert settings_dao.get("theme") == "light"
+
+        db_connection.execute("UPDATE settings SET value = 'dark' WHERE key = 'theme'")
+        db_connection.commit()
+        assert settings_dao.get("theme") == "light"
+
+        SettingsDAO.invalidate_cache()
+        assert settings_dao.get("theme") == "dark"
+
+    def test_cached_json_values_are_copied(self, settings_dao):
+        """Test that mutating a returned JSON value does not change the cache."""
+        settings_dao.set("columns", ["Title", "Due"], "json")
+
+        settings_dao.get("columns").append("Priority")
+
+        assert settings_dao.get("columns") == ["Title", "Due"]
+
+    def test_listeners_receive_matching_keys(self, settings_dao):
+        """Test that listeners are notified only for keys of interest."""
+        seen = []
+        any_key = []
+
+        def on_change(key):
+            seen.append(key)
+
+        def on_any(key):
+            any_key.append(key)
+
+        SettingsDAO.add_listener(on_change, keys=["theme"])
+        SettingsDAO.add_listener(on_any)
+        try:
+            settings_dao.set("theme", "dark", "string")
+            settings_dao.set("other", 1, "integer")
+            SettingsDAO.invalidate_cache()
+        finally:
+            SettingsDAO.remove_listener(on_change)
+            SettingsDAO.remove_listener(on_any)
+
+        assert seen == ["theme", None]
+        assert any_key == ["theme", "other", None]
+
+        settings_dao.set("theme", "light", "string")
+        assert seen == ["theme", None]
+
+    def test_listeners_skip_changes_made_off_the_main_thread(self, settings_dao):
+        """Test that a change on a worker thread clears the cache but calls no listener."""
+        import threading
+
+        seen = []
+
+        def on_change(key):
+            seen.append(key)
+
+        SettingsDAO.add_listener(on_change)
+        try:
+            settings_dao.get("theme")
+            worker = threading.Thread(target=SettingsDAO.invalidate_cache, args=("theme",))
+            worker.start()
+            worker.join()
+            assert seen == []
+            assert settings_dao.db not in SettingsDAO._caches
+
+            SettingsDAO.invalidate_cache()
+            assert seen == [None]
+        finally:
+            SettingsDAO.remove_listener(on_change)
+
+    def test_bound_method_listeners_are_weak(self, settings_dao):
+        """Test that registering a listener does not keep its owner alive."""
+        import gc
+
+        class Owner:
+            def __init__(self):
+                self.calls = 0
+
+            def on_change(self, key):
+                self.calls += 1
+
+        owner = Owner()
+        SettingsDAO.add_listener(owner.on_change)
+        settings_dao.set("theme", "dark", "string")
+        assert owner.calls == 1
+
+        del owner
+        gc.collect()
+        settings_dao.set("theme", "light", "string")  # Must not fail
+
+    def test_indicator_service_reloads_on_change(self, settings_dao):
+        """Test that DueDateIndicatorService picks up changed symbols."""
+        from src.services.due_date_indicator_service import DueDateIndicatorService
+
+        service = DueDateIndicatorService(settings_dao)
+        settings_dao.set("overdue_symbol", "!!", "string")
+
+        assert service.overdue_symbol == "!!"
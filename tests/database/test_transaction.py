@@ -0,0 +1,143 @@
+"""
+Unit tests for unit-of-work transactions.
+
+Tests the transaction scope including:
+- Deferring DAO commits until the outermost scope exits
+- Rolling back every write when the scope raises
+- Nested scopes as savepoints
+- Atomic command execution through UndoManager
+"""
+
+import pytest
+import sqlite3
+
+from src.database.schema import DatabaseSchema
+from src.database.task_dao import TaskDAO
+from src.database.transaction import transaction, in_transaction
+from src.models.task import Task
+from src.models.enums import TaskState
+from src.commands.base_command import Command
+from src.services.undo_manager import UndoManager
+
+
+@pytest.fixture
+def db_connection():
+    """Create in-memory database for testing."""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    DatabaseSchema.initialize_database(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def task_dao(db_connection):
+    """Create TaskDAO instance."""
+    return TaskDAO(db_connection)
+
+
+def task_titles(db_connection):
+    """Get the titles of all stored tasks."""
+    return sorted(row[0] for row in db_connection.execute("SELECT title FROM tasks"))
+
+
+class TestTransaction:
+    """Tests for the transaction context."""
+
+    def test_dao_writes_commit_once(self, db_connection, task_dao):
+        """Test that several DAO writes inside a scope produce one commit."""
+        statements = []
+        db_connection.set_trace_callback(statements.append)
+
+        with transaction(db_connection):
+            task = task_dao.create(Task(title="First"))
+            task_dao.create(Task(title="Second"))
+            task.title = "First (edited)"
+            task_dao.update(task)
+            assert in_transaction(db_connection)
+            assert db_connection.in_transaction
+
+        db_connection.set_trace_callback(None)
+
+        assert not in_transaction(db_connection)
+        assert not db_connection.in_transaction
+        assert len([s for s in statements if s.startswith('COMMIT')]) == 0
+        assert len([s for s in statements if s.startswith('RELEASE')]) == 1
+        assert task_titles(db_connection) == ["First (edited)", "Second"]
+
+    def test_error_rolls_back_every_write(self, db_connection, task_dao):
+        """Test that an exception discards all writes of the scope."""
+        existing = task_dao.create(Task(title="Existing"))
+
+        with pytest.raises(RuntimeError):
+            with transaction(db_connection):
+                task_dao.create(Task(title="New"))
+                task_dao.delete(existing.id)
+                raise RuntimeError("boom")
+
+        assert not in_transaction(db_connection)
+        assert task_titles(db_connection) == ["Existing"]
+
+    def test_nested_scope_rolls_back_to_savepoint(self, db_connection, task_dao):
+        """Test that a failing inner scope keeps the outer scope's writes."""
+        with transaction(db_connection):
+            task_dao.create(Task(title="Outer"))
+
+            with pytest.raises(ValueError):
+                with transaction(db_connection):
+                    task_dao.create(Task(title="Inner"))
+                    raise ValueError("inner failure")
+
+            with transaction(db_connection):
+                task_dao.create(Task(title="Inner kept"))
+
+        assert task_titles(db_connection) == ["Inner kept", "Outer"]
+
+    def test_rollback_only(self, db_connection, task_dao):
+        """Test that set_rollback_only() discards writes without an exception."""
+        with transaction(db_connection) as unit:
+            task_dao.create(Task(title="Discarded"))
+            unit.set_rollback_only()
+
+        assert task_titles(db_connection) == []
+
+    def test_service_connection_shares_scope(self, db_connection, task_dao):
+        """Test that a DatabaseConnection-style wrapper opens the same scope as its connection."""
+        class Wrapper:
+            def get_connection(self):
+                return db_connection
+
+        with transaction(Wrapper()):
+            assert in_transaction(db_connection)
+
+
+class FailingCompleteCommand(Command):
+    """Command that writes and then reports failure."""
+
+    def __init__(self, task_dao, task_id):
+        self.task_dao = task_dao
+        self.task_id = task_id
+
+    def execute(self):
+        task = self.task_dao.get_by_id(self.task_id)
+        task.state = TaskState.COMPLETED
+        self.task_dao.update(task)
+        return False
+
+    def undo(self):
+        return True
+
+    def get_description(self):
+        return "Failing command"
+
+
+class TestAtomicCommands:
+    """Tests for commands run through UndoManager."""
+
+    def test_failed_command_leaves_no_partial_state(self, db_connection, task_dao):
+        """Test that writes of a command returning False are rolled back."""
+        task = task_dao.create(Task(title="Task"))
+
+        assert not UndoManager().execute_command(FailingCompleteCommand(task_dao, task.id))
+
+        assert task_dao.get_by_id(task.id).state == TaskState.ACTIVE
@@ -0,0 +1,120 @@
+"""
+Scoring Benchmark Tests
+
+Compares the column-wise scoring engine in algorithms.priority against the
+per-task scoring it replaced, with 100,000 tasks.
+"""
+
+import pytest
+import random
+import time
+from datetime import date, timedelta
+
+from src.algorithms import priority
+from src.algorithms.priority import (
+    calculate_score_arrays,
+    calculate_task_scores,
+    elo_to_effective_priority
+)
+from src.models.task import Task
+
+
+TASK_COUNT = 100_000
+
+
+def legacy_importance_scores(tasks, today):
+    """Per-task scoring as done before the array engine (dict passes + scalar calls)."""
+    urgency_scores = {}
+    days_remaining_list = []
+    for task in tasks:
+        if task.due_date is None:
+            urgency_scores[task.id] = 1.0
+        else:
+            days_remaining_list.append((task, (task.due_date - today).days))
+
+    min_days = min(days for _, days in days_remaining_list)
+    max_days = max(days for _, days in days_remaining_list)
+    for task, days in days_remaining_list:
+        urgency_scores[task.id] = 3.0 - ((days - min_days) / (max_days - min_days)) * 2.0
+
+    return {
+        task.id: elo_to_effective_priority(task.base_priority, task.elo_rating) * urgency_scores.get(task.id, 1.0)
+        for task in tasks
+    }
+
+
+def best_of(func, repeat=3):
+    """Return the best wall-clock time of several runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.fixture(scope="module")
+def large_task_list():
+    """Generate 100,000 in-memory tasks with mixed priorities and due dates."""
+    rng = random.Random(2024)
+    today = date.today()
+    return [
+        Task(
+            title=f"Task {i}",
+            id=i + 1,
+            base_priority=rng.choice([1, 2, 3]),
+            elo_rating=rng.uniform(900.0, 2100.0),
+            due_date=today + timedelta(days=rng.randint(-30, 90)) if rng.random() < 0.7 else None
+        )
+        for i in range(TASK_COUNT)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestScoringBenchmark:
+    """
+    Scoring benchmark with 100,000 tasks.
+
+    Acceptance Criteria:
+    - Array scoring returns exactly the legacy scores
+    - Array scoring is faster than per-task scoring (NumPy and pure Python)
+    """
+
+    @pytest.mark.parametrize("backend", ["numpy", "python"])
+    def test_scoring_100k_tasks(self, large_task_list, backend, monkeypatch):
+        """
+        Benchmark: importance scoring for 100,000 tasks.
+
+        Acceptance: identical scores and faster than per-task scoring
+        """
+        if backend == "numpy" and priority.np is None:
+            pytest.skip("NumPy not installed")
+        if backend == "python":
+            monkeypatch.setattr(priority, "np", None)
+
+        today = date.today()
+        expected = legacy_importance_scores(large_task_list, today)
+        _, importance = calculate_task_scores(large_task_list)
+        assert importance == [expected[task.id] for task in large_task_list]
+
+        legacy_time = best_of(lambda: legacy_importance_scores(large_task_list, today))
+        array_time = best_of(lambda: calculate_task_scores(large_task_list))
+
+        columns = (
+            [t.base_priority for t in large_task_list],
+            [t.elo_rating for t in large_task_list],
+            [t.due_date.toordinal() if t.due_date else None for t in large_task_list]
+        )
+        columns_time = best_of(lambda: calculate_score_arrays(*columns))
+
+        print(f"\n  [{backend}] per-task scoring: {legacy_time*1000:.1f}ms")
+        print(f"  [{backend}] calculate_task_scores: {array_time*1000:.1f}ms "
+              f"({legacy_time/array_time:.1f}x)")
+        print(f"  [{backend}] calculate_score_arrays (columns only): {columns_time*1000:.1f}ms "
+              f"({legacy_time/columns_time:.1f}x)")
+
+        assert array_time < legacy_time, (
+            f"Array scoring ({array_time*1000:.1f}ms) should beat per-task scoring "
+            f"({legacy_time*1000:.1f}ms)"
+        )
@@ -3,9 +3,10 @@ import json
 import os
 import sqlite3
 import tempfile
+import threading
 import pytest
 from datetime import datetime
-from src.services.export_service import ExportService
+from src.services.export_service import ExportFilter, ExportService
 from src.models.task import Task
 from src.models.enums import TaskState, Priority
 from src.database.task_dao import TaskDAO
@@ -227,6 +228,53 @@ def test_export_database_backup(export_service):
             os.unlink(filepath)
 
 
+def test_database_backup_is_stepwise_and_consistent(export_service, test_db, tmp_path):
+    """Test that the backup copies in steps and reports progress."""
+    test_db.executemany(
+        "INSERT INTO tasks (title, description) VALUES (?, ?)",
+        [(f"Task {i}", "x" * 1000) for i in range(500)]
+    )
+    test_db.commit()
+    export_service.BACKUP_PAGES_PER_STEP = 16
+    progress_calls = []
+
+    filepath = tmp_path / "backup.db"
+    result = export_service.export_database_backup(
+        str(filepath), lambda msg, pct: progress_calls.append(pct)
+    )
+
+    assert result['success'] is True
+    assert len(progress_calls) > 10
+    assert progress_calls == sorted(progress_calls)
+    assert progress_calls[-1] == 100
+    backup = sqlite3.connect(filepath)
+    try:
+        assert backup.execute("PRAGMA integrity_check").fetchone()[0] == 'ok'
+        assert backup.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 500
+    finally:
+        backup.close()
+
+
+def test_database_backup_cancel(export_service, test_db, tmp_path):
+    """Test that a cancelled backup leaves no file behind."""
+    test_db.executemany("INSERT INTO tasks (title) VALUES (?)", [(f"Task {i}",) for i in range(200)])
+    test_db.commit()
+    export_service.BACKUP_PAGES_PER_STEP = 1
+    cancel_event = threading.Event()
+
+    def on_progress(message, percent):
+        if percent > 0:
+            cancel_event.set()
+
+    result = export_service.export_database_backup(
+        str(tmp_path / "backup.db"), on_progress, cancel_event
+    )
+
+    assert result['success'] is False
+    assert result['cancelled'] is True
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_export_empty_database(export_service):
     """Test exporting from empty database."""
     with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
@@ -341,3 +389,237 @@ def test_export_tasks_format(export_service, sample_data):
     finally:
         if os.path.exists(filepath):
             os.unlink(filepath)
+
+
+def test_export_streams_large_tables(export_service, test_db, tmp_path):
+    """Test that tables larger than one chunk export completely with tag links."""
+    task_count = ExportService.CHUNK_SIZE * 2 + 7
+    test_db.execute("INSERT INTO project_tags (name) VALUES ('Bulk')")
+    test_db.executemany(
+        "INSERT INTO tasks (title) VALUES (?)",
+        [(f"Task {i}",) for i in range(task_count)]
+    )
+    test_db.execute(
+        "INSERT INTO task_project_tags (task_id, project_tag_id) "
+        "SELECT id, 1 FROM tasks WHERE id % 3 = 0"
+    )
+    test_db.commit()
+
+    progress_calls = []
+    filepath = tmp_path / "large.json"
+    result = export_service.export_to_json(
+        str(filepath), progress_callback=lambda message, percent: progress_calls.append(percent)
+    )
+
+    assert result['success'] is True
+    assert result['task_count'] == task_count
+
+    data = json.loads(filepath.read_text(encoding='utf-8'))
+    assert [t['project_tag_ids'] for t in data['tasks'][:3]] == [[], [], [1]]
+    assert sum(1 for t in data['tasks'] if t['project_tag_ids']) == task_count // 3
+
+    # Progress is reported while rows are written, never going backwards
+    assert len(progress_calls) > 10
+    assert progress_calls == sorted(progress_calls)
+
+
+def test_export_layout_matches_json_dump(export_service, sample_data, tmp_path):
+    """Test that the streamed file is byte-identical to json.dump(indent=2)."""
+    filepath = tmp_path / "export.json"
+    export_service.export_to_json(str(filepath))
+
+    text = filepath.read_text(encoding='utf-8')
+    assert text == json.dumps(json.loads(text), indent=2, ensure_ascii=False)
+
+
+def test_export_compact_mode(export_service, sample_data, tmp_path):
+    """Test that compact mode writes the same data without whitespace."""
+    indented_path = tmp_path / "indented.json"
+    compact_path = tmp_path / "compact.json"
+
+    export_service.export_to_json(str(indented_path))
+    result = export_service.export_to_json(str(compact_path), compact=True)
+
+    assert result['success'] is True
+    indented = json.loads(indented_path.read_text(encoding='utf-8'))
+    compact = json.loads(compact_path.read_text(encoding='utf-8'))
+    del indented['metadata']['export_date'], compact['metadata']['export_date']
+    assert compact == indented
+    assert "\n" not in compact_path.read_text(encoding='utf-8')
+    assert compact_path.stat().st_size < indented_path.stat().st_size
+
+
+def test_failed_export_leaves_no_file(export_service, sample_data, tmp_path, monkeypatch):
+    """Test that an error while streaming removes the partially written file."""
+    def failing_notifications():
+        raise sqlite3.OperationalError("disk I/O error")
+        yield
+
+    monkeypatch.setattr(export_service, '_export_notifications', failing_notifications)
+    filepath = tmp_path / "broken.json"
+
+    result = export_service.export_to_json(str(filepath))
+
+    assert result['success'] is False
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_delta_export_contains_only_changes(export_service, test_db, tmp_path):
+    """Test that a delta holds changed tasks, new history rows and tombstones."""
+    test_db.executemany("INSERT INTO tasks (title) VALUES (?)", [(f"Task {i}",) for i in range(1, 6)])
+    test_db.execute("INSERT INTO task_history (task_id, event_type) VALUES (1, 'created')")
+    test_db.execute("INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (3, 4)")
+    test_db.commit()
+
+    full = export_service.export_to_json(str(tmp_path / "full.json"))
+    assert full['success'] is True
+    assert full['event_count'] == 1
+    assert export_service.get_export_watermark() == full['watermark']
+
+    test_db.execute("UPDATE tasks SET title = 'Renamed' WHERE id = 2")
+    test_db.execute("DELETE FROM tasks WHERE id = 4")  # Also drops the dependency of task 3
+    test_db.execute("INSERT INTO task_history (task_id, event_type) VALUES (2, 'edited')")
+    test_db.commit()
+
+    delta_path = tmp_path / "delta.json"
+    result = export_service.export_delta(str(delta_path))
+
+    assert result['success'] is True
+    data = json.loads(delta_path.read_text(encoding='utf-8'))
+    assert data['metadata']['export_type'] == 'delta'
+    assert data['metadata']['since'] == full['watermark']
+    assert data['metadata']['watermark'] == result['watermark']
+    assert data['deleted_tasks'] == [4]
+    assert [task['id'] for task in data['tasks']] == [2, 3]
+    assert data['dependencies'] == []
+    assert [event['event_type'] for event in data['task_history']] == ['edited']
+    assert ExportService.WATERMARK_SETTING not in data['settings']
+    assert export_service.get_export_watermark() == result['watermark']
+
+
+def test_delta_export_requires_previous_export(export_service, tmp_path):
+    """Test that a delta cannot be created before any full export."""
+    result = export_service.export_delta(str(tmp_path / "delta.json"))
+
+    assert result['success'] is False
+    assert 'full export' in result['error']
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cancelled_json_export_removes_partial_file(export_service, test_db, tmp_path):
+    """Test that cancelling a JSON export leaves no file behind."""
+    test_db.executemany("INSERT INTO tasks (title) VALUES (?)", [(f"Task {i}",) for i in range(50)])
+    test_db.commit()
+    cancel_event = threading.Event()
+
+    def on_progress(message, percent):
+        if percent > 0:
+            cancel_event.set()
+
+    result = export_service.export_to_json(
+        str(tmp_path / "export.json"), progress_callback=on_progress, cancel_event=cancel_event
+    )
+
+    assert result['cancelled'] is True
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.fixture
+def two_projects(test_db):
+    """Two project tags with three tasks each, linked across projects."""
+    test_db.executescript("""
+        INSERT INTO contexts (id, name) VALUES (1, '@home'), (2, '@work'), (3, '@unused');
+        INSERT INTO project_tags (id, name) VALUES (1, 'Alpha'), (2, 'Beta'), (3, 'Shared');
+        INSERT INTO tasks (id, title, context_id, state) VALUES
+            (1, 'Alpha 1', 1, 'active'), (2, 'Alpha 2', 1, 'completed'), (3, 'Alpha 3', NULL, 'active'),
+            (4, 'Beta 1', 2, 'active'), (5, 'Beta 2', 2, 'active'), (6, 'Beta 3', 2, 'someday');
+        INSERT INTO task_project_tags (task_id, project_tag_id) VALUES
+            (1, 1), (2, 1), (3, 1), (3, 3), (4, 2), (5, 2), (6, 2);
+        INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (2, 1), (3, 4), (5, 4);
+        INSERT INTO task_comparisons (winner_task_id, loser_task_id, adjustment_amount)
+            VALUES (1, 3, 10), (1, 4, 10), (4, 5, 10);
+        INSERT INTO postpone_history (task_id, reason_type) VALUES (1, 'other'), (5, 'other');
+        INSERT INTO task_history (task_id, event_type) VALUES (2, 'completed'), (6, 'created');
+        INSERT INTO notifications (type, title, message) VALUES ('info', 'Note', 'Message');
+    """)
+    test_db.execute("UPDATE tasks SET recurrence_parent_id = 4 WHERE id = 3")
+    test_db.commit()
+    return test_db
+
+
+def test_filtered_export_by_project_tag(export_service, two_projects, tmp_path):
+    """Test that a filtered export holds only the matching tasks and the rows among them."""
+    filepath = tmp_path / "alpha.json"
+    result = export_service.export_to_json(str(filepath), export_filter=ExportFilter(project_tag_ids=(1,)))
+
+    assert result['success'] is True
+    assert result['watermark'] is None
+    data = json.loads(filepath.read_text(encoding='utf-8'))
+
+    assert data['metadata']['export_type'] == 'filtered'
+    assert data['metadata']['filter']['project_tag_ids'] == [1]
+    assert 'watermark' not in data['metadata']
+    assert [t['id'] for t in data['tasks']] == [1, 2, 3]
+    assert data['tasks'][2]['project_tag_ids'] == [1, 3]
+    assert data['tasks'][2]['recurrence_parent_id'] is None  # Parent is not exported
+    assert [c['id'] for c in data['contexts']] == [1]
+    assert [t['id'] for t in data['project_tags']] == [1, 3]
+    assert [(d['blocked_task_id'], d['blocking_task_id']) for d in data['dependencies']] == [(2, 1)]
+    assert [(c['winner_task_id'], c['loser_task_id']) for c in data['task_comparisons']] == [(1, 3)]
+    assert [h['task_id'] for h in data['postpone_history']] == [1]
+    assert [h['task_id'] for h in data['task_history']] == [2]
+    assert data['notifications'] == []
+    assert result['task_count'] == 3 and result['dependency_count'] == 1
+
+    # A filtered export is not a base for incremental exports
+    assert export_service.get_export_watermark() is None
+
+
+def test_filtered_export_combines_criteria(export_service, two_projects, tmp_path, monkeypatch):
+    """Test that context, state and updated-since criteria must all match."""
+    import src.database.task_dao as task_dao_module
+
+    class FrozenDatetime(datetime):
+        frozen = None
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.frozen
+
+    # Timestamps as TaskDAO writes them
+    monkeypatch.setattr(task_dao_module, 'datetime', FrozenDatetime)
+    task_dao = TaskDAO(two_projects)
+    for task_id, updated_at in [
+        (1, datetime(2024, 1, 1)),
+        (2, datetime(2024, 1, 1)),
+        (3, datetime(2024, 1, 1)),
+        (4, datetime(2024, 6, 1, 11, 0)),  # Earlier on the cutoff day
+        (5, datetime(2024, 6, 1, 12, 0, 0, 123456)),
+        (6, datetime(2024, 6, 2, 8, 30)),
+    ]:
+        FrozenDatetime.frozen = updated_at
+        task_dao.update(task_dao.get_by_id(task_id))
+    filepath = tmp_path / "work.json"
+
+    export_filter = ExportFilter(
+        context_ids=(2,),
+        states=(TaskState.ACTIVE, TaskState.SOMEDAY),
+        updated_since=datetime(2024, 6, 1, 12, 0)
+    )
+    assert export_service.export_to_json(str(filepath), export_filter=export_filter)['success'] is True
+    data = json.loads(filepath.read_text(encoding='utf-8'))
+
+    assert [t['id'] for t in data['tasks']] == [5, 6]
+    assert data['metadata']['filter']['states'] == ['active', 'someday']
+    assert data['dependencies'] == []
+
+    # Default CURRENT_TIMESTAMP values (' ' separator) compare as instants too
+    two_projects.execute("UPDATE tasks SET updated_at = '2024-06-01 11:59:59' WHERE id = 5")
+    two_projects.commit()
+    result = export_service.export_to_json(str(filepath), export_filter=export_filter)
+    assert result['task_count'] == 1
+
+    # An empty filter is a full export
+    result = export_service.export_to_json(str(filepath), export_filter=ExportFilter())
+    assert result['task_count'] == 6
+    assert result['watermark'] is not None
@@ -2,10 +2,12 @@
 import json
 import sqlite3
 import tempfile
+import threading
 import pytest
 from datetime import datetime
 from src.services.import_service import ImportService
-from src.services.export_service import ExportService
+from src.services.export_service import ExportFilter, ExportService
+from src.database.schema import DatabaseSchema
 from src.models.task import Task
 from src.models.enums import TaskState, Priority
 from src.database.task_dao import TaskDAO
@@ -454,3 +456,383 @@ def test_import_clears_data_in_replace_mode(db_connection, import_service, sampl
     finally:
         import os
         os.unlink(filepath)
+
+
+def write_export(tmp_path, data, name="import.json"):
+    """Write export data to a file and return its path."""
+    filepath = tmp_path / name
+    filepath.write_text(json.dumps(data), encoding='utf-8')
+    return str(filepath)
+
+
+def test_streaming_and_loaded_imports_match(db_connection, export_service, import_service, tmp_path):
+    """Test that both parser modes restore the same data from a multi-batch export."""
+    conn = db_connection.get_connection()
+    task_count = ImportService.BATCH_SIZE * 2 + 3
+    conn.execute("INSERT INTO project_tags (name) VALUES ('Tag')")
+    conn.executemany("INSERT INTO tasks (title) VALUES (?)", [(f"Task {i}",) for i in range(task_count)])
+    conn.executemany(
+        "INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (?, ?)",
+        [(i, i - 1) for i in range(2, task_count + 1)]
+    )
+    conn.execute("INSERT INTO task_project_tags (task_id, project_tag_id) SELECT id, 1 FROM tasks")
+    conn.commit()
+
+    export_path = str(tmp_path / "export.json")
+    assert export_service.export_to_json(export_path, compact=True)['success'] is True
+
+    snapshots = []
+    for streaming in (True, False):
+        result = import_service.import_from_json(export_path, streaming=streaming)
+        assert result['success'] is True
+        assert result['task_count'] == task_count
+        assert result['dependency_count'] == task_count - 1
+        snapshots.append((
+            conn.execute("SELECT id, title FROM tasks ORDER BY id").fetchall(),
+            conn.execute("SELECT blocked_task_id, blocking_task_id FROM dependencies ORDER BY 1").fetchall(),
+            conn.execute("SELECT COUNT(*) FROM task_project_tags").fetchone()[0],
+        ))
+
+    assert [tuple(r) for r in snapshots[0][0]] == [tuple(r) for r in snapshots[1][0]]
+    assert [tuple(r) for r in snapshots[0][1]] == [tuple(r) for r in snapshots[1][1]]
+    assert snapshots[0][2] == snapshots[1][2] == task_count
+
+
+def test_merge_mode_remaps_references(db_connection, import_service, sample_export_data, tmp_path):
+    """Test that remapped IDs are applied to tags, dependencies and history."""
+    conn = db_connection.get_connection()
+    conn.execute("INSERT INTO project_tags (id, name) VALUES (1, 'Existing tag')")
+    conn.execute("INSERT INTO tasks (id, title) VALUES (1, 'Existing task')")
+    conn.commit()
+
+    sample_export_data['tasks'].append(dict(sample_export_data['tasks'][0], id=2, title="Test Task 2"))
+    sample_export_data['dependencies'] = [{"blocked_task_id": 2, "blocking_task_id": 1}]
+    sample_export_data['postpone_history'] = [{
+        "task_id": 1, "reason_type": "other", "postponed_at": datetime.now().isoformat()
+    }]
+
+    result = import_service.import_from_json(
+        write_export(tmp_path, sample_export_data), merge_mode=True
+    )
+
+    assert result['success'] is True
+    imported_id = conn.execute("SELECT id FROM tasks WHERE title = 'Test Task 1'").fetchone()[0]
+    second_id = conn.execute("SELECT id FROM tasks WHERE title = 'Test Task 2'").fetchone()[0]
+    assert imported_id not in (1, second_id)
+    assert second_id == 2
+
+    new_tag_id = conn.execute("SELECT id FROM project_tags WHERE name = 'Project A'").fetchone()[0]
+    assert conn.execute(
+        "SELECT project_tag_id FROM task_project_tags WHERE task_id = ?", (imported_id,)
+    ).fetchone()[0] == new_tag_id
+    assert tuple(conn.execute("SELECT blocked_task_id, blocking_task_id FROM dependencies").fetchone()) == \
+        (2, imported_id)
+    assert conn.execute("SELECT task_id FROM postpone_history").fetchone()[0] == imported_id
+
+
+def test_foreign_key_violation_rolls_back_everything(db_connection, import_service,
+                                                     sample_export_data, tmp_path):
+    """Test that a broken reference found at commit leaves existing data untouched."""
+    conn = db_connection.get_connection()
+    conn.execute("INSERT INTO contexts (name) VALUES ('Keep me')")
+    conn.commit()
+
+    sample_export_data['dependencies'] = [{"blocked_task_id": 1, "blocking_task_id": 999}]
+
+    result = import_service.import_from_json(write_export(tmp_path, sample_export_data))
+
+    assert result['success'] is False
+    assert [row[0] for row in conn.execute("SELECT name FROM contexts")] == ['Keep me']
+    assert conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 0
+
+
+def test_streaming_accepts_sections_out_of_order(import_service, sample_export_data, tmp_path):
+    """Test that sections before the metadata or their prerequisites are held back."""
+    reordered = {
+        'tasks': sample_export_data['tasks'],
+        'dependencies': [],
+        'project_tags': sample_export_data['project_tags'],
+        'contexts': sample_export_data['contexts'],
+        'metadata': sample_export_data['metadata'],
+    }
+
+    result = import_service.import_from_json(write_export(tmp_path, reordered), merge_mode=True)
+
+    assert result['success'] is True
+    assert result['task_count'] == 1
+    assert result['context_count'] == 2
+
+
+def test_streaming_reports_missing_section(import_service, sample_export_data, tmp_path):
+    """Test that a missing required section fails the import."""
+    del sample_export_data['project_tags']
+
+    result = import_service.import_from_json(write_export(tmp_path, sample_export_data))
+
+    assert result['success'] is False
+    assert 'project_tags' in result['error']
+
+
+@pytest.mark.parametrize("suffix,export_format", [
+    (".json.gz", "json"),
+    (".ndjson", "ndjson"),
+    (".ndjson.gz", "ndjson"),
+])
+def test_compressed_and_line_delimited_round_trip(db_connection, export_service, import_service,
+                                                  tmp_path, suffix, export_format):
+    """Test that gzip and NDJSON exports are detected and imported with either parser mode."""
+    conn = db_connection.get_connection()
+    conn.execute("INSERT INTO contexts (name) VALUES ('Work')")
+    conn.executemany("INSERT INTO tasks (title, context_id) VALUES (?, 1)", [(f"Task {i}",) for i in range(5)])
+    conn.execute("INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (2, 1)")
+    conn.commit()
+
+    export_path = str(tmp_path / f"export{suffix}")
+    result = export_service.export_to_json(export_path, export_format=export_format)
+    assert result['success'] is True
+    with open(export_path, 'rb') as f:
+        assert (f.read(2) == b"\x1f\x8b") == suffix.endswith(".gz")
+
+    summary = import_service.read_file_summary(export_path)
+    assert summary['format'] == export_format
+    assert summary['compressed'] == suffix.endswith(".gz")
+    assert summary['metadata']['schema_version'] == 1
+    assert summary['counts'].get('tasks') == 5
+    assert summary['counts'].get('dependencies') == 1
+    assert summary['has_settings'] is True
+
+    for streaming in (True, False):
+        result = import_service.import_from_json(export_path, streaming=streaming)
+        assert result['success'] is True
+        assert result['task_count'] == 5
+        assert result['context_count'] == 1
+        assert result['dependency_count'] == 1
+        assert conn.execute("SELECT COUNT(*) FROM tasks WHERE context_id = 1").fetchone()[0] == 5
+
+
+def table_rows(conn):
+    """Snapshot the exported tables for comparison."""
+    queries = {
+        'contexts': "SELECT id, name FROM contexts",
+        'tasks': "SELECT id, title, state, context_id FROM tasks",
+        'tags': "SELECT task_id, project_tag_id FROM task_project_tags",
+        'dependencies': "SELECT blocked_task_id, blocking_task_id FROM dependencies",
+        'comparisons': "SELECT id, winner_task_id, loser_task_id FROM task_comparisons",
+        'history': "SELECT id, task_id, event_type FROM task_history",
+        'notifications': "SELECT id, title FROM notifications",
+    }
+    return {name: sorted(tuple(row) for row in conn.execute(query)) for name, query in queries.items()}
+
+
+@pytest.mark.parametrize("export_format", ["json", "ndjson"])
+def test_delta_chain_restores_current_data(db_connection, export_service, import_service,
+                                           tmp_path, export_format):
+    """Test that a full export plus deltas restores the same data as the source."""
+    conn = db_connection.get_connection()
+    conn.executemany("INSERT INTO contexts (name) VALUES (?)", [("Work",), ("Home",)])
+    conn.execute("INSERT INTO project_tags (name) VALUES ('Tag')")
+    conn.executemany("INSERT INTO tasks (title, context_id) VALUES (?, 1)", [(f"Task {i}",) for i in range(6)])
+    conn.execute("INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (2, 1)")
+    conn.execute("INSERT INTO task_history (task_id, event_type) VALUES (1, 'created')")
+    conn.commit()
+    files = [str(tmp_path / f"full.{export_format}")]
+    assert export_service.export_to_json(files[0], export_format=export_format)['success'] is True
+
+    # Delta 1: edits, a tombstone, new links and history
+    conn.execute("UPDATE tasks SET title = 'Edited', state = 'completed' WHERE id = 3")
+    conn.execute("DELETE FROM tasks WHERE id = 1")
+    conn.execute("INSERT INTO task_project_tags (task_id, project_tag_id) VALUES (4, 1)")
+    conn.execute("INSERT INTO task_comparisons (winner_task_id, loser_task_id, adjustment_amount) VALUES (4, 5, 1)")
+    conn.execute("INSERT INTO notifications (type, title, message) VALUES ('info', 'Hello', 'm')")
+    conn.commit()
+    files.append(str(tmp_path / f"delta1.{export_format}.gz"))
+    assert export_service.export_delta(files[1], export_format=export_format)['success'] is True
+
+    # Delta 2: a deleted context, a new task and a removed tag link
+    conn.execute("DELETE FROM contexts WHERE id = 1")
+    conn.execute("INSERT INTO tasks (title, context_id) VALUES ('New', 2)")
+    conn.execute("DELETE FROM task_project_tags")
+    conn.execute("DELETE FROM notifications")
+    conn.execute("INSERT INTO task_history (task_id, event_type) VALUES (7, 'created')")
+    conn.commit()
+    files.append(str(tmp_path / f"delta2.{export_format}"))
+    assert export_service.export_delta(files[2], export_format=export_format)['success'] is True
+
+    expected = table_rows(conn)
+    conn.execute("DELETE FROM tasks")
+    conn.commit()
+
+    result = import_service.import_export_chain(list(reversed(files)))
+
+    assert result['success'] is True, result.get('error')
+    assert result['file_count'] == 3
+    assert result['deleted_count'] == 1
+    assert table_rows(conn) == expected
+
+
+def test_delta_chain_rejects_gaps(export_service, import_service, test_db, tmp_path):
+    """Test that a delta that does not continue the previous file is refused."""
+    test_db.execute("INSERT INTO tasks (title) VALUES ('Task')")
+    test_db.commit()
+    files = [str(tmp_path / name) for name in ("full.json", "delta1.json", "delta2.json")]
+    export_service.export_to_json(files[0])
+    for filepath in files[1:]:
+        test_db.execute("UPDATE tasks SET title = title || '!'")
+        test_db.commit()
+        export_service.export_delta(filepath)
+
+    result = import_service.import_export_chain([files[0], files[2]])
+    assert result['success'] is False
+    assert 'delta2.json' in result['error']
+
+    result = import_service.import_from_json(files[1])
+    assert result['success'] is False
+    assert 'incremental export' in result['error']
+    assert test_db.execute("SELECT title FROM tasks").fetchone()[0] == 'Task!!'
+
+
+def test_replace_import_clears_export_watermark(db_connection, export_service, import_service,
+                                                sample_export_data, tmp_path):
+    """Test that deltas need a new full export after the data was replaced."""
+    export_service.export_to_json(str(tmp_path / "full.json"))
+    assert export_service.get_export_watermark() is not None
+
+    result = import_service.import_from_json(write_export(tmp_path, sample_export_data))
+
+    assert result['success'] is True
+    assert export_service.get_export_watermark() is None
+
+
+def test_cancelled_import_rolls_back(db_connection, export_service, import_service, tmp_path):
+    """Test that cancelling a replace import mid-run leaves the data unchanged."""
+    conn = db_connection.get_connection()
+    conn.executemany("INSERT INTO tasks (title) VALUES (?)", [(f"Task {i}",) for i in range(50)])
+    conn.commit()
+    export_path = str(tmp_path / "export.json")
+    assert export_service.export_to_json(export_path)['success'] is True
+    conn.execute("INSERT INTO tasks (title) VALUES ('Added after export')")
+    conn.commit()
+
+    cancel_event = threading.Event()
+
+    def on_progress(message, percent):
+        if percent >= 20:
+            cancel_event.set()
+
+    result = import_service.import_from_json(
+        export_path, merge_mode=False, progress_callback=on_progress, cancel_event=cancel_event
+    )
+
+    assert result == {'success': False, 'cancelled': True, 'error': 'Cancelled'}
+    assert conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 51
+
+
+def test_filtered_export_merges_into_other_database(db_connection, export_service, tmp_path):
+    """Test that one project's filtered export imports on its own into another database."""
+    conn = db_connection.get_connection()
+    conn.executescript("""
+        INSERT INTO contexts (id, name) VALUES (1, '@home');
+        INSERT INTO project_tags (id, name) VALUES (1, 'Alpha'), (2, 'Beta');
+        INSERT INTO tasks (id, title, context_id) VALUES (1, 'Alpha 1', 1), (2, 'Alpha 2', NULL), (3, 'Beta 1', 1);
+        INSERT INTO task_project_tags (task_id, project_tag_id) VALUES (1, 1), (2, 1), (3, 2);
+        INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (2, 1), (1, 3);
+    """)
+    conn.execute("UPDATE tasks SET recurrence_parent_id = 3 WHERE id = 2")
+    conn.commit()
+    export_path = str(tmp_path / "alpha.json")
+    result = export_service.export_to_json(export_path, export_filter=ExportFilter(project_tag_ids=(1,)))
+    assert result['success'] is True
+
+    other = sqlite3.connect(str(tmp_path / "other.db"))
+    try:
+        other.execute("PRAGMA foreign_keys = ON")
+        DatabaseSchema.initialize_database(other)
+        DatabaseSchema.migrate_to_notification_system(other)
+        other.execute("INSERT INTO tasks (title) VALUES ('Existing')")
+        other.commit()
+
+        result = ImportService(other).import_from_json(export_path, merge_mode=True)
+
+        assert result['success'] is True, result.get('error')
+        assert result['task_count'] == 2
+        assert {r[0] for r in other.execute("SELECT title FROM tasks")} == {'Existing', 'Alpha 1', 'Alpha 2'}
+        assert other.execute("SELECT name FROM project_tags").fetchall() == [('Alpha',)]
+        assert other.execute("SELECT COUNT(*) FROM dependencies").fetchone()[0] == 1
+    finally:
+        other.close()
+
+
+def test_filtered_export_merge_reuses_existing_names(db_connection, export_service, tmp_path):
+    """Test that merging reuses a context and project tag the target already has by name."""
+    conn = db_connection.get_connection()
+    conn.executescript("""
+        INSERT INTO contexts (id, name) VALUES (1, '@home');
+        INSERT INTO project_tags (id, name) VALUES (1, 'Alpha');
+        INSERT INTO tasks (id, title, context_id) VALUES (1, 'Alpha 1', 1);
+        INSERT INTO task_project_tags (task_id, project_tag_id) VALUES (1, 1);
+    """)
+    conn.commit()
+    export_path = str(tmp_path / "alpha.json")
+    result = export_service.export_to_json(export_path, export_filter=ExportFilter(project_tag_ids=(1,)))
+    assert result['success'] is True
+
+    other = sqlite3.connect(str(tmp_path / "other.db"))
+    try:
+        other.execute("PRAGMA foreign_keys = ON")
+        DatabaseSchema.initialize_database(other)
+        DatabaseSchema.migrate_to_notification_system(other)
+        other.executescript("""
+            INSERT INTO contexts (id, name) VALUES (1, '@work'), (2, '@home');
+            INSERT INTO project_tags (id, name) VALUES (1, 'Beta'), (2, 'Alpha');
+        """)
+        other.commit()
+
+        result = ImportService(other).import_from_json(export_path, merge_mode=True)
+
+        assert result['success'] is True, result.get('error')
+        assert other.execute("SELECT COUNT(*) FROM contexts").fetchone()[0] == 2
+        assert other.execute("SELECT COUNT(*) FROM project_tags").fetchone()[0] == 2
+        task_id, context_id = other.execute(
+            "SELECT id, context_id FROM tasks WHERE title = 'Alpha 1'"
+        ).fetchone()
+        assert context_id == 2
+        assert other.execute(
+            "SELECT project_tag_id FROM task_project_tags WHERE task_id = ?", (task_id,)
+        ).fetchall() == [(2,)]
+    finally:
+        other.close()
+
+
+def test_delta_chain_applies_deleted_history(db_connection, export_service, import_service, tmp_path):
+    """Test that history rows deleted after an export (comparison reset) are deleted on restore."""
+    from src.services.comparison_service import ComparisonService
+
+    conn = db_connection.get_connection()
+    conn.executemany("INSERT INTO tasks (title, elo_rating) VALUES (?, 1510)", [("A",), ("B",), ("C",)])
+    conn.executemany(
+        "INSERT INTO task_comparisons (winner_task_id, loser_task_id, adjustment_amount) VALUES (?, ?, 1)",
+        [(1, 2), (2, 3)]
+    )
+    conn.executemany("INSERT INTO postpone_history (task_id, reason_type) VALUES (?, 'other')", [(1,), (2,)])
+    conn.commit()
+    files = [str(tmp_path / "full.json")]
+    assert export_service.export_to_json(files[0])['success'] is True
+
+    ComparisonService(db_connection).reset_all_priority_adjustments()
+    conn.execute("DELETE FROM postpone_history WHERE task_id = 2")
+    conn.execute("INSERT INTO task_comparisons (winner_task_id, loser_task_id, adjustment_amount) VALUES (3, 1, 1)")
+    conn.commit()
+    files.append(str(tmp_path / "delta.json"))
+    assert export_service.export_delta(files[1])['success'] is True
+
+    expected = table_rows(conn)
+    expected_postponed = conn.execute("SELECT id FROM postpone_history").fetchall()
+    conn.execute("DELETE FROM tasks")
+    conn.commit()
+
+    result = import_service.import_export_chain(files)
+
+    assert result['success'] is True, result.get('error')
+    assert table_rows(conn) == expected
+    assert [tuple(r) for r in conn.execute("SELECT winner_task_id, loser_task_id FROM task_comparisons")] == [(3, 1)]
+    assert conn.execute("SELECT id FROM postpone_history").fetchall() == expected_postponed
@@ -0,0 +1,116 @@
+"""Unit tests for streaming JSON reading and writing."""
+import gzip
+import io
+import json
+import pytest
+from src.services.json_stream import (
+    FORMAT_JSON, FORMAT_NDJSON, GZIP_MAGIC, JsonStreamWriter, NdjsonStreamWriter,
+    iter_export_members, iter_members, open_export
+)
+
+
+DOCUMENT = {
+    "metadata": {"schema_version": 1, "note": "multi\nline \"quoted\" ünïcode"},
+    "records": [{"id": i, "name": "é" * i, "tags": [i, i + 1]} for i in range(40)],
+    "numbers": [1, 22, 333, 4444, 55555, -6.5e3],
+    "empty": [],
+    "settings": {"key": {"value": "v", "type": "string"}},
+    "count": 12345,
+}
+
+
+def read_document(raw: bytes, chunk_size: int) -> dict:
+    """Read a document back with iter_members, materializing arrays."""
+    result = {}
+    for key, value in iter_members(io.BytesIO(raw), chunk_size=chunk_size):
+        result[key] = value if isinstance(value, (dict, list, str, int, float)) else list(value)
+    return result
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 65536])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_read_across_chunk_boundaries(chunk_size, indent):
+    """Test that values split across reads (including numbers) decode correctly."""
+    raw = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False).encode('utf-8')
+    assert read_document(raw, chunk_size) == DOCUMENT
+
+
+def test_unconsumed_arrays_are_skipped():
+    """Test that advancing past an array without reading it is allowed."""
+    raw = json.dumps(DOCUMENT).encode('utf-8')
+    keys = [key for key, _ in iter_members(io.BytesIO(raw), chunk_size=16)]
+    assert keys == list(DOCUMENT)
+
+
+def test_writer_round_trip():
+    """Test that the writer produces json.dump's layout and compact output."""
+    for compact in (False, True):
+        out = io.StringIO()
+        writer = JsonStreamWriter(out, compact)
+        writer.write_value("metadata", DOCUMENT["metadata"])
+        writer.write_array("records", iter(DOCUMENT["records"]))
+        writer.write_array("empty", iter([]))
+        writer.write_object("settings", iter(DOCUMENT["settings"].items()))
+        writer.close()
+
+        expected = {k: DOCUMENT[k] for k in ("metadata", "records", "empty", "settings")}
+        assert json.loads(out.getvalue()) == expected
+        if not compact:
+            assert out.getvalue() == json.dumps(expected, indent=2, ensure_ascii=False)
+
+
+def test_invalid_document_raises():
+    """Test that truncated input is reported as an error."""
+    raw = json.dumps(DOCUMENT).encode('utf-8')[:-20]
+    with pytest.raises(ValueError):
+        read_document(raw, 64)
+
+
+def write_sections(writer):
+    """Write the common sections of DOCUMENT with a stream writer."""
+    writer.write_value("metadata", DOCUMENT["metadata"])
+    writer.write_array("records", iter(DOCUMENT["records"]))
+    writer.write_array("empty", iter([]))
+    writer.write_object("settings", iter(DOCUMENT["settings"].items()))
+    writer.close()
+
+
+def test_ndjson_round_trip():
+    """Test that NDJSON lines regroup into members (empty arrays are omitted)."""
+    out = io.StringIO()
+    write_sections(NdjsonStreamWriter(out))
+
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 1 + len(DOCUMENT["records"]) + 1
+    assert json.loads(lines[0]) == {"metadata": DOCUMENT["metadata"]}
+
+    result = {}
+    for key, value in iter_export_members(io.BytesIO(out.getvalue().encode('utf-8')), FORMAT_NDJSON):
+        result[key] = value if isinstance(value, dict) else list(value)
+    assert result == {k: DOCUMENT[k] for k in ("metadata", "records", "settings")}
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("export_format", [FORMAT_JSON, FORMAT_NDJSON])
+def test_open_export_detects_format(tmp_path, export_format, compress):
+    """Test that compression and format are detected from the content alone."""
+    out = io.StringIO()
+    if export_format == FORMAT_NDJSON:
+        write_sections(NdjsonStreamWriter(out))
+    else:
+        write_sections(JsonStreamWriter(out))
+    data = out.getvalue().encode('utf-8')
+    if compress:
+        data = gzip.compress(data)
+        assert data.startswith(GZIP_MAGIC)
+
+    filepath = tmp_path / "export.bin"
+    filepath.write_bytes(data)
+
+    stream, raw, detected = open_export(str(filepath))
+    with raw, stream:
+        assert detected == export_format
+        assert (stream is not raw) == compress
+        keys = [key for key, _ in iter_export_members(stream, detected)]
+    assert keys[0] == "metadata"
+    assert "records" in keys
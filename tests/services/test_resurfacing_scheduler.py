@@ -148,6 +148,34 @@ class TestJobConfiguration:
         jobs = scheduler.scheduler.get_jobs()
         assert len(jobs) == 4  # All 4 jobs should still exist
 
+    def test_job_setting_change_reschedules(self, scheduler, settings_dao):
+        """Should reschedule jobs automatically when a job setting changes."""
+        scheduler.start()
+
+        with patch.object(scheduler, '_configure_jobs') as mock_configure:
+            settings_dao.set('someday_review_days', 10, 'integer')
+            settings_dao.set('theme', 'dark', 'string')  # Unrelated setting
+
+        mock_configure.assert_called_once()
+
+    def test_snapshot_job_only_when_enabled(self, scheduler, settings_dao):
+        """Should schedule the snapshot job only while snapshots are enabled."""
+        scheduler.start()
+        assert scheduler.scheduler.get_job('create_snapshot') is None
+
+        settings_dao.set('snapshot_enabled', True, 'boolean')
+
+        assert scheduler.scheduler.get_job('create_snapshot') is not None
+
+    def test_snapshot_job_takes_and_prunes(self, scheduler):
+        """Should take a snapshot and apply retention when the job runs."""
+        with patch.object(scheduler.snapshot_service, 'take_snapshot') as mock_take, \
+                patch.object(scheduler.snapshot_service, 'prune') as mock_prune:
+            scheduler._job_create_snapshot()
+
+        mock_take.assert_called_once()
+        mock_prune.assert_called_once()
+
     def test_reload_settings_when_not_running(self, scheduler, settings_dao):
         """Should not reload if scheduler not running."""
         settings_dao.set('deferred_check_hours', 5, 'integer')
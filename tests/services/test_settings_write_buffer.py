@@ -0,0 +1,136 @@
+"""
+Unit tests for SettingsWriteBuffer.
+
+Tests the write-behind settings layer including:
+- Coalescing repeated writes to the same key
+- Read-your-writes for pending changes
+- Flushing in a single transaction (idle timer and explicit flush)
+- Change notifications after flush
+"""
+
+import pytest
+import sqlite3
+
+from src.database.schema import DatabaseSchema
+from src.database.settings_dao import SettingsDAO
+from src.services.settings_write_buffer import SettingsWriteBuffer
+
+
+@pytest.fixture
+def db_connection():
+    """Create in-memory database for testing."""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    DatabaseSchema.initialize_database(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def write_buffer(qapp, db_connection):
+    """Create a buffer with a long delay so tests control flushing."""
+    buffer = SettingsWriteBuffer(SettingsDAO(db_connection), delay_ms=60000)
+    yield buffer
+    buffer.flush()
+
+
+def stored_value(db_connection, key):
+    """Read a setting straight from the table, bypassing every cache."""
+    row = db_connection.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+class TestSettingsWriteBuffer:
+    """Tests for buffered settings writes."""
+
+    def test_writes_are_deferred_until_flush(self, write_buffer, db_connection):
+        """Test that nothing is written before the buffer flushes."""
+        write_buffer.set('task_list.search_text', 'abc', 'string')
+
+        assert write_buffer.has_pending
+        assert stored_value(db_connection, 'task_list.search_text') is None
+
+        write_buffer.flush()
+
+        assert not write_buffer.has_pending
+        assert stored_value(db_connection, 'task_list.search_text') == 'abc'
+
+    def test_pending_values_are_readable(self, write_buffer):
+        """Test that get() sees pending sets and deletes."""
+        write_buffer.set('task_list.tag_filters', [1, 2], 'json')
+        assert write_buffer.get('task_list.tag_filters') == [1, 2]
+
+        write_buffer.delete('task_list.tag_filters')
+        assert write_buffer.get('task_list.tag_filters', []) == []
+
+    def test_keystrokes_coalesce_into_one_transaction(self, write_buffer, db_connection):
+        """Test that many changes produce a single commit with the last values."""
+        SettingsDAO(db_connection).set('task_list.context_filters', [1], 'json')
+
+        for text in ('a', 'ab', 'abc', 'abcd'):
+            write_buffer.set('task_list.search_text', text, 'string')
+            write_buffer.set('task_list.hide_dependencies', True, 'boolean')
+        write_buffer.delete('task_list.context_filters')
+
+        statements = []
+        db_connection.set_trace_callback(statements.append)
+        write_buffer.flush()
+        db_connection.set_trace_callback(None)
+
+        writes = [s for s in statements if s.strip().startswith(('INSERT', 'DELETE'))]
+        assert len(writes) == 3
+        assert len([s for s in statements if s.startswith('BEGIN')]) == 1
+        assert stored_value(db_connection, 'task_list.search_text') == 'abcd'
+        assert stored_value(db_connection, 'task_list.context_filters') is None
+
+    def test_idle_timer_flushes(self, qtbot, db_connection):
+        """Test that pending writes are flushed after the idle delay."""
+        buffer = SettingsWriteBuffer(SettingsDAO(db_connection), delay_ms=10)
+        buffer.set('focus_mode.tag_filters', [3], 'json')
+
+        qtbot.waitUntil(lambda: not buffer.has_pending, timeout=1000)
+
+        assert stored_value(db_connection, 'focus_mode.tag_filters') == '[3]'
+
+    def test_flush_all_writes_every_dirty_buffer(self, qapp, db_connection):
+        """Test that flush_all() writes buffers nobody else references."""
+        SettingsWriteBuffer.for_connection(db_connection).set('theme', 'dark', 'string')
+
+        SettingsWriteBuffer.flush_all()
+
+        assert stored_value(db_connection, 'theme') == 'dark'
+
+    def test_for_connection_returns_shared_buffer(self, qapp, db_connection):
+        """Test that widgets on the same connection share one buffer."""
+        first = SettingsWriteBuffer.for_connection(db_connection)
+        assert SettingsWriteBuffer.for_connection(db_connection) is first
+
+    def test_flush_notifies_listeners(self, write_buffer):
+        """Test that listeners hear about buffered changes once they are written."""
+        seen = []
+
+        def on_change(key):
+            seen.append(key)
+
+        SettingsDAO.add_listener(on_change, keys=['theme'])
+        try:
+            write_buffer.set('theme', 'dark', 'string')
+            assert seen == []
+            write_buffer.flush()
+        finally:
+            SettingsDAO.remove_listener(on_change)
+
+        assert seen == ['theme']
+        assert write_buffer.settings_dao.get('theme') == 'dark'
+
+    def test_flush_on_closed_connection_is_reported(self, qapp):
+        """Test that flush_all() does not raise for a closed database."""
+        conn = sqlite3.connect(":memory:")
+        DatabaseSchema.initialize_database(conn)
+        buffer = SettingsWriteBuffer.for_connection(conn)
+        buffer.set('theme', 'dark', 'string')
+        conn.close()
+
+        SettingsWriteBuffer.flush_all()
+
+        assert not buffer.has_pending
@@ -0,0 +1,147 @@
+"""Unit tests for SnapshotService."""
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.services.snapshot_service import (
+    SnapshotError, SnapshotInfo, SnapshotService, select_retained_snapshots
+)
+
+
+@pytest.fixture
+def snapshot_service(test_db, tmp_path):
+    """Create SnapshotService with a store in a temporary directory."""
+    return SnapshotService(test_db, str(tmp_path / "snapshots"))
+
+
+@pytest.fixture
+def populated_db(test_db):
+    """Fill the database with enough tasks to span many chunks."""
+    test_db.executemany(
+        "INSERT INTO tasks (title, description) VALUES (?, ?)",
+        [(f"Task {i}", f"Description {i} " * 50) for i in range(3000)]
+    )
+    test_db.commit()
+    return test_db
+
+
+def make_snapshot(snapshot_id, created_at):
+    return SnapshotInfo(snapshot_id, created_at, "/data/tasks.db", 0, 0, 0)
+
+
+def test_consecutive_snapshots_share_unchanged_chunks(snapshot_service, populated_db):
+    """Test that a small change only adds the chunks it touched."""
+    first = snapshot_service.take_snapshot()
+    store_size = snapshot_service.get_store_size()
+
+    populated_db.execute("UPDATE tasks SET title = 'Changed' WHERE id = 1500")
+    populated_db.commit()
+    second = snapshot_service.take_snapshot()
+
+    assert second.id != first.id
+    assert second.chunk_count == first.chunk_count > 10
+    assert 0 < second.added_bytes < first.added_bytes / 5
+    assert snapshot_service.get_store_size() < store_size * 1.3
+    assert [s.id for s in snapshot_service.list_snapshots()] == [second.id, first.id]
+
+
+def test_unchanged_database_reuses_last_snapshot(snapshot_service, populated_db):
+    """Test that no snapshot is stored if nothing changed."""
+    first = snapshot_service.take_snapshot()
+    second = snapshot_service.take_snapshot()
+
+    assert second == first
+    assert len(snapshot_service.list_snapshots()) == 1
+
+
+def test_restore_rebuilds_snapshot(snapshot_service, populated_db, tmp_path):
+    """Test that a restored snapshot holds the data at snapshot time."""
+    snapshot = snapshot_service.take_snapshot()
+    populated_db.execute("DELETE FROM tasks WHERE id > 100")
+    populated_db.commit()
+
+    restored_path = tmp_path / "restored.db"
+    assert snapshot_service.restore(snapshot.id, str(restored_path)) == str(restored_path)
+
+    restored = sqlite3.connect(restored_path)
+    try:
+        assert restored.execute("PRAGMA integrity_check").fetchone()[0] == 'ok'
+        assert restored.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 3000
+    finally:
+        restored.close()
+
+
+def test_restore_detects_damaged_chunk(snapshot_service, populated_db, tmp_path):
+    """Test that a corrupted chunk fails the restore without leaving a file."""
+    snapshot = snapshot_service.take_snapshot()
+    chunk = next((snapshot_service.store_dir / "chunks").glob("*/*"))
+    chunk.write_bytes(b"garbage")
+
+    restored_path = tmp_path / "restored.db"
+    with pytest.raises(SnapshotError):
+        snapshot_service.restore(snapshot.id, str(restored_path))
+    assert not restored_path.exists()
+    assert not (tmp_path / "restored.db.partial").exists()
+
+
+def test_prune_deletes_unreferenced_chunks(snapshot_service, populated_db):
+    """Test that pruning removes old snapshots and chunks only they used."""
+    snapshot_service.take_snapshot()
+    populated_db.execute("UPDATE tasks SET title = 'Changed' WHERE id = 1")
+    populated_db.commit()
+    latest = snapshot_service.take_snapshot()
+    store_size = snapshot_service.get_store_size()
+
+    assert snapshot_service.prune(keep_hourly=0, keep_daily=0, keep_weekly=0) == 1
+
+    assert snapshot_service.list_snapshots() == [latest]
+    assert snapshot_service.get_store_size() < store_size
+    chunk_files = list((snapshot_service.store_dir / "chunks").glob("*/*"))
+    assert len(chunk_files) == len(set(snapshot_service._read_manifest(latest.id)['chunks']))
+
+
+def test_prune_keeps_chunks_if_a_manifest_is_unreadable(snapshot_service, populated_db, tmp_path):
+    """Test that chunk cleanup is skipped rather than orphaning an unreadable snapshot."""
+    first = snapshot_service.take_snapshot()
+    populated_db.execute("UPDATE tasks SET title = 'Changed' WHERE id = 1")
+    populated_db.commit()
+    snapshot_service.take_snapshot()
+
+    manifest_path = snapshot_service.store_dir / "manifests" / f"{first.id}.json"
+    manifest_text = manifest_path.read_text(encoding='utf-8')
+    manifest_path.write_text("{", encoding='utf-8')
+    chunk_files = set((snapshot_service.store_dir / "chunks").glob("*/*"))
+
+    snapshot_service.prune(keep_hourly=0, keep_daily=0, keep_weekly=0)
+
+    assert set((snapshot_service.store_dir / "chunks").glob("*/*")) == chunk_files
+    manifest_path.write_text(manifest_text, encoding='utf-8')
+    restored_path = tmp_path / "restored.db"
+    assert snapshot_service.restore(first.id, str(restored_path)) == str(restored_path)
+
+
+def test_retention_keeps_latest_per_period():
+    """Test hourly, daily and weekly retention."""
+    now = datetime(2024, 3, 15, 12, 30)
+    snapshots = [
+        make_snapshot(f"h{i}", now - timedelta(minutes=20 * i)) for i in range(72 * 3)
+    ]
+
+    kept = select_retained_snapshots(snapshots, keep_hourly=3, keep_daily=2, keep_weekly=0)
+    kept_times = sorted((s.created_at for s in snapshots if s.id in kept), reverse=True)
+
+    assert kept_times == [
+        datetime(2024, 3, 15, 12, 30),  # Latest; newest of 12:00 and of March 15
+        datetime(2024, 3, 15, 11, 50),
+        datetime(2024, 3, 15, 10, 50),
+        datetime(2024, 3, 14, 23, 50),  # Newest of March 14
+    ]
+
+
+def test_retention_always_keeps_latest():
+    """Test that the newest snapshot survives a policy keeping nothing."""
+    snapshots = [make_snapshot("old", datetime(2024, 1, 1)), make_snapshot("new", datetime(2024, 2, 1))]
+
+    assert select_retained_snapshots(snapshots, 0, 0, 0) == {"new"}
+    assert select_retained_snapshots([], 1, 1, 1) == set()
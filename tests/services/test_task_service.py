@@ -252,6 +252,171 @@ class TestFocusMode:
         assert high_idx < low_idx
 
 
+class TestFocusSnapshot:
+    """Test single-snapshot focus evaluation."""
+
+    def test_snapshot_contains_focus_task_and_counts(self, task_service):
+        """Test that one evaluation returns the focus task and state counts."""
+        task_service.create_task(Task(title="Low", base_priority=1, comparison_count=1))
+        high = task_service.create_task(Task(title="High", base_priority=3, comparison_count=1))
+
+        snapshot = task_service.evaluate_focus()
+
+        assert snapshot.focus_task.id == high.id
+        assert snapshot.tied_tasks == []
+        assert not snapshot.has_new_tasks
+        assert snapshot.state_counts['active'] == 2
+        assert len(snapshot.active_tasks) == 2
+
+    def test_snapshot_reports_new_task_band(self, task_service):
+        """Test that unranked tasks are reported with their highest band."""
+        task_service.create_task(Task(title="Ranked", base_priority=3, comparison_count=2))
+        new_medium = task_service.create_task(Task(title="New medium", base_priority=2))
+        new_low = task_service.create_task(Task(title="New low", base_priority=1))
+
+        snapshot = task_service.evaluate_focus()
+
+        assert snapshot.has_new_tasks
+        assert snapshot.new_task_band == 2
+        assert [t.id for t in snapshot.new_tasks] == [new_medium.id]
+        assert new_low.id in [t.id for t in snapshot.active_tasks]
+
+        assert not task_service.evaluate_focus(check_new_tasks=False).has_new_tasks
+
+    def test_snapshot_reports_ties(self, task_service):
+        """Test that tied tasks come back in the same snapshot."""
+        first = task_service.create_task(Task(title="First", base_priority=2))
+        second = task_service.create_task(Task(title="Second", base_priority=2))
+
+        snapshot = task_service.evaluate_focus()
+
+        assert snapshot.focus_task is None
+        assert {t.id for t in snapshot.tied_tasks} == {first.id, second.id}
+
+    def test_snapshot_loads_tasks_once(self, task_service, monkeypatch):
+        """Test that a refresh hydrates tasks at most once."""
+        task_service.create_task(Task(title="Task", base_priority=2))
+
+        calls = []
+        original = task_service.task_dao.get_all
+        monkeypatch.setattr(
+            task_service.task_dao, 'get_all',
+            lambda *args, **kwargs: (calls.append(1), original(*args, **kwargs))[1]
+        )
+
+        task_service.evaluate_focus()
+        assert len(calls) == 1
+
+        task_service.evaluate_focus()
+        assert len(calls) == 1
+
+
+class TestRankingIndexSync:
+    """Test that the Focus Mode ranking index follows database changes."""
+
+    def test_direct_dao_update_applied_incrementally(self, task_service, db_connection, monkeypatch):
+        """Test that changes made outside the service update the index without a full reload."""
+        low = task_service.create_task(Task(title="Low", base_priority=1))
+        high = task_service.create_task(Task(title="High", base_priority=3))
+        assert task_service.get_focus_task().id == high.id
+
+        def fail_get_all(*args, **kwargs):
+            raise AssertionError("index should not reload all tasks")
+        monkeypatch.setattr(task_service.task_dao, 'get_all', fail_get_all)
+
+        dao = TaskDAO(db_connection.get_connection())
+        low.base_priority = 3
+        low.elo_rating = 1800.0
+        dao.update(low)
+
+        assert task_service.get_focus_task().id == low.id
+
+    def test_completed_blocker_unblocks_dependent(self, task_service, db_connection):
+        """Test that completing a blocker re-evaluates its dependents."""
+        from src.database.dependency_dao import DependencyDAO
+        from src.models.dependency import Dependency
+
+        blocker = task_service.create_task(Task(title="Blocker", base_priority=1))
+        blocked = task_service.create_task(Task(title="Blocked", base_priority=3))
+        DependencyDAO(db_connection.get_connection()).create(
+            Dependency(blocked_task_id=blocked.id, blocking_task_id=blocker.id)
+        )
+        assert task_service.get_focus_task().id == blocker.id
+
+        task_service.complete_task(blocker.id)
+
+        assert task_service.get_focus_task().id == blocked.id
+
+    def test_deleted_task_removed(self, task_service):
+        """Test that deleted tasks drop out of the index."""
+        keep = task_service.create_task(Task(title="Keep", base_priority=1))
+        gone = task_service.create_task(Task(title="Gone", base_priority=3))
+        assert task_service.get_focus_task().id == gone.id
+
+        task_service.delete_task(gone.id)
+
+        assert task_service.get_focus_task().id == keep.id
+        assert gone.id not in task_service.get_ranking_index()
+
+
+class TestDependencyMetrics:
+    """Test dependency metrics and the unblock-count tiebreaker."""
+
+    def add_dependency(self, db_connection, blocked, blocking):
+        from src.database.dependency_dao import DependencyDAO
+        DependencyDAO(db_connection.get_connection()).add_dependency(blocked.id, blocking.id)
+
+    def test_metrics_follow_state_changes(self, task_service, db_connection):
+        """Test that completing a task in the graph updates the metrics."""
+        first = task_service.create_task(Task(title="First"))
+        second = task_service.create_task(Task(title="Second"))
+        third = task_service.create_task(Task(title="Third"))
+        self.add_dependency(db_connection, second, first)
+        self.add_dependency(db_connection, third, second)
+
+        metrics = task_service.get_dependency_metrics()
+        assert metrics[third.id].depth == 2
+        assert metrics[first.id].unblock_count == 1
+
+        task_service.complete_task(first.id)
+
+        metrics = task_service.get_dependency_metrics()
+        assert metrics[third.id].depth == 1
+        assert metrics[second.id].unblock_count == 1
+
+    def test_unrelated_changes_keep_cached_metrics(self, task_service, db_connection, monkeypatch):
+        """Test that editing a task outside the graph does not recompute the metrics."""
+        blocker = task_service.create_task(Task(title="Blocker"))
+        blocked = task_service.create_task(Task(title="Blocked"))
+        other = task_service.create_task(Task(title="Other"))
+        self.add_dependency(db_connection, blocked, blocker)
+        metrics = task_service.get_dependency_metrics()
+
+        def fail_analysis(*args, **kwargs):
+            raise AssertionError("metrics should not be recomputed")
+        monkeypatch.setattr('src.services.task_service.analyze_dependencies', fail_analysis)
+
+        other.title = "Other (edited)"
+        task_service.update_task(other)
+
+        assert task_service.get_dependency_metrics() is metrics
+
+    def test_unblock_count_breaks_focus_tie(self, task_service, db_connection):
+        """Test that the tied task unblocking other work becomes the focus task."""
+        plain = task_service.create_task(Task(title="Plain", base_priority=2))
+        key = task_service.create_task(Task(title="Key", base_priority=2))
+        waiting = task_service.create_task(Task(title="Waiting", base_priority=1))
+        assert task_service.get_focus_task() is None
+
+        self.add_dependency(db_connection, waiting, key)
+
+        snapshot = task_service.evaluate_focus(check_new_tasks=False)
+        assert snapshot.focus_task.id == key.id
+        assert snapshot.tied_tasks == []
+        assert task_service.get_focus_task().id == key.id
+        assert task_service.get_tied_tasks() == []
+
+
 class TestStateTransitions:
     """Test task state transitions."""
 
@@ -506,3 +671,59 @@ class TestPriorityReset:
         result = task_service.reset_priority_adjustment(99999)
 
         assert result is None
+
+
+class TestChangeLogCompaction:
+    """Test compaction of the task change log."""
+
+    def log_size(self, db_connection):
+        return db_connection.get_connection().execute("SELECT COUNT(*) FROM task_changes").fetchone()[0]
+
+    def test_compaction_keeps_rows_readers_need(self, task_service, db_connection):
+        """Test that rows after the export watermark and the ranking index position survive."""
+        from src.database.settings_dao import SettingsDAO
+        from src.services.export_service import ExportService
+        from src.services.task_service import TaskService
+
+        tasks = [task_service.create_task(Task(title=f"Task {i}")) for i in range(5)]
+        watermark_seq = task_service.task_dao.get_change_seq()
+        SettingsDAO(db_connection.get_connection()).set(
+            ExportService.WATERMARK_SETTING, {'task_changes': watermark_seq}, 'json'
+        )
+
+        for task in tasks:
+            task.title += " (edited)"
+            task_service.update_task(task)
+        task_service.get_ranking_index()
+        for task in tasks[:2]:
+            task_service.complete_task(task.id)
+
+        # Another reader synchronized before the watermark holds compaction back
+        reader = TaskService(db_connection)
+        reader._ranking_seq = 2
+        reader_changes = task_service.task_dao.get_changed_task_ids(2)
+        task_service.compact_change_log()
+        assert task_service.task_dao.get_changed_task_ids(2) == reader_changes
+        del reader
+
+        task_service.compact_change_log()
+
+        # Only tasks changed after the watermark remain, one row each
+        assert self.log_size(db_connection) == 5
+        assert task_service.task_dao.get_changed_task_ids(watermark_seq) == {t.id for t in tasks}
+
+        # The ranking index keeps following changes after compaction
+        task_service.complete_task(tasks[2].id)
+        assert tasks[2].id not in task_service.get_ranking_index()
+
+    def test_compaction_without_watermark_collapses_per_task(self, task_service, db_connection):
+        """Test that without an export watermark every task keeps its latest row."""
+        tasks = [task_service.create_task(Task(title=f"Task {i}")) for i in range(4)]
+        for task in tasks:
+            task_service.complete_task(task.id)
+        task_service.get_ranking_index()
+
+        task_service.compact_change_log()
+
+        assert self.log_size(db_connection) == len(tasks)
+        assert task_service.task_dao.get_changed_task_ids(0) == {t.id for t in tasks}
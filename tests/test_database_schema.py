@@ -203,3 +203,97 @@ class TestDatabaseSchema:
         # Verify association is gone
         cursor.execute("SELECT * FROM task_project_tags WHERE task_id = ?", (task_id,))
         assert cursor.fetchone() is None
+
+    def test_run_migrations_on_new_database(self, db_connection):
+        """Test that a fresh database is migrated to the current version."""
+        version = DatabaseSchema.run_migrations(db_connection)
+
+        assert version == DatabaseSchema.CURRENT_VERSION
+        assert DatabaseSchema.get_schema_version(db_connection) == DatabaseSchema.CURRENT_VERSION
+
+        cursor = db_connection.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = {row[0] for row in cursor.fetchall()}
+        assert {'tasks', 'settings', 'task_history', 'notifications'}.issubset(tables)
+
+    def test_current_version_matches_migration_registry(self):
+        """Test that CURRENT_VERSION is the last registered migration."""
+        versions = [version for version, _, _ in DatabaseSchema.get_migrations()]
+
+        assert versions == sorted(versions)
+        assert len(versions) == len(set(versions))
+        assert versions[-1] == DatabaseSchema.CURRENT_VERSION
+
+    def test_run_migrations_skips_work_when_current(self, db_connection, monkeypatch):
+        """Test that a current database only performs the version check."""
+        DatabaseSchema.run_migrations(db_connection)
+
+        def fail(_conn):
+            raise AssertionError("migration should not run")
+
+        monkeypatch.setattr(
+            DatabaseSchema, 'get_migrations',
+            staticmethod(lambda: [(v, str(v), fail) for v in range(1, DatabaseSchema.CURRENT_VERSION + 1)])
+        )
+
+        assert DatabaseSchema.run_migrations(db_connection) == DatabaseSchema.CURRENT_VERSION
+
+    def test_run_migrations_only_runs_pending_steps(self, db_connection, monkeypatch):
+        """Test that only steps newer than the stored version are applied."""
+        DatabaseSchema.initialize_database(db_connection)
+        DatabaseSchema.set_schema_version(db_connection, 2)
+
+        applied = []
+        monkeypatch.setattr(
+            DatabaseSchema, 'get_migrations',
+            staticmethod(lambda: [(v, str(v), lambda conn, v=v: applied.append(v)) for v in (1, 2, 3, 4)])
+        )
+
+        DatabaseSchema.run_migrations(db_connection)
+
+        assert applied == [3, 4]
+        assert DatabaseSchema.get_schema_version(db_connection) == 4
+
+    def test_search_index_built_for_existing_tasks(self, db_connection):
+        """Test that creating the search index indexes tasks that already exist."""
+        DatabaseSchema.initialize_database(db_connection)
+        db_connection.execute("DROP TABLE tasks_fts")
+        for trigger in ('tasks_fts_insert', 'tasks_fts_delete', 'tasks_fts_update'):
+            db_connection.execute(f"DROP TRIGGER {trigger}")
+        db_connection.execute("INSERT INTO tasks (title) VALUES ('Existing task')")
+        db_connection.commit()
+
+        assert DatabaseSchema.create_search_index(db_connection) is True
+
+        rows = db_connection.execute(
+            "SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH 'existing'"
+        ).fetchall()
+        assert len(rows) == 1
+
+    def test_change_log_records_task_writes(self, db_connection):
+        """Test that task, dependency and tag writes are logged in task_changes."""
+        DatabaseSchema.initialize_database(db_connection)
+        cursor = db_connection.cursor()
+        cursor.execute("INSERT INTO tasks (title) VALUES ('Task 1')")
+        first = cursor.lastrowid
+        cursor.execute("INSERT INTO tasks (title) VALUES ('Task 2')")
+        second = cursor.lastrowid
+        cursor.execute("UPDATE tasks SET title = 'Renamed' WHERE id = ?", (first,))
+        cursor.execute(
+            "INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (?, ?)",
+            (second, first)
+        )
+        cursor.execute("DELETE FROM tasks WHERE id = ?", (first,))
+        db_connection.commit()
+
+        rows = [
+            tuple(row) for row in
+            cursor.execute("SELECT task_id, operation FROM task_changes ORDER BY seq")
+        ]
+        assert rows[:4] == [
+            (first, 'insert'),
+            (second, 'insert'),
+            (first, 'update'),
+            (second, 'update'),
+        ]
+        assert (first, 'delete') in rows
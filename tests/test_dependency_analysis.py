@@ -0,0 +1,139 @@
+"""
+Unit tests for dependency graph analysis.
+"""
+
+import random
+import time
+from src.algorithms.dependency_analysis import analyze_dependencies, DependencyMetrics, NO_DEPENDENCIES
+from src.algorithms.ranking import break_ties_by_unblock_count, resolve_focus_task, select_tied_tier
+from src.models.task import Task
+
+
+def brute_force_metrics(edges, completed_ids):
+    """Metrics by explicit upstream sets (for comparison)."""
+    blockers = {}
+    nodes = set()
+    for blocked, blocking in edges:
+        blockers.setdefault(blocked, set()).add(blocking)
+        nodes.update((blocked, blocking))
+
+    def upstream(task_id):
+        found, stack = set(), list(blockers.get(task_id, ()))
+        while stack:
+            current = stack.pop()
+            if current not in found:
+                found.add(current)
+                stack.extend(blockers.get(current, ()))
+        return {t for t in found if t not in completed_ids}
+
+    def depth(task_id):
+        return max(
+            (depth(b) + (0 if b in completed_ids else 1) for b in blockers.get(task_id, ())),
+            default=0
+        )
+
+    upstreams = {task_id: upstream(task_id) for task_id in nodes}
+    return {
+        task_id: DependencyMetrics(
+            blocked=bool(upstreams[task_id]),
+            depth=depth(task_id),
+            unblock_count=sum(
+                1 for other, ups in upstreams.items()
+                if ups == {task_id} and other not in completed_ids
+            )
+        )
+        for task_id in nodes
+    }
+
+
+class TestAnalyzeDependencies:
+    """Tests for analyze_dependencies."""
+
+    def test_chain(self):
+        """Depth grows along a chain; only the head of the chain unblocks anything"""
+        # 3 blocked by 2, 2 blocked by 1
+        metrics = analyze_dependencies([(3, 2), (2, 1)], completed_ids=set())
+
+        assert metrics[1] == DependencyMetrics(blocked=False, depth=0, unblock_count=1)
+        assert metrics[2] == DependencyMetrics(blocked=True, depth=1, unblock_count=0)
+        assert metrics[3] == DependencyMetrics(blocked=True, depth=2, unblock_count=0)
+
+    def test_completed_blocker_is_transparent(self):
+        """A task stays blocked by work upstream of an already completed blocker"""
+        metrics = analyze_dependencies([(3, 2), (2, 1)], completed_ids={2})
+
+        assert metrics[3].blocked
+        assert metrics[3].depth == 1
+        assert metrics[1].unblock_count == 1  # Task 3 (task 2 is completed)
+
+    def test_shared_blockers(self):
+        """A task with two incomplete blockers is not unblocked by either alone"""
+        metrics = analyze_dependencies([(3, 1), (3, 2), (4, 1)], completed_ids=set())
+
+        assert metrics[1].unblock_count == 1  # Only task 4
+        assert metrics[2].unblock_count == 0
+
+        metrics = analyze_dependencies([(3, 1), (3, 2), (4, 1)], completed_ids={2})
+        assert metrics[1].unblock_count == 2
+
+    def test_cycle_is_reported_blocked(self):
+        """Tasks in a cycle are blocked and unblocked by no single task"""
+        metrics = analyze_dependencies([(1, 2), (2, 1), (3, 1)], completed_ids=set())
+
+        assert metrics[1].blocked and metrics[2].blocked and metrics[3].blocked
+        assert all(m.unblock_count == 0 for m in metrics.values())
+
+    def test_tasks_without_dependencies_are_absent(self):
+        """Only tasks in the graph get entries"""
+        metrics = analyze_dependencies([(2, 1)], completed_ids=set())
+        assert set(metrics) == {1, 2}
+        assert NO_DEPENDENCIES == DependencyMetrics()
+
+    def test_random_graphs_match_brute_force(self):
+        """Random DAGs agree with explicit upstream sets"""
+        rng = random.Random(5)
+        for _ in range(30):
+            edges = set()
+            for _ in range(rng.randint(1, 40)):
+                blocking, blocked = sorted(rng.sample(range(1, 25), 2))
+                edges.add((blocked, blocking))
+            completed = {t for t in range(1, 25) if rng.random() < 0.3}
+
+            assert analyze_dependencies(edges, completed) == brute_force_metrics(edges, completed)
+
+    def test_large_graph_is_fast(self):
+        """Tens of thousands of edges are analyzed in well under a second"""
+        rng = random.Random(1)
+        edges = [(i, rng.randint(max(1, i - 50), i - 1)) for i in range(2, 40000)]
+        edges += [(i, rng.randint(1, i - 1)) for i in range(2, 20000)]
+
+        start = time.perf_counter()
+        metrics = analyze_dependencies(edges, completed_ids=set(range(1, 40000, 3)))
+        elapsed = time.perf_counter() - start
+
+        assert len(metrics) == 39999
+        assert elapsed < 2.0
+
+
+class TestUnblockTiebreaker:
+    """Tests for the unblock-count tiebreaker in ranking."""
+
+    def make_tied(self):
+        return [Task(id=i, title=f"Task {i}", base_priority=2) for i in (1, 2, 3)]
+
+    def test_unique_best_wins(self):
+        """The task unblocking the most work settles the tie"""
+        tasks = self.make_tied()
+        counts = {2: 3, 3: 1}
+
+        assert resolve_focus_task(tasks, counts) is tasks[1]
+        assert select_tied_tier(tasks, counts) == []
+
+    def test_shared_best_still_needs_comparison(self):
+        """Equal top unblock counts leave the tie for a comparison"""
+        tasks = self.make_tied()
+        counts = {1: 2, 2: 2}
+
+        assert resolve_focus_task(tasks, counts) is None
+        assert select_tied_tier(tasks, counts) == tasks
+        assert break_ties_by_unblock_count(tasks, None) == tasks
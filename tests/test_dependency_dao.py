@@ -146,6 +146,27 @@ class TestDependencyDAO:
         blocked_ids = {d.blocked_task_id for d in deps}
         assert blocked_ids == {task2.id, task3.id}
 
+    def test_get_blocker_map(self, dependency_dao, task_dao):
+        """Test loading the full blocked -> blockers map with titles."""
+        task1 = task_dao.create(Task(title="Task 1"))
+        task2 = task_dao.create(Task(title="Task 2"))
+        task3 = task_dao.create(Task(title="Task 3"))
+
+        dependency_dao.create(Dependency(blocked_task_id=task3.id, blocking_task_id=task1.id))
+        dependency_dao.create(Dependency(blocked_task_id=task3.id, blocking_task_id=task2.id))
+        dependency_dao.create(Dependency(blocked_task_id=task2.id, blocking_task_id=task1.id))
+
+        blocker_map = dependency_dao.get_blocker_map()
+
+        assert blocker_map == {
+            task3.id: [(task1.id, "Task 1"), (task2.id, "Task 2")],
+            task2.id: [(task1.id, "Task 1")],
+        }
+
+    def test_get_blocker_map_empty(self, dependency_dao):
+        """Test that the blocker map is empty without dependencies."""
+        assert dependency_dao.get_blocker_map() == {}
+
     def test_delete_dependency(self, dependency_dao, task_dao):
         """Test deleting a dependency."""
         task1 = task_dao.create(Task(title="Task 1"))
@@ -189,3 +210,56 @@ class TestDependencyDAO:
         assert "Dependency" in repr(dep)
         assert "blocked=2" in repr(dep)
         assert "blocking=1" in repr(dep)
+
+
+class TestDependencyGraphCache:
+    """Tests for the cached dependency graph behind cycle checks."""
+
+    def test_transitive_ids(self, dependency_dao, task_dao):
+        """Test transitive blocker and dependent queries."""
+        t1, t2, t3 = (task_dao.create(Task(title=f"Task {i}")) for i in range(1, 4))
+        dependency_dao.add_dependency(t3.id, t2.id)
+        dependency_dao.add_dependency(t2.id, t1.id)
+
+        assert dependency_dao.get_transitive_blocker_ids(t3.id) == {t1.id, t2.id}
+        assert dependency_dao.get_transitive_dependent_ids(t1.id) == {t2.id, t3.id}
+
+    def test_cycle_check_uses_single_queries(self, dependency_dao, task_dao, db_connection):
+        """Test that cycle checks on a long chain do not query per visited task."""
+        tasks = [task_dao.create(Task(title=f"Task {i}")) for i in range(50)]
+        for blocked, blocking in zip(tasks, tasks[1:]):
+            dependency_dao.add_dependency(blocked.id, blocking.id)
+
+        statements = []
+        db_connection.set_trace_callback(statements.append)
+        with pytest.raises(ValueError, match="circular"):
+            dependency_dao.add_dependency(tasks[-1].id, tasks[0].id)
+        db_connection.set_trace_callback(None)
+
+        assert len([s for s in statements if 'FROM dependencies' in s]) == 1
+
+    def test_graph_reloads_after_raw_sql_writes(self, dependency_dao, task_dao, db_connection):
+        """Test that writes bypassing the DAO (imports, resets) are picked up."""
+        t1, t2 = task_dao.create(Task(title="Task 1")), task_dao.create(Task(title="Task 2"))
+        dependency_dao.add_dependency(t2.id, t1.id)
+        assert dependency_dao.get_transitive_blocker_ids(t2.id) == {t1.id}
+
+        db_connection.execute("DELETE FROM dependencies")
+        db_connection.execute(
+            "INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (?, ?)",
+            (t1.id, t2.id)
+        )
+        db_connection.commit()
+
+        assert dependency_dao.get_transitive_blocker_ids(t2.id) == set()
+        with pytest.raises(ValueError, match="circular"):
+            dependency_dao.add_dependency(t2.id, t1.id)
+
+    def test_graph_follows_task_deletion(self, dependency_dao, task_dao):
+        """Test that cascading deletes of dependencies are picked up."""
+        t1, t2 = task_dao.create(Task(title="Task 1")), task_dao.create(Task(title="Task 2"))
+        dependency_dao.add_dependency(t2.id, t1.id)
+
+        task_dao.delete(t1.id)
+
+        assert dependency_dao.get_transitive_blocker_ids(t2.id) == set()
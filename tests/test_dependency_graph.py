@@ -0,0 +1,94 @@
+"""
+Unit tests for the in-memory dependency graph.
+"""
+
+import random
+from src.algorithms.dependency_graph import DependencyGraph
+
+
+def brute_force_blockers(edges, task_id):
+    """Transitive blockers by plain search over the edge list."""
+    found = set()
+    frontier = [task_id]
+    while frontier:
+        current = frontier.pop()
+        for blocked, blocking in edges:
+            if blocked == current and blocking not in found:
+                found.add(blocking)
+                frontier.append(blocking)
+    return found
+
+
+class TestDependencyGraph:
+    """Tests for reachability queries and incremental updates."""
+
+    def test_transitive_blockers_and_dependents(self):
+        """Chains and diamonds are followed in both directions"""
+        graph = DependencyGraph([(1, 2), (2, 3), (1, 4), (4, 3)])
+
+        assert graph.get_transitive_blockers(1) == {2, 3, 4}
+        assert graph.get_transitive_dependents(3) == {1, 2, 4}
+        assert graph.get_blockers(1) == {2, 4}
+        assert graph.get_dependents(2) == {1}
+
+    def test_would_create_cycle(self):
+        """Adding a blocker that already depends on the task is a cycle"""
+        graph = DependencyGraph([(1, 2), (2, 3)])
+
+        assert graph.would_create_cycle(3, 1)
+        assert graph.would_create_cycle(1, 1)
+        assert not graph.would_create_cycle(1, 3)
+
+    def test_add_extends_memoized_sets(self):
+        """Memoized sets include blockers added later"""
+        graph = DependencyGraph([(1, 2)])
+        assert graph.get_transitive_blockers(1) == {2}
+        assert graph.get_transitive_dependents(2) == {1}
+
+        graph.add(2, 3)
+
+        assert graph.get_transitive_blockers(1) == {2, 3}
+        assert graph.get_transitive_dependents(3) == {1, 2}
+        assert (2, 3) in graph
+
+    def test_remove_keeps_alternative_paths(self):
+        """Removing one of two paths keeps the task reachable"""
+        graph = DependencyGraph([(1, 2), (2, 3), (1, 3)])
+        assert graph.get_transitive_blockers(1) == {2, 3}
+
+        graph.remove(1, 3)
+        assert graph.get_transitive_blockers(1) == {2, 3}
+
+        graph.remove(2, 3)
+        assert graph.get_transitive_blockers(1) == {2}
+        assert len(graph) == 1
+
+    def test_deep_chain(self):
+        """Very deep chains do not hit the recursion limit"""
+        depth = 20000
+        graph = DependencyGraph((i, i + 1) for i in range(depth))
+
+        assert graph.would_create_cycle(depth, 0)
+        assert len(graph.get_transitive_blockers(0)) == depth
+
+    def test_random_changes_match_brute_force(self):
+        """After random adds and removes, queries match a full search"""
+        rng = random.Random(11)
+        edges = []
+        graph = DependencyGraph()
+
+        for step in range(400):
+            blocked, blocking = rng.sample(range(1, 30), 2)
+            if edges and rng.random() < 0.3:
+                edge = rng.choice(edges)
+                edges.remove(edge)
+                graph.remove(*edge)
+            elif not graph.would_create_cycle(blocked, blocking) and (blocked, blocking) not in graph:
+                edges.append((blocked, blocking))
+                graph.add(blocked, blocking)
+
+            task_id = rng.randint(1, 29)
+            assert graph.get_transitive_blockers(task_id) == brute_force_blockers(edges, task_id)
+            assert graph.would_create_cycle(blocked, blocking) == (
+                blocking == blocked or blocked in brute_force_blockers(edges, blocking)
+            )
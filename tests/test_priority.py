@@ -3,15 +3,20 @@ Unit tests for priority and urgency calculation algorithms.
 """
 
 import pytest
+import random
 from datetime import date, timedelta
 from src.models.task import Task
 from src.models.enums import TaskState, Priority
+from src.algorithms import priority
 from src.algorithms.priority import (
     calculate_urgency,
     calculate_urgency_for_tasks,
     calculate_effective_priority,
     calculate_importance,
     calculate_importance_for_tasks,
+    calculate_score_arrays,
+    calculate_task_scores,
+    elo_to_effective_priority,
     get_task_score_breakdown
 )
 
@@ -183,6 +188,91 @@ class TestImportanceCalculation:
         assert importance_scores[1] > importance_scores[3]
 
 
+@pytest.fixture(params=["numpy", "python"])
+def scoring_backend(request, monkeypatch):
+    """Run array scoring tests with NumPy (when installed) and the pure-Python fallback."""
+    if request.param == "numpy":
+        if priority.np is None:
+            pytest.skip("NumPy not installed")
+    else:
+        monkeypatch.setattr(priority, "np", None)
+    return request.param
+
+
+class TestScoreArrays:
+    """Test column-wise urgency/importance scoring."""
+
+    def _random_tasks(self, count, seed=42):
+        rng = random.Random(seed)
+        today = date.today()
+        tasks = []
+        for i in range(count):
+            due = today + timedelta(days=rng.randint(-30, 90)) if rng.random() < 0.7 else None
+            tasks.append(Task(
+                title=f"Task {i}",
+                id=i + 1,
+                base_priority=rng.choice([1, 2, 3]),
+                elo_rating=rng.uniform(800.0, 2200.0),
+                due_date=due
+            ))
+        return tasks
+
+    def _reference_scores(self, tasks):
+        """Per-task scoring using the scalar functions."""
+        days = [(t.due_date - date.today()).days for t in tasks if t.due_date is not None]
+        urgency = []
+        for t in tasks:
+            if t.due_date is None:
+                urgency.append(1.0)
+            elif len(days) == 1 or min(days) == max(days):
+                urgency.append(3.0)
+            else:
+                d = (t.due_date - date.today()).days
+                urgency.append(3.0 - ((d - min(days)) / (max(days) - min(days))) * 2.0)
+        importance = [
+            elo_to_effective_priority(t.base_priority, t.elo_rating) * u
+            for t, u in zip(tasks, urgency)
+        ]
+        return urgency, importance
+
+    def test_matches_scalar_scoring_exactly(self, scoring_backend):
+        """Array scores are identical to the per-task calculation"""
+        tasks = self._random_tasks(500)
+        urgency, importance = calculate_task_scores(tasks)
+        expected_urgency, expected_importance = self._reference_scores(tasks)
+
+        assert urgency == expected_urgency
+        assert importance == expected_importance
+
+    def test_dict_helpers_match_arrays(self, scoring_backend):
+        """Dict-returning helpers agree with the positional arrays"""
+        tasks = self._random_tasks(50)
+        urgency, importance = calculate_task_scores(tasks)
+
+        assert calculate_urgency_for_tasks(tasks) == {t.id: u for t, u in zip(tasks, urgency)}
+        assert calculate_importance_for_tasks(tasks) == {t.id: i for t, i in zip(tasks, importance)}
+
+    def test_single_and_identical_due_dates(self, scoring_backend):
+        """Single or identical due dates get max urgency, no date gets 1.0"""
+        urgency, importance = calculate_score_arrays([3, 2], [1500.0, 1500.0], [738000, None])
+        assert list(urgency) == [3.0, 1.0]
+        assert list(importance) == [7.5, 1.5]
+
+        urgency, _ = calculate_score_arrays([1, 1], [1000.0, 1000.0], [738000, 738000])
+        assert list(urgency) == [3.0, 3.0]
+
+    def test_empty_input(self, scoring_backend):
+        """Empty columns produce empty results"""
+        urgency, importance = calculate_score_arrays([], [], [])
+        assert len(urgency) == 0
+        assert len(importance) == 0
+
+    def test_invalid_base_priority_raises(self, scoring_backend):
+        """Invalid base priority raises like elo_to_effective_priority"""
+        with pytest.raises(ValueError, match="Invalid base_priority: 4"):
+            calculate_score_arrays([2, 4], [1500.0, 1500.0], [None, None])
+
+
 class TestScoreBreakdown:
     """Test score breakdown for debugging."""
 
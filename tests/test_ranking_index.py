@@ -0,0 +1,176 @@
+"""
+Unit tests for the incremental ranking index.
+"""
+
+import pytest
+import random
+from datetime import date, datetime, timedelta
+from src.models.task import Task
+from src.models.enums import TaskState
+from src.algorithms.ranking import get_next_focus_task, get_tied_tasks, rank_tasks, get_actionable_tasks
+from src.algorithms.ranking_index import RankingIndex
+
+
+def make_task(task_id, **kwargs):
+    """Create a task with a created_at that orders like TaskDAO.get_all()."""
+    kwargs.setdefault('title', f"Task {task_id}")
+    kwargs.setdefault('state', TaskState.ACTIVE)
+    kwargs.setdefault('created_at', datetime(2024, 1, 1) + timedelta(minutes=task_id))
+    return Task(id=task_id, **kwargs)
+
+
+def as_loaded(tasks):
+    """Order tasks the way TaskDAO.get_all() returns them (newest first)."""
+    return sorted(tasks, key=lambda t: t.created_at, reverse=True)
+
+
+class TestRankingIndexQueries:
+    """Test index queries against the list-based ranking functions."""
+
+    def test_top_task_and_ranking_order(self):
+        """Index order matches rank_tasks over active, actionable tasks"""
+        today = date.today()
+        tasks = [
+            make_task(1, base_priority=3, due_date=today + timedelta(days=1)),
+            make_task(2, base_priority=1, due_date=today + timedelta(days=10)),
+            make_task(3, base_priority=2),
+            make_task(4, base_priority=3, state=TaskState.COMPLETED),
+        ]
+        index = RankingIndex(tasks)
+
+        expected = rank_tasks(get_actionable_tasks(as_loaded([t for t in tasks if t.state == TaskState.ACTIVE])))
+        assert [(t.id, s) for t, s in index.get_top_n(10)] == [(t.id, s) for t, s in expected]
+        assert index.get_next_focus_task().id == 1
+        assert 4 not in index
+
+    def test_tied_tasks_same_tier(self):
+        """Tasks tied within one tier are returned as the tied set"""
+        tasks = [make_task(i, base_priority=2) for i in range(1, 4)]
+        index = RankingIndex(tasks)
+
+        assert index.get_next_focus_task() is None
+        assert {t.id for t in index.get_tied_tasks()} == {1, 2, 3}
+
+    def test_blocked_and_future_tasks_skipped(self):
+        """Blocked and not-yet-started tasks are skipped at query time"""
+        tasks = [
+            make_task(1, base_priority=3, blocking_task_ids=[2]),
+            make_task(2, base_priority=2, start_date=date.today() + timedelta(days=3)),
+            make_task(3, base_priority=1),
+        ]
+        index = RankingIndex(tasks)
+
+        assert index.get_next_focus_task().id == 3
+        assert len(index) == 3
+
+    def test_context_and_tag_filters(self):
+        """Context ('NONE' included) and tag filters match get_actionable_tasks"""
+        tasks = [
+            make_task(1, base_priority=3, context_id=5),
+            make_task(2, base_priority=2, project_tags=[7]),
+            make_task(3, base_priority=1),
+        ]
+        index = RankingIndex(tasks)
+
+        assert index.get_next_focus_task(context_filter=5).id == 1
+        assert index.get_next_focus_task(context_filter="NONE").id == 2
+        assert index.get_next_focus_task(tag_filters={7}).id == 2
+        assert index.get_next_focus_task(tag_filters={99}) is None
+
+    def test_top_n_limit(self):
+        """get_top_n returns at most N tasks, highest first"""
+        index = RankingIndex([make_task(i, elo_rating=1000.0 + i * 10) for i in range(1, 20)])
+        top = index.get_top_n(3)
+        assert [t.id for t, _ in top] == [19, 18, 17]
+
+
+class TestRankingIndexUpdates:
+    """Test incremental maintenance of the index."""
+
+    def test_upsert_rescores_single_task(self):
+        """Changing one task's Elo moves only that task"""
+        index = RankingIndex([make_task(1, elo_rating=1500.0), make_task(2, elo_rating=1400.0)])
+        assert index.get_top_n(1)[0][0].id == 1
+
+        index.upsert(make_task(2, elo_rating=1600.0))
+
+        assert index.get_top_n(1)[0][0].id == 2
+
+    def test_upsert_non_active_removes(self):
+        """Tasks leaving ACTIVE are removed"""
+        index = RankingIndex([make_task(1), make_task(2)])
+        index.upsert(make_task(1, state=TaskState.COMPLETED))
+
+        assert 1 not in index
+        assert len(index) == 1
+
+    def test_remove_unknown_task_is_ignored(self):
+        """Removing an unknown ID is a no-op"""
+        index = RankingIndex([make_task(1)])
+        index.remove(42)
+        assert len(index) == 1
+
+    def test_upsert_without_id_raises(self):
+        """Tasks must have an id to be indexed"""
+        with pytest.raises(ValueError):
+            RankingIndex().upsert(Task(title="No id"))
+
+    def test_normalization_change_triggers_recompute(self, monkeypatch):
+        """Only changes that move the due-date min/max re-score every task"""
+        today = date.today()
+        index = RankingIndex([
+            make_task(1, due_date=today),
+            make_task(2, due_date=today + timedelta(days=10)),
+            make_task(3, due_date=today + timedelta(days=5)),
+        ])
+
+        recomputes = []
+        original = index._recompute
+        monkeypatch.setattr(index, '_recompute', lambda: (recomputes.append(1), original()))
+
+        # Inside the existing range: single-task update
+        index.upsert(make_task(3, due_date=today + timedelta(days=6)))
+        assert recomputes == []
+
+        # New latest due date: normalization changes
+        index.upsert(make_task(4, due_date=today + timedelta(days=20)))
+        assert recomputes == [1]
+
+        # Removing the latest due date moves the max back
+        index.remove(4)
+        assert recomputes == [1, 1]
+
+    def test_random_changes_match_full_ranking(self):
+        """After random changes, the index agrees with a full re-rank"""
+        rng = random.Random(7)
+        today = date.today()
+        tasks = {}
+        index = RankingIndex()
+
+        for step in range(300):
+            task_id = rng.randint(1, 60)
+            if rng.random() < 0.15:
+                tasks.pop(task_id, None)
+                index.remove(task_id)
+                continue
+
+            task = make_task(
+                task_id,
+                base_priority=rng.choice([1, 2, 3]),
+                elo_rating=rng.choice([1400.0, 1500.0, rng.uniform(1000.0, 2000.0)]),
+                due_date=today + timedelta(days=rng.randint(-5, 30)) if rng.random() < 0.6 else None,
+                state=rng.choice([TaskState.ACTIVE] * 4 + [TaskState.COMPLETED, TaskState.DEFERRED]),
+                context_id=rng.choice([None, 1, 2])
+            )
+            tasks[task_id] = task
+            index.upsert(task)
+
+            loaded = as_loaded(tasks.values())
+            assert index.get_next_focus_task() is get_next_focus_task(loaded)
+            assert index.get_tied_tasks() == get_tied_tasks(loaded)
+            assert index.get_next_focus_task(context_filter=1) is get_next_focus_task(loaded, context_filter=1)
+
+            active = [t for t in loaded if t.state == TaskState.ACTIVE]
+            expected = rank_tasks(active)
+            actual = index.get_top_n(len(active))
+            assert [(t.id, s) for t, s in actual] == [(t.id, s) for t, s in expected]
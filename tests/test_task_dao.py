@@ -304,3 +304,234 @@ class TestTaskDAO:
         retrieved = task_dao.get_by_id(task.id)
         assert retrieved.resurface_count == 1
         assert retrieved.last_resurfaced_at is not None
+
+    def test_get_all_hydrates_tags_and_blockers_in_batch(self, task_dao, db_connection):
+        """Test that get_all populates related data matching get_by_id."""
+        cursor = db_connection.cursor()
+        cursor.execute("INSERT INTO project_tags (name) VALUES (?)", ("Work",))
+        work_id = cursor.lastrowid
+        cursor.execute("INSERT INTO project_tags (name) VALUES (?)", ("Home",))
+        home_id = cursor.lastrowid
+        db_connection.commit()
+
+        blocker = task_dao.create(Task(title="Blocker"))
+        done_blocker = task_dao.create(Task(title="Done", state=TaskState.COMPLETED))
+        blocked = task_dao.create(Task(title="Blocked", project_tags=[home_id, work_id]))
+        task_dao.create(Task(title="Plain"))
+
+        cursor.executemany(
+            "INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (?, ?)",
+            [(blocked.id, blocker.id), (blocked.id, done_blocker.id)]
+        )
+        db_connection.commit()
+
+        tasks = {t.id: t for t in task_dao.get_all()}
+
+        assert sorted(tasks[blocked.id].project_tags) == sorted([work_id, home_id])
+        # Completed blockers are not reported as blocking
+        assert tasks[blocked.id].blocking_task_ids == [blocker.id]
+        for task_id, task in tasks.items():
+            single = task_dao.get_by_id(task_id)
+            assert task.project_tags == single.project_tags
+            assert task.blocking_task_ids == single.blocking_task_ids
+
+    def test_get_all_hydration_spans_multiple_chunks(self, task_dao, db_connection, monkeypatch):
+        """Test that batched hydration handles result sets larger than one chunk."""
+        monkeypatch.setattr(TaskDAO, 'HYDRATION_CHUNK_SIZE', 2)
+
+        cursor = db_connection.cursor()
+        cursor.execute("INSERT INTO project_tags (name) VALUES (?)", ("Work",))
+        tag_id = cursor.lastrowid
+        db_connection.commit()
+
+        created = [task_dao.create(Task(title=f"Task {i}", project_tags=[tag_id])) for i in range(5)]
+
+        tasks = task_dao.get_all()
+
+        assert len(tasks) == len(created)
+        assert all(t.project_tags == [tag_id] for t in tasks)
+
+    def test_bulk_create(self, task_dao, db_connection):
+        """Test creating many tasks in one call."""
+        cursor = db_connection.cursor()
+        cursor.execute("INSERT INTO project_tags (name) VALUES (?)", ("Work",))
+        tag_id = cursor.lastrowid
+        db_connection.commit()
+
+        tasks = [Task(title=f"Bulk {i}", project_tags=[tag_id] if i % 2 else []) for i in range(4)]
+        created = task_dao.bulk_create(tasks)
+
+        assert all(t.id is not None for t in created)
+        assert len({t.id for t in created}) == 4
+        assert task_dao.get_by_id(created[1].id).project_tags == [tag_id]
+        assert task_dao.get_by_id(created[0].id).project_tags == []
+
+    def test_bulk_create_with_existing_id_raises_error(self, task_dao):
+        """Test that bulk_create rejects tasks that already have ids."""
+        with pytest.raises(ValueError, match="Cannot create task that already has an id"):
+            task_dao.bulk_create([Task(title="New"), Task(title="Old", id=5)])
+
+        assert task_dao.get_all() == []
+
+    def test_bulk_update_diffs_project_tags(self, task_dao, db_connection):
+        """Test that bulk_update persists fields and only changes differing tags."""
+        cursor = db_connection.cursor()
+        tag_ids = []
+        for name in ("Work", "Home", "Health"):
+            cursor.execute("INSERT INTO project_tags (name) VALUES (?)", (name,))
+            tag_ids.append(cursor.lastrowid)
+        db_connection.commit()
+
+        task1 = task_dao.create(Task(title="One", project_tags=[tag_ids[0], tag_ids[1]]))
+        task2 = task_dao.create(Task(title="Two", project_tags=[tag_ids[2]]))
+        cursor.execute(
+            "UPDATE task_project_tags SET created_at = '2000-01-01' WHERE task_id = ? AND project_tag_id = ?",
+            (task1.id, tag_ids[0])
+        )
+        db_connection.commit()
+
+        task1.elo_rating = 1600.0
+        task1.project_tags = [tag_ids[0], tag_ids[2]]
+        task2.title = "Two (renamed)"
+        task2.project_tags = []
+        task_dao.bulk_update([task1, task2])
+
+        reloaded1 = task_dao.get_by_id(task1.id)
+        reloaded2 = task_dao.get_by_id(task2.id)
+        assert reloaded1.elo_rating == 1600.0
+        assert sorted(reloaded1.project_tags) == sorted([tag_ids[0], tag_ids[2]])
+        assert reloaded2.title == "Two (renamed)"
+        assert reloaded2.project_tags == []
+
+        # Unchanged link was left in place rather than deleted and re-inserted
+        kept = cursor.execute(
+            "SELECT created_at FROM task_project_tags WHERE task_id = ? AND project_tag_id = ?",
+            (task1.id, tag_ids[0])
+        ).fetchone()
+        assert kept[0] == '2000-01-01'
+
+    def test_bulk_update_without_id_raises_error(self, task_dao):
+        """Test that bulk_update rejects tasks without ids."""
+        with pytest.raises(ValueError, match="Cannot update task without an id"):
+            task_dao.bulk_update([Task(title="Unsaved")])
+
+    def test_search_task_ids_prefix_and_ranking(self, task_dao):
+        """Test full-text search with prefix terms and title-weighted ranking."""
+        in_description = task_dao.create(Task(title="Weekly chores", description="Python scripting"))
+        in_title = task_dao.create(Task(title="Python development"))
+        task_dao.create(Task(title="Java testing"))
+
+        assert task_dao.search_task_ids("pyth") == [in_title.id, in_description.id]
+        assert task_dao.search_task_ids("PYTHON dev") == [in_title.id]
+        assert task_dao.search_task_ids("pyth", title_only=True) == [in_title.id]
+        assert task_dao.search_task_ids("pyth", limit=1) == [in_title.id]
+        assert task_dao.search_task_ids("ruby") == []
+        assert task_dao.search_task_ids("   ") == []
+
+    def test_search_index_follows_updates_and_deletes(self, task_dao):
+        """Test that the search index is kept in sync by triggers."""
+        task = task_dao.create(Task(title="Draft report"))
+
+        task.title = "Final summary"
+        task_dao.update(task)
+        assert task_dao.search_task_ids("draft") == []
+        assert task_dao.search_task_ids("summ") == [task.id]
+
+        task_dao.delete(task.id)
+        assert task_dao.search_task_ids("summ") == []
+
+    def test_search_falls_back_without_index(self, task_dao, db_connection):
+        """Test substring search when the FTS index is missing."""
+        task = task_dao.create(Task(title="Python development"))
+        db_connection.execute("DROP TABLE tasks_fts")
+        for trigger in ('tasks_fts_insert', 'tasks_fts_delete', 'tasks_fts_update'):
+            db_connection.execute(f"DROP TRIGGER {trigger}")
+
+        assert task_dao.search_task_ids("ython") == [task.id]
+
+    def test_get_by_ids_preserves_order(self, task_dao):
+        """Test batch retrieval by ID."""
+        first = task_dao.create(Task(title="First"))
+        second = task_dao.create(Task(title="Second"))
+
+        tasks = task_dao.get_by_ids([second.id, 9999, first.id])
+
+        assert [t.id for t in tasks] == [second.id, first.id]
+
+    def test_count_by_state(self, task_dao):
+        """Test counting tasks per state in one query."""
+        task_dao.create(Task(title="Active 1"))
+        task_dao.create(Task(title="Active 2"))
+        task_dao.create(Task(title="Done", state=TaskState.COMPLETED))
+
+        counts = task_dao.count_by_state()
+
+        assert counts['active'] == 2
+        assert counts['completed'] == 1
+        assert counts['deferred'] == 0
+        assert set(counts) == {state.value for state in TaskState}
+
+    def test_get_actionable_tasks_matches_python_filter(self, task_dao, db_connection):
+        """Test that SQL actionable filtering matches ranking.get_actionable_tasks."""
+        from src.algorithms.ranking import get_actionable_tasks
+
+        cursor = db_connection.cursor()
+        cursor.execute("INSERT INTO contexts (name) VALUES (?)", ("@work",))
+        context_id = cursor.lastrowid
+        cursor.execute("INSERT INTO project_tags (name) VALUES (?)", ("Work",))
+        work_id = cursor.lastrowid
+        cursor.execute("INSERT INTO project_tags (name) VALUES (?)", ("Home",))
+        home_id = cursor.lastrowid
+        db_connection.commit()
+
+        today = date.today()
+        blocker = task_dao.create(Task(title="Blocker", context_id=context_id))
+        done_blocker = task_dao.create(Task(title="Done", state=TaskState.COMPLETED))
+        blocked = task_dao.create(Task(title="Blocked", project_tags=[work_id]))
+        unblocked = task_dao.create(Task(title="Unblocked", project_tags=[home_id]))
+        task_dao.create(Task(title="Future", start_date=today + timedelta(days=2)))
+        task_dao.create(Task(title="Started", start_date=today, context_id=context_id, project_tags=[work_id]))
+        task_dao.create(Task(title="Trashed", state=TaskState.TRASH, project_tags=[work_id]))
+        task_dao.create(Task(title="Plain"))
+        cursor.executemany(
+            "INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (?, ?)",
+            [(blocked.id, blocker.id), (unblocked.id, done_blocker.id)]
+        )
+        db_connection.commit()
+
+        all_tasks = task_dao.get_all()
+        for context_filter, tag_filters in [
+            (None, None),
+            (context_id, None),
+            ("NONE", None),
+            (None, {work_id}),
+            (None, {work_id, home_id}),
+            ("NONE", {home_id}),
+        ]:
+            expected = get_actionable_tasks(all_tasks, context_filter, tag_filters)
+            actual = task_dao.get_actionable_tasks(context_filter=context_filter, tag_filters=tag_filters)
+            assert sorted(t.id for t in actual) == sorted(t.id for t in expected)
+            assert all(t.project_tags == task_dao.get_by_id(t.id).project_tags for t in actual)
+
+    def test_compact_change_log(self, task_dao, db_connection):
+        """Test that compaction keeps the answer to 'what changed since seq' for every seq."""
+        tasks = [task_dao.create(Task(title=f"Task {i}")) for i in range(3)]
+        for _ in range(3):
+            for task in tasks:
+                task.title += "!"
+                task_dao.update(task)
+        task_dao.delete(tasks[1].id)
+        latest = task_dao.get_change_seq()
+        changed = {seq: task_dao.get_changed_task_ids(seq) for seq in range(latest + 1)}
+
+        assert task_dao.compact_change_log() > 0
+
+        rows = db_connection.execute("SELECT task_id FROM task_changes").fetchall()
+        assert len(rows) == 3
+        assert task_dao.get_change_seq() == latest
+        assert {seq: task_dao.get_changed_task_ids(seq) for seq in range(latest + 1)} == changed
+
+        # Rows up to the lowest needed seq go too, except the newest
+        task_dao.compact_change_log(needed_seq=latest)
+        assert db_connection.execute("SELECT seq FROM task_changes").fetchall()[0][0] == latest
+        assert task_dao.get_change_seq() == latest
@@ -57,14 +57,14 @@ def test_task_list_displays_tasks(task_list_view):
     task_list_view.refresh_tasks()
 
     # Check that table has at least one row
-    assert task_list_view.task_table.rowCount() >= 1
+    assert task_list_view.task_model.rowCount() >= 1
 
     # Find our task in the table (title column may vary, check all columns)
     found = False
-    for row in range(task_list_view.task_table.rowCount()):
-        for col in range(task_list_view.task_table.columnCount()):
-            item = task_list_view.task_table.item(row, col)
-            if item and "Test Task" in item.text():
+    for row in range(task_list_view.task_model.rowCount()):
+        for col in range(task_list_view.task_model.columnCount()):
+            item = task_list_view.task_model.index(row, col).data()
+            if item and "Test Task" in item:
                 found = True
                 break
         if found:
@@ -89,19 +89,19 @@ def test_search_filter(task_list_view):
     task_list_view._on_filter_changed()
 
     # Should only show Python task
-    assert task_list_view.task_table.rowCount() >= 1
+    assert task_list_view.task_model.rowCount() >= 1
 
     # Check that filtered task is visible
     found_python = False
     found_java = False
 
-    for row in range(task_list_view.task_table.rowCount()):
-        for col in range(task_list_view.task_table.columnCount()):
-            item = task_list_view.task_table.item(row, col)
+    for row in range(task_list_view.task_model.rowCount()):
+        for col in range(task_list_view.task_model.columnCount()):
+            item = task_list_view.task_model.index(row, col).data()
             if item:
-                if "Python" in item.text():
+                if "Python" in item:
                     found_python = True
-                if "Java" in item.text():
+                if "Java" in item:
                     found_java = True
 
     assert found_python, "Python task should be visible"
@@ -134,13 +134,13 @@ def test_state_filter(task_list_view):
         found_active = False
         found_completed = False
 
-        for row in range(task_list_view.task_table.rowCount()):
-            for col in range(task_list_view.task_table.columnCount()):
-                item = task_list_view.task_table.item(row, col)
+        for row in range(task_list_view.task_model.rowCount()):
+            for col in range(task_list_view.task_model.columnCount()):
+                item = task_list_view.task_model.index(row, col).data()
                 if item:
-                    if "Active Task" in item.text():
+                    if "Active Task" in item:
                         found_active = True
-                    if "Completed Task" in item.text():
+                    if "Completed Task" in item:
                         found_completed = True
 
         assert found_active, "Active task should be visible"
@@ -163,7 +163,7 @@ def test_task_list_sorting(task_list_view):
 
     # Check that sorting is enabled (it may be disabled during refresh and re-enabled after)
     # So we just verify the table exists and has rows
-    assert task_list_view.task_table.rowCount() >= 2
+    assert task_list_view.task_model.rowCount() >= 2
 
 
 def test_count_label_updates(task_list_view):
@@ -176,4 +176,117 @@ def test_count_label_updates(task_list_view):
     task_list_view.refresh_tasks()
 
     # The count is now emitted as a signal, check that table has the right number of rows
-    assert task_list_view.task_table.rowCount() >= 3
+    assert task_list_view.task_model.rowCount() >= 3
+
+
+def test_task_model_builds_rows_lazily(task_list_view):
+    """Test that cell data is only built for rows that are requested."""
+    for i in range(5):
+        task_list_view.task_service.create_task(Task(title=f"Lazy Task {i}", state=TaskState.ACTIVE))
+
+    task_list_view.refresh_tasks()
+    model = task_list_view.task_model
+    model._row_cache.clear()
+
+    title_col = task_list_view.column_indices["Title"]
+    title = model.index(2, title_col).data()
+
+    assert title == model.task_at(2).title
+    assert list(model._row_cache.keys()) == [2]
+
+
+def test_task_model_shares_palette_between_refreshes(task_list_view):
+    """Test that theme brushes are built once and reused across refreshes."""
+    task_list_view.task_service.create_task(Task(title="Palette Task", state=TaskState.ACTIVE))
+
+    task_list_view.refresh_tasks()
+    first_palette = task_list_view.task_model._palette
+    task_list_view.refresh_tasks()
+
+    assert task_list_view.task_model._palette is first_palette
+
+
+def test_task_model_state_column_colors(task_list_view):
+    """Test that the State column uses the theme's state brushes."""
+    task_list_view.task_service.create_task(Task(title="Done Task", state=TaskState.COMPLETED))
+    task_list_view.refresh_tasks()
+
+    state_col = task_list_view.column_indices["State"]
+    background = task_list_view.task_model.index(0, state_col).data(Qt.BackgroundRole)
+
+    assert background.color().name() == "#d4edda"
+
+
+def test_selected_task_id_with_id_column_hidden(task_list_view):
+    """Test that the selected task resolves even when the ID column is hidden."""
+    created = task_list_view.task_service.create_task(Task(title="Hidden ID Task", state=TaskState.ACTIVE))
+    task_list_view.refresh_tasks()
+
+    task_list_view.visible_columns = [col for col in task_list_view.visible_columns if col != "ID"]
+    task_list_view._update_column_visibility()
+    task_list_view.task_table.selectRow(0)
+
+    current_row = task_list_view.task_table.currentIndex().row()
+    assert task_list_view.task_model.columnCount() == len(task_list_view.visible_columns)
+    assert task_list_view.task_model.task_id_at(current_row) == created.id
+    assert task_list_view.edit_btn.isEnabled()
+
+
+def test_dependency_column_uses_blocker_map(task_list_view):
+    """Test that the Dependencies column and tooltip come from one bulk query."""
+    blocker = task_list_view.task_service.create_task(Task(title="Blocker", state=TaskState.ACTIVE))
+    blocked = task_list_view.task_service.create_task(Task(title="Blocked", state=TaskState.ACTIVE))
+    task_list_view.dependency_dao.add_dependency(blocked.id, blocker.id)
+    task_list_view.refresh_tasks()
+
+    statements = []
+    task_list_view.db_connection.get_connection().set_trace_callback(statements.append)
+    try:
+        assert task_list_view._get_dependencies_str(blocked) == "⛔ 1"
+        assert task_list_view._get_dependency_tooltip(blocked) == "Blocked by:\n• Blocker"
+        assert task_list_view._get_dependencies_str(blocker) == "—"
+        assert task_list_view._task_has_dependencies(blocked)
+        assert not task_list_view._task_has_dependencies(blocker)
+    finally:
+        task_list_view.db_connection.get_connection().set_trace_callback(None)
+
+    assert statements == []
+
+
+def test_search_typing_buffers_filter_writes(task_list_view, test_db):
+    """Test that typing in the search box does not commit settings per keystroke."""
+    from src.services.settings_write_buffer import SettingsWriteBuffer
+
+    statements = []
+    test_db.set_trace_callback(statements.append)
+    try:
+        for text in ("P", "Py", "Pyt"):
+            task_list_view.search_box.setText(text)
+    finally:
+        test_db.set_trace_callback(None)
+
+    assert not [s for s in statements if "INTO settings" in s]
+
+    buffer = SettingsWriteBuffer.for_connection(test_db)
+    assert buffer.get('task_list.search_text') == "Pyt"
+    buffer.flush()
+    row = test_db.execute("SELECT value FROM settings WHERE key = 'task_list.search_text'").fetchone()
+    assert row[0] == "Pyt"
+
+
+def test_dependency_metric_columns_are_optional(task_list_view):
+    """Test that the dependency metric columns are hidden by default and filled when shown."""
+    assert "Blocking Depth" not in task_list_view.visible_columns
+    assert "Unblocks" not in task_list_view.visible_columns
+
+    blocker = task_list_view.task_service.create_task(Task(title="Blocker", state=TaskState.ACTIVE))
+    blocked = task_list_view.task_service.create_task(Task(title="Blocked", state=TaskState.ACTIVE))
+    task_list_view.dependency_dao.add_dependency(blocked.id, blocker.id)
+    task_list_view.refresh_tasks()
+    assert task_list_view._build_row_data(blocked, 1.0)["Blocking Depth"][0] == ""
+
+    task_list_view.visible_columns = task_list_view.visible_columns + ["Blocking Depth", "Unblocks"]
+    task_list_view._update_column_visibility()
+
+    assert task_list_view._build_row_data(blocked, 1.0)["Blocking Depth"][0] == "⛔ 1"
+    assert task_list_view._build_row_data(blocker, 1.0)["Unblocks"][0] == "1"
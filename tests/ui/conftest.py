@@ -8,6 +8,7 @@ including preventing the Welcome Wizard from appearing during test execution.
 import pytest
 import sqlite3
 from PyQt5.QtWidgets import QApplication
+from src.database.settings_dao import SettingsDAO
 
 
 @pytest.fixture(scope="session")
@@ -117,6 +118,7 @@ def mark_onboarding_complete():
                    'Whether interactive tutorial has been shown')
         """)
         conn.commit()
+        SettingsDAO.invalidate_cache()
 
     return _mark_complete
 
@@ -138,6 +140,10 @@ class MockDatabaseConnection:
         """Return underlying connection (DatabaseConnection interface)."""
         return self._conn
 
+    def thread_bound(self, read_only=False):
+        """Return underlying connection (tests run jobs on the calling thread)."""
+        return self._conn
+
     def close(self):
         """Close the database connection."""
         self._conn.close()
@@ -0,0 +1,51 @@
+"""Tests for background database jobs used by the import and export dialogs."""
+import pytest
+
+from src.ui.database_job import DatabaseJob
+from src.ui.export_dialog import ExportWorker
+from src.ui.import_dialog import ImportWorker
+
+
+@pytest.fixture
+def populated_db(test_db):
+    """Database with some tasks."""
+    test_db.executemany("INSERT INTO tasks (title) VALUES (?)", [(f"Task {i}",) for i in range(20)])
+    test_db.commit()
+    return test_db
+
+
+def test_job_runs_on_its_own_connection(qtbot, populated_db):
+    """Test that a job opens (and closes) a connection of its own."""
+    connections = []
+
+    def count_tasks(connection):
+        connections.append(connection)
+        return {'count': connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]}
+
+    job = DatabaseJob(populated_db, count_tasks)
+
+    with qtbot.waitSignal(job.finished, timeout=5000) as blocker:
+        job.start()
+    job.wait()
+
+    assert blocker.args == [{'count': 20}]
+    assert connections[0] is not populated_db
+
+
+def test_export_then_cancelled_import(qtbot, populated_db, tmp_path):
+    """Test an export job, then an import job cancelled before it changes anything."""
+    export_path = str(tmp_path / "export.json")
+    export_job = ExportWorker(populated_db, 'json', export_path, include_settings=True)
+    with qtbot.waitSignal(export_job.finished, timeout=5000) as blocker:
+        export_job.start()
+    export_job.wait()
+    assert blocker.args[0]['task_count'] == 20
+
+    import_job = ImportWorker(populated_db, export_path, merge_mode=False)
+    import_job.cancel()
+    with qtbot.waitSignal(import_job.finished, timeout=5000) as blocker:
+        import_job.start()
+    import_job.wait()
+
+    assert blocker.args[0]['cancelled'] is True
+    assert populated_db.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 20
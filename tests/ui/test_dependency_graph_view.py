@@ -5,7 +5,7 @@ Tests the dependency graph visualization including:
 - Tree structure rendering
 - Task state icons
 - Circular dependency detection
-- Max depth handling
+- Lazy loading of deep and wide graphs
 - Export functionality
 - Refresh functionality
 """
@@ -22,6 +22,7 @@ from src.models.enums import TaskState
 from src.database.task_dao import TaskDAO
 from src.database.dependency_dao import DependencyDAO
 from src.ui.dependency_graph_view import DependencyGraphView
+from src.ui.dependency_tree_model import BLOCKERS, DEPENDENTS
 
 
 
@@ -110,11 +111,11 @@ class TestDialogInitialization:
         assert view.dependency_dao is not None
         view.close()
 
-    def test_graph_display_created(self, qapp, db_connection, sample_task):
-        """Test that graph display widget is created."""
+    def test_graph_tree_created(self, qapp, db_connection, sample_task):
+        """Test that graph tree widget is created with the lazy model."""
         view = DependencyGraphView(sample_task, db_connection)
-        assert view.graph_display is not None
-        assert view.graph_display.isReadOnly()
+        assert view.graph_tree is not None
+        assert view.graph_tree.model() is view.graph_model
         view.close()
 
 
@@ -125,7 +126,7 @@ class TestNoDependencies:
         """Test that message is shown when task has no blocking tasks."""
         view = DependencyGraphView(sample_task, db_connection)
 
-        graph_text = view.graph_display.toPlainText()
+        graph_text = view.graph_text()
         assert "No blocking tasks" in graph_text
         assert "ready to work on" in graph_text
         view.close()
@@ -134,7 +135,7 @@ class TestNoDependencies:
         """Test that message is shown when task has no dependent tasks."""
         view = DependencyGraphView(sample_task, db_connection)
 
-        graph_text = view.graph_display.toPlainText()
+        graph_text = view.graph_text()
         assert "No dependent tasks" in graph_text
         view.close()
 
@@ -153,7 +154,7 @@ class TestWithDependencies:
 
         view = DependencyGraphView(sample_task, db_connection)
 
-        graph_text = view.graph_display.toPlainText()
+        graph_text = view.graph_text()
         assert blocking_task.title in graph_text
         assert "TASKS BLOCKING THIS TASK" in graph_text
         view.close()
@@ -180,7 +181,7 @@ class TestWithDependencies:
 
         view = DependencyGraphView(sample_task, db_connection)
 
-        graph_text = view.graph_display.toPlainText()
+        graph_text = view.graph_text()
         assert dependent.title in graph_text
         assert "TASKS BLOCKED BY THIS TASK" in graph_text
         view.close()
@@ -200,7 +201,7 @@ class TestTreeStructure:
 
         view = DependencyGraphView(sample_task, db_connection)
 
-        graph_text = view.graph_display.toPlainText()
+        graph_text = view.graph_text()
         # Should have tree branch characters
         assert "└─" in graph_text or "├─" in graph_text
         view.close()
@@ -233,7 +234,7 @@ class TestTreeStructure:
 
         view = DependencyGraphView(sample_task, db_connection)
 
-        graph_text = view.graph_display.toPlainText()
+        graph_text = view.graph_text()
         # Both tasks should be in the graph
         assert blocking_task.title in graph_text
         assert second_blocker.title in graph_text
@@ -350,38 +351,104 @@ class TestCircularDependencies:
             dependency_dao.create(dep2)
 
 
-class TestMaxDepth:
-    """Test max depth limiting."""
-
-    def test_deep_chain_limited(self, qapp, db_connection, sample_task, task_dao, dependency_dao):
-        """Test that very deep dependency chains are limited to max depth."""
-        # Create a chain of 7 tasks (exceeds MAX_DEPTH of 5)
-        current_task = sample_task
-        tasks = [current_task]
-
-        for i in range(7):
-            blocker = Task(
-                title=f"Blocker {i}",
-                base_priority=2,
-                state=TaskState.ACTIVE,
-                elo_rating=1500.0,
-                comparison_count=1
-            )
-            blocker = task_dao.create(blocker)
-            tasks.append(blocker)
+class TestLazyLoading:
+    """Test on-demand loading of the tree."""
 
-            dep = Dependency(
-                blocked_task_id=current_task.id,
-                blocking_task_id=blocker.id
-            )
-            dependency_dao.create(dep)
+    def make_chain(self, task_dao, dependency_dao, first, length):
+        """Create a chain of blockers above first; return the created tasks."""
+        tasks = []
+        current_task = first
+        for i in range(length):
+            blocker = task_dao.create(Task(title=f"Blocker {i}", base_priority=2))
+            dependency_dao.create(Dependency(blocked_task_id=current_task.id, blocking_task_id=blocker.id))
+            tasks.append(blocker)
             current_task = blocker
+        return tasks
+
+    def test_deep_chain_fetched_on_expand(self, qapp, db_connection, sample_task, task_dao, dependency_dao):
+        """Test that only the first level is loaded until a node is expanded."""
+        blockers = self.make_chain(task_dao, dependency_dao, sample_task, 7)
+
+        view = DependencyGraphView(sample_task, db_connection)
+        model = view.graph_model
+        section = model.section_index(BLOCKERS)
+
+        assert model.rowCount(section) == 1
+        first = model.index(0, 0, section)
+        assert blockers[0].title in model.data(first)
+        assert model.hasChildren(first)
+        assert model.canFetchMore(first)
+        assert model.rowCount(first) == 0
+
+        model.fetchMore(first)
+
+        assert not model.canFetchMore(first)
+        assert blockers[1].title in model.data(model.index(0, 0, first))
+        view.close()
+
+    def test_deep_chain_exported_completely(self, qapp, db_connection, sample_task, task_dao, dependency_dao):
+        """Test that the text export contains the whole chain."""
+        blockers = self.make_chain(task_dao, dependency_dao, sample_task, 7)
+
+        view = DependencyGraphView(sample_task, db_connection)
+
+        graph_text = view.graph_text()
+        assert all(blocker.title in graph_text for blocker in blockers)
+        assert "│" in graph_text or "   " in graph_text
+        view.close()
 
+    def test_hub_task_loads_in_bulk(self, qapp, db_connection, sample_task, task_dao, dependency_dao):
+        """Test that opening a hub task runs a bounded number of queries."""
+        for i in range(200):
+            dependent = task_dao.create(Task(title=f"Dependent {i}", base_priority=2))
+            dependency_dao.create(Dependency(blocked_task_id=dependent.id, blocking_task_id=sample_task.id))
+
+        statements = []
+        conn = db_connection.get_connection()
+        conn.set_trace_callback(statements.append)
         view = DependencyGraphView(sample_task, db_connection)
+        conn.set_trace_callback(None)
 
-        graph_text = view.graph_display.toPlainText()
-        # Should have max depth indicator
-        assert "MAX DEPTH" in graph_text or "⋯" in graph_text
+        assert view.graph_model.rowCount(view.graph_model.section_index(DEPENDENTS)) == 200
+        assert len(statements) < 20
+        view.close()
+
+    def test_shared_subtree_exported_once(self, qapp, db_connection, sample_task, task_dao, dependency_dao):
+        """Test that a blocker reached along two paths is written out once."""
+        left = task_dao.create(Task(title="Left", base_priority=2))
+        right = task_dao.create(Task(title="Right", base_priority=2))
+        shared = task_dao.create(Task(title="Shared", base_priority=2))
+        root = task_dao.create(Task(title="Shared Root", base_priority=2))
+        for blocked, blocking in ((sample_task, left), (sample_task, right), (left, shared),
+                                  (right, shared), (shared, root)):
+            dependency_dao.create(Dependency(blocked_task_id=blocked.id, blocking_task_id=blocking.id))
+
+        view = DependencyGraphView(sample_task, db_connection)
+
+        graph_text = view.graph_text()
+        assert graph_text.count("Shared Root") == 1
+        assert "Shared (see above)" in graph_text
+        view.close()
+
+    def test_cycle_marked_circular(self, qapp, db_connection, sample_task, blocking_task, dependency_dao):
+        """Test that a cycle (e.g. from imported data) is shown but not expanded."""
+        dependency_dao.create(Dependency(blocked_task_id=sample_task.id, blocking_task_id=blocking_task.id))
+        conn = db_connection.get_connection()
+        conn.execute(
+            "INSERT INTO dependencies (blocked_task_id, blocking_task_id) VALUES (?, ?)",
+            (blocking_task.id, sample_task.id)
+        )
+        conn.commit()
+
+        view = DependencyGraphView(sample_task, db_connection)
+        model = view.graph_model
+        blocker_index = model.index(0, 0, model.section_index(BLOCKERS))
+        model.fetchMore(blocker_index)
+        circular_index = model.index(0, 0, blocker_index)
+
+        assert "CIRCULAR" in model.data(circular_index)
+        assert not model.hasChildren(circular_index)
+        assert "CIRCULAR" in view.graph_text()
         view.close()
 
 
@@ -402,7 +469,7 @@ class TestRefreshButton:
         """Test that refresh rebuilds the graph."""
         view = DependencyGraphView(sample_task, db_connection)
 
-        initial_text = view.graph_display.toPlainText()
+        initial_text = view.graph_text()
 
         # Add a dependency
         dep = Dependency(
@@ -414,7 +481,7 @@ class TestRefreshButton:
         # Refresh
         view._build_graph()
 
-        updated_text = view.graph_display.toPlainText()
+        updated_text = view.graph_text()
 
         # Text should change (now includes blocking task)
         assert updated_text != initial_text
@@ -565,7 +632,7 @@ class TestUnsavedTask:
 
         view = DependencyGraphView(task, db_connection)
 
-        graph_text = view.graph_display.toPlainText()
+        graph_text = view.graph_text()
         assert "not been saved" in graph_text or "no dependency information" in graph_text
 
         view.close()
@@ -12,6 +12,7 @@ Tests the main application window including:
 - Signal handling
 """
 
+import gc
 import pytest
 import sqlite3
 from datetime import date, timedelta
@@ -34,6 +35,9 @@ def main_window(qapp, db_connection):
     window = MainWindow(app=qapp, test_mode=True, db_connection=db_connection)
     yield window
     window.close()
+    # Collect the window now rather than at an arbitrary point while the next
+    # test is building its widgets
+    gc.collect()
 
 
 @pytest.fixture
@@ -343,6 +347,28 @@ class TestStatusBar:
         assert "Completed:" in status_text
 
 
+class TestFocusRefresh:
+    """Test the Focus Mode refresh pipeline."""
+
+    def test_refresh_uses_single_snapshot(self, main_window, sample_tasks):
+        """Test that a refresh evaluates focus once instead of separate queries."""
+        with patch.object(main_window.task_service, 'get_all_tasks') as mock_all, \
+                patch.object(main_window.task_service, 'get_tied_tasks') as mock_tied, \
+                patch.object(main_window.task_service, 'get_focus_task') as mock_focus, \
+                patch.object(main_window.task_service, 'get_task_count_by_state') as mock_counts, \
+                patch.object(main_window.task_service, 'evaluate_focus',
+                             wraps=main_window.task_service.evaluate_focus) as mock_evaluate:
+            main_window._refresh_focus_task()
+
+        mock_evaluate.assert_called_once()
+        mock_all.assert_not_called()
+        mock_tied.assert_not_called()
+        mock_focus.assert_not_called()
+        mock_counts.assert_not_called()
+        assert main_window.focus_mode.get_current_task().id == sample_tasks[0].id
+        assert "Active: 2" in main_window.statusBar().currentMessage()
+
+
 class TestTaskActions:
     """Test task-related actions."""
 